@@ -0,0 +1,44 @@
+"""add match_events table
+
+Revision ID: add_match_events
+Revises: add_personalized_development
+Create Date: 2026-10-16
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = 'add_match_events'
+down_revision = 'add_personalized_development'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'match_events',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column(
+            'match_id',
+            sa.Integer,
+            sa.ForeignKey('matches.id', ondelete='CASCADE'),
+            nullable=False
+        ),
+        sa.Column('minute', sa.Integer, nullable=False),
+        sa.Column('event_type', sa.String(30), nullable=False),
+        sa.Column('team', sa.String(10), nullable=False),
+        sa.Column('player', sa.String(100), nullable=True),
+        sa.Column('player2', sa.String(100), nullable=True),
+    )
+    op.create_index('ix_match_events_match_id', 'match_events', ['match_id'])
+    op.create_index('ix_match_events_player', 'match_events', ['player'])
+    op.create_index('ix_match_events_type_player', 'match_events', ['event_type', 'player'])
+
+
+def downgrade():
+    op.drop_index('ix_match_events_type_player', 'match_events')
+    op.drop_index('ix_match_events_player', 'match_events')
+    op.drop_index('ix_match_events_match_id', 'match_events')
+    op.drop_table('match_events')
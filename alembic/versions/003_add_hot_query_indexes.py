@@ -0,0 +1,41 @@
+"""add indexes for hot queries
+
+Revision ID: add_hot_query_indexes
+Revises: add_match_events
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'add_hot_query_indexes'
+down_revision = 'add_match_events'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns), as declared in the models' __table_args__
+INDEXES = [
+    ('ix_players_club_id_ability', 'players', ['club_id', 'current_ability']),
+    ('ix_clubs_league_id', 'clubs', ['league_id']),
+    ('ix_matches_season_id_matchday', 'matches', ['season_id', 'matchday']),
+    ('ix_matches_home_club_id_match_date', 'matches', ['home_club_id', 'match_date']),
+    ('ix_matches_away_club_id_match_date', 'matches', ['away_club_id', 'match_date']),
+    ('ix_matches_match_date', 'matches', ['match_date']),
+    ('ix_transfers_player_id', 'transfers', ['player_id']),
+    ('ix_transfers_offered_at', 'transfers', ['offered_at']),
+    ('ix_cup_rounds_edition_id', 'cup_rounds', ['edition_id']),
+    ('ix_cup_participants_edition_id_is_active', 'cup_participants', ['edition_id', 'is_active']),
+    ('ix_cup_participants_edition_id_group_name', 'cup_participants', ['edition_id', 'group_name']),
+    ('ix_cup_matches_round_id', 'cup_matches', ['round_id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table)
@@ -7,7 +7,7 @@ import json
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
-from fm_manager.engine.llm_client import LLMClient, LLMProvider
+from fm_manager.engine.llm_client import AsyncLLMClient, LLMClient, LLMProvider, generate_async
 from fm_manager.ai.tools.tool_registry import get_tool_registry
 from fm_manager.ai.tools.tool_implementations import set_current_club, set_current_calendar
 from fm_manager.data.cleaned_data_loader import ClubDataFull
@@ -45,7 +45,7 @@ class LLMResponse:
 class LLMToolInterface:
     """Interface for LLM to call tools and generate responses."""
 
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    def __init__(self, llm_client: Optional[LLMClient | AsyncLLMClient] = None):
         """Initialize the LLM tool interface."""
         if llm_client is None:
             llm_client = LLMClient(provider=LLMProvider.MOCK)
@@ -291,7 +291,8 @@ Your response should:
         system_prompt = self._build_system_prompt()
 
         # First LLM call - decide which tools to call
-        response1 = self.llm.generate(
+        response1 = await generate_async(
+            self.llm,
             prompt=user_query,
             system_prompt=system_prompt,
             max_tokens=1000,
@@ -367,7 +368,8 @@ DO NOT make additional tool calls.
 Simply provide a helpful, conversational response summarizing the results."""
         )
 
-        response2 = self.llm.generate(
+        response2 = await generate_async(
+            self.llm,
             prompt=final_prompt,
             system_prompt=final_system_prompt,
             max_tokens=1500,
@@ -381,7 +383,8 @@ Simply provide a helpful, conversational response summarizing the results."""
                 additional_results = self._execute_tool_calls(additional_calls)
                 all_results.extend(additional_results)
                 final_prompt = self._build_follow_up_prompt(user_query, all_results)
-                response2 = self.llm.generate(
+                response2 = await generate_async(
+                    self.llm,
                     prompt=final_prompt,
                     system_prompt=final_system_prompt,
                     max_tokens=1500,
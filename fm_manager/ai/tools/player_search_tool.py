@@ -4,12 +4,20 @@ Provides flexible player search capabilities with support for complex queries
 like "find English midfielders under 23 with high potential".
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Callable
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any
 from enum import Enum
 import re
 
-from fm_manager.data.cleaned_data_loader import load_for_match_engine, PlayerDataFull
+import numpy as np
+
+from fm_manager.data.cleaned_data_loader import (
+    load_for_match_engine,
+    load_player_table,
+    PlayerDataFull,
+)
+from fm_manager.data.player_table import PlayerTable
 
 
 class PositionCategory(Enum):
@@ -135,13 +143,207 @@ class PlayerSearchResult:
         }
 
 
+# Numeric criteria answered from sorted indexes: (column, min field, max field)
+RANGE_FILTERS = (
+    ("age", "min_age", "max_age"),
+    ("current_ability", "min_current_ability", "max_current_ability"),
+    ("potential_ability", "min_potential_ability", "max_potential_ability"),
+    ("market_value", "min_market_value", "max_market_value"),
+    ("weekly_wage", "min_weekly_wage", "max_weekly_wage"),
+)
+
+SORT_COLUMNS = ("current_ability", "potential_ability", "market_value", "age", "name")
+
+NATIONALITY_ALIASES = {"english": "england"}
+
+
+class _SortedIndex:
+    """Row numbers ordered by one numeric column, for range lookups."""
+
+    def __init__(self, values: np.ndarray):
+        self.order = np.argsort(values, kind="stable")
+        self.sorted = values[self.order]
+
+    def bounds(self, low: Optional[float], high: Optional[float]) -> tuple[int, int]:
+        lo = 0 if low is None else int(np.searchsorted(self.sorted, low, side="left"))
+        hi = len(self.sorted) if high is None else int(np.searchsorted(self.sorted, high, "right"))
+        return lo, max(lo, hi)
+
+
+def _group_rows(codes: np.ndarray) -> dict[int, np.ndarray]:
+    """Hash index: code -> ascending row numbers holding it."""
+    order = np.argsort(codes, kind="stable")
+    uniques, starts = np.unique(codes[order], return_index=True)
+    return {
+        int(code): rows
+        for code, rows in zip(uniques.tolist(), np.split(order, starts[1:]), strict=True)
+    }
+
+
+class PlayerIndex:
+    """Indexes over a ``PlayerTable`` answering ``PlayerSearchCriteria``.
+
+    Numeric ranges use sorted indexes, nationality/position/club use hash
+    indexes. The most selective indexed predicate produces the candidate
+    rows and the remaining predicates are applied to those as vector masks.
+    """
+
+    def __init__(self, table: PlayerTable):
+        self.table = table
+        self.version = table.version
+        self.ranges = {column: _SortedIndex(table.column(column)) for column, _, _ in RANGE_FILTERS}
+        self.nationality = _group_rows(table.strings["nationality"].codes)
+        self.position = _group_rows(table.strings["position"].codes)
+        self.club = _group_rows(table.ints["club_id"])
+        self._all_rows = table.unique_rows()
+        # Duplicated ids are served by their last row only, as in the players dict
+        self._shadowed = None
+        if len(self._all_rows) < len(table):
+            self._shadowed = np.ones(len(table), dtype=bool)
+            self._shadowed[self._all_rows] = False
+
+        names = table.strings["name"].categories
+        name_rank = np.empty(len(names), dtype=np.int64)
+        name_rank[sorted(range(len(names)), key=names.__getitem__)] = np.arange(len(names))
+        self.sort_keys = {column: table.column(column) for column in SORT_COLUMNS[:-1]}
+        self.sort_keys["name"] = name_rank[table.strings["name"].codes]
+
+    def query(self, key: tuple) -> tuple[np.ndarray, int]:
+        """Rows of the requested page and the total match count for a normalised key."""
+        criteria = dict(key)
+        table = self.table
+        candidates: list[np.ndarray] = []
+        masks = []
+
+        for column, low_field, high_field in RANGE_FILTERS:
+            low, high = criteria[low_field], criteria[high_field]
+            if low is None and high is None:
+                continue
+            index = self.ranges[column]
+            lo, hi = index.bounds(low, high)
+            candidates.append(index.order[lo:hi])
+            values = table.column(column)
+            if low is not None:
+                masks.append(lambda rows, v=values, x=low: v[rows] >= x)
+            if high is not None:
+                masks.append(lambda rows, v=values, x=high: v[rows] <= x)
+
+        for column, value, index in (
+            ("nationality", criteria["nationality"], self.nationality),
+            ("position", criteria["position"], self.position),
+        ):
+            if value is None:
+                continue
+            # Substring match, resolved once per distinct value
+            categories = table.strings[column].categories
+            codes = [code for code, text in enumerate(categories) if value in text.lower()]
+            candidates.append(self._rows_for(index, codes))
+            masks.append(self._code_mask(column, codes))
+
+        if criteria["position_category"] is not None:
+            positions = POSITION_MAPPING[PositionCategory(criteria["position_category"])]
+            column = table.strings["position"]
+            codes = [code for code in map(column.code_for, positions) if code >= 0]
+            candidates.append(self._rows_for(self.position, codes))
+            masks.append(self._code_mask("position", codes))
+
+        if criteria["club_id"] is not None:
+            candidates.append(self.club.get(criteria["club_id"], self._all_rows[:0]))
+            masks.append(lambda rows, x=criteria["club_id"]: table.ints["club_id"][rows] == x)
+
+        if criteria["name"] is not None:
+            names = table.strings["name"].categories
+            codes = [code for code, text in enumerate(names) if criteria["name"] in text.lower()]
+            masks.append(self._code_mask("name", codes))
+
+        if criteria["exclude_club_id"] is not None:
+            excluded = criteria["exclude_club_id"]
+            masks.append(lambda rows: table.ints["club_id"][rows] != excluded)
+
+        if self._shadowed is not None:
+            masks.append(lambda rows: ~self._shadowed[rows])
+
+        rows = min(candidates, key=len) if candidates else self._all_rows
+        for mask in masks:
+            if not len(rows):
+                break
+            rows = rows[mask(rows)]
+
+        return self._top_k(rows, criteria), len(rows)
+
+    def _rows_for(self, index: dict[int, np.ndarray], codes: list[int]) -> np.ndarray:
+        groups = [index[code] for code in codes if code in index]
+        if not groups:
+            return self._all_rows[:0]
+        return groups[0] if len(groups) == 1 else np.concatenate(groups)
+
+    def _code_mask(self, column: str, codes: list[int]):
+        allowed = np.zeros(len(self.table.strings[column].categories), dtype=bool)
+        allowed[codes] = True
+        column_codes = self.table.strings[column].codes
+        return lambda rows: allowed[column_codes[rows]]
+
+    def _top_k(self, rows: np.ndarray, criteria: dict) -> np.ndarray:
+        """Rows of one page in sort order, without sorting every match."""
+        k = criteria["offset"] + criteria["limit"]
+        if k <= 0 or not len(rows):
+            return rows[:0]
+        keys = self.sort_keys[criteria["sort_by"]][rows]
+        if criteria["sort_descending"]:
+            keys = -keys
+        if k < len(rows):
+            # Keep everything tied with the k-th key so ties resolve by row order
+            kth = np.partition(keys, k - 1)[k - 1]
+            selected = keys <= kth
+            rows, keys = rows[selected], keys[selected]
+        order = np.lexsort((rows, keys))[:k]
+        return rows[order][criteria["offset"] :]
+
+
+def normalise_criteria(criteria: PlayerSearchCriteria) -> tuple:
+    """Hashable cache key; criteria that always match the same players share a key."""
+    key = {f.name: getattr(criteria, f.name) for f in fields(criteria)}
+    for name in ("name", "nationality", "position"):
+        value = key[name]
+        key[name] = value.lower() if value else None
+    if key["nationality"] is not None:
+        key["nationality"] = NATIONALITY_ALIASES.get(key["nationality"], key["nationality"])
+    if key["position_category"] is not None:
+        key["position_category"] = PositionCategory(key["position_category"]).value
+    if key["sort_by"] not in SORT_COLUMNS:
+        key["sort_by"] = "current_ability"
+    key["sort_descending"] = bool(key["sort_descending"])
+    key["offset"] = max(0, key["offset"] or 0)
+    key["limit"] = max(0, key["limit"] or 0)
+    return tuple(sorted(key.items()))
+
+
 class PlayerSearchTool:
     """Tool for searching players with complex criteria."""
 
-    def __init__(self):
-        """Initialize the search tool with player data."""
-        self.clubs, self.players = load_for_match_engine()
-        self._cache: Dict[str, PlayerSearchResult] = {}
+    def __init__(self, table: Optional[PlayerTable] = None, cache_size: int = 256):
+        """Initialize the search tool with player data.
+
+        Args:
+            table: Player table to search; defaults to the shared loaded dataset
+            cache_size: Number of distinct queries kept in the result cache
+        """
+        if table is None:
+            self.clubs, self.players = load_for_match_engine()
+            table = load_player_table()
+        else:
+            self.clubs, self.players = {}, {row.id: row for row in table.rows()}
+        self.table = table
+        self.cache_size = cache_size
+        self._index: Optional[PlayerIndex] = None
+        self._cache: OrderedDict[tuple, tuple[np.ndarray, int]] = OrderedDict()
+
+    def _current_index(self) -> PlayerIndex:
+        """Indexes for the table, rebuilt (and the cache dropped) after player changes."""
+        if self._index is None or self._index.version != self.table.version:
+            self._index = PlayerIndex(self.table)
+            self._cache.clear()
+        return self._index
 
     def search(self, criteria: PlayerSearchCriteria) -> PlayerSearchResult:
         """
@@ -153,90 +355,21 @@ class PlayerSearchTool:
         Returns:
             PlayerSearchResult with matching players
         """
-        # Build filter functions
-        filters: List[Callable[[PlayerDataFull], bool]] = []
-
-        # Name filter
-        if criteria.name:
-            name_lower = criteria.name.lower()
-            filters.append(lambda p: name_lower in p.full_name.lower())
-
-        # Nationality filter
-        if criteria.nationality:
-            nat_lower = criteria.nationality.lower()
-            # Handle "English" -> "England" mapping
-            if nat_lower == "english":
-                nat_lower = "england"
-            filters.append(lambda p: nat_lower in p.nationality.lower())
-
-        # Age filters
-        if criteria.min_age is not None:
-            filters.append(lambda p: p.age >= criteria.min_age)
-        if criteria.max_age is not None:
-            filters.append(lambda p: p.age <= criteria.max_age)
-
-        # Position filter (specific)
-        if criteria.position:
-            pos_upper = criteria.position.upper()
-            filters.append(lambda p: pos_upper in p.position.upper())
-
-        # Position category filter (broad)
-        if criteria.position_category:
-            valid_positions = POSITION_MAPPING[criteria.position_category]
-            filters.append(lambda p: p.position in valid_positions)
-
-        # Current ability filters
-        if criteria.min_current_ability is not None:
-            filters.append(lambda p: p.current_ability >= criteria.min_current_ability)
-        if criteria.max_current_ability is not None:
-            filters.append(lambda p: p.current_ability <= criteria.max_current_ability)
-
-        # Potential ability filters
-        if criteria.min_potential_ability is not None:
-            filters.append(lambda p: p.potential_ability >= criteria.min_potential_ability)
-        if criteria.max_potential_ability is not None:
-            filters.append(lambda p: p.potential_ability <= criteria.max_potential_ability)
-
-        # Market value filters
-        if criteria.min_market_value is not None:
-            filters.append(lambda p: p.market_value >= criteria.min_market_value)
-        if criteria.max_market_value is not None:
-            filters.append(lambda p: p.market_value <= criteria.max_market_value)
-
-        # Weekly wage filters
-        if criteria.min_weekly_wage is not None:
-            filters.append(lambda p: p.weekly_wage >= criteria.min_weekly_wage)
-        if criteria.max_weekly_wage is not None:
-            filters.append(lambda p: p.weekly_wage <= criteria.max_weekly_wage)
-
-        # Club filters
-        if criteria.club_id is not None:
-            filters.append(lambda p: p.club_id == criteria.club_id)
-        if criteria.exclude_club_id is not None:
-            filters.append(lambda p: p.club_id != criteria.exclude_club_id)
-
-        # Apply all filters
-        filtered_players = self.players.values()
-        for filter_fn in filters:
-            filtered_players = [p for p in filtered_players if filter_fn(p)]
-
-        # Sort results
-        sort_key = {
-            "current_ability": lambda p: p.current_ability,
-            "potential_ability": lambda p: p.potential_ability,
-            "market_value": lambda p: p.market_value,
-            "age": lambda p: p.age,
-            "name": lambda p: p.full_name,
-        }.get(criteria.sort_by, lambda p: p.current_ability)
-
-        filtered_players = sorted(filtered_players, key=sort_key, reverse=criteria.sort_descending)
-
-        # Apply pagination
-        total_count = len(filtered_players)
-        paginated_players = filtered_players[criteria.offset : criteria.offset + criteria.limit]
-
+        index = self._current_index()
+        key = normalise_criteria(criteria)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = index.query(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        rows, total_count = cached
         return PlayerSearchResult(
-            players=paginated_players, total_count=total_count, criteria=criteria
+            players=[self.table.row(row) for row in rows.tolist()],
+            total_count=total_count,
+            criteria=criteria,
         )
 
     def parse_position(
@@ -3,7 +3,12 @@
 from fm_manager.core.config import settings, get_settings
 from fm_manager.core.database import (
     Base,
+    STORAGE_PROFILES,
+    StorageProfile,
+    create_database_engine,
     get_engine,
+    get_read_engine,
+    get_read_session_maker,
     get_session_maker,
     get_db_session,
     init_db,
@@ -29,7 +34,12 @@ __all__ = [
     "get_settings",
     # Database
     "Base",
+    "STORAGE_PROFILES",
+    "StorageProfile",
+    "create_database_engine",
     "get_engine",
+    "get_read_engine",
+    "get_read_session_maker",
     "get_session_maker",
     "get_db_session",
     "init_db",
@@ -33,11 +33,32 @@ class Settings(BaseSettings):
         alias="DATABASE_URL",
     )
     database_echo: bool = Field(default=False, alias="DATABASE_ECHO")
+    # SQLite pragma set applied to every connection (see database.STORAGE_PROFILES)
+    database_profile: Literal["default", "balanced", "durable", "bulk"] = Field(
+        default="balanced",
+        alias="DATABASE_PROFILE",
+    )
+    database_pool_size: int = Field(default=5, alias="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=10, alias="DATABASE_MAX_OVERFLOW")
+    # Read-only engine for analytics queries; empty = the main database, opened read-only
+    database_read_url: str = Field(default="", alias="DATABASE_READ_URL")
 
     # Server
     server_host: str = Field(default="0.0.0.0", alias="SERVER_HOST")
     server_port: int = Field(default=8000, alias="SERVER_PORT")
     server_reload: bool = Field(default=False, alias="SERVER_RELOAD")
+    # Match simulation worker processes (0 = one per CPU) and queue bounds
+    simulation_workers: int = Field(default=0, alias="SIMULATION_WORKERS")
+    simulation_queue_size: int = Field(default=64, alias="SIMULATION_QUEUE_SIZE")
+    simulation_queue_per_room: int = Field(default=4, alias="SIMULATION_QUEUE_PER_ROOM")
+    # Multi-worker rooms: shared room directory ("memory" or "sqlite") and
+    # this worker's identity; the URL must be reachable by clients
+    room_backend: Literal["memory", "sqlite"] = Field(default="memory", alias="ROOM_BACKEND")
+    room_backend_path: str = Field(default=str(DATA_DIR / "rooms.db"), alias="ROOM_BACKEND_PATH")
+    worker_id: str = Field(default="", alias="WORKER_ID")
+    worker_url: str = Field(default="", alias="WORKER_URL")
+    # Pause between match result broadcasts in game rooms (seconds)
+    room_result_delay: float = Field(default=0.5, alias="ROOM_RESULT_DELAY")
 
     # LLM Configuration
     llm_provider: Literal["openai", "anthropic", "custom"] = Field(
@@ -1,7 +1,10 @@
 """Database configuration and session management."""
 
-from typing import AsyncGenerator, Optional
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, List, Optional
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -15,23 +18,148 @@ from fm_manager.core.config import settings
 # Base class for all models
 Base = declarative_base()
 
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """SQLite PRAGMAs set on every new connection; None keeps SQLite's default."""
+
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    # Pages if positive, KiB if negative
+    cache_size: Optional[int] = None
+    # Bytes of the database file to memory-map
+    mmap_size: Optional[int] = None
+    temp_store: Optional[str] = None
+    # Milliseconds to wait for a lock held by another connection
+    busy_timeout: Optional[int] = None
+
+    def pragmas(self, read_only: bool = False) -> List[str]:
+        """PRAGMA statements for a connection.
+
+        The journal mode is a property of the database file, so read-only
+        connections leave it to the writer and switch on ``query_only``.
+        """
+        values = {
+            "journal_mode": None if read_only else self.journal_mode,
+            "synchronous": self.synchronous,
+            "cache_size": self.cache_size,
+            "mmap_size": self.mmap_size,
+            "temp_store": self.temp_store,
+            "busy_timeout": self.busy_timeout,
+            "query_only": "ON" if read_only else None,
+        }
+        return [f"PRAGMA {name}={value}" for name, value in values.items() if value is not None]
+
+
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    # aiosqlite defaults: rollback journal, synchronous=FULL, 2 MB cache
+    "default": StorageProfile(),
+    # WAL lets readers run during writes; NORMAL only syncs at checkpoints
+    "balanced": StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64_000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+    # Every commit reaches the disk before it returns
+    "durable": StorageProfile(
+        journal_mode="WAL",
+        synchronous="FULL",
+        cache_size=-64_000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+    # Throwaway simulation databases: a crash may lose recent commits
+    "bulk": StorageProfile(
+        journal_mode="WAL",
+        synchronous="OFF",
+        cache_size=-256_000,
+        mmap_size=1024 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+}
+
 # Global engine instance
 _engine: Optional[AsyncEngine] = None
 _async_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+_read_engine: Optional[AsyncEngine] = None
+_read_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def create_database_engine(
+    url: str,
+    profile: str = "balanced",
+    read_only: bool = False,
+    echo: bool = False,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+) -> AsyncEngine:
+    """Create an async engine, applying the storage profile to SQLite connections."""
+    if profile not in STORAGE_PROFILES:
+        raise ValueError(f"Unknown storage profile: {profile}")
+
+    parsed = make_url(url)
+    is_sqlite = parsed.get_backend_name() == "sqlite"
+    # In-memory SQLite uses a single static connection, which has no pool to size
+    in_memory = is_sqlite and parsed.database in (None, "", ":memory:")
+    options = {}
+    if not in_memory:
+        if pool_size is not None:
+            options["pool_size"] = pool_size
+        if max_overflow is not None:
+            options["max_overflow"] = max_overflow
+
+    engine = create_async_engine(url, echo=echo, future=True, **options)
+    if is_sqlite:
+        statements = STORAGE_PROFILES[profile].pragmas(read_only)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_profile(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.close()
+
+    return engine
 
 
 def get_engine() -> AsyncEngine:
     """Get or create the async database engine."""
     global _engine
     if _engine is None:
-        _engine = create_async_engine(
+        _engine = create_database_engine(
             settings.database_url,
+            profile=settings.database_profile,
             echo=settings.database_echo,
-            future=True,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
         )
     return _engine
 
 
+def get_read_engine() -> AsyncEngine:
+    """Get or create the read-only engine for analytics queries.
+
+    Under a WAL profile its queries run alongside the simulation's writes
+    instead of queueing behind them.
+    """
+    global _read_engine
+    if _read_engine is None:
+        _read_engine = create_database_engine(
+            settings.database_read_url or settings.database_url,
+            profile=settings.database_profile,
+            read_only=True,
+            echo=settings.database_echo,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+        )
+    return _read_engine
+
+
 def get_session_maker() -> async_sessionmaker[AsyncSession]:
     """Get or create the async session maker."""
     global _async_session_maker
@@ -45,6 +173,19 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
     return _async_session_maker
 
 
+def get_read_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Get or create the session maker for read-only analytics sessions."""
+    global _read_session_maker
+    if _read_session_maker is None:
+        _read_session_maker = async_sessionmaker(
+            get_read_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    return _read_session_maker
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions."""
     session_maker = get_session_maker()
@@ -68,7 +209,12 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine
+    global _engine, _async_session_maker, _read_engine, _read_session_maker
+    if _read_engine is not None:
+        await _read_engine.dispose()
+        _read_engine = None
+        _read_session_maker = None
     if _engine is not None:
         await _engine.dispose()
         _engine = None
+        _async_session_maker = None
@@ -10,6 +10,7 @@ from datetime import datetime, date
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from fm_manager.core.save_catalog import SaveCatalog
 from fm_manager.engine.calendar import Calendar, create_league_calendar, Match
 
 
@@ -46,6 +47,9 @@ class SaveLoadManager:
             save_dir = Path.home() / ".fm_manager" / "saves"
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = SaveCatalog(
+            self.save_dir, "*.json", self._read_catalog_entry, index_name=".json.index"
+        )
 
     def save_game(
         self,
@@ -97,30 +101,31 @@ class SaveLoadManager:
         return self._deserialize_calendar(game_state.calendar_data)
 
     def list_saves(self) -> list[Dict[str, Any]]:
-        """List all available save files with metadata."""
-        saves = []
-
-        for save_path in sorted(
-            self.save_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
-        ):
-            try:
-                with open(save_path, "r") as f:
-                    data = json.load(f)
-
-                saves.append(
-                    {
-                        "name": save_path.stem,
-                        "club": data.get("club_name", "Unknown"),
-                        "league": data.get("league_name", "Unknown"),
-                        "week": data.get("current_week", 1),
-                        "date": data.get("saved_at", "Unknown"),
-                        "path": str(save_path),
-                    }
-                )
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-        return saves
+        """List all available save files with metadata.
+
+        Summaries come from the save catalog; only new or modified files
+        are parsed.
+        """
+        entries = sorted(self.catalog.scan(), key=lambda e: e.mtime_ns, reverse=True)
+        return [
+            {"name": entry.path.stem, **entry.data, "path": str(entry.path)} for entry in entries
+        ]
+
+    def _read_catalog_entry(self, save_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(save_path, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        return {
+            "club": data.get("club_name", "Unknown"),
+            "league": data.get("league_name", "Unknown"),
+            "week": data.get("current_week", 1),
+            "date": data.get("saved_at", "Unknown"),
+        }
 
     def delete_save(self, save_name: str) -> bool:
         """Delete a save file."""
@@ -3,7 +3,7 @@
 from fm_manager.core.models.player import Player, Position, WorkRate, Foot
 from fm_manager.core.models.club import Club, ClubReputation
 from fm_manager.core.models.league import League, LeagueFormat, Season
-from fm_manager.core.models.match import Match, MatchStatus, MatchEventType
+from fm_manager.core.models.match import Match, MatchEvent, MatchStatus, MatchEventType
 from fm_manager.core.models.transfer import Transfer, TransferStatus, TransferWindow
 from fm_manager.core.models.cup_competition import (
     CupCompetition,
@@ -33,6 +33,7 @@ __all__ = [
     "Season",
     # Match
     "Match",
+    "MatchEvent",
     "MatchStatus",
     "MatchEventType",
     # Transfer
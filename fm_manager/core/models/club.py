@@ -4,7 +4,7 @@ from datetime import date
 from enum import Enum as PyEnum
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, Text, Date, Float, Enum
+from sqlalchemy import ForeignKey, Integer, String, Text, Date, Float, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fm_manager.core.database import Base
@@ -28,6 +28,9 @@ class Club(Base):
     """Club entity representing a football club."""
     
     __tablename__ = "clubs"
+    __table_args__ = (
+        Index("ix_clubs_league_id", "league_id"),
+    )
     
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
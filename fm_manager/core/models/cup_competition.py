@@ -8,7 +8,7 @@ from datetime import date
 from enum import Enum as PyEnum
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Date, ForeignKey, Text, Enum, Boolean, Float
+from sqlalchemy import Integer, String, Date, ForeignKey, Text, Enum, Boolean, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fm_manager.core.database import Base
@@ -180,6 +180,9 @@ class CupRound(Base):
     """
 
     __tablename__ = "cup_rounds"
+    __table_args__ = (
+        Index("ix_cup_rounds_edition_id", "edition_id"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -222,6 +225,11 @@ class CupParticipant(Base):
     """A club participating in a cup edition."""
 
     __tablename__ = "cup_participants"
+    __table_args__ = (
+        Index("ix_cup_participants_edition_id_is_active", "edition_id", "is_active"),
+        # Group tables
+        Index("ix_cup_participants_edition_id_group_name", "edition_id", "group_name"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -288,6 +296,9 @@ class CupMatch(Base):
     """
 
     __tablename__ = "cup_matches"
+    __table_args__ = (
+        Index("ix_cup_matches_round_id", "round_id"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -5,7 +5,7 @@ from enum import Enum as PyEnum
 from typing import Optional, List, TYPE_CHECKING
 
 from sqlalchemy import (
-    Integer, String, Date, DateTime, ForeignKey, Text, Enum, Boolean
+    Integer, String, Date, DateTime, ForeignKey, Text, Enum, Boolean, Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,6 +42,13 @@ class Match(Base):
     """Match entity representing a football match."""
     
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_season_id_matchday", "season_id", "matchday"),
+        # A club's fixtures, newest first
+        Index("ix_matches_home_club_id_match_date", "home_club_id", "match_date"),
+        Index("ix_matches_away_club_id_match_date", "away_club_id", "match_date"),
+        Index("ix_matches_match_date", "match_date"),
+    )
     
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -89,7 +96,7 @@ class Match(Base):
     away_yellow_cards: Mapped[int] = mapped_column(Integer, default=0)
     away_red_cards: Mapped[int] = mapped_column(Integer, default=0)
     
-    # Events stored as JSON string
+    # Legacy free-form event log; simulated events go to match_events
     events: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Lineups stored as JSON string
@@ -145,3 +152,31 @@ class Match(Base):
             f"{self.away_club.short_name if hasattr(self, 'away_club') else '?'}, "
             f"status={self.status.value})>"
         )
+
+
+class MatchEvent(Base):
+    """One event of a played match, as recorded by the match engine."""
+
+    __tablename__ = "match_events"
+    __table_args__ = (
+        # Per-player stats such as top scorers filter by type, then group by player
+        Index("ix_match_events_type_player", "event_type", "player"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    match_id: Mapped[int] = mapped_column(
+        ForeignKey("matches.id", ondelete="CASCADE"), index=True
+    )
+
+    minute: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Engine event type name, e.g. "GOAL_HOME"
+    event_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    team: Mapped[str] = mapped_column(String(10), nullable=False)
+    player: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    player2: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<MatchEvent(match_id={self.match_id}, minute={self.minute}, "
+            f"type={self.event_type}, player={self.player})>"
+        )
@@ -4,7 +4,7 @@ from datetime import date
 from enum import Enum as PyEnum
 from typing import Optional, Dict
 
-from sqlalchemy import ForeignKey, Integer, String, Float, Date, Text, Enum
+from sqlalchemy import ForeignKey, Integer, String, Float, Date, Text, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -51,6 +51,10 @@ class Player(Base):
     """Player entity representing a football player."""
     
     __tablename__ = "players"
+    __table_args__ = (
+        # Squads are loaded per club, best players first
+        Index("ix_players_club_id_ability", "club_id", "current_ability"),
+    )
     
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
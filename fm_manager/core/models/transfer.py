@@ -4,7 +4,7 @@ from datetime import datetime, date
 from enum import Enum as PyEnum
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Date, DateTime, ForeignKey, Text, Enum, Boolean
+from sqlalchemy import Integer, String, Date, DateTime, ForeignKey, Text, Enum, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fm_manager.core.database import Base
@@ -29,6 +29,10 @@ class Transfer(Base):
     """Transfer entity representing a transfer offer/deal."""
     
     __tablename__ = "transfers"
+    __table_args__ = (
+        Index("ix_transfers_player_id", "player_id"),
+        Index("ix_transfers_offered_at", "offered_at"),
+    )
     
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -0,0 +1,141 @@
+"""Query-plan audit for the game's hot queries.
+
+Runs ``EXPLAIN QUERY PLAN`` for the queries the simulation and save code
+issue most often and flags any that fall back to a full table scan, which
+usually means a missing or unusable index. Audits an empty schema in
+memory by default, or an existing database opened read-only:
+
+    python -m fm_manager.core.query_audit [--database-url URL]
+
+Exits with status 1 when a full scan is found.
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import Select
+
+from fm_manager.core.database import Base, create_database_engine
+from fm_manager.core.models import (
+    Club,
+    CupMatch,
+    CupParticipant,
+    CupRound,
+    Match,
+    MatchEvent,
+    Player,
+    Transfer,
+)
+
+# "SCAN players" (SQLite >= 3.36) or "SCAN TABLE players"; index scans name the index
+FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+
+IN_MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+
+
+def hot_queries() -> Dict[str, Select]:
+    """Representative statements for the hot query paths, by name."""
+    league_club_ids = select(Club.id).where(Club.league_id.in_([1]))
+    return {
+        "club_squad": select(Player)
+        .where(Player.club_id == 1)
+        .order_by(Player.current_ability.desc()),
+        "league_clubs": select(Club).where(Club.league_id == 1),
+        "season_squads": select(Player)
+        .where(Player.club_id.in_(league_club_ids))
+        .order_by(Player.current_ability.desc(), Player.id),
+        "matchday_fixtures": select(Match).where(Match.season_id == 1, Match.matchday == 1),
+        "recent_matches": select(Match).order_by(Match.match_date.desc()).limit(200),
+        "club_matches": select(Match)
+        .where(or_(Match.home_club_id == 1, Match.away_club_id == 1))
+        .order_by(Match.match_date.desc()),
+        "club_home_goals": select(func.sum(Match.home_score)).where(Match.home_club_id == 1),
+        "club_away_goals": select(func.sum(Match.away_score)).where(Match.away_club_id == 1),
+        "recent_transfers": select(Transfer).order_by(Transfer.offered_at.desc()).limit(100),
+        "player_transfers": select(Transfer).where(Transfer.player_id == 1),
+        "edition_rounds": select(CupRound).where(CupRound.edition_id == 1),
+        "round_matches": select(CupMatch).where(CupMatch.round_id == 1),
+        "active_participants": select(CupParticipant).where(
+            CupParticipant.edition_id == 1, CupParticipant.is_active.is_(True)
+        ),
+        "group_table": select(CupParticipant)
+        .where(CupParticipant.edition_id == 1, CupParticipant.group_name == "A")
+        .order_by(CupParticipant.group_points.desc()),
+        "match_events": select(MatchEvent)
+        .where(MatchEvent.match_id == 1)
+        .order_by(MatchEvent.minute),
+        "top_scorers": select(MatchEvent.player, func.count())
+        .where(MatchEvent.event_type.in_(["GOAL_HOME", "GOAL_AWAY"]))
+        .group_by(MatchEvent.player),
+    }
+
+
+@dataclass
+class PlanReport:
+    """Query plan of one hot query."""
+
+    name: str
+    sql: str
+    plan: List[str] = field(default_factory=list)
+
+    @property
+    def full_scans(self) -> List[str]:
+        """Tables read in full."""
+        return [m.group(1) for m in map(FULL_SCAN.match, self.plan) if m]
+
+    @property
+    def ok(self) -> bool:
+        return not self.full_scans
+
+
+async def explain(conn: AsyncConnection, name: str, statement: Select) -> PlanReport:
+    """``EXPLAIN QUERY PLAN`` for a statement on a SQLite connection."""
+    sql = str(statement.compile(conn.engine, compile_kwargs={"literal_binds": True}))
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+    # Rows are (id, parent, notused, detail)
+    return PlanReport(name, sql, [row[3] for row in result])
+
+
+async def audit(database_url: str = IN_MEMORY_URL) -> List[PlanReport]:
+    """Plans of all hot queries.
+
+    The schema is only created for the in-memory default; any other
+    database is audited as it is, on a read-only connection.
+    """
+    in_memory = database_url == IN_MEMORY_URL
+    engine = create_database_engine(database_url, profile="default", read_only=not in_memory)
+    try:
+        async with engine.connect() as conn:
+            if in_memory:
+                await conn.run_sync(Base.metadata.create_all)
+            return [
+                await explain(conn, name, statement) for name, statement in hot_queries().items()
+            ]
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Flag hot queries that scan whole tables")
+    parser.add_argument("--database-url", default=IN_MEMORY_URL)
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    reports = asyncio.run(audit(args.database_url))
+    for report in reports:
+        status = "ok" if report.ok else "FULL SCAN: " + ", ".join(report.full_scans)
+        print(f"{report.name:<22} {status}")
+        if args.verbose or not report.ok:
+            for line in report.plan:
+                print(f"    {line}")
+    sys.exit(0 if all(r.ok for r in reports) else 1)
+
+
+if __name__ == "__main__":
+    main()
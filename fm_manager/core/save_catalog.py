@@ -0,0 +1,116 @@
+"""Cached catalog of the save files in a directory.
+
+Listing saves should not mean opening every save. The catalog keeps each
+file's summary (its metadata) in a small sidecar index, keyed by file name
+and validated against the file's size and modification time, so a listing
+is one directory scan plus a read of only the files that changed since the
+last one.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+INDEX_VERSION = 1
+
+
+@dataclass
+class CatalogEntry:
+    """Cached summary of one save file."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    data: Dict[str, Any]
+
+
+class SaveCatalog:
+    """Save summaries for the files matching ``pattern`` in ``save_dir``.
+
+    ``read_entry`` builds the summary of a file that is new or has changed;
+    it returns None for files that cannot be read, which are then skipped
+    until they change again.
+    """
+
+    def __init__(
+        self,
+        save_dir: Path,
+        pattern: str,
+        read_entry: Callable[[Path], Optional[Dict[str, Any]]],
+        index_name: str = ".catalog.index",
+    ):
+        self.save_dir = Path(save_dir)
+        self.pattern = pattern
+        self.read_entry = read_entry
+        self.index_path = self.save_dir / index_name
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            return {}
+        return index.get("entries", {})
+
+    def _save_index(self) -> None:
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "entries": self._entries}, f, default=str)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # The index is only a cache; the next scan rebuilds what is missing
+            tmp_path.unlink(missing_ok=True)
+
+    def scan(self) -> List[CatalogEntry]:
+        """Entries for the save files currently in the directory."""
+        if self._entries is None:
+            self._entries = self._load_index()
+
+        entries: List[CatalogEntry] = []
+        seen = set()
+        changed = False
+        try:
+            dir_entries = list(os.scandir(self.save_dir))
+        except FileNotFoundError:
+            dir_entries = []
+
+        for dir_entry in dir_entries:
+            if not dir_entry.is_file() or not fnmatch(dir_entry.name, self.pattern):
+                continue
+            try:
+                stat = dir_entry.stat()
+            except FileNotFoundError:
+                continue
+            seen.add(dir_entry.name)
+
+            cached = self._entries.get(dir_entry.name)
+            stamp = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            if cached is None or any(cached[key] != value for key, value in stamp.items()):
+                cached = {**stamp, "data": self.read_entry(Path(dir_entry.path))}
+                self._entries[dir_entry.name] = cached
+                changed = True
+
+            if cached["data"] is not None:
+                entries.append(
+                    CatalogEntry(
+                        path=Path(dir_entry.path),
+                        mtime_ns=cached["mtime_ns"],
+                        size=cached["size"],
+                        data=cached["data"],
+                    )
+                )
+
+        for name in set(self._entries) - seen:
+            del self._entries[name]
+            changed = True
+
+        if changed:
+            self._save_index()
+        return entries
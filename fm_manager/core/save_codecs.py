@@ -0,0 +1,188 @@
+"""Record codecs for streamed save files.
+
+The header of a save file is always one JSON line, so any reader can tell
+which codec wrote the records that follow. Text codecs write one JSON
+document per line; binary codecs write length-prefixed frames. Either way
+a record's frame is what the save checksum covers.
+
+``orjson`` and ``msgpack`` are optional; the stdlib ``json`` codec is
+always available and is what saves before version 2.1 were written with.
+"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Date, DateTime, Table
+from sqlalchemy import Enum as EnumType
+
+# Try to import optional dependencies
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+_FRAME_LENGTH = struct.Struct(">I")
+
+
+def encode_value(value: Any) -> Any:
+    """Saved form of a value the codecs have no native encoding for."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat()
+
+
+_column_encoders: Dict[Table, List[Tuple[str, Optional[Callable[[Any], Any]]]]] = {}
+
+
+def column_encoders(table: Table) -> List[Tuple[str, Optional[Callable[[Any], Any]]]]:
+    """``(column name, encoder)`` pairs giving the saved form of a row's values.
+
+    Enum columns save their value and date columns their ISO format; the
+    encoder is None for values saved as they are. Chosen once per table
+    from the column types instead of per value.
+    """
+    encoders = _column_encoders.get(table)
+    if encoders is None:
+        encoders = []
+        for column in table.columns:
+            encoder = None
+            if isinstance(column.type, EnumType) and column.type.enum_class is not None:
+                encoder = _enum_value
+            elif isinstance(column.type, (Date, DateTime)):
+                encoder = _isoformat
+            encoders.append((column.name, encoder))
+        _column_encoders[table] = encoders
+    return encoders
+
+
+class SaveCodec(ABC):
+    """Encodes and decodes the records of a save file."""
+
+    name = ""
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """One record as a frame."""
+
+    def iter_frames(self, f: IO[bytes]) -> Iterator[Tuple[bytes, Any]]:
+        """``(frame, record)`` pairs read from the current position of ``f``."""
+        try:
+            yield from self._iter_frames(f)
+        except ValueError as e:
+            raise ValueError("Save file is corrupted (unreadable record)") from e
+
+    @abstractmethod
+    def _iter_frames(self, f: IO[bytes]) -> Iterator[Tuple[bytes, Any]]:
+        """``(frame, record)`` pairs; raise ``ValueError`` on unreadable data."""
+
+
+class JsonCodec(SaveCodec):
+    """Newline-delimited JSON through the standard library."""
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=encode_value).encode() + b"\n"
+
+    def _iter_frames(self, f: IO[bytes]) -> Iterator[Tuple[bytes, Any]]:
+        for line in f:
+            yield line, json.loads(line)
+
+
+class OrjsonCodec(SaveCodec):
+    """Newline-delimited JSON through orjson; readable as plain JSON lines."""
+
+    name = "orjson"
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=encode_value) + b"\n"
+
+    def _iter_frames(self, f: IO[bytes]) -> Iterator[Tuple[bytes, Any]]:
+        for line in f:
+            yield line, orjson.loads(line)
+
+
+class MsgpackCodec(SaveCodec):
+    """MessagePack records, each prefixed with its length as a 4-byte integer."""
+
+    name = "msgpack"
+
+    def encode(self, obj: Any) -> bytes:
+        payload = msgpack.packb(obj, default=encode_value, use_bin_type=True)
+        return _FRAME_LENGTH.pack(len(payload)) + payload
+
+    def _iter_frames(self, f: IO[bytes]) -> Iterator[Tuple[bytes, Any]]:
+        while prefix := f.read(_FRAME_LENGTH.size):
+            if len(prefix) < _FRAME_LENGTH.size:
+                raise ValueError("Save file is corrupted (truncated record)")
+            (length,) = _FRAME_LENGTH.unpack(prefix)
+            payload = f.read(length)
+            if len(payload) < length:
+                raise ValueError("Save file is corrupted (truncated record)")
+            yield prefix + payload, msgpack.unpackb(payload, raw=False)
+
+
+SAVE_CODECS: Dict[str, SaveCodec] = {
+    codec.name: codec for codec in (JsonCodec(), OrjsonCodec(), MsgpackCodec())
+}
+_REQUIREMENTS = {"orjson": HAS_ORJSON, "msgpack": HAS_MSGPACK}
+# Codecs whose frames another codec can read when their package is missing
+_READ_FALLBACKS = {"orjson": "json"}
+
+
+def codec_available(name: str) -> bool:
+    return name in SAVE_CODECS and _REQUIREMENTS.get(name, True)
+
+
+def get_codec(name: str) -> SaveCodec:
+    """The codec registered under ``name``."""
+    if name not in SAVE_CODECS:
+        raise ValueError(f"Unknown save codec: {name}")
+    if not codec_available(name):
+        raise ImportError(f"{name} package not installed. Run: pip install {name}")
+    return SAVE_CODECS[name]
+
+
+def get_reading_codec(name: str) -> SaveCodec:
+    """Codec to read records written by the codec ``name``.
+
+    orjson frames are plain JSON lines, so they are read with the standard
+    library when orjson is not installed.
+    """
+    if not codec_available(name) and name in _READ_FALLBACKS:
+        name = _READ_FALLBACKS[name]
+    return get_codec(name)
+
+
+def default_codec_name() -> str:
+    """Codec for new saves: orjson, then msgpack, whichever is installed first.
+
+    ``scripts/benchmark_save_codecs.py`` compares them on a generated world.
+    """
+    for name in ("orjson", "msgpack"):
+        if codec_available(name):
+            return name
+    return "json"
@@ -0,0 +1,145 @@
+"""Change tracking for incremental (delta) saves.
+
+A delta save stores only the rows that changed since the previous save in
+its chain, so frequent autosaves stay small. ``ChangeTracker`` collects
+those rows from SQLAlchemy's unit of work: every flush reports the new,
+modified and deleted objects of the saved tables. Bulk ORM statements
+(``session.execute(insert(Model), rows)`` and friends) do not pass
+through the unit of work, so a table they touch is saved in full by the
+next delta instead.
+
+Changes are held per session until its transaction commits and dropped
+when it rolls back, so a rolled back delete never reaches a delta.
+
+Changes made with Core statements on a raw connection are not seen; take
+a full save after such changes.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+
+@dataclass
+class ChangeSet:
+    """Rows changed since the last save, by table name."""
+
+    upserted: Dict[str, Set[Any]] = field(default_factory=dict)
+    deleted: Dict[str, Set[Any]] = field(default_factory=dict)
+    # Tables changed by bulk statements, saved in full
+    replaced: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.upserted or self.deleted or self.replaced)
+
+    def merge(self, other: "ChangeSet") -> None:
+        """Add the changes of a later change set."""
+        for table, ids in other.upserted.items():
+            self.upserted.setdefault(table, set()).update(ids)
+            self.deleted.get(table, set()).difference_update(ids)
+        for table, ids in other.deleted.items():
+            self.deleted.setdefault(table, set()).update(ids)
+            self.upserted.get(table, set()).difference_update(ids)
+        self.replaced |= other.replaced
+
+
+class ChangeTracker:
+    """Collects changes to the given tables from every ORM session.
+
+    Listens on the ``Session`` class, which also covers the sessions
+    behind ``AsyncSession``, between ``start()`` and ``stop()``. Changes
+    count once their session commits.
+    """
+
+    def __init__(self, tables: Iterable[str]):
+        self.tables = set(tables)
+        self.active = False
+        self._changes = ChangeSet()
+        # Flushed but uncommitted changes, by session
+        self._pending: "weakref.WeakKeyDictionary[Session, ChangeSet]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if not self.active:
+            for name, listener in self._listeners():
+                event.listen(Session, name, listener)
+            self.active = True
+
+    def stop(self) -> None:
+        if self.active:
+            for name, listener in self._listeners():
+                event.remove(Session, name, listener)
+            self._pending.clear()
+            self.active = False
+
+    def _listeners(self):
+        return [
+            ("after_flush", self._after_flush),
+            ("do_orm_execute", self._do_orm_execute),
+            ("after_commit", self._after_commit),
+            ("after_soft_rollback", self._after_soft_rollback),
+        ]
+
+    def take(self, session: Optional[Session] = None) -> ChangeSet:
+        """Committed changes since the last call, clearing the tracker.
+
+        With ``session``, its uncommitted changes are taken too, since a
+        save made through it sees them.
+        """
+        with self._lock:
+            changes, self._changes = self._changes, ChangeSet()
+            if session is not None and session in self._pending:
+                changes.merge(self._pending.pop(session))
+        return changes
+
+    def restore(self, changes: ChangeSet) -> None:
+        """Put back changes taken for a save that failed."""
+        with self._lock:
+            changes.merge(self._changes)
+            self._changes = changes
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        # The session still lists the objects of the flush that just ran
+        flushed = ChangeSet()
+        for objects, target in (
+            (session.new, flushed.upserted),
+            (session.dirty, flushed.upserted),
+            (session.deleted, flushed.deleted),
+        ):
+            for obj in objects:
+                table = getattr(obj, "__table__", None)
+                if table is not None and table.name in self.tables:
+                    target.setdefault(table.name, set()).add(obj.id)
+        if flushed:
+            self._record(session, flushed)
+
+    def _do_orm_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if orm_execute_state.is_select:
+            return
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and table.name in self.tables:
+            self._record(orm_execute_state.session, ChangeSet(replaced={table.name}))
+
+    def _record(self, session: Session, changes: ChangeSet) -> None:
+        with self._lock:
+            self._pending.setdefault(session, ChangeSet()).merge(changes)
+
+    def _after_commit(self, session: Session) -> None:
+        # Also fires when a savepoint is released, which commits nothing yet
+        if session.in_nested_transaction():
+            return
+        with self._lock:
+            changes = self._pending.pop(session, None)
+            if changes:
+                self._changes.merge(changes)
+
+    def _after_soft_rollback(self, session: Session, previous_transaction) -> None:
+        # A rolled back savepoint keeps the changes of its whole transaction;
+        # deltas check that deleted rows are really gone
+        if previous_transaction.parent is None:
+            with self._lock:
+                self._pending.pop(session, None)
@@ -1,10 +1,10 @@
 """Enhanced Save/Load System for FM Manager.
 
 Features:
-- Compressed save files (gzip)
-- JSON-based serialization
+- Compressed save files (gzip), streamed in bounded memory
+- Newline-delimited JSON or binary records with an incremental checksum
 - Version control for save compatibility
-- Auto-save functionality
+- Auto-save functionality, written as incremental (delta) saves
 - Save file metadata and thumbnails
 - Cloud save support (optional)
 """
@@ -12,10 +12,11 @@ Features:
 import gzip
 import json
 import hashlib
+import os
 import shutil
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple, Callable
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
@@ -26,6 +27,16 @@ from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fm_manager.core.database import get_db_session
+from fm_manager.core.save_catalog import SaveCatalog
+from fm_manager.core.save_codecs import (
+    SaveCodec,
+    column_encoders,
+    default_codec_name,
+    get_codec,
+    get_reading_codec,
+)
+from fm_manager.core.save_delta import ChangeSet, ChangeTracker
+from fm_manager.core.save_restore import BulkRestorer, RestoreReport
 from fm_manager.core.models import (
     Player,
     Club,
@@ -47,7 +58,9 @@ class SaveVersion(Enum):
     V1_0 = "1.0"  # Initial version
     V1_1 = "1.1"  # Added cup competitions
     V1_2 = "1.2"  # Added player development tracking
-    CURRENT = V1_2
+    V2_0 = "2.0"  # Streamed newline-delimited records
+    V2_1 = "2.1"  # Pluggable record codecs, named in the header
+    CURRENT = V2_1
 
 
 @dataclass
@@ -167,18 +180,151 @@ class GameState:
         return state
 
 
+# Marks the header line of a streamed save file
+SAVE_FORMAT = "fmsave-ndjson"
+# Codec of streamed saves whose header names none (version 2.0)
+LEGACY_RECORD_CODEC = "json"
+
+
+# Record marking a row deleted since the parent of a delta save
+DELETE_RECORD = "$delete"
+
+
+def encode_save_line(obj: Any) -> bytes:
+    """One compact JSON line of a streamed save file, as used for the header."""
+    return json.dumps(obj, separators=(",", ":"), default=str).encode() + b"\n"
+
+
+class SaveWriter:
+    """Streams a save file as gzip-compressed records.
+
+    The first line is a JSON header holding the metadata and the name of
+    the record codec, followed by one ``[table, row]`` record per row and
+    a trailer with the SHA-256 of the encoded records, hashed as they are
+    written. The file is written under a temporary name and only replaces
+    an existing save once complete.
+
+    A delta save also has a ``delta`` entry in its header naming the save
+    it applies to, and may contain ``[DELETE_RECORD, {"table", "id"}]``
+    records for rows deleted since then.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        metadata: SaveMetadata,
+        compresslevel: int = 6,
+        delta: Optional[Dict[str, Any]] = None,
+        codec: Optional[SaveCodec] = None,
+    ):
+        self.path = Path(path)
+        self.codec = codec or get_codec(default_codec_name())
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = gzip.open(self._tmp_path, "wb", compresslevel=compresslevel)
+        self._hash = hashlib.sha256()
+        self.records = 0
+        header = {"format": SAVE_FORMAT, "codec": self.codec.name, "metadata": metadata.to_dict()}
+        if delta is not None:
+            header["delta"] = delta
+        self._file.write(encode_save_line(header))
+
+    def _write_record(self, obj: Any) -> bytes:
+        frame = self.codec.encode(obj)
+        self._file.write(frame)
+        return frame
+
+    def write(self, table: str, row: Dict[str, Any]) -> None:
+        """Append one record."""
+        self._hash.update(self._write_record([table, row]))
+        self.records += 1
+
+    def delete(self, table: str, row_id: Any) -> None:
+        """Append a deletion record (delta saves only)."""
+        self.write(DELETE_RECORD, {"table": table, "id": row_id})
+
+    def close(self) -> str:
+        """Write the checksum trailer and move the file into place."""
+        checksum = self._hash.hexdigest()
+        self._write_record({"checksum": checksum})
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        return checksum
+
+    def abort(self) -> None:
+        """Discard a partly written file."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "SaveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def read_save_header(save_path: Path) -> Optional[Dict[str, Any]]:
+    """Header of a streamed save file, or None for a legacy single-document save."""
+    with gzip.open(save_path, "rb") as f:
+        first_line = f.readline()
+    try:
+        header = json.loads(first_line)
+    except ValueError:
+        # Legacy saves are one indented JSON document starting with "{"
+        return None
+    if isinstance(header, dict) and header.get("format") == SAVE_FORMAT:
+        return header
+    return None
+
+
+def iter_save_records(save_path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Records of a streamed save file, read one line at a time.
+
+    The checksum is verified once the last record has been read; a
+    corrupted or truncated file raises ``ValueError`` at that point.
+    """
+    digest = hashlib.sha256()
+    with gzip.open(save_path, "rb") as f:
+        header = json.loads(f.readline())
+        codec = get_reading_codec(header.get("codec", LEGACY_RECORD_CODEC))
+        for frame, record in codec.iter_frames(f):
+            if isinstance(record, dict):
+                if record.get("checksum") != digest.hexdigest():
+                    raise ValueError("Save file is corrupted (checksum mismatch)")
+                return
+            digest.update(frame)
+            yield record[0], record[1]
+    raise ValueError("Save file is corrupted (missing checksum)")
+
+
 class EnhancedSaveLoadManager:
     """Enhanced save/load manager with compression and auto-save."""
 
     SAVE_EXTENSION = ".fmsave"  # FM Manager Save
     AUTO_SAVE_PREFIX = "autosave_"
     MAX_AUTO_SAVES = 5
-
-    def __init__(self, save_dir: Optional[Path] = None):
+    # Rows fetched per round trip while streaming a save
+    SAVE_CHUNK_SIZE = 500
+    # Delta auto-saves written before the next full snapshot
+    AUTO_SAVE_COMPACT_EVERY = 10
+    # Tables of which only the newest rows are saved (see _state_queries)
+    WINDOWED_TABLES = ("matches", "transfers")
+
+    def __init__(self, save_dir: Optional[Path] = None, codec: Optional[str] = None):
         if save_dir is None:
             save_dir = Path.home() / ".fm_manager" / "saves"
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
+        # Record codec of new saves; saves load whichever codec wrote them
+        self.codec = get_codec(codec or default_codec_name())
+        self.catalog = SaveCatalog(
+            self.save_dir,
+            f"*{self.SAVE_EXTENSION}",
+            self._read_catalog_entry,
+            index_name=f"{self.SAVE_EXTENSION}.index",
+        )
 
         # Auto-save settings
         self.auto_save_enabled = True
@@ -189,11 +335,26 @@ class EnhancedSaveLoadManager:
         # Current game session
         self._session_start_time: Optional[datetime] = None
         self._current_save_name: Optional[str] = None
+        self._session_factory: Optional[Callable[[], Session]] = None
+
+        # Incremental saves: changes since the newest save of the chain
+        self.change_tracker = ChangeTracker(table for table, _ in self._state_queries())
+        self._chain_head: Optional[Path] = None
+        self._chain_length = 0
 
-    def start_session(self, save_name: Optional[str] = None):
-        """Start a new game session."""
+    def start_session(
+        self,
+        save_name: Optional[str] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        """Start a new game session.
+
+        ``session_factory`` opens the sessions the auto-save thread saves
+        from; without it no auto-saves are written.
+        """
         self._session_start_time = datetime.now()
         self._current_save_name = save_name
+        self._session_factory = session_factory
 
         if self.auto_save_enabled:
             self._start_auto_save()
@@ -203,17 +364,19 @@ class EnhancedSaveLoadManager:
         self._stop_auto_save.set()
         if self._auto_save_thread and self._auto_save_thread.is_alive():
             self._auto_save_thread.join(timeout=5)
+        self.change_tracker.stop()
+        self._chain_head = None
+        self._chain_length = 0
 
     def _start_auto_save(self):
         """Start auto-save background thread."""
 
         def auto_save_worker():
             while not self._stop_auto_save.wait(self.auto_save_interval_minutes * 60):
-                if self._current_save_name:
+                if self._current_save_name and self._session_factory is not None:
                     try:
-                        # Auto-save requires session - disabled for now
-                        # self.create_auto_save(session)
-                        pass
+                        with self._session_factory() as session:
+                            self.create_auto_save(session)
                     except Exception as e:
                         print(f"Auto-save failed: {e}")
 
@@ -221,49 +384,69 @@ class EnhancedSaveLoadManager:
         self._auto_save_thread = threading.Thread(target=auto_save_worker, daemon=True)
         self._auto_save_thread.start()
 
-    def create_auto_save(self, session: Session) -> str:
-        """Create an auto-save."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def create_auto_save(self, session: Session, **save_options) -> str:
+        """Create an auto-save.
+
+        Auto-saves are deltas on the previous save of the session, with a
+        full snapshot every ``AUTO_SAVE_COMPACT_EVERY`` saves so that the
+        chain a load has to replay stays short.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         save_name = f"{self.AUTO_SAVE_PREFIX}{timestamp}"
 
+        if self._chain_length < self.AUTO_SAVE_COMPACT_EVERY:
+            path = self.save_delta(session, save_name, **save_options)
+        else:
+            path = self.save_game(session, save_name, is_auto_save=True, **save_options)
+
         # Clean up old auto-saves
         self._cleanup_auto_saves()
-
-        return self.save_game(session=session, save_name=save_name, is_auto_save=True)
+        return path
 
     def _cleanup_auto_saves(self):
-        """Remove old auto-saves, keeping only the most recent ones."""
+        """Remove old auto-saves, keeping the most recent ones and the saves they build on."""
         auto_saves = sorted(
             self.save_dir.glob(f"{self.AUTO_SAVE_PREFIX}*{self.SAVE_EXTENSION}"),
             key=lambda p: p.stat().st_mtime,
             reverse=True,
         )
 
+        keep = set()
+        for save_path in auto_saves[: self.MAX_AUTO_SAVES]:
+            keep.update(path for path, _ in self._save_chain(save_path, strict=False))
+
         for old_save in auto_saves[self.MAX_AUTO_SAVES :]:
-            old_save.unlink()
+            if old_save not in keep:
+                old_save.unlink()
 
     def get_save_files(self) -> List[Tuple[SaveMetadata, Path]]:
-        """Get all available save files with metadata."""
-        saves = []
+        """Get all available save files with metadata.
 
-        if not self.save_dir.exists():
-            return saves
-
-        for save_path in self.save_dir.glob(f"*{self.SAVE_EXTENSION}"):
+        Metadata comes from the save catalog; only new or modified files
+        are opened.
+        """
+        saves = []
+        for entry in self.catalog.scan():
             try:
-                metadata = self._read_save_metadata(save_path)
-                if metadata:
-                    saves.append((metadata, save_path))
-            except Exception:
+                saves.append((SaveMetadata.from_dict(entry.data), entry.path))
+            except (KeyError, ValueError):
                 continue
 
         # Sort by save date (newest first)
         saves.sort(key=lambda x: x[0].save_date, reverse=True)
         return saves
 
+    def _read_catalog_entry(self, save_path: Path) -> Optional[Dict[str, Any]]:
+        metadata = self._read_save_metadata(save_path)
+        return metadata.to_dict() if metadata else None
+
     def _read_save_metadata(self, save_path: Path) -> Optional[SaveMetadata]:
         """Read metadata from a save file."""
         try:
+            header = read_save_header(save_path)
+            if header is not None:
+                return SaveMetadata.from_dict(header["metadata"])
+
             with gzip.open(save_path, "rt", encoding="utf-8") as f:
                 data = json.load(f)
 
@@ -282,7 +465,135 @@ class EnhancedSaveLoadManager:
         is_auto_save: bool = False,
     ) -> str:
         """Save current game state to a compressed file."""
-        # Generate metadata
+        metadata = self._build_metadata(
+            session, save_name, current_season, current_week, player_club_id, in_game_date
+        )
+
+        # Stream the game state to the file, one chunk of rows at a time
+        save_path = self.save_dir / f"{save_name}{self.SAVE_EXTENSION}"
+
+        # Changes from here on belong to the deltas on top of this save
+        pending = self._start_chain()
+        try:
+            with SaveWriter(save_path, metadata, codec=self.codec) as writer:
+                for table, query in self._state_queries():
+                    query = query.execution_options(yield_per=self.SAVE_CHUNK_SIZE)
+                    for obj in session.execute(query).scalars():
+                        writer.write(table, self._object_to_dict(obj))
+        except BaseException:
+            self.change_tracker.restore(pending)
+            raise
+
+        self._chain_head = save_path
+        self._chain_length = 0
+        return str(save_path)
+
+    def save_delta(
+        self,
+        session: Session,
+        save_name: str,
+        current_season: int = 1,
+        current_week: int = 1,
+        player_club_id: Optional[int] = None,
+        in_game_date: Optional[date] = None,
+    ) -> str:
+        """Save only the rows changed since the previous save of this session.
+
+        The delta names that save as its parent; loading it replays the
+        chain from the last full save. Falls back to a full save when
+        there is nothing to build on.
+        """
+        save_path = self.save_dir / f"{save_name}{self.SAVE_EXTENSION}"
+        parent = self._chain_head
+        if parent is None or parent == save_path or not parent.exists():
+            return self.save_game(
+                session, save_name, current_season, current_week, player_club_id, in_game_date
+            )
+
+        # Pending changes reach the tracker when they are flushed
+        session.flush()
+        metadata = self._build_metadata(
+            session, save_name, current_season, current_week, player_club_id, in_game_date
+        )
+        changes = self.change_tracker.take(session)
+        self._confirm_deletes(session, changes)
+        # A changed window of recent rows is saved whole, as a full save would
+        changes.replaced.update(
+            table
+            for table in self.WINDOWED_TABLES
+            if table in changes.upserted or table in changes.deleted
+        )
+        delta = {"parent": parent.name, "replaced": sorted(changes.replaced)}
+        try:
+            with SaveWriter(save_path, metadata, delta=delta, codec=self.codec) as writer:
+                for table, row_id in self._deleted_rows(changes):
+                    writer.delete(table, row_id)
+                for table, query in self._delta_queries(changes):
+                    for obj in session.execute(query).scalars():
+                        writer.write(table, self._object_to_dict(obj))
+        except BaseException:
+            self.change_tracker.restore(changes)
+            raise
+
+        self._chain_head = save_path
+        self._chain_length += 1
+        return str(save_path)
+
+    def _start_chain(self) -> ChangeSet:
+        """Start tracking changes for deltas on a new full save.
+
+        Returns the changes tracked so far, which the full save supersedes;
+        they are put back if the save fails.
+        """
+        self.change_tracker.start()
+        return self.change_tracker.take()
+
+    def _confirm_deletes(self, session: Session, changes: ChangeSet) -> None:
+        """Save deleted rows that still exist, e.g. after a rolled back savepoint, as updates."""
+        for table, query in self._state_queries():
+            ids = sorted(changes.deleted.get(table, ()))
+            if not ids or table in changes.replaced:
+                continue
+            model = query.column_descriptions[0]["entity"]
+            for start in range(0, len(ids), self.SAVE_CHUNK_SIZE):
+                chunk = ids[start : start + self.SAVE_CHUNK_SIZE]
+                existing = set(session.scalars(select(model.id).where(model.id.in_(chunk))))
+                changes.deleted[table].difference_update(existing)
+                changes.upserted.setdefault(table, set()).update(existing)
+
+    def _deleted_rows(self, changes: ChangeSet) -> List[Tuple[str, Any]]:
+        """Deletion records of a delta; replaced tables are saved in full instead."""
+        return [
+            (table, row_id)
+            for table, _ in self._state_queries()
+            if table in changes.deleted and table not in changes.replaced
+            for row_id in sorted(changes.deleted[table])
+        ]
+
+    def _delta_queries(self, changes: ChangeSet) -> List[Tuple[str, Any]]:
+        """Queries for the rows a delta saves, in save order."""
+        queries = []
+        for table, query in self._state_queries():
+            if table in changes.replaced:
+                queries.append((table, query.execution_options(yield_per=self.SAVE_CHUNK_SIZE)))
+                continue
+            model = query.column_descriptions[0]["entity"]
+            ids = sorted(changes.upserted.get(table, ()))
+            for start in range(0, len(ids), self.SAVE_CHUNK_SIZE):
+                chunk = ids[start : start + self.SAVE_CHUNK_SIZE]
+                queries.append((table, select(model).where(model.id.in_(chunk))))
+        return queries
+
+    def _build_metadata(
+        self,
+        session: Session,
+        save_name: str,
+        current_season: int,
+        current_week: int,
+        player_club_id: Optional[int],
+        in_game_date: Optional[date],
+    ) -> SaveMetadata:
+        """Metadata for a save of the current game state."""
         player_club_name = None
         if player_club_id:
             club = session.get(Club, player_club_id)
@@ -297,7 +608,7 @@ class EnhancedSaveLoadManager:
         # Get statistics
         stats = self._calculate_statistics(session, player_club_id)
 
-        metadata = SaveMetadata(
+        return SaveMetadata(
             save_name=save_name,
             save_date=datetime.now(),
             version=SaveVersion.CURRENT.value,
@@ -312,28 +623,6 @@ class EnhancedSaveLoadManager:
             league_position=stats.get("league_position"),
         )
 
-        # Capture game state
-        game_state = self._capture_game_state(session)
-
-        # Build save data
-        save_data = {
-            "metadata": metadata.to_dict(),
-            "game_state": game_state.to_dict(),
-            "checksum": "",  # Will be calculated
-        }
-
-        # Calculate checksum for integrity
-        checksum_data = json.dumps(save_data["game_state"], sort_keys=True)
-        save_data["checksum"] = hashlib.sha256(checksum_data.encode()).hexdigest()
-
-        # Save to file with compression
-        save_path = self.save_dir / f"{save_name}{self.SAVE_EXTENSION}"
-
-        with gzip.open(save_path, "wt", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, default=str)
-
-        return str(save_path)
-
     async def save_game_async(
         self,
         session: AsyncSession,
@@ -376,26 +665,22 @@ class EnhancedSaveLoadManager:
             league_position=stats.get("league_position"),
         )
 
-        # Capture game state
-        game_state = await self._capture_game_state_async(session)
-
-        # Build save data
-        save_data = {
-            "metadata": metadata.to_dict(),
-            "game_state": game_state.to_dict(),
-            "checksum": "",  # Will be calculated
-        }
-
-        # Calculate checksum for integrity
-        checksum_data = json.dumps(save_data["game_state"], sort_keys=True)
-        save_data["checksum"] = hashlib.sha256(checksum_data.encode()).hexdigest()
-
-        # Save to file with compression
+        # Stream the game state to the file, one chunk of rows at a time
         save_path = self.save_dir / f"{save_name}{self.SAVE_EXTENSION}"
 
-        with gzip.open(save_path, "wt", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, default=str)
-
+        pending = self._start_chain()
+        try:
+            with SaveWriter(save_path, metadata, codec=self.codec) as writer:
+                for table, query in self._state_queries():
+                    query = query.execution_options(yield_per=self.SAVE_CHUNK_SIZE)
+                    async for obj in await session.stream_scalars(query):
+                        writer.write(table, self._object_to_dict(obj))
+        except BaseException:
+            self.change_tracker.restore(pending)
+            raise
+
+        self._chain_head = save_path
+        self._chain_length = 0
         return str(save_path)
 
     def load_game(self, save_name: str) -> Tuple[SaveMetadata, GameState]:
@@ -405,7 +690,75 @@ class EnhancedSaveLoadManager:
         if not save_path.exists():
             raise FileNotFoundError(f"Save file not found: {save_name}")
 
-        # Read and decompress
+        header = read_save_header(save_path)
+        if header is None:
+            metadata, game_state = self._load_legacy_game(save_path)
+        else:
+            metadata = SaveMetadata.from_dict(header["metadata"])
+            game_state = self._replay_chain(self._save_chain(save_path))
+
+        # Check version compatibility
+        if metadata.version != SaveVersion.CURRENT.value:
+            game_state = self._migrate_save(game_state, metadata.version)
+
+        return metadata, game_state
+
+    def _save_chain(
+        self, save_path: Path, strict: bool = True
+    ) -> List[Tuple[Path, Dict[str, Any]]]:
+        """A save and the saves it builds on, with their headers, newest first.
+
+        A missing parent raises ``FileNotFoundError``, or ends the chain
+        when ``strict`` is False.
+        """
+        chain = []
+        while True:
+            header = read_save_header(save_path) if save_path.exists() else None
+            if header is None:
+                if strict:
+                    raise FileNotFoundError(f"Base save not found: {save_path.stem}")
+                return chain
+            chain.append((save_path, header))
+            if "delta" not in header:
+                return chain
+            save_path = self.save_dir / header["delta"]["parent"]
+
+    def _replay_chain(self, chain: List[Tuple[Path, Dict[str, Any]]]) -> GameState:
+        """Game state of a full save with the deltas on top of it applied in order."""
+        tables: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        for save_path, header in reversed(chain):
+            for table in header.get("delta", {}).get("replaced", []):
+                tables[table] = {}
+            for table, row in iter_save_records(save_path):
+                if table == DELETE_RECORD:
+                    tables.get(row["table"], {}).pop(row["id"], None)
+                else:
+                    # Updated rows keep the position of the original
+                    tables.setdefault(table, {})[row.get("id")] = row
+
+        game_state = GameState()
+        for table, rows in tables.items():
+            target = getattr(game_state, table, None)
+            if isinstance(target, list):
+                target.extend(rows.values())
+        return game_state
+
+    def compact_save(self, save_name: str) -> str:
+        """Rewrite a delta save as a full save, so it no longer needs its parents."""
+        metadata, game_state = self.load_game(save_name)
+        save_path = self.save_dir / f"{save_name}{self.SAVE_EXTENSION}"
+
+        with SaveWriter(save_path, metadata, codec=self.codec) as writer:
+            for table, _ in self._state_queries():
+                for row in getattr(game_state, table):
+                    writer.write(table, row)
+
+        if save_path == self._chain_head:
+            self._chain_length = 0
+        return str(save_path)
+
+    def _load_legacy_game(self, save_path: Path) -> Tuple[SaveMetadata, GameState]:
+        """Load a pre-2.0 save stored as a single JSON document."""
         with gzip.open(save_path, "rt", encoding="utf-8") as f:
             save_data = json.load(f)
 
@@ -422,11 +775,6 @@ class EnhancedSaveLoadManager:
         # Parse data
         metadata = SaveMetadata.from_dict(save_data["metadata"])
         game_state = GameState.from_dict(game_state_data)
-
-        # Check version compatibility
-        if metadata.version != SaveVersion.CURRENT.value:
-            game_state = self._migrate_save(game_state, metadata.version)
-
         return metadata, game_state
 
     def _migrate_save(self, game_state: GameState, from_version: str) -> GameState:
@@ -442,129 +790,39 @@ class EnhancedSaveLoadManager:
 
         return game_state
 
-    def restore_game_state(self, session: Session, game_state: GameState):
-        """Restore game state to database."""
-        # Clear existing data (optional - depends on strategy)
-        # session.execute(text("DELETE FROM cup_matches"))
-        # session.execute(text("DELETE FROM cup_participants"))
-        # ... etc
-
-        # Restore clubs
-        for club_data in game_state.clubs:
-            club = Club(**club_data)
-            session.merge(club)
-
-        # Restore players
-        for player_data in game_state.players:
-            # Convert position string back to enum
-            if player_data.get("position"):
-                from fm_manager.core.models.player import Position
-
-                try:
-                    player_data["position"] = Position(player_data["position"])
-                except ValueError:
-                    player_data["position"] = None
-
-            # Parse dates
-            if player_data.get("birth_date"):
-                player_data["birth_date"] = date.fromisoformat(player_data["birth_date"])
-            if player_data.get("contract_until"):
-                player_data["contract_until"] = date.fromisoformat(player_data["contract_until"])
-
-            player = Player(**player_data)
-            session.merge(player)
-
-        # Restore other entities...
-        # (Similar pattern for leagues, matches, transfers, etc.)
+    def restore_game_state(self, session: Session, game_state: GameState) -> RestoreReport:
+        """Restore game state to database.
 
+        Saved rows replace the rows with the same id; other rows are kept.
+        """
+        report = BulkRestorer(chunk_size=self.SAVE_CHUNK_SIZE).restore(
+            session, game_state.to_dict()
+        )
         session.commit()
+        return report
 
-    async def restore_game_state_async(self, session: AsyncSession, game_state: GameState):
+    async def restore_game_state_async(
+        self, session: AsyncSession, game_state: GameState
+    ) -> RestoreReport:
         """Restore game state to database (async version)."""
-        from fm_manager.core.models.player import Position, Foot
-
-        # Restore clubs - skip if data issues
-        for club_data in game_state.clubs:
-            try:
-                # Handle reputation_level enum if present as string
-                if club_data.get("reputation_level"):
-                    from fm_manager.core.models.club import ClubReputation
-
-                    rep_val = club_data["reputation_level"]
-                    if isinstance(rep_val, str):
-                        try:
-                            club_data["reputation_level"] = ClubReputation[
-                                rep_val.upper().replace(" ", "_")
-                            ]
-                        except KeyError:
-                            club_data["reputation_level"] = ClubReputation.RESPECTABLE
-
-                club = Club(**club_data)
-                await session.merge(club)
-            except Exception as e:
-                # Skip clubs that can't be restored
-                print(f"Warning: Could not restore club {club_data.get('name', 'Unknown')}: {e}")
-                continue
-
-        # Restore players - handle enum conversions carefully
-        for player_data in game_state.players:
-            try:
-                # Convert position string back to enum
-                if player_data.get("position"):
-                    try:
-                        player_data["position"] = Position(player_data["position"])
-                    except ValueError:
-                        player_data["position"] = None
-
-                # Convert preferred_foot string back to enum
-                if player_data.get("preferred_foot"):
-                    foot_val = player_data["preferred_foot"]
-                    if isinstance(foot_val, str):
-                        try:
-                            # Try direct enum creation first
-                            player_data["preferred_foot"] = Foot(foot_val)
-                        except ValueError:
-                            # Try by name (RIGHT, LEFT, BOTH)
-                            try:
-                                player_data["preferred_foot"] = Foot[foot_val.upper()]
-                            except KeyError:
-                                player_data["preferred_foot"] = Foot.RIGHT
-
-                # Convert secondary_position string back to enum
-                if player_data.get("secondary_position"):
-                    try:
-                        player_data["secondary_position"] = Position(
-                            player_data["secondary_position"]
-                        )
-                    except ValueError:
-                        player_data["secondary_position"] = None
-
-                # Parse dates
-                if player_data.get("birth_date"):
-                    player_data["birth_date"] = date.fromisoformat(player_data["birth_date"])
-                if player_data.get("contract_until"):
-                    player_data["contract_until"] = date.fromisoformat(
-                        player_data["contract_until"]
-                    )
-
-                player = Player(**player_data)
-                await session.merge(player)
-            except Exception as e:
-                # Skip players that can't be restored
-                player_name = (
-                    player_data.get("first_name", "") + " " + player_data.get("last_name", "")
-                )
-                print(f"Warning: Could not restore player {player_name.strip() or 'Unknown'}: {e}")
-                continue
-
+        restorer = BulkRestorer(chunk_size=self.SAVE_CHUNK_SIZE)
+        report = await session.run_sync(restorer.restore, game_state.to_dict())
         await session.commit()
+        return report
 
     def delete_save(self, save_name: str) -> bool:
-        """Delete a save file."""
+        """Delete a save file.
+
+        Delta saves built on it are compacted first, so they still load.
+        """
         save_path = self.save_dir / f"{save_name}{self.SAVE_EXTENSION}"
 
         if save_path.exists():
+            for child in self._dependent_saves(save_path):
+                self.compact_save(child.stem)
             save_path.unlink()
+            if save_path == self._chain_head:
+                self._chain_head = None
             return True
         return False
 
@@ -579,19 +837,28 @@ class EnhancedSaveLoadManager:
         if new_path.exists():
             raise FileExistsError(f"Save file already exists: {new_name}")
 
-        # Read, update metadata, and write with new name
-        with gzip.open(old_path, "rt", encoding="utf-8") as f:
-            save_data = json.load(f)
-
-        save_data["metadata"]["save_name"] = new_name
-        save_data["metadata"]["save_date"] = datetime.now().isoformat()
+        self._copy_with_new_name(old_path, new_path, new_name)
 
-        with gzip.open(new_path, "wt", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, default=str)
+        # Delta saves built on it name their parent by file name
+        for child in self._dependent_saves(old_path):
+            self._rewrite_header(
+                child, child, lambda header: header["delta"].update(parent=new_path.name)
+            )
 
         old_path.unlink()
+        if old_path == self._chain_head:
+            self._chain_head = new_path
         return str(new_path)
 
+    def _dependent_saves(self, save_path: Path) -> List[Path]:
+        """Delta saves whose parent is ``save_path``."""
+        children = []
+        for path in self.save_dir.glob(f"*{self.SAVE_EXTENSION}"):
+            header = read_save_header(path) if path != save_path else None
+            if header is not None and header.get("delta", {}).get("parent") == save_path.name:
+                children.append(path)
+        return children
+
     def duplicate_save(self, source_name: str, new_name: str) -> str:
         """Duplicate a save file."""
         source_path = self.save_dir / f"{source_name}{self.SAVE_EXTENSION}"
@@ -603,233 +870,75 @@ class EnhancedSaveLoadManager:
         if new_path.exists():
             raise FileExistsError(f"Save file already exists: {new_name}")
 
-        # Read and update metadata
-        with gzip.open(source_path, "rt", encoding="utf-8") as f:
-            save_data = json.load(f)
-
-        save_data["metadata"]["save_name"] = new_name
-        save_data["metadata"]["save_date"] = datetime.now().isoformat()
-
-        with gzip.open(new_path, "wt", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, default=str)
+        self._copy_with_new_name(source_path, new_path, new_name)
 
         return str(new_path)
 
-    def _capture_game_state(self, session: Session) -> GameState:
-        """Capture complete game state from database."""
-        state = GameState()
-
-        # Export clubs
-        clubs = session.execute(select(Club)).scalars().all()
-        for club in clubs:
-            state.clubs.append(self._object_to_dict(club))
-
-        # Export players
-        players = session.execute(select(Player)).scalars().all()
-        for player in players:
-            player_dict = self._object_to_dict(player)
-            # Handle enum and date serialization
-            if player.position:
-                player_dict["position"] = player.position.value
-            state.players.append(player_dict)
-
-        # Export leagues
-        leagues = session.execute(select(League)).scalars().all()
-        for league in leagues:
-            state.leagues.append(self._object_to_dict(league))
-
-        # Export matches (last 200)
-        matches = (
-            session.execute(select(Match).order_by(Match.match_date.desc()).limit(200))
-            .scalars()
-            .all()
-        )
-        for match in matches:
-            match_dict = self._object_to_dict(match)
-            if match.match_date:
-                match_dict["match_date"] = match.match_date.isoformat()
-            state.matches.append(match_dict)
-
-        # Export transfers (last 100)
-        transfers = (
-            session.execute(select(Transfer).order_by(Transfer.date.desc()).limit(100))
-            .scalars()
-            .all()
-        )
-        for transfer in transfers:
-            transfer_dict = self._object_to_dict(transfer)
-            if transfer.date:
-                transfer_dict["date"] = transfer.date.isoformat()
-            state.transfers.append(transfer_dict)
-
-        # Export seasons
-        seasons = session.execute(select(Season)).scalars().all()
-        for season in seasons:
-            season_dict = self._object_to_dict(season)
-            if season.start_date:
-                season_dict["start_date"] = season.start_date.isoformat()
-            if season.end_date:
-                season_dict["end_date"] = season.end_date.isoformat()
-            state.seasons.append(season_dict)
-
-        # Export cup competitions
-        cup_comps = session.execute(select(CupCompetition)).scalars().all()
-        for comp in cup_comps:
-            state.cup_competitions.append(self._object_to_dict(comp))
-
-        # Export cup editions
-        cup_editions = session.execute(select(CupEdition)).scalars().all()
-        for edition in cup_editions:
-            edition_dict = self._object_to_dict(edition)
-            if edition.start_date:
-                edition_dict["start_date"] = edition.start_date.isoformat()
-            if edition.end_date:
-                edition_dict["end_date"] = edition.end_date.isoformat()
-            state.cup_editions.append(edition_dict)
-
-        # Export cup rounds
-        cup_rounds = session.execute(select(CupRound)).scalars().all()
-        for round_obj in cup_rounds:
-            round_dict = self._object_to_dict(round_obj)
-            if round_obj.scheduled_start:
-                round_dict["scheduled_start"] = round_obj.scheduled_start.isoformat()
-            if round_obj.scheduled_end:
-                round_dict["scheduled_end"] = round_obj.scheduled_end.isoformat()
-            state.cup_rounds.append(round_dict)
-
-        # Export cup participants
-        cup_participants = session.execute(select(CupParticipant)).scalars().all()
-        for participant in cup_participants:
-            state.cup_participants.append(self._object_to_dict(participant))
-
-        # Export cup matches
-        cup_matches = session.execute(select(CupMatch)).scalars().all()
-        for cup_match in cup_matches:
-            state.cup_matches.append(self._object_to_dict(cup_match))
-
-        return state
-
-    async def _capture_game_state_async(self, session: AsyncSession) -> GameState:
-        """Capture complete game state from database (async version)."""
-        state = GameState()
-
-        # Export clubs - handle potential data issues gracefully
-        try:
-            result = await session.execute(select(Club))
-            clubs = result.scalars().all()
-            for club in clubs:
-                try:
-                    club_dict = self._object_to_dict(club)
-                    state.clubs.append(club_dict)
-                except Exception as e:
-                    pass  # Skip clubs with data issues
-        except Exception as e:
-            print(f"Warning: Could not export clubs: {e}")
-
-        # Export players
-        result = await session.execute(select(Player))
-        players = result.scalars().all()
-        for player in players:
-            player_dict = self._object_to_dict(player)
-            if player.position:
-                player_dict["position"] = player.position.value
-            state.players.append(player_dict)
-
-        # Export leagues
-        result = await session.execute(select(League))
-        leagues = result.scalars().all()
-        for league in leagues:
-            state.leagues.append(self._object_to_dict(league))
-
-        # Export matches (last 200)
-        result = await session.execute(select(Match).order_by(Match.match_date.desc()).limit(200))
-        matches = result.scalars().all()
-        for match in matches:
-            match_dict = self._object_to_dict(match)
-            if match.match_date:
-                match_dict["match_date"] = match.match_date.isoformat()
-            state.matches.append(match_dict)
-
-        # Export transfers (last 100)
-        result = await session.execute(
-            select(Transfer).order_by(Transfer.offered_at.desc()).limit(100)
-        )
-        transfers = result.scalars().all()
-        for transfer in transfers:
-            transfer_dict = self._object_to_dict(transfer)
-            if transfer.offered_at:
-                transfer_dict["offered_at"] = transfer.offered_at.isoformat()
-            state.transfers.append(transfer_dict)
-
-        # Export seasons
-        result = await session.execute(select(Season))
-        seasons = result.scalars().all()
-        for season in seasons:
-            season_dict = self._object_to_dict(season)
-            if season.start_date:
-                season_dict["start_date"] = season.start_date.isoformat()
-            if season.end_date:
-                season_dict["end_date"] = season.end_date.isoformat()
-            state.seasons.append(season_dict)
-
-        # Export cup competitions
-        result = await session.execute(select(CupCompetition))
-        cup_comps = result.scalars().all()
-        for comp in cup_comps:
-            state.cup_competitions.append(self._object_to_dict(comp))
-
-        # Export cup editions
-        result = await session.execute(select(CupEdition))
-        cup_editions = result.scalars().all()
-        for edition in cup_editions:
-            edition_dict = self._object_to_dict(edition)
-            if edition.start_date:
-                edition_dict["start_date"] = edition.start_date.isoformat()
-            if edition.end_date:
-                edition_dict["end_date"] = edition.end_date.isoformat()
-            state.cup_editions.append(edition_dict)
-
-        # Export cup rounds
-        result = await session.execute(select(CupRound))
-        cup_rounds = result.scalars().all()
-        for round_obj in cup_rounds:
-            round_dict = self._object_to_dict(round_obj)
-            if round_obj.scheduled_start:
-                round_dict["scheduled_start"] = round_obj.scheduled_start.isoformat()
-            if round_obj.scheduled_end:
-                round_dict["scheduled_end"] = round_obj.scheduled_end.isoformat()
-            state.cup_rounds.append(round_dict)
-
-        # Export cup participants
-        result = await session.execute(select(CupParticipant))
-        cup_participants = result.scalars().all()
-        for participant in cup_participants:
-            state.cup_participants.append(self._object_to_dict(participant))
-
-        # Export cup matches
-        result = await session.execute(select(CupMatch))
-        cup_matches = result.scalars().all()
-        for cup_match in cup_matches:
-            state.cup_matches.append(self._object_to_dict(cup_match))
-
-        return state
+    def _copy_with_new_name(self, source_path: Path, new_path: Path, new_name: str) -> None:
+        """Copy a save file, updating the name and date in its metadata.
+
+        Streamed saves only have their header rewritten; the records are
+        copied through unchanged, so the checksum stays valid.
+        """
+        header = read_save_header(source_path)
+        if header is None:
+            with gzip.open(source_path, "rt", encoding="utf-8") as f:
+                save_data = json.load(f)
+
+            save_data["metadata"]["save_name"] = new_name
+            save_data["metadata"]["save_date"] = datetime.now().isoformat()
+
+            with gzip.open(new_path, "wt", encoding="utf-8") as f:
+                json.dump(save_data, f, indent=2, default=str)
+            return
+
+        def rename(header: Dict[str, Any]) -> None:
+            header["metadata"]["save_name"] = new_name
+            header["metadata"]["save_date"] = datetime.now().isoformat()
+
+        self._rewrite_header(source_path, new_path, rename)
+
+    def _rewrite_header(
+        self, source_path: Path, new_path: Path, update: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Copy a streamed save with ``update`` applied to its header.
+
+        The records are copied through unchanged, so the checksum stays valid.
+        """
+        header = read_save_header(source_path)
+        update(header)
+
+        tmp_path = new_path.with_name(new_path.name + ".tmp")
+        with gzip.open(source_path, "rb") as src, gzip.open(tmp_path, "wb", compresslevel=6) as dst:
+            src.readline()
+            dst.write(encode_save_line(header))
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp_path, new_path)
+
+    def _state_queries(self) -> List[Tuple[str, Any]]:
+        """Query for each ``GameState`` table, in save order."""
+        return [
+            ("clubs", select(Club)),
+            ("players", select(Player)),
+            ("leagues", select(League)),
+            # Only recent history is saved
+            ("matches", select(Match).order_by(Match.match_date.desc()).limit(200)),
+            ("transfers", select(Transfer).order_by(Transfer.offered_at.desc()).limit(100)),
+            ("seasons", select(Season)),
+            ("cup_competitions", select(CupCompetition)),
+            ("cup_editions", select(CupEdition)),
+            ("cup_rounds", select(CupRound)),
+            ("cup_participants", select(CupParticipant)),
+            ("cup_matches", select(CupMatch)),
+        ]
 
     def _object_to_dict(self, obj) -> Dict[str, Any]:
         """Convert SQLAlchemy object to dictionary."""
-        from datetime import date, datetime
-
+        loaded = obj.__dict__
         result = {}
-        for column in obj.__table__.columns:
-            value = getattr(obj, column.name)
-            # Handle enum values - convert to string
-            if hasattr(value, "value"):
-                result[column.name] = value.value
-            elif isinstance(value, Enum):
-                result[column.name] = value.value
-            elif isinstance(value, (date, datetime)):
-                result[column.name] = value.isoformat()
-            else:
-                result[column.name] = value
+        for name, encode in column_encoders(obj.__table__):
+            value = loaded[name] if name in loaded else getattr(obj, name)
+            result[name] = value if value is None or encode is None else encode(value)
         return result
 
     def _calculate_statistics(
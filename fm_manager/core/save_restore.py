@@ -0,0 +1,199 @@
+"""Bulk restore of saved game state into the database.
+
+Loading a career used to build one ORM object per saved row and merge it
+into the session, which dominated load times for large worlds.
+``BulkRestorer`` writes each table with a couple of ``executemany``
+statements instead, in foreign-key order: rows whose id already exists
+are updated in place and the rest are inserted, so the result matches the
+old merge. Non-unique indexes of large tables are dropped for the load
+and rebuilt once at the end.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import Date, DateTime, Enum, Table, bindparam, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from fm_manager.core.database import Base
+
+
+@dataclass
+class TableRestoreStats:
+    """Rows written to one table, and how long it took in seconds."""
+
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.inserted + self.updated
+
+
+@dataclass
+class RestoreReport:
+    """Timings of one restore, per table."""
+
+    tables: List[TableRestoreStats] = field(default_factory=list)
+    # Time spent rebuilding deferred indexes
+    index_seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return sum(stats.rows for stats in self.tables)
+
+    @property
+    def total(self) -> float:
+        return sum(stats.seconds for stats in self.tables) + self.index_seconds
+
+    def summary(self) -> str:
+        slowest = sorted(self.tables, key=lambda s: s.seconds, reverse=True)[:3]
+        details = ", ".join(f"{s.table} {s.rows:,} in {s.seconds:.2f}s" for s in slowest)
+        return (
+            f"Restored {self.rows:,} rows in {self.total:.2f}s "
+            f"({details}; indexes {self.index_seconds:.2f}s)"
+        )
+
+
+def _to_enum(enum_class, fallback: Any, value: Any) -> Any:
+    # Saves store enum values; older ones may hold names or display labels
+    if value is None or isinstance(value, enum_class):
+        return value
+    try:
+        return enum_class(value)
+    except ValueError:
+        pass
+    try:
+        return enum_class[str(value).upper().replace(" ", "_")]
+    except KeyError:
+        return fallback
+
+
+def _to_date(value: Any) -> Any:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _to_datetime(value: Any) -> Any:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def column_converters(table: Table) -> Dict[str, Callable[[Any], Any]]:
+    """Functions turning saved values back into column values, by column name."""
+    converters: Dict[str, Callable[[Any], Any]] = {}
+    for column in table.columns:
+        if isinstance(column.type, Enum) and column.type.enum_class is not None:
+            default = column.default
+            fallback = default.arg if default is not None and default.is_scalar else None
+            converters[column.name] = partial(_to_enum, column.type.enum_class, fallback)
+        elif isinstance(column.type, DateTime):
+            converters[column.name] = _to_datetime
+        elif isinstance(column.type, Date):
+            converters[column.name] = _to_date
+    return converters
+
+
+class BulkRestorer:
+    """Writes saved rows back to their tables with bulk statements.
+
+    Tables with at least ``defer_indexes_min_rows`` rows to restore have
+    their non-unique indexes rebuilt after loading instead of updated on
+    every row.
+    """
+
+    def __init__(self, chunk_size: int = 500, defer_indexes_min_rows: Optional[int] = 1000):
+        self.chunk_size = chunk_size
+        self.defer_indexes_min_rows = defer_indexes_min_rows
+
+    def restore(self, session: Session, tables: Dict[str, List[Dict[str, Any]]]) -> RestoreReport:
+        """Write the rows of each table, by table name, without committing.
+
+        Unknown tables and columns are ignored, so saves from older
+        versions of the schema still restore.
+        """
+        report = RestoreReport()
+        ordered = [t for t in Base.metadata.sorted_tables if tables.get(t.name)]
+        connection = session.connection()
+
+        # Databases created before an index was added to the models lack it
+        inspector = inspect(connection)
+        deferred = [
+            index
+            for table in ordered
+            if self._defer_indexes(len(tables[table.name]))
+            for index in table.indexes
+            if not index.unique
+            and index.name in {i["name"] for i in inspector.get_indexes(table.name)}
+        ]
+        for index in deferred:
+            index.drop(connection)
+
+        with session.no_autoflush:
+            for table in ordered:
+                report.tables.append(self._restore_table(session, table, tables[table.name]))
+
+        start = time.perf_counter()
+        for index in deferred:
+            index.create(connection)
+        report.index_seconds = time.perf_counter() - start
+
+        # The identity map still holds the rows as they were before the restore
+        session.expire_all()
+        return report
+
+    def _defer_indexes(self, rows: int) -> bool:
+        return self.defer_indexes_min_rows is not None and rows >= self.defer_indexes_min_rows
+
+    def _restore_table(
+        self, session: Session, table: Table, rows: List[Dict[str, Any]]
+    ) -> TableRestoreStats:
+        stats = TableRestoreStats(table.name)
+        start = time.perf_counter()
+        converters = column_converters(table)
+        columns = set(table.columns.keys())
+
+        for offset in range(0, len(rows), self.chunk_size):
+            chunk = [
+                {
+                    key: converters[key](value) if key in converters else value
+                    for key, value in row.items()
+                    if key in columns
+                }
+                for row in rows[offset : offset + self.chunk_size]
+            ]
+            existing = self._existing_ids(session, table, (row.get("id") for row in chunk))
+            inserts = [row for row in chunk if row.get("id") not in existing]
+            updates = [
+                {**{k: v for k, v in row.items() if k != "id"}, "_restore_id": row["id"]}
+                for row in chunk
+                if row.get("id") in existing and len(row) > 1
+            ]
+
+            for params in _by_keys(inserts):
+                session.execute(insert(table), params)
+            statement = update(table).where(table.c.id == bindparam("_restore_id"))
+            for params in _by_keys(updates):
+                session.execute(statement, params)
+            stats.inserted += len(inserts)
+            stats.updated += len(chunk) - len(inserts)
+
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _existing_ids(self, session: Session, table: Table, ids: Iterable[Any]) -> Set[Any]:
+        ids = [row_id for row_id in ids if row_id is not None]
+        if not ids:
+            return set()
+        return set(session.execute(select(table.c.id).where(table.c.id.in_(ids))).scalars())
+
+
+def _by_keys(rows: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Rows grouped by their set of keys, as one executemany needs."""
+    groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+    return list(groups.values())
@@ -1,11 +1,16 @@
 """Load cleaned FM data with full attributes."""
 
 import re
+import time
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from fm_manager.data.player_table import PlayerRow, PlayerTable
+
 
 POSITION_MAPPING = {
     "门将": "GK",
@@ -36,6 +41,10 @@ POSITION_MAPPING = {
 }
 
 
+# Sorted by length (descending) to prioritize longer matches
+_SORTED_POSITION_MAPPING = sorted(POSITION_MAPPING.items(), key=lambda x: len(x[0]), reverse=True)
+
+
 def map_position(pos_str: str) -> str:
     """Map Chinese position string to English position code.
 
@@ -44,15 +53,85 @@ def map_position(pos_str: str) -> str:
     """
     pos_str = str(pos_str).strip() if pos_str else ""
 
-    # Sort by length (descending) to prioritize longer matches
-    sorted_mappings = sorted(POSITION_MAPPING.items(), key=lambda x: len(x[0]), reverse=True)
-
-    for cn_pos, en_pos in sorted_mappings:
+    for cn_pos, en_pos in _SORTED_POSITION_MAPPING:
         if cn_pos in pos_str:
             return en_pos
     return "CM"
 
 
+# CSV column -> (PlayerDataFull field, default) for numeric fields
+PLAYER_INT_COLUMNS = {
+    "player_id": ("id", 0),
+    "age": ("age", 0),
+    "fatigue": ("fatigue", 0),
+    "happiness": ("happiness", 50),
+    "intl_caps": ("intl_caps", 0),
+    "intl_goals": ("intl_goals", 0),
+    "value": ("market_value", 0),
+    "wage": ("weekly_wage", 0),
+    "club_id": ("club_id", -1),
+    "club_reputation": ("club_reputation", 0),
+}
+PLAYER_FLOAT_COLUMNS = {
+    "current_ability": ("current_ability", 0.0),
+    "potential_ability": ("potential_ability", 0.0),
+    "stamina": ("stamina", 100.0),
+    "match_shape": ("match_shape", 50.0),
+    "match_experience": ("match_experience", 0.0),
+}
+# CSV column -> default when the column is missing
+PLAYER_STRING_COLUMNS = {
+    "name": "Unknown",
+    "nationality": "Unknown",
+    "birth_date": "",
+    "position": "",
+    "location": "",
+    "player_role": "",
+    "estimated_role": "",
+    "club_name": "",
+    "squad_status": "",
+}
+
+
+@dataclass
+class LoadMetrics:
+    """Timings of one dataset load, in seconds."""
+
+    players: int = 0
+    teams: int = 0
+    from_snapshot: bool = False
+    read_players: float = 0.0
+    build_players: float = 0.0
+    read_teams: float = 0.0
+    build_clubs: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.read_players + self.build_players + self.read_teams + self.build_clubs
+
+    @property
+    def players_per_second(self) -> float:
+        elapsed = self.read_players + self.build_players
+        return self.players / elapsed if elapsed else 0.0
+
+    def summary(self) -> str:
+        source = "snapshot" if self.from_snapshot else "csv"
+        return (
+            f"Loaded dataset from {source} in {self.total:.2f}s "
+            f"(players: read {self.read_players:.2f}s, build {self.build_players:.2f}s, "
+            f"{self.players_per_second:,.0f}/s; teams: read {self.read_teams:.2f}s, "
+            f"clubs {self.build_clubs:.2f}s)"
+        )
+
+
+def _numeric_column(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+    """Column as float64 with missing, non-numeric and infinite values set to ``default``."""
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=np.float64)
+    values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64)
+    return np.where(np.isfinite(values), values, default)
+
+
 @dataclass
 class PlayerDataFull:
     id: int
@@ -190,127 +269,129 @@ class ClubDataFull:
     wage_budget: int = 0
     stadium_capacity: int = 30000
     avg_attendance: int = 0
-    players: list[PlayerDataFull] = field(default_factory=list)
+    players: list["PlayerDataFull | PlayerRow"] = field(default_factory=list)
+    # Bumped whenever the squad changes; cached lineups are keyed on it
+    squad_version: int = 0
 
     @property
     def squad_size(self) -> int:
         return len(self.players)
 
+    def mark_squad_changed(self) -> None:
+        """Invalidate cached lineups after a transfer, injury or similar change."""
+        self.squad_version += 1
+
 
 class CleanedDataLoaderV2:
-    def __init__(self, data_dir: str = "data/cleaned"):
+    def __init__(self, data_dir: str = "data/cleaned", use_snapshot: bool = True):
         self.data_dir = Path(data_dir)
+        self.use_snapshot = use_snapshot
         self.players_df: Optional[pd.DataFrame] = None
         self.teams_df: Optional[pd.DataFrame] = None
         self.clubs: dict[int, ClubDataFull] = {}
-        self.players: dict[int, PlayerDataFull] = {}
+        self.table: Optional["PlayerTable"] = None
+        self.players: dict[int, "PlayerRow"] = {}
+        self.metrics = LoadMetrics()
 
-    def load_all(self) -> tuple[dict[int, ClubDataFull], dict[int, PlayerDataFull]]:
+    def load_all(self) -> tuple[dict[int, ClubDataFull], dict[int, "PlayerRow"]]:
         self._load_players()
         self._load_teams()
         self._build_clubs()
+        print(self.metrics.summary())
         return self.clubs, self.players
 
     def _load_players(self) -> None:
+        from fm_manager.data.player_table import RATING_POSITIONS, PlayerTable, StringColumn
+
         players_path = self.data_dir / "players_cleaned.csv"
         if not players_path.exists():
             raise FileNotFoundError(f"Players file not found: {players_path}")
 
-        self.players_df = pd.read_csv(players_path)
-        print(f"Loaded {len(self.players_df)} players from {players_path}")
+        digest = None
+        if self.use_snapshot:
+            from fm_manager.data.snapshot import load_snapshot, source_digest
+
+            start = time.perf_counter()
+            digest = source_digest(self.data_dir)
+            table = load_snapshot(self.data_dir, digest)
+            if table is not None:
+                self._set_table(table)
+                self.metrics.from_snapshot = True
+                self.metrics.read_players = time.perf_counter() - start
+                print(f"Loaded {len(table)} players from snapshot of {players_path}")
+                return
+
+        start = time.perf_counter()
+        self.players_df = pd.read_csv(players_path, dtype=dict.fromkeys(PLAYER_STRING_COLUMNS, str))
+        df = self.players_df
+        self.metrics.read_players = time.perf_counter() - start
+        print(f"Loaded {len(df)} players from {players_path}")
+
+        start = time.perf_counter()
+        ints = {
+            field_name: np.trunc(_numeric_column(df, column, default)).astype(np.int64)
+            for column, (field_name, default) in PLAYER_INT_COLUMNS.items()
+        }
+        floats = {
+            field_name: _numeric_column(df, column, default)
+            for column, (field_name, default) in PLAYER_FLOAT_COLUMNS.items()
+        }
+
+        strings = {}
+        for column, default in PLAYER_STRING_COLUMNS.items():
+            if column in df.columns:
+                # Missing cells read back as "nan", as str(value) did per row
+                values = df[column].fillna("nan").astype(str)
+            else:
+                values = pd.Series([default] * len(df), dtype=object)
+            codes, uniques = pd.factorize(values)
+            categories = list(uniques)
+            if column == "position":
+                # Map each distinct raw string once
+                categories = [map_position(value) for value in categories]
+            strings[column] = StringColumn(codes.astype(np.int32), categories)
+        # Positions collapse onto few codes; re-encode so categories are unique
+        positions = strings["position"]
+        strings["position"] = StringColumn.from_values(positions.values())
+
+        ratings = np.column_stack(
+            [_numeric_column(df, f"rating_{pos}", 0.0) for pos in RATING_POSITIONS]
+        ).reshape(len(df), len(RATING_POSITIONS))
+        potentials = np.column_stack(
+            [_numeric_column(df, f"potential_{pos}", 0.0) for pos in RATING_POSITIONS]
+        ).reshape(len(df), len(RATING_POSITIONS))
+
+        self._set_table(PlayerTable(ints, floats, strings, ratings, potentials))
+        self.metrics.build_players = time.perf_counter() - start
+
+        if digest is not None:
+            from fm_manager.data.snapshot import write_snapshot
 
-        for _, row in self.players_df.iterrows():
             try:
-                player = self._parse_player_row(row)
-                self.players[player.id] = player
-            except Exception as e:
-                continue
+                write_snapshot(self.table, self.data_dir, digest)
+            except OSError as e:
+                print(f"Could not write dataset snapshot: {e}")
+
+    def _set_table(self, table: "PlayerTable") -> None:
+        # Players are served as views onto one columnar table
+        self.table = table
+        for player_id, player in zip(table.ints["id"].tolist(), table.rows(), strict=True):
+            self.players[player_id] = player
+        self.metrics.players = len(table)
 
     def _load_teams(self) -> None:
         teams_path = self.data_dir / "teams_cleaned.csv"
         if not teams_path.exists():
             raise FileNotFoundError(f"Teams file not found: {teams_path}")
 
+        start = time.perf_counter()
         self.teams_df = pd.read_csv(teams_path)
+        self.metrics.read_teams = time.perf_counter() - start
+        self.metrics.teams = len(self.teams_df)
         print(f"Loaded {len(self.teams_df)} teams from {teams_path}")
 
-    def _parse_player_row(self, row: pd.Series) -> PlayerDataFull:
-        position = map_position(str(row.get("position", "")))
-
-        def get_float(col, default=0.0):
-            val = row.get(col, default)
-            try:
-                return float(val) if pd.notna(val) else default
-            except:
-                return default
-
-        def get_int(col, default=0):
-            val = row.get(col, default)
-            try:
-                return int(val) if pd.notna(val) else default
-            except:
-                return default
-
-        return PlayerDataFull(
-            id=get_int("player_id"),
-            name=str(row.get("name", "Unknown")),
-            nationality=str(row.get("nationality", "Unknown")),
-            age=get_int("age"),
-            birth_date=str(row.get("birth_date", "")),
-            position=position,
-            location=str(row.get("location", "")),
-            current_ability=get_float("current_ability"),
-            potential_ability=get_float("potential_ability"),
-            player_role=str(row.get("player_role", "")),
-            estimated_role=str(row.get("estimated_role", "")),
-            rating_gk=get_float("rating_gk"),
-            rating_sw=get_float("rating_sw"),
-            rating_dl=get_float("rating_dl"),
-            rating_dc=get_float("rating_dc"),
-            rating_dr=get_float("rating_dr"),
-            rating_wbl=get_float("rating_wbl"),
-            rating_wbr=get_float("rating_wbr"),
-            rating_dm=get_float("rating_dm"),
-            rating_ml=get_float("rating_ml"),
-            rating_mc=get_float("rating_mc"),
-            rating_mr=get_float("rating_mr"),
-            rating_aml=get_float("rating_aml"),
-            rating_amc=get_float("rating_amc"),
-            rating_amr=get_float("rating_amr"),
-            rating_fs=get_float("rating_fs"),
-            rating_ts=get_float("rating_ts"),
-            potential_gk=get_float("potential_gk"),
-            potential_sw=get_float("potential_sw"),
-            potential_dl=get_float("potential_dl"),
-            potential_dc=get_float("potential_dc"),
-            potential_dr=get_float("potential_dr"),
-            potential_wbl=get_float("potential_wbl"),
-            potential_wbr=get_float("potential_wbr"),
-            potential_dm=get_float("potential_dm"),
-            potential_ml=get_float("potential_ml"),
-            potential_mc=get_float("potential_mc"),
-            potential_mr=get_float("potential_mr"),
-            potential_aml=get_float("potential_aml"),
-            potential_amc=get_float("potential_amc"),
-            potential_amr=get_float("potential_amr"),
-            potential_fs=get_float("potential_fs"),
-            potential_ts=get_float("potential_ts"),
-            fatigue=get_int("fatigue"),
-            stamina=get_float("stamina", 100.0),
-            match_shape=get_float("match_shape", 50.0),
-            happiness=get_int("happiness", 50),
-            match_experience=get_float("match_experience"),
-            intl_caps=get_int("intl_caps"),
-            intl_goals=get_int("intl_goals"),
-            market_value=get_int("value"),
-            weekly_wage=get_int("wage"),
-            club_id=get_int("club_id", -1),
-            club_name=str(row.get("club_name", "")),
-            club_reputation=get_int("club_reputation"),
-            squad_status=str(row.get("squad_status", "")),
-        )
-
     def _build_clubs(self) -> None:
+        start = time.perf_counter()
         if self.teams_df is not None:
             for _, row in self.teams_df.iterrows():
                 club_id = int(row.get("club_id", 0))
@@ -329,9 +410,11 @@ class CleanedDataLoaderV2:
                 )
 
         for player in self.players.values():
-            if player.club_id in self.clubs:
-                self.clubs[player.club_id].players.append(player)
+            club = self.clubs.get(player.club_id)
+            if club is not None:
+                club.players.append(player)
 
+        self.metrics.build_clubs = time.perf_counter() - start
         print(f"Built {len(self.clubs)} clubs with squads")
 
     def get_clubs_by_league(self, league_name: str) -> list[ClubDataFull]:
@@ -345,21 +428,30 @@ class CleanedDataLoaderV2:
 
 
 # Global cache for loaded data
-_loaded_data: tuple[dict[int, ClubDataFull], dict[int, PlayerDataFull]] | None = None
+_loaded_data: tuple[dict[int, ClubDataFull], dict[int, "PlayerRow"]] | None = None
+_loaded_table: Optional["PlayerTable"] = None
 
 
-def load_for_match_engine() -> tuple[dict[int, ClubDataFull], dict[int, PlayerDataFull]]:
+def load_for_match_engine() -> tuple[dict[int, ClubDataFull], dict[int, "PlayerRow"]]:
     """Load data for match engine with singleton pattern to avoid repeated loading."""
-    global _loaded_data
+    global _loaded_data, _loaded_table
     if _loaded_data is None:
         loader = CleanedDataLoaderV2()
         _loaded_data = loader.load_all()
+        _loaded_table = loader.table
     return _loaded_data
 
 
-def reload_data() -> tuple[dict[int, ClubDataFull], dict[int, PlayerDataFull]]:
+def load_player_table() -> "PlayerTable":
+    """Columnar view of the players returned by ``load_for_match_engine``."""
+    load_for_match_engine()
+    return _loaded_table
+
+
+def reload_data() -> tuple[dict[int, ClubDataFull], dict[int, "PlayerRow"]]:
     """Force reload data from disk."""
-    global _loaded_data
+    global _loaded_data, _loaded_table
     loader = CleanedDataLoaderV2()
     _loaded_data = loader.load_all()
+    _loaded_table = loader.table
     return _loaded_data
@@ -0,0 +1,67 @@
+"""Indexed club registry.
+
+Game rooms and clients look clubs up by id or name for every fixture and
+every standings row. ``ClubRegistry`` keeps id, name and league maps so
+those lookups are O(1) rather than a scan over every loaded club.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+from fm_manager.data.cleaned_data_loader import ClubDataFull
+
+
+class ClubRegistry:
+    """Clubs indexed by id, name and league, in insertion order."""
+
+    def __init__(self, clubs: Iterable[ClubDataFull] = ()):
+        self._by_id: dict[int, ClubDataFull] = {}
+        self._by_name: dict[str, ClubDataFull] = {}
+        self._by_league: dict[str, dict[int, ClubDataFull]] = {}
+        for club in clubs:
+            self.add(club)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[ClubDataFull]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, club_id: object) -> bool:
+        return club_id in self._by_id
+
+    def add(self, club: ClubDataFull) -> None:
+        """Add or replace a club."""
+        self.remove(club.id)
+        self._by_id[club.id] = club
+        # First club registered under a name wins, as with a linear scan
+        self._by_name.setdefault(club.name, club)
+        self._by_league.setdefault(club.league, {})[club.id] = club
+
+    def remove(self, club_id: int) -> Optional[ClubDataFull]:
+        """Remove a club, returning it if it was registered."""
+        club = self._by_id.pop(club_id, None)
+        if club is None:
+            return None
+        if self._by_name.get(club.name) is club:
+            del self._by_name[club.name]
+            # Fall back to the next club sharing the name, if any
+            for other in self._by_id.values():
+                if other.name == club.name:
+                    self._by_name[club.name] = other
+                    break
+        self._by_league.get(club.league, {}).pop(club_id, None)
+        return club
+
+    def get(self, club_id: int) -> Optional[ClubDataFull]:
+        return self._by_id.get(club_id)
+
+    def by_name(self, name: str) -> Optional[ClubDataFull]:
+        return self._by_name.get(name)
+
+    def name_of(self, club_id: int) -> str:
+        """Club name, or a placeholder for unknown ids."""
+        club = self._by_id.get(club_id)
+        return club.name if club else f"Club {club_id}"
+
+    def in_league(self, league: str) -> list[ClubDataFull]:
+        return list(self._by_league.get(league, {}).values())
@@ -0,0 +1,356 @@
+"""Columnar storage for the cleaned player dataset.
+
+``PlayerTable`` keeps every player attribute in one NumPy column, with the
+16 positional ratings and potentials as two ``(n, 16)`` matrices. Repeated
+strings such as nationality or club name are stored once per distinct value.
+``PlayerRow`` is a two-slot view onto one row. It exposes the same attribute
+API as ``PlayerDataFull``, so existing callers keep working while search and
+squad building can operate on whole columns.
+"""
+
+from dataclasses import fields
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from fm_manager.data.cleaned_data_loader import PlayerDataFull
+
+# Column order of the rating/potential matrices, as in PlayerDataFull
+RATING_POSITIONS = (
+    "gk",
+    "sw",
+    "dl",
+    "dc",
+    "dr",
+    "wbl",
+    "wbr",
+    "dm",
+    "ml",
+    "mc",
+    "mr",
+    "aml",
+    "amc",
+    "amr",
+    "fs",
+    "ts",
+)
+RATING_INDEX = {pos: i for i, pos in enumerate(RATING_POSITIONS)}
+
+# Position codes accepted by get_rating_for_position
+POSITION_RATING_INDEX = {
+    "GK": RATING_INDEX["gk"],
+    "SW": RATING_INDEX["sw"],
+    "DL": RATING_INDEX["dl"],
+    "LB": RATING_INDEX["dl"],
+    "DC": RATING_INDEX["dc"],
+    "CB": RATING_INDEX["dc"],
+    "DR": RATING_INDEX["dr"],
+    "RB": RATING_INDEX["dr"],
+    "WBL": RATING_INDEX["wbl"],
+    "LWB": RATING_INDEX["wbl"],
+    "WBR": RATING_INDEX["wbr"],
+    "RWB": RATING_INDEX["wbr"],
+    "DM": RATING_INDEX["dm"],
+    "CDM": RATING_INDEX["dm"],
+    "ML": RATING_INDEX["ml"],
+    "LM": RATING_INDEX["ml"],
+    "MC": RATING_INDEX["mc"],
+    "CM": RATING_INDEX["mc"],
+    "MR": RATING_INDEX["mr"],
+    "RM": RATING_INDEX["mr"],
+    "AML": RATING_INDEX["aml"],
+    "LW": RATING_INDEX["aml"],
+    "AMC": RATING_INDEX["amc"],
+    "CAM": RATING_INDEX["amc"],
+    "AMR": RATING_INDEX["amr"],
+    "RW": RATING_INDEX["amr"],
+    "FS": RATING_INDEX["fs"],
+    "CF": RATING_INDEX["fs"],
+    "TS": RATING_INDEX["ts"],
+    "ST": RATING_INDEX["ts"],
+}
+
+INT_COLUMNS = (
+    "id",
+    "age",
+    "fatigue",
+    "happiness",
+    "intl_caps",
+    "intl_goals",
+    "market_value",
+    "weekly_wage",
+    "club_id",
+    "club_reputation",
+)
+FLOAT_COLUMNS = (
+    "current_ability",
+    "potential_ability",
+    "stamina",
+    "match_shape",
+    "match_experience",
+)
+STRING_COLUMNS = (
+    "name",
+    "nationality",
+    "birth_date",
+    "position",
+    "location",
+    "player_role",
+    "estimated_role",
+    "club_name",
+    "squad_status",
+)
+
+_FIELD_ORDER = tuple(f.name for f in fields(PlayerDataFull))
+
+
+class StringColumn:
+    """Dictionary-encoded string column."""
+
+    def __init__(self, codes: np.ndarray, categories: list[str]):
+        self.codes = codes
+        self.categories = categories
+        self._lookup = {value: code for code, value in enumerate(categories)}
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "StringColumn":
+        categories: list[str] = []
+        lookup: dict[str, int] = {}
+        codes = []
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(categories)
+                categories.append(value)
+            codes.append(code)
+        return cls(np.array(codes, dtype=np.int32), categories)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def get(self, row: int) -> str:
+        return self.categories[self.codes[row]]
+
+    def set(self, row: int, value: str) -> None:
+        self.codes[row] = self.code_for(value, create=True)
+
+    def code_for(self, value: str, create: bool = False) -> int:
+        """Code of ``value``; -1 if unknown and ``create`` is false."""
+        code = self._lookup.get(value)
+        if code is None:
+            if not create:
+                return -1
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def values(self) -> np.ndarray:
+        """Materialise the column as an object array."""
+        return np.array(self.categories, dtype=object)[self.codes]
+
+
+class PlayerTable:
+    """Column-oriented player dataset."""
+
+    def __init__(
+        self,
+        ints: dict[str, np.ndarray],
+        floats: dict[str, np.ndarray],
+        strings: dict[str, StringColumn],
+        ratings: np.ndarray,
+        potentials: np.ndarray,
+    ):
+        self.ints = ints
+        self.floats = floats
+        self.strings = strings
+        self.ratings = ratings
+        self.potentials = potentials
+        self._rows_by_id = {int(pid): row for row, pid in enumerate(ints["id"])}
+        self._views: Optional[list[PlayerRow]] = None
+        # Bumped on every write through a view; derived indexes compare against it
+        self.version = 0
+
+    @classmethod
+    def from_players(cls, players: Iterable[PlayerDataFull]) -> "PlayerTable":
+        """Build a table from ``PlayerDataFull`` records."""
+        players = list(players)
+        return cls(
+            ints={
+                c: np.array([getattr(p, c) for p in players], dtype=np.int64) for c in INT_COLUMNS
+            },
+            floats={
+                c: np.array([getattr(p, c) for p in players], dtype=np.float64)
+                for c in FLOAT_COLUMNS
+            },
+            strings={
+                c: StringColumn.from_values(getattr(p, c) for p in players) for c in STRING_COLUMNS
+            },
+            ratings=np.array(
+                [[getattr(p, f"rating_{pos}") for pos in RATING_POSITIONS] for p in players],
+                dtype=np.float64,
+            ).reshape(len(players), len(RATING_POSITIONS)),
+            potentials=np.array(
+                [[getattr(p, f"potential_{pos}") for pos in RATING_POSITIONS] for p in players],
+                dtype=np.float64,
+            ).reshape(len(players), len(RATING_POSITIONS)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ints["id"])
+
+    def __iter__(self) -> Iterator["PlayerRow"]:
+        return iter(self.rows())
+
+    def rows(self) -> list["PlayerRow"]:
+        """Views for every row, created once and shared."""
+        if self._views is None:
+            self._views = [PlayerRow(self, row) for row in range(len(self))]
+        return self._views
+
+    def row(self, row: int) -> "PlayerRow":
+        return self.rows()[row]
+
+    def get(self, player_id: int) -> Optional["PlayerRow"]:
+        """View of the player with ``player_id`` (the last row wins on duplicates)."""
+        row = self._rows_by_id.get(player_id)
+        return None if row is None else self.row(row)
+
+    def unique_rows(self) -> np.ndarray:
+        """Ascending rows reachable through ``get``, i.e. without shadowed duplicates."""
+        return np.sort(np.fromiter(self._rows_by_id.values(), dtype=np.int64))
+
+    def column(self, name: str) -> np.ndarray:
+        """Numeric column by ``PlayerDataFull`` field name, or rating/potential column."""
+        if name in self.ints:
+            return self.ints[name]
+        if name in self.floats:
+            return self.floats[name]
+        prefix, _, pos = name.partition("_")
+        if prefix == "rating" and pos in RATING_INDEX:
+            return self.ratings[:, RATING_INDEX[pos]]
+        if prefix == "potential" and pos in RATING_INDEX:
+            return self.potentials[:, RATING_INDEX[pos]]
+        raise KeyError(name)
+
+    def best_positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorised ``get_best_position``: (position codes, ratings) per row."""
+        best = self.ratings.argmax(axis=1)
+        codes = np.array([pos.upper() for pos in RATING_POSITIONS], dtype=object)
+        return codes[best], self.ratings[np.arange(len(self)), best]
+
+    def rows_for_club(self, club_id: int) -> np.ndarray:
+        """Row indices of a club's players."""
+        return np.flatnonzero(self.ints["club_id"] == club_id)
+
+    def mark_modified(self) -> None:
+        """Record a change made to the column arrays directly rather than via a view."""
+        self.version += 1
+
+    def to_record(self, row: int) -> PlayerDataFull:
+        """Materialise one row as a standalone ``PlayerDataFull``."""
+        view = self.row(row)
+        return PlayerDataFull(*(getattr(view, name) for name in _FIELD_ORDER))
+
+
+class PlayerRow:
+    """Mutable view of one ``PlayerTable`` row with the ``PlayerDataFull`` API."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: PlayerTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def table(self) -> PlayerTable:
+        """The table holding this player's values."""
+        return self._table
+
+    @property
+    def full_name(self) -> str:
+        return self.name
+
+    @property
+    def is_goalkeeper(self) -> bool:
+        return self.position == "GK"
+
+    def get_rating_for_position(self, pos: str) -> float:
+        index = POSITION_RATING_INDEX.get(pos)
+        if index is None:
+            return self.current_ability
+        return float(self._table.ratings[self._row, index])
+
+    def get_best_position(self) -> tuple[str, float]:
+        ratings = self._table.ratings[self._row]
+        best = int(ratings.argmax())
+        return RATING_POSITIONS[best].upper(), float(ratings[best])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerRow):
+            return NotImplemented
+        return self._table is other._table and self._row == other._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._row))
+
+    def __reduce__(self):
+        # Pickle as a standalone record rather than dragging the table along
+        return PlayerDataFull, tuple(getattr(self, name) for name in _FIELD_ORDER)
+
+    def __repr__(self) -> str:
+        return f"PlayerRow(id={self.id}, name={self.name!r}, position={self.position!r})"
+
+
+def _int_property(name: str) -> property:
+    def fget(self: PlayerRow) -> int:
+        return int(self._table.ints[name][self._row])
+
+    def fset(self: PlayerRow, value: int) -> None:
+        self._table.ints[name][self._row] = value
+        self._table.version += 1
+
+    return property(fget, fset)
+
+
+def _float_property(name: str) -> property:
+    def fget(self: PlayerRow) -> float:
+        return float(self._table.floats[name][self._row])
+
+    def fset(self: PlayerRow, value: float) -> None:
+        self._table.floats[name][self._row] = value
+        self._table.version += 1
+
+    return property(fget, fset)
+
+
+def _string_property(name: str) -> property:
+    def fget(self: PlayerRow) -> str:
+        return self._table.strings[name].get(self._row)
+
+    def fset(self: PlayerRow, value: str) -> None:
+        self._table.strings[name].set(self._row, value)
+        self._table.version += 1
+
+    return property(fget, fset)
+
+
+def _matrix_property(matrix: str, index: int) -> property:
+    def fget(self: PlayerRow) -> float:
+        return float(getattr(self._table, matrix)[self._row, index])
+
+    def fset(self: PlayerRow, value: float) -> None:
+        getattr(self._table, matrix)[self._row, index] = value
+        self._table.version += 1
+
+    return property(fget, fset)
+
+
+for _name in INT_COLUMNS:
+    setattr(PlayerRow, _name, _int_property(_name))
+for _name in FLOAT_COLUMNS:
+    setattr(PlayerRow, _name, _float_property(_name))
+for _name in STRING_COLUMNS:
+    setattr(PlayerRow, _name, _string_property(_name))
+for _pos, _index in RATING_INDEX.items():
+    setattr(PlayerRow, f"rating_{_pos}", _matrix_property("ratings", _index))
+    setattr(PlayerRow, f"potential_{_pos}", _matrix_property("potentials", _index))
@@ -0,0 +1,151 @@
+"""Binary snapshots of the cleaned player dataset.
+
+Parsing ``players_cleaned.csv`` costs every process a second or more. A
+snapshot stores the ``PlayerTable`` columns as ``.npy`` files next to the
+CSV, keyed by the CSV's SHA-256. Processes then memory-map it instead of
+re-parsing. The mapping is copy-on-write, so concurrent server workers and
+CLI clients share the same physical pages until one of them modifies a
+player.
+
+Build one ahead of time with::
+
+    python -m fm_manager.data.snapshot [data_dir]
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from fm_manager.data.player_table import PlayerTable, StringColumn
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIRNAME = ".snapshot"
+PLAYERS_CSV = "players_cleaned.csv"
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_digest(data_dir: Path) -> str:
+    """Digest of the players CSV, reusing the cached one while size and mtime match."""
+    csv_path = data_dir / PLAYERS_CSV
+    stat = csv_path.stat()
+    index_path = data_dir / SNAPSHOT_DIRNAME / "index.json"
+    try:
+        index = json.loads(index_path.read_text())
+        if index["size"] == stat.st_size and index["mtime_ns"] == stat.st_mtime_ns:
+            return index["sha256"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    digest = file_digest(csv_path)
+    try:
+        index_path.parent.mkdir(exist_ok=True)
+        index_path.write_text(
+            json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest})
+        )
+    except OSError:
+        pass
+    return digest
+
+
+def snapshot_path(data_dir: Path, digest: str) -> Path:
+    return data_dir / SNAPSHOT_DIRNAME / f"v{SNAPSHOT_VERSION}-{digest[:16]}"
+
+
+def write_snapshot(table: PlayerTable, data_dir: Path, digest: str) -> Path:
+    """Write ``table`` as the snapshot for ``digest`` and drop older snapshots."""
+    target = snapshot_path(data_dir, digest)
+    if target.exists():
+        return target
+
+    target.parent.mkdir(exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=target.name + ".", dir=target.parent))
+    try:
+        for name, values in table.ints.items():
+            np.save(staging / f"int_{name}.npy", values)
+        for name, values in table.floats.items():
+            np.save(staging / f"float_{name}.npy", values)
+        for name, column in table.strings.items():
+            np.save(staging / f"str_{name}.npy", column.codes)
+        np.save(staging / "ratings.npy", table.ratings)
+        np.save(staging / "potentials.npy", table.potentials)
+
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "sha256": digest,
+            "rows": len(table),
+            "ints": list(table.ints),
+            "floats": list(table.floats),
+            "strings": {name: column.categories for name, column in table.strings.items()},
+        }
+        # Written last: a snapshot without meta.json is never read
+        (staging / "meta.json").write_text(json.dumps(meta, ensure_ascii=False))
+        staging.chmod(0o755)
+        os.rename(staging, target)
+    except OSError:
+        # Another process may have published the same snapshot first
+        shutil.rmtree(staging, ignore_errors=True)
+        if not target.exists():
+            raise
+
+    for stale in target.parent.iterdir():
+        if stale.is_dir() and stale != target and "." not in stale.name:
+            shutil.rmtree(stale, ignore_errors=True)
+    return target
+
+
+def load_snapshot(data_dir: Path, digest: str) -> Optional[PlayerTable]:
+    """Memory-map the snapshot for ``digest``, or return None if there is none."""
+    path = snapshot_path(data_dir, digest)
+    try:
+        meta = json.loads((path / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != SNAPSHOT_VERSION or meta.get("sha256") != digest:
+        return None
+
+    def mapped(filename: str) -> np.ndarray:
+        return np.load(path / filename, mmap_mode="c")
+
+    try:
+        return PlayerTable(
+            ints={name: mapped(f"int_{name}.npy") for name in meta["ints"]},
+            floats={name: mapped(f"float_{name}.npy") for name in meta["floats"]},
+            strings={
+                name: StringColumn(mapped(f"str_{name}.npy"), categories)
+                for name, categories in meta["strings"].items()
+            },
+            ratings=mapped("ratings.npy"),
+            potentials=mapped("potentials.npy"),
+        )
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: list[str]) -> int:
+    from fm_manager.data.cleaned_data_loader import CleanedDataLoaderV2
+
+    data_dir = Path(argv[0]) if argv else Path("data/cleaned")
+    loader = CleanedDataLoaderV2(str(data_dir), use_snapshot=False)
+    loader.load_all()
+    path = write_snapshot(loader.table, data_dir, source_digest(data_dir))
+    print(f"Wrote snapshot {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
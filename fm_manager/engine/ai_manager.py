@@ -9,6 +9,8 @@ AI-controlled clubs can:
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import random
 from dataclasses import dataclass, field
@@ -21,7 +23,7 @@ from fm_manager.engine.transfer_engine import TransferEngine, TransferOffer, Con
 from fm_manager.engine.finance_engine import FinanceEngine, ClubFinances
 
 if TYPE_CHECKING:
-    from fm_manager.engine.llm_client import LLMClient
+    from fm_manager.engine.llm_client import AsyncLLMClient, LLMClient
 
 
 class AIPersonality(Enum):
@@ -135,7 +137,21 @@ class LLMManagerDecisionMaker:
     This class uses LLM to make complex managerial decisions.
     """
     
+    # Generation settings and fallback of tactics decisions
+    TACTICS_OPTIONS = {"max_tokens": 250, "temperature": 0.4}
+    FALLBACK_TACTICS = {
+        "formation": "4-3-3",
+        "style": "balanced",
+        "mentality": "balanced",
+        "reasoning": "Default fallback",
+    }
+    
     def __init__(self, llm_client: "LLMClient"):
+        if llm_client is not None and inspect.iscoroutinefunction(llm_client.generate):
+            raise TypeError(
+                "AI manager decisions need a sync LLMClient; pass an AsyncLLMClient "
+                "to AIManagerController(async_llm_client=...) instead"
+            )
         self.llm = llm_client
     
     def decide_transfer_offer(
@@ -194,6 +210,21 @@ Respond in JSON format:
         if not self.llm:
             return {"formation": "4-3-3", "style": "balanced", "reasoning": "Default"}
         
+        prompt = self.tactics_prompt(opponent, key_players_available, recent_form)
+        
+        try:
+            response = self.llm.generate(prompt, **self.TACTICS_OPTIONS)
+            return self.parse_tactics(response.content)
+        except Exception:
+            return dict(self.FALLBACK_TACTICS)
+    
+    def tactics_prompt(
+        self,
+        opponent: Club,
+        key_players_available: list[Player],
+        recent_form: str,
+    ) -> str:
+        """Prompt asking the LLM for match tactics."""
         players_str = "\n".join([
             f"- {p.full_name} ({p.position.value if p.position else 'Unknown'}, CA{p.current_ability or 50})"
             for p in key_players_available[:5]
@@ -220,12 +251,14 @@ Respond in JSON:
     "reasoning": "<brief explanation>"
 }}"""
         
+        return prompt
+    
+    def parse_tactics(self, content: str) -> dict:
+        """Tactics from the LLM's JSON answer, or the fallback tactics."""
         try:
-            response = self.llm.generate(prompt, max_tokens=250, temperature=0.4)
-            result = json.loads(response.content)
-            return result
+            return json.loads(content)
         except Exception:
-            return {"formation": "4-3-3", "style": "balanced", "mentality": "balanced", "reasoning": "Default fallback"}
+            return dict(self.FALLBACK_TACTICS)
     
     def decide_substitution(
         self,
@@ -892,11 +925,17 @@ class AIManager:
 class AIManagerController:
     """Controller managing all AI managers in the game."""
     
-    def __init__(self, llm_client: "LLMClient" | None = None):
+    def __init__(
+        self,
+        llm_client: "LLMClient" | None = None,
+        async_llm_client: "AsyncLLMClient" | None = None,
+    ):
         self.managers: dict[int, AIManager] = {}  # club_id -> AIManager
         self.transfer_engine = TransferEngine()
         self.finance_engine = FinanceEngine()
         self.llm_client = llm_client
+        # Used by the async batch methods; managers' own decisions stay sync
+        self.async_llm_client = async_llm_client
     
     def create_manager(
         self,
@@ -988,6 +1027,58 @@ class AIManagerController:
         
         return transfers
     
+    async def prepare_match_tactics_many(
+        self,
+        fixtures: list[tuple[Club, Club, list[Player]]],
+    ) -> dict[int, dict]:
+        """Prepare tactics for many AI clubs at once, by club id.
+        
+        ``fixtures`` holds (club, opponent, key players) per club. With an
+        ``async_llm_client`` the prompts of LLM-powered managers go out as
+        one concurrent batch; otherwise their sync decisions run one after
+        another in a worker thread, off the event loop.
+        """
+        from fm_manager.engine.llm_client import LLMRequest
+        
+        tactics: dict[int, dict] = {}
+        batch: list[tuple[int, LLMManagerDecisionMaker, LLMRequest]] = []
+        deferred: list[tuple[int, AIManager, Club, list[Player]]] = []
+        for club, opponent, key_players in fixtures:
+            manager = self.managers.get(club.id or 0)
+            if manager is None:
+                continue
+            
+            decision_maker = manager.llm_decision_maker
+            if decision_maker is None or not decision_maker.llm:
+                tactics[club.id or 0] = manager.prepare_match_tactics(opponent, key_players)
+            elif self.async_llm_client is None:
+                deferred.append((club.id or 0, manager, opponent, key_players))
+            else:
+                prompt = decision_maker.tactics_prompt(opponent, key_players, manager.get_form())
+                request = LLMRequest(prompt, **decision_maker.TACTICS_OPTIONS)
+                batch.append((club.id or 0, decision_maker, request))
+        
+        if batch:
+            responses = await self.async_llm_client.generate_many(
+                [request for _, _, request in batch], return_exceptions=True
+            )
+            for (club_id, decision_maker, _), response in zip(batch, responses, strict=True):
+                if isinstance(response, BaseException):
+                    tactics[club_id] = dict(decision_maker.FALLBACK_TACTICS)
+                else:
+                    tactics[club_id] = decision_maker.parse_tactics(response.content)
+        
+        if deferred:
+            def decide_all() -> dict[int, dict]:
+                return {
+                    club_id: manager.prepare_match_tactics(opponent, key_players)
+                    for club_id, manager, opponent, key_players in deferred
+                }
+            
+            tactics.update(await asyncio.to_thread(decide_all))
+        
+        return tactics
+    
     def get_manager(self, club_id: int) -> AIManager | None:
         """Get AI manager for a club."""
         return self.managers.get(club_id)
@@ -10,15 +10,20 @@ Features:
 - Token usage tracking
 - Retry with exponential backoff
 - Prompt templates
+- Async client with a shared connection pool, request coalescing and batching
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import random
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterable
+
+import httpx
 
 # Try to import optional dependencies
 try:
@@ -123,10 +128,7 @@ class ResponseCache:
 
     def _make_key(self, prompt: str, model: str, **kwargs) -> str:
         """Create cache key from prompt and parameters."""
-        key_data = {"prompt": prompt, "model": model, **kwargs}
-        import hashlib
-
-        return hashlib.md5(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+        return _request_key(prompt, model, **kwargs)
 
     def get(self, prompt: str, model: str, **kwargs) -> LLMResponse | None:
         """Get cached response if exists and not expired."""
@@ -165,6 +167,79 @@ class ResponseCache:
         return len(self._cache)
 
 
+def _request_key(prompt: str, model: str, **kwargs) -> str:
+    """Key identifying a request by its prompt and parameters."""
+    key_data = {"prompt": prompt, "model": model, **kwargs}
+    return hashlib.md5(json.dumps(key_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# Simulated round trip of the mock provider
+MOCK_LATENCY_SECONDS = 0.1
+
+MOCK_RESPONSES = [
+    "This is a mock response for testing purposes.",
+    "The simulation suggests this is a reasonable outcome.",
+    "Based on the available data, this appears to be the case.",
+    "Analysis indicates this is the most likely scenario.",
+]
+
+
+def _chat_messages(prompt: str, system_prompt: str | None) -> list[dict]:
+    """Chat messages for OpenAI-compatible APIs."""
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _openai_response(response, provider: LLMProvider, model: str) -> LLMResponse:
+    """LLMResponse from an OpenAI chat completion."""
+    # Handle empty or invalid response
+    if not response or not response.choices or len(response.choices) == 0:
+        raise RuntimeError(f"Empty response from API: {response}")
+
+    content = response.choices[0].message.content
+    if content is None:
+        raise RuntimeError("Response content is None")
+
+    return LLMResponse(
+        content=content,
+        provider=provider,
+        model=model,
+        tokens_used=getattr(response.usage, "total_tokens", 0) if response.usage else 0,
+        prompt_tokens=getattr(response.usage, "prompt_tokens", 0) if response.usage else 0,
+        completion_tokens=(
+            getattr(response.usage, "completion_tokens", 0) if response.usage else 0
+        ),
+    )
+
+
+def _anthropic_response(response, model: str) -> LLMResponse:
+    """LLMResponse from an Anthropic message."""
+    return LLMResponse(
+        content=response.content[0].text,
+        provider=LLMProvider.ANTHROPIC,
+        model=model,
+        tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+        prompt_tokens=response.usage.input_tokens,
+        completion_tokens=response.usage.output_tokens,
+    )
+
+
+def _mock_response(prompt: str, model: str) -> LLMResponse:
+    """Mock response based on the prompt, for testing."""
+    content = random.choice(MOCK_RESPONSES)
+    return LLMResponse(
+        content=content,
+        provider=LLMProvider.MOCK,
+        model=model,
+        tokens_used=len(prompt.split()) + len(content.split()),
+        prompt_tokens=len(prompt.split()),
+        completion_tokens=len(content.split()),
+    )
+
+
 class LLMClient:
     """Unified LLM client with multiple provider support."""
 
@@ -310,37 +385,14 @@ class LLMClient:
         self, prompt: str, system_prompt: str | None, temperature: float, max_tokens: int, **kwargs
     ) -> LLMResponse:
         """Generate using OpenAI API."""
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=_chat_messages(prompt, system_prompt),
             temperature=temperature,
             max_tokens=max_tokens,
             **kwargs,
         )
-
-        # Handle empty or invalid response
-        if not response or not response.choices or len(response.choices) == 0:
-            raise RuntimeError(f"Empty response from API: {response}")
-
-        content = response.choices[0].message.content
-        if content is None:
-            raise RuntimeError("Response content is None")
-
-        return LLMResponse(
-            content=content,
-            provider=LLMProvider.OPENAI,
-            model=self.model,
-            tokens_used=getattr(response.usage, "total_tokens", 0) if response.usage else 0,
-            prompt_tokens=getattr(response.usage, "prompt_tokens", 0) if response.usage else 0,
-            completion_tokens=getattr(response.usage, "completion_tokens", 0)
-            if response.usage
-            else 0,
-        )
+        return _openai_response(response, LLMProvider.OPENAI, self.model)
 
     def _generate_anthropic(
         self, prompt: str, system_prompt: str | None, temperature: float, max_tokens: int, **kwargs
@@ -354,15 +406,7 @@ class LLMClient:
             messages=[{"role": "user", "content": prompt}],
             **kwargs,
         )
-
-        return LLMResponse(
-            content=response.content[0].text,
-            provider=LLMProvider.ANTHROPIC,
-            model=self.model,
-            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
-            prompt_tokens=response.usage.input_tokens,
-            completion_tokens=response.usage.output_tokens,
-        )
+        return _anthropic_response(response, self.model)
 
     def _generate_local(
         self, prompt: str, system_prompt: str | None, temperature: float, max_tokens: int, **kwargs
@@ -371,14 +415,9 @@ class LLMClient:
         if not HAS_OPENAI or not self.client:
             return self._generate_mock(prompt, system_prompt, temperature, max_tokens, **kwargs)
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=_chat_messages(prompt, system_prompt),
             temperature=temperature,
             max_tokens=max_tokens,
             **kwargs,
@@ -398,37 +437,327 @@ class LLMClient:
     ) -> LLMResponse:
         """Generate mock response for testing."""
         # Simulate latency
-        time.sleep(0.1)
+        time.sleep(MOCK_LATENCY_SECONDS)
+        return _mock_response(prompt, self.model)
+
+    def get_usage_stats(self) -> dict:
+        """Get usage statistics."""
+        stats = self.usage.to_dict()
+        stats["cache_size"] = self.cache.size if self.cache else 0
+        return stats
+
+    def reset_usage(self) -> None:
+        """Reset usage statistics."""
+        self.usage = TokenUsage()
 
-        # Generate a simple mock response based on prompt content
-        mock_responses = [
-            "This is a mock response for testing purposes.",
-            "The simulation suggests this is a reasonable outcome.",
-            "Based on the available data, this appears to be the case.",
-            "Analysis indicates this is the most likely scenario.",
-        ]
 
-        content = random.choice(mock_responses)
+@dataclass
+class LLMRequest:
+    """One prompt of a batch for ``AsyncLLMClient.generate_many``."""
+
+    prompt: str
+    system_prompt: str | None = None
+    temperature: float | None = None
+    max_tokens: int | None = None
+    use_cache: bool = True
+    # Additional provider-specific parameters
+    options: dict = field(default_factory=dict)
+
+
+class AsyncLLMClient:
+    """LLM client for async code that never blocks the event loop.
+
+    Requests share one HTTP connection pool and at most ``max_concurrency``
+    run at a time; retries back off with ``asyncio.sleep``. Identical
+    cacheable requests made while one is in flight wait for its response
+    instead of sending another, and ``generate_many`` sends a batch
+    concurrently. Sync call sites keep using ``LLMClient``.
+    """
 
-        return LLMResponse(
-            content=content,
-            provider=LLMProvider.MOCK,
-            model=self.model,
-            tokens_used=len(prompt.split()) + len(content.split()),
-            prompt_tokens=len(prompt.split()),
-            completion_tokens=len(content.split()),
+    DEFAULT_MODELS = LLMClient.DEFAULT_MODELS
+
+    def __init__(
+        self,
+        provider: LLMProvider = LLMProvider.MOCK,
+        model: str | None = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        enable_cache: bool = True,
+        max_retries: int = 3,
+        max_concurrency: int = 8,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        self.provider = provider
+        self.model = model or self.DEFAULT_MODELS[provider]
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.max_retries = max_retries
+        self.enable_cache = enable_cache
+        self.max_concurrency = max_concurrency
+
+        self.cache = ResponseCache() if enable_cache else None
+        self.usage = TokenUsage()
+
+        self._limiter = asyncio.Semaphore(max_concurrency)
+        # Request key -> task of the identical request being sent
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+        self._init_provider(api_key, base_url, http_client)
+
+    def _init_provider(
+        self, api_key: str | None, base_url: str | None, http_client: httpx.AsyncClient | None
+    ) -> None:
+        """Initialize the async client of the provider."""
+        if self.provider in (LLMProvider.OPENAI, LLMProvider.LOCAL) and http_client is None:
+            # One pool for every request of this client, sized for the limiter
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            )
+            http_client = openai.DefaultAsyncHttpxClient(limits=limits) if HAS_OPENAI else None
+
+        if self.provider == LLMProvider.OPENAI:
+            if not HAS_OPENAI:
+                raise ImportError("OpenAI package not installed. Run: pip install openai")
+
+            api_key = api_key or os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("OpenAI API key required. Set OPENAI_API_KEY env var.")
+
+            self.client = openai.AsyncOpenAI(
+                api_key=api_key, base_url=base_url, http_client=http_client
+            )
+
+        elif self.provider == LLMProvider.ANTHROPIC:
+            api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+            if not api_key:
+                raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY env var.")
+
+            try:
+                import anthropic
+
+                self.client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+            except ImportError:
+                raise ImportError("Anthropic package not installed. Run: pip install anthropic")
+
+        elif self.provider == LLMProvider.LOCAL:
+            base_url = base_url or "http://localhost:8000/v1"
+            if HAS_OPENAI:
+                self.client = openai.AsyncOpenAI(
+                    api_key="dummy", base_url=base_url, http_client=http_client
+                )
+            else:
+                self.client = None
+
+        elif self.provider == LLMProvider.MOCK:
+            self.client = None
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> LLMResponse:
+        """Generate text from LLM; takes the same arguments as ``LLMClient.generate``."""
+        params = {
+            "system_prompt": system_prompt,
+            "temperature": temperature if temperature is not None else self.temperature,
+            "max_tokens": max_tokens if max_tokens is not None else self.max_tokens,
+            **kwargs,
+        }
+        if not use_cache:
+            return await self._fetch(prompt, params, use_cache=False)
+
+        if self.cache and self.enable_cache:
+            cached = self.cache.get(prompt, self.model, **params)
+            if cached:
+                self.usage.add_usage(cached, self.model)
+                return cached
+
+        key = _request_key(prompt, self.model, **params)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(prompt, params, use_cache=True))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            # Shielded so that a cancelled caller does not cancel the others
+            return await asyncio.shield(task)
+
+        response = await asyncio.shield(task)
+        shared = LLMResponse(
+            content=response.content,
+            provider=response.provider,
+            model=response.model,
+            cached=True,
+        )
+        self.usage.add_usage(shared, self.model)
+        return shared
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # Mark a failure as retrieved even when every caller was cancelled
+            task.exception()
+
+    async def _fetch(self, prompt: str, params: dict, use_cache: bool) -> LLMResponse:
+        """Send a request with retry, then cache it and track its usage."""
+        params = dict(params)
+        system_prompt = params.pop("system_prompt")
+        temperature = params.pop("temperature")
+        max_tokens = params.pop("max_tokens")
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self._limiter:
+                    start_time = time.time()
+                    response = await self._generate(
+                        prompt, system_prompt, temperature, max_tokens, **params
+                    )
+                response.latency_ms = (time.time() - start_time) * 1000
+
+                if use_cache and self.cache and self.enable_cache:
+                    self.cache.set(
+                        prompt,
+                        self.model,
+                        response,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        **params,
+                    )
+                self.usage.add_usage(response, self.model)
+                return response
+
+            except Exception:
+                if attempt == self.max_retries - 1:
+                    raise
+                # Exponential backoff, without holding a concurrency slot
+                await asyncio.sleep(2**attempt)
+
+        raise RuntimeError("Max retries exceeded")
+
+    async def _generate(
+        self, prompt: str, system_prompt: str | None, temperature: float, max_tokens: int, **kwargs
+    ) -> LLMResponse:
+        """One request to the provider."""
+        if self.provider == LLMProvider.ANTHROPIC:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system_prompt or "",
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs,
+            )
+            return _anthropic_response(response, self.model)
+
+        if self.client is not None:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=_chat_messages(prompt, system_prompt),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+            return _openai_response(response, self.provider, self.model)
+
+        # Mock provider, or a local one without the openai package
+        await asyncio.sleep(MOCK_LATENCY_SECONDS)
+        return _mock_response(prompt, self.model)
+
+    async def generate_many(
+        self, requests: Iterable[str | LLMRequest], return_exceptions: bool = False
+    ) -> list[LLMResponse | BaseException]:
+        """Generate a batch of prompts concurrently, returning responses in order.
+
+        With ``return_exceptions`` a failed request yields its exception in
+        place of a response instead of failing the whole batch.
+        """
+        batch = [LLMRequest(r) if isinstance(r, str) else r for r in requests]
+        return await asyncio.gather(
+            *(
+                self.generate(
+                    r.prompt, r.system_prompt, r.temperature, r.max_tokens, r.use_cache, **r.options
+                )
+                for r in batch
+            ),
+            return_exceptions=return_exceptions,
         )
 
     def get_usage_stats(self) -> dict:
         """Get usage statistics."""
         stats = self.usage.to_dict()
         stats["cache_size"] = self.cache.size if self.cache else 0
+        stats["in_flight"] = len(self._in_flight)
         return stats
 
     def reset_usage(self) -> None:
         """Reset usage statistics."""
         self.usage = TokenUsage()
 
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self.client is not None:
+            await self.client.close()
+
+    async def __aenter__(self) -> "AsyncLLMClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+async def generate_async(client: LLMClient | AsyncLLMClient, prompt: str, **kwargs) -> LLMResponse:
+    """Generate with either client from async code.
+
+    A sync ``LLMClient`` runs in a worker thread so the event loop stays free.
+    """
+    if isinstance(client, AsyncLLMClient):
+        return await client.generate(prompt, **kwargs)
+    return await asyncio.to_thread(client.generate, prompt, **kwargs)
+
+
+async def generate_many_async(
+    client: LLMClient | AsyncLLMClient,
+    requests: Iterable[str | LLMRequest],
+    return_exceptions: bool = False,
+) -> list[LLMResponse | BaseException]:
+    """``AsyncLLMClient.generate_many`` for either client.
+
+    A sync ``LLMClient`` sends the batch one request at a time in a worker
+    thread, as before.
+    """
+    if isinstance(client, AsyncLLMClient):
+        return await client.generate_many(requests, return_exceptions=return_exceptions)
+
+    def run_batch() -> list[LLMResponse | BaseException]:
+        responses = []
+        for r in requests:
+            r = LLMRequest(r) if isinstance(r, str) else r
+            try:
+                responses.append(
+                    client.generate(
+                        r.prompt,
+                        r.system_prompt,
+                        r.temperature,
+                        r.max_tokens,
+                        r.use_cache,
+                        **r.options,
+                    )
+                )
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                responses.append(e)
+        return responses
+
+    return await asyncio.to_thread(run_batch)
+
 
 class PromptTemplate:
     """Template for LLM prompts with variable substitution."""
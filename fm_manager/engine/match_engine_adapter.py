@@ -310,6 +310,144 @@ class AdaptedPlayer:
             return 0.70
 
 
+POSITION_CATEGORIES = {
+    "GK": ["GK"],
+    "DEF": ["DL", "DC", "DR", "WBL", "WBR", "LB", "RB", "CB", "LWB", "RWB"],
+    "MID": ["DM", "ML", "MC", "MR", "CDM", "CM", "LM", "RM"],
+    "ATT": ["AML", "AMC", "AMR", "FS", "TS", "CAM", "LW", "RW", "CF", "ST"],
+}
+
+
+def categorize_players(players: list) -> dict[str, list]:
+    """Group players by their best position category, strongest first."""
+    categorized = {"GK": [], "DEF": [], "MID": [], "ATT": []}
+    category_ratings = {}
+    
+    for player in players:
+        # Each position rating is looked up once and reused for the sort key
+        best_cat = "MID"
+        best_rating = 0
+        ratings = {}
+        for cat, positions in POSITION_CATEGORIES.items():
+            cat_best = 0
+            for p in positions:
+                rating = player.get_rating_for_position(p)
+                cat_best = max(cat_best, rating)
+                if rating > best_rating:
+                    best_rating = rating
+                    best_cat = cat
+            ratings[cat] = cat_best
+        
+        categorized[best_cat].append(player)
+        category_ratings[id(player)] = ratings
+    
+    for category, members in categorized.items():
+        members.sort(key=lambda p: category_ratings[id(p)][category], reverse=True)
+    
+    return categorized
+
+
+def select_lineup(players_by_position: dict[str, list], formation: str) -> list:
+    """Pick the strongest eleven for a formation from categorised players."""
+    if formation not in ClubSquadBuilder.FORMATIONS:
+        formation = "4-3-3"
+    
+    req = ClubSquadBuilder.FORMATIONS[formation]
+    lineup = []
+    for category in ("GK", "DEF", "MID", "ATT"):
+        lineup.extend(players_by_position[category][:req[category]])
+    
+    while len(lineup) < 11:
+        remaining = []
+        for category in players_by_position:
+            used_ids = {p.id for p in lineup}
+            remaining.extend([p for p in players_by_position[category] if p.id not in used_ids])
+        remaining.sort(key=lambda p: p.current_ability, reverse=True)
+        if remaining:
+            lineup.append(remaining[0])
+        else:
+            break
+    
+    return lineup[:11]
+
+
+def squad_condition(players) -> int:
+    """Version of the players' values, which cached AdaptedPlayers reflect.
+
+    Players loaded into a ``PlayerTable`` bump the table's version on every
+    write, e.g. fatigue or fitness after a match. Other player objects have
+    no version; call ``SquadCache.invalidate`` after changing them.
+    """
+    table = getattr(players[0], "table", None) if players else None
+    return table.version if table is not None else 0
+
+
+class _SquadEntry:
+    """Cached squad data for one club."""
+    
+    def __init__(self, club: ClubDataFull, key: tuple):
+        self.club = club
+        self.key = key
+        self.players_by_position = categorize_players(club.players)
+        self.refresh(squad_condition(club.players))
+    
+    def refresh(self, condition: int) -> None:
+        """Drop AdaptedPlayers and lineups built for an older player condition."""
+        self.condition = condition
+        self._adapted: Dict[int, AdaptedPlayer] = {}
+        self._lineups: Dict[str, List[AdaptedPlayer]] = {}
+    
+    def adapted(self, player) -> AdaptedPlayer:
+        adapted = self._adapted.get(id(player))
+        if adapted is None:
+            adapted = self._adapted[id(player)] = AdaptedPlayer(player)
+        return adapted
+    
+    def lineup(self, formation: str) -> List[AdaptedPlayer]:
+        lineup = self._lineups.get(formation)
+        if lineup is None:
+            players = select_lineup(self.players_by_position, formation)
+            lineup = self._lineups[formation] = [self.adapted(p) for p in players]
+        return lineup
+
+
+class SquadCache:
+    """Categorised players, AdaptedPlayers and lineups per club.
+    
+    Entries are keyed on ``ClubDataFull.squad_version`` and the squad size,
+    so players are categorised again only after a transfer or other squad
+    change marked with ``mark_squad_changed``. AdaptedPlayers and lineups
+    are also rebuilt when the players' ``PlayerTable`` is written to, e.g.
+    fatigue or fitness after injuries or rotation. Call ``invalidate`` after
+    editing players outside a table in place.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[int, _SquadEntry] = {}
+    
+    def entry(self, club: ClubDataFull) -> _SquadEntry:
+        key = (getattr(club, "squad_version", 0), len(club.players))
+        entry = self._entries.get(club.id)
+        if entry is None or entry.club is not club or entry.key != key:
+            entry = self._entries[club.id] = _SquadEntry(club, key)
+        else:
+            condition = squad_condition(club.players)
+            if condition != entry.condition:
+                entry.refresh(condition)
+        return entry
+    
+    def invalidate(self, club_id: Optional[int] = None) -> None:
+        """Drop one club's entry, or every entry."""
+        if club_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(club_id, None)
+
+
+# Shared by every ClubSquadBuilder unless one is passed explicitly
+squad_cache = SquadCache()
+
+
 class ClubSquadBuilder:
     """Build balanced squads from club data."""
 
@@ -321,58 +459,36 @@ class ClubSquadBuilder:
         "5-3-2": {"GK": 1, "DEF": 5, "MID": 3, "ATT": 2},
     }
 
-    POSITION_MAP = {
-        "GK": ["GK"],
-        "DEF": ["DL", "DC", "DR", "WBL", "WBR", "LB", "RB", "CB", "LWB", "RWB"],
-        "MID": ["DM", "ML", "MC", "MR", "CDM", "CM", "LM", "RM"],
-        "ATT": ["AML", "AMC", "AMR", "FS", "TS", "CAM", "LW", "RW", "CF", "ST"],
-    }
+    POSITION_MAP = POSITION_CATEGORIES
 
-    def __init__(self, club_data: ClubDataFull, enable_rotation: bool = False):
+    def __init__(
+        self,
+        club_data: ClubDataFull,
+        enable_rotation: bool = False,
+        cache: Optional[SquadCache] = None,
+    ):
         """
         Initialize squad builder.
 
         Args:
             club_data: 球队数据
             enable_rotation: 是否启用轮换系统
+            cache: 阵容缓存，默认使用共享的 squad_cache
         """
         self.club = club_data
-        self.players_by_position = self._categorize_players()
+        self._squad = (cache or squad_cache).entry(club_data)
+        self.players_by_position = self._squad.players_by_position
         self.enable_rotation = enable_rotation
 
         # 轮换系统
         if enable_rotation:
-            # 转换为AdaptedPlayer列表
-            adapted_squad = [AdaptedPlayer(p) for p in club_data.players]
+            # 转换为AdaptedPlayer列表（复用缓存的对象）
+            adapted_squad = [self._squad.adapted(p) for p in club_data.players]
             self.rotation_system = LineupSelector(
                 squad=adapted_squad,
                 formation="4-3-3"
             )
     
-    def _categorize_players(self) -> dict[str, list[PlayerDataFull]]:
-        categorized = {"GK": [], "DEF": [], "MID": [], "ATT": []}
-        
-        for player in self.club.players:
-            best_cat = "MID"
-            best_rating = 0
-            
-            for cat, positions in self.POSITION_MAP.items():
-                for p in positions:
-                    rating = player.get_rating_for_position(p)
-                    if rating > best_rating:
-                        best_rating = rating
-                        best_cat = cat
-            
-            categorized[best_cat].append(player)
-        
-        for category in categorized:
-            categorized[category].sort(
-                key=lambda p: max([p.get_rating_for_position(pos) for pos in self.POSITION_MAP[category]] + [0]),
-                reverse=True
-            )
-        
-        return categorized
-    
     def build_lineup(
         self,
         formation: str = "4-3-3",
@@ -407,37 +523,8 @@ class ClubSquadBuilder:
             # 转换为AdaptedPlayer
             return selected_players
 
-        # 原逻辑：不轮换，总是选择最强的11人
-        if formation not in self.FORMATIONS:
-            formation = "4-3-3"
-
-        req = self.FORMATIONS[formation].copy()
-        lineup = []
-
-        gk_needed = req.pop("GK")
-        lineup.extend(self.players_by_position["GK"][:gk_needed])
-
-        def_needed = req.pop("DEF")
-        lineup.extend(self.players_by_position["DEF"][:def_needed])
-
-        mid_needed = req.pop("MID")
-        lineup.extend(self.players_by_position["MID"][:mid_needed])
-
-        att_needed = req.pop("ATT")
-        lineup.extend(self.players_by_position["ATT"][:att_needed])
-
-        while len(lineup) < 11:
-            remaining = []
-            for category in self.players_by_position:
-                used_ids = {p.id for p in lineup}
-                remaining.extend([p for p in self.players_by_position[category] if p.id not in used_ids])
-            remaining.sort(key=lambda p: p.current_ability, reverse=True)
-            if remaining:
-                lineup.append(remaining[0])
-            else:
-                break
-
-        return [AdaptedPlayer(p) for p in lineup[:11]]
+        # 原逻辑：不轮换，总是选择最强的11人（缓存，直到阵容变化）
+        return list(self._squad.lineup(formation))
 
     def update_rotation_after_match(
         self,
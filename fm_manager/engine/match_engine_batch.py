@@ -0,0 +1,920 @@
+"""Batched Markov match simulation over NumPy arrays.
+
+``EnhancedMarkovEngine.simulate`` plays one match at a time through per-event
+Python code. For whole-league and Monte Carlo runs this module advances many
+fixtures in lockstep instead: zone, possession, score, momentum, fatigue and
+per-player counters live in arrays indexed by match, and every event step is a
+handful of vectorised operations over all matches that are still in play.
+
+The state machine mirrors the scalar engine event for event (zone transition
+weights, player selection pools, pass/shot/foul resolution, momentum and stat
+accounting), so outcome distributions match. The random streams differ, so a
+batch run is not bit-identical to the same fixtures played one by one.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from heapq import merge
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from fm_manager.engine.match_engine_markov import (
+    MatchEvent,
+    MatchEventType,
+    MatchState,
+    PitchZone,
+    PlayerMatchState,
+    ResultDetail,
+)
+
+if TYPE_CHECKING:
+    from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine
+
+
+@dataclass
+class BatchFixture:
+    """A single fixture queued for batched simulation."""
+
+    home_lineup: list
+    away_lineup: list
+    home_formation: str = "4-3-3"
+    away_formation: str = "4-3-3"
+
+
+FixtureLike = Union[BatchFixture, Tuple[list, list], Tuple[list, list, str, str]]
+
+
+# Zone indices follow the engine's zone order (home box -> away box)
+ZONES = (
+    PitchZone.HOME_BOX,
+    PitchZone.HOME_THIRD,
+    PitchZone.MIDFIELD,
+    PitchZone.AWAY_THIRD,
+    PitchZone.AWAY_BOX,
+)
+HOME_BOX, HOME_THIRD, MIDFIELD, AWAY_THIRD, AWAY_BOX = range(5)
+
+# Event columns of the zone transition matrix
+PASS, DRIBBLE, FOUL, SHOT, CLEARANCE = range(5)
+
+BASE_ZONE_PROBS = np.array(
+    [
+        [0.40, 0.10, 0.12, 0.08, 0.25],  # HOME_BOX
+        [0.52, 0.24, 0.13, 0.06, 0.05],  # HOME_THIRD
+        [0.55, 0.28, 0.09, 0.08, 0.0],  # MIDFIELD
+        [0.45, 0.25, 0.10, 0.20, 0.0],  # AWAY_THIRD
+        [0.30, 0.18, 0.12, 0.35, 0.0],  # AWAY_BOX
+    ]
+)
+
+# Per-event sensitivity to the attacking side's strength factor
+STRENGTH_WEIGHTS = np.array([0.30, 0.20, -0.15, 0.35, -0.40])
+
+# Rows of the player selection table: 0-4 pick a passer for that zone,
+# the remaining rows pick a player by role.
+SEL_GK, SEL_DEF, SEL_MID, SEL_ATT = 5, 6, 7, 8
+DRIBBLER_ROW = np.array([SEL_DEF, SEL_DEF, SEL_MID, SEL_ATT, SEL_ATT])
+
+# Recorded event codes
+(
+    EV_PASS_SUCCESS,
+    EV_PASS_FAIL,
+    EV_DRIBBLE_SUCCESS,
+    EV_DRIBBLE_FAIL,
+    EV_SHOT_ON_TARGET,
+    EV_SHOT_OFF_TARGET,
+    EV_GOAL,
+    EV_FOUL,
+    EV_YELLOW,
+    EV_RED,
+    EV_CLEARANCE,
+) = range(11)
+
+# Per-player counters kept as columns of one integer array
+COUNTER_FIELDS = (
+    "goals",
+    "assists",
+    "shots",
+    "shots_on_target",
+    "passes_attempted",
+    "passes_completed",
+    "key_passes",
+    "dribbles_attempted",
+    "dribbles",
+    "dribbles_completed",
+    "dribbles_failed",
+    "tackles",
+    "tackles_completed",
+    "tackles_attempted",
+    "interceptions",
+    "fouls",
+    "yellow_cards",
+    "red_cards",
+    "saves",
+    "goals_conceded",
+)
+(
+    C_GOALS,
+    C_ASSISTS,
+    C_SHOTS,
+    C_SHOTS_ON_TARGET,
+    C_PASSES_ATTEMPTED,
+    C_PASSES_COMPLETED,
+    C_KEY_PASSES,
+    C_DRIBBLES_ATTEMPTED,
+    C_DRIBBLES,
+    C_DRIBBLES_COMPLETED,
+    C_DRIBBLES_FAILED,
+    C_TACKLES,
+    C_TACKLES_COMPLETED,
+    C_TACKLES_ATTEMPTED,
+    C_INTERCEPTIONS,
+    C_FOULS,
+    C_YELLOW_CARDS,
+    C_RED_CARDS,
+    C_SAVES,
+    C_GOALS_CONCEDED,
+) = range(len(COUNTER_FIELDS))
+
+# Team counters
+(
+    T_PASSES,
+    T_SHOTS,
+    T_SHOTS_ON_TARGET,
+    T_FOULS,
+    T_SAVES,
+    T_GOALS_CONCEDED,
+) = range(6)
+
+# Position tokens used by the scalar engine's player selection helpers
+_ROLE_TOKENS = {
+    SEL_GK: ["GK"],
+    SEL_DEF: ["CB", "LB", "RB", "WB", "LCB", "RCB", "LWB", "RWB"],
+    SEL_MID: ["CM", "DM", "AM", "WM", "CDM", "CAM", "LM", "RM"],
+    SEL_ATT: ["ST", "CF", "WF", "AM", "LW", "RW", "SS"],
+}
+
+SHOT_DISTANCE = 15.0
+SHOT_ANGLE = 30.0
+MAX_EVENTS_PER_MINUTE = 6
+INJURY_CHECK_PROB = 0.0015
+
+
+def _normalise_fixture(fixture: FixtureLike) -> BatchFixture:
+    if isinstance(fixture, BatchFixture):
+        return fixture
+    return BatchFixture(*fixture)
+
+
+def _pool(positions: List[str], tokens: List[str]) -> np.ndarray:
+    """Membership weights of players whose position string contains any token."""
+    return np.array([float(any(t in pos for t in tokens)) for pos in positions])
+
+
+def _mixture(clauses: List[Tuple[float, np.ndarray]], n: int) -> np.ndarray:
+    """Selection probabilities of an ``if r < t and pool`` chain.
+
+    Each clause is ``(threshold, pool_weights)``; the first clause whose
+    threshold exceeds the uniform draw and whose pool is non-empty wins, and
+    the whole squad is the final fallback. Within a pool players are chosen
+    uniformly (weighted by how many times they appear in the pool).
+    """
+    cuts = sorted({0.0, 1.0, *(t for t, _ in clauses if t < 1.0)})
+    fallback = np.ones(n)
+    probs = np.zeros(n)
+    for lo, hi in zip(cuts[:-1], cuts[1:], strict=True):
+        mid = (lo + hi) / 2
+        chosen = fallback
+        for threshold, weights in clauses:
+            if mid < threshold and weights.sum() > 0:
+                chosen = weights
+                break
+        probs += (hi - lo) * chosen / chosen.sum()
+    return probs
+
+
+def _selection_table(players: list, width: int) -> np.ndarray:
+    """Build cumulative selection rows (passer by zone, then by role)."""
+    n = len(players)
+    positions = [str(getattr(p, "position", "")) for p in players]
+
+    gks = _pool(positions, ["GK"])
+    cbs = _pool(positions, ["CB"])
+    fbs = _pool(positions, ["LB", "RB", "WB"])
+    dms = _pool(positions, ["CDM"])
+    cms = _pool(positions, ["CM"])
+    cams = _pool(positions, ["CAM"])
+    wide_ams = _pool(positions, ["CAM", "LM", "RM", "LW", "RW"])
+    sts = _pool(positions, ["ST", "CF"])
+    wingers = _pool(positions, ["LW", "RW", "WF"])
+    inf = float("inf")
+
+    rows = [
+        _mixture([(0.70, gks), (inf, cbs)], n),
+        _mixture([(0.50, cbs), (0.80, fbs), (0.90, dms), (inf, cms)], n),
+        _mixture([(0.60, cms + dms), (0.85, fbs), (inf, cams)], n),
+        _mixture([(0.40, wide_ams), (0.70, sts), (0.95, fbs)], n),
+        _mixture([(0.40, sts), (0.75, wingers), (0.95, cams), (inf, fbs)], n),
+    ]
+    for row in (SEL_GK, SEL_DEF, SEL_MID, SEL_ATT):
+        rows.append(_mixture([(inf, _pool(positions, _ROLE_TOKENS[row]))], n))
+
+    table = np.ones((len(rows), width))
+    cdf = np.cumsum(np.array(rows), axis=1)
+    table[:, :n] = cdf
+    # Guard against rounding leaving the last player unreachable
+    table[:, n - 1 :] = 1.0
+    return table
+
+
+def _attribute(players: list, name: str) -> np.ndarray:
+    return np.array([float(getattr(p, name, 70)) for p in players])
+
+
+def _position_value(player) -> Optional[str]:
+    position = getattr(player, "position", None)
+    if not position:
+        return None
+    return position.value if hasattr(position, "value") else str(position)
+
+
+@dataclass
+class _SideProfile:
+    """Precomputed arrays for one lineup playing one formation."""
+
+    select_cdf: np.ndarray
+    overall: float
+    mid_strength: float
+    tempo: float
+    wide: bool
+    pass_score: np.ndarray
+    shooting: np.ndarray
+    positioning: np.ndarray
+    reflexes: np.ndarray
+    def_score: np.ndarray
+    header_chance: np.ndarray
+
+
+class BatchMarkovSimulator:
+    """Simulate many fixtures in lockstep with the enhanced Markov model."""
+
+    def __init__(self, engine: "EnhancedMarkovEngine", random_seed: Optional[int] = None):
+        self.engine = engine
+        self.rng = np.random.default_rng(random_seed)
+
+    def simulate(
+        self,
+        fixtures: Sequence[FixtureLike],
+        detail: ResultDetail | str = ResultDetail.FULL,
+    ) -> List[MatchState]:
+        """Simulate all fixtures and return one ``MatchState`` per fixture.
+
+        ``detail`` has the same meaning as in ``EnhancedMarkovEngine.simulate``;
+        below ``FULL`` no events are recorded or materialised.
+        """
+        self._detail = ResultDetail(detail)
+        self._record_events = self._detail is ResultDetail.FULL
+        self._fixtures = [_normalise_fixture(f) for f in fixtures]
+        if not self._fixtures:
+            return []
+
+        self._prepare()
+
+        self._seq = 0
+        self._records: List[Tuple[np.ndarray, ...]] = []
+        self._injuries: Dict[int, List[Tuple[int, MatchEvent]]] = {}
+
+        all_matches = np.arange(self.n)
+        for minute in range(1, 91):
+            self._minute = minute
+            self.minute_score_diff = self.score[:, 0] - self.score[:, 1]
+            active = all_matches
+            for _ in range(MAX_EVENTS_PER_MINUTE):
+                if active.size == 0:
+                    break
+                stop = self._step(active, minute)
+                active = active[~stop]
+
+            injured = np.flatnonzero(self.rng.random(self.n) < INJURY_CHECK_PROB)
+            for m in injured.tolist():
+                self._handle_injury(m, minute)
+
+        if self._record_events:
+            self._index_events()
+        return [self._build_state(m) for m in range(self.n)]
+
+    # === Setup ===
+
+    def _prepare(self) -> None:
+        n = self.n = len(self._fixtures)
+
+        # Player lists mirror MatchState's name-keyed stats dicts. Fixtures
+        # commonly repeat the same lineup objects, so squads are built once.
+        squads: Dict[int, list] = {}
+        self.squads: List[Tuple[list, list]] = []
+        for fixture in self._fixtures:
+            if not fixture.home_lineup or not fixture.away_lineup:
+                raise ValueError("Batched simulation requires non-empty lineups")
+            pair = []
+            for lineup in (fixture.home_lineup, fixture.away_lineup):
+                squad = squads.get(id(lineup))
+                if squad is None:
+                    squad = squads[id(lineup)] = list({p.full_name: p for p in lineup}.values())
+                pair.append(squad)
+            self.squads.append((pair[0], pair[1]))
+
+        width = self.width = max(len(s) for s in squads.values())
+
+        self.select_cdf = np.ones((n, 2, 9, width))
+        self.pass_score = np.zeros((n, 2, width))
+        self.shooting = np.zeros((n, 2, width))
+        self.positioning = np.zeros((n, 2, width))
+        self.reflexes = np.zeros((n, 2, width))
+        self.def_score = np.zeros((n, 2, width))
+        self.header_chance = np.zeros((n, 2, width))
+
+        self.overall = np.zeros((n, 2))
+        self.mid_strength = np.zeros((n, 2))
+        self.tempo = np.ones((n, 2))
+        self.wide = np.zeros((n, 2), dtype=bool)
+
+        profiles: Dict[Tuple[int, str], _SideProfile] = {}
+        for m, fixture in enumerate(self._fixtures):
+            lineups = (fixture.home_lineup, fixture.away_lineup)
+            formations = (fixture.home_formation, fixture.away_formation)
+            for side in (0, 1):
+                key = (id(lineups[side]), formations[side])
+                profile = profiles.get(key)
+                if profile is None:
+                    profile = profiles[key] = self._side_profile(
+                        self.squads[m][side], lineups[side], formations[side]
+                    )
+                k = len(self.squads[m][side])
+                self.select_cdf[m, side] = profile.select_cdf
+                self.overall[m, side] = profile.overall
+                self.mid_strength[m, side] = profile.mid_strength
+                self.tempo[m, side] = profile.tempo
+                self.wide[m, side] = profile.wide
+                self.pass_score[m, side, :k] = profile.pass_score
+                self.shooting[m, side, :k] = profile.shooting
+                self.positioning[m, side, :k] = profile.positioning
+                self.reflexes[m, side, :k] = profile.reflexes
+                self.def_score[m, side, :k] = profile.def_score
+                self.header_chance[m, side, :k] = profile.header_chance
+
+        diff = self.overall[:, 0] - self.overall[:, 1]
+        self.strength_factor = np.stack([diff / 50.0 + 0.05, -diff / 50.0 - 0.05], axis=1)
+
+        # Dynamic state
+        home_prob = np.clip(0.5 + diff / 120, 0.30, 0.70)
+        self.possession = np.where(self.rng.random(n) < home_prob, 0, 1)
+        self.zone = np.full(n, MIDFIELD)
+        self.score = np.zeros((n, 2), dtype=np.int64)
+        self.attacking_momentum = np.zeros((n, 2))
+        self.defensive_stability = np.zeros((n, 2))
+        self.last_passer = np.full((n, 2), -1)
+        self.last_pass_minute = np.zeros((n, 2), dtype=np.int64)
+        self.counters = np.zeros((n, 2, width, len(COUNTER_FIELDS)), dtype=np.int64)
+        self.fatigue = np.zeros((n, 2, width))
+        self.team_counters = np.zeros((n, 2, 6), dtype=np.int64)
+        self.injured = np.zeros((n, 2, width), dtype=bool)
+        self._chemistry: Dict[int, Tuple[float, float]] = {}
+
+    def _side_profile(self, players: list, lineup: list, formation: str) -> "_SideProfile":
+        """Per-lineup arrays; immutable for the duration of a batch."""
+        engine = self.engine
+        strength = engine._calculate_team_strength(lineup)
+        tactics = engine._get_formation_tactics(formation)
+
+        ca = _attribute(players, "current_ability")
+        passing = _attribute(players, "passing")
+        positioning = _attribute(players, "positioning")
+        pace = _attribute(players, "pace")
+        header_chance = np.zeros(len(players))
+        for i, player in enumerate(players):
+            pos = _position_value(player)
+            if pos is not None:
+                header_chance[i] = 0.20 if pos in ["ST", "CF"] else 0.10
+
+        return _SideProfile(
+            select_cdf=_selection_table(players, self.width),
+            overall=strength["overall"],
+            mid_strength=strength["mid"],
+            tempo=tactics.tempo,
+            wide=tactics.width * 1.1 > 1.0,
+            pass_score=ca * 0.35 + passing * 0.35 + positioning * 0.20 + pace * 0.10,
+            shooting=_attribute(players, "shooting"),
+            positioning=positioning,
+            reflexes=_attribute(players, "reflexes"),
+            def_score=(
+                _attribute(players, "tackling") * 0.40
+                + _attribute(players, "marking") * 0.35
+                + positioning * 0.25
+            ),
+            header_chance=header_chance,
+        )
+
+    # === Event loop ===
+
+    def _momentum(self, m: np.ndarray, side: np.ndarray) -> np.ndarray:
+        base = (self.attacking_momentum[m, side] + self.defensive_stability[m, side]) / 2.0
+        return 1.0 + base / 20.0
+
+    def _pick(self, m: np.ndarray, side: np.ndarray, row, u: np.ndarray) -> np.ndarray:
+        cdf = self.select_cdf[m, side, row]
+        return (cdf < u[:, None]).sum(axis=1)
+
+    def _tire(self, m: np.ndarray, side: np.ndarray, player: np.ndarray, amount: float) -> None:
+        self.fatigue[m, side, player] = np.minimum(100.0, self.fatigue[m, side, player] + amount)
+
+    def _record(self, m, code, team, player, zone, xg=None, aux=None) -> None:
+        k = len(m)
+        if k == 0 or not self._record_events:
+            return
+        self._records.append(
+            (
+                m,
+                np.full(k, self._seq),
+                np.full(k, self._minute),
+                np.broadcast_to(code, k),
+                team,
+                player,
+                zone,
+                np.zeros(k) if xg is None else xg,
+                np.full(k, -1) if aux is None else aux,
+            )
+        )
+
+    def _step(self, m: np.ndarray, minute: int) -> np.ndarray:
+        """Play one event for every match in ``m``; return the stop mask."""
+        self._seq += 1
+        k = len(m)
+        u = self.rng.random((k, 8))
+        side = self.possession[m]
+        zone = self.zone[m]
+        score_diff = self.minute_score_diff[m]
+
+        probs = BASE_ZONE_PROBS[zone] * (
+            1.0 + self.strength_factor[m, side][:, None] * STRENGTH_WEIGHTS
+        )
+
+        tempo = self.tempo[m, side]
+        if minute > 75:
+            tempo = np.where(
+                score_diff > 0, tempo * 0.8, np.where(score_diff < 0, tempo * 1.2, tempo)
+            )
+        fast = tempo > 1.1
+        slow = tempo < 0.9
+        probs[fast, PASS] *= 0.9
+        probs[fast, DRIBBLE] *= 1.2
+        probs[slow, PASS] *= 1.2
+        probs[slow, DRIBBLE] *= 0.8
+
+        wide = self.wide[m, side] & ((zone == HOME_THIRD) | (zone == AWAY_THIRD))
+        probs[wide, DRIBBLE] *= 1.3
+
+        # Scalar engine reads the attacking side's momentum here
+        momentum = self._momentum(m, side)
+        low = momentum < 0.9
+        high = momentum > 1.1
+        probs[low, SHOT] *= 1.3
+        probs[low, PASS] *= 0.9
+        probs[high, SHOT] *= 0.7
+        probs[high, CLEARANCE] *= 1.3
+
+        if minute > 80:
+            losing = ((side == 0) & (score_diff < 0)) | ((side == 1) & (score_diff > 0))
+            desperate = (np.abs(score_diff) >= 2) & losing
+            probs[desperate, SHOT] *= 1.15
+            probs[desperate, PASS] *= 0.95
+
+        cum = np.cumsum(probs, axis=1)
+        event = (cum[:, :-1] < (u[:, 0] * cum[:, -1])[:, None]).sum(axis=1)
+
+        stop = np.zeros(k, dtype=bool)
+        for event_type, handler in (
+            (PASS, self._handle_pass),
+            (DRIBBLE, self._handle_dribble),
+            (SHOT, self._handle_shot),
+            (FOUL, self._handle_foul),
+            (CLEARANCE, self._handle_clearance),
+        ):
+            rows = np.flatnonzero(event == event_type)
+            if rows.size:
+                stop[rows] = handler(m[rows], side[rows], u[rows], minute)
+        return stop
+
+    def _advance(self, zone: np.ndarray, side: np.ndarray) -> np.ndarray:
+        return np.clip(zone + np.where(side == 0, 1, -1), HOME_BOX, AWAY_BOX)
+
+    def _handle_pass(self, m, side, u, minute) -> np.ndarray:
+        other = 1 - side
+        zone = self.zone[m]
+        passer = self._pick(m, side, zone, u[:, 1])
+        self.counters[m, side, passer, C_PASSES_ATTEMPTED] += 1
+        self._tire(m, side, passer, 0.3)
+
+        attacker_score = self.pass_score[m, side, passer] * self._momentum(m, side)
+        defender_score = self.mid_strength[m, other]
+        team_diff = self.score[m, side] - self.score[m, other]
+        overall_diff = self.overall[m, side] - self.overall[m, other]
+        late = (team_diff < 0) & (minute > 70)
+        success_prob = np.where(
+            late,
+            0.65 + (attacker_score - defender_score) / 150 + overall_diff / 60,
+            0.65 + (attacker_score - defender_score) / 120 + overall_diff / 50,
+        )
+        success_prob += np.where(side == 0, 0.03, -0.03)
+        success = u[:, 2] < np.clip(success_prob, 0.40, 0.98)
+
+        # Completed passes
+        s_m, s_side, s_passer = m[success], side[success], passer[success]
+        new_zone = self._advance(zone[success], s_side)
+        self.zone[s_m] = new_zone
+        self.counters[s_m, s_side, s_passer, C_PASSES_COMPLETED] += 1
+        key = new_zone >= AWAY_THIRD
+        self.counters[s_m[key], s_side[key], s_passer[key], C_KEY_PASSES] += 1
+        self.last_passer[s_m[key], s_side[key]] = s_passer[key]
+        self.last_pass_minute[s_m[key], s_side[key]] = minute
+        stale = (self.last_passer[s_m, s_side] >= 0) & (
+            minute - self.last_pass_minute[s_m, s_side] > 2
+        )
+        self.last_passer[s_m[stale], s_side[stale]] = -1
+        self.team_counters[s_m, s_side, T_PASSES] += 1
+        self._record(s_m, EV_PASS_SUCCESS, s_side, s_passer, new_zone)
+
+        # Interceptions
+        failed = ~success
+        f_m, f_side, f_other = m[failed], side[failed], other[failed]
+        interceptor = self._pick(f_m, f_other, SEL_DEF, u[failed, 3])
+        self.counters[f_m, f_other, interceptor, C_INTERCEPTIONS] += 1
+        self._tire(f_m, f_other, interceptor, 0.4)
+        self.possession[f_m] = f_other
+        loose = (u[failed, 4] < 0.55).astype(np.int64)
+        self._record(f_m, EV_PASS_FAIL, f_side, passer[failed], zone[failed], aux=loose)
+
+        return np.zeros(len(m), dtype=bool)
+
+    def _handle_dribble(self, m, side, u, minute) -> np.ndarray:
+        other = 1 - side
+        zone = self.zone[m]
+        dribbler = self._pick(m, side, DRIBBLER_ROW[zone], u[:, 1])
+        self.counters[m, side, dribbler, C_DRIBBLES_ATTEMPTED] += 1
+        self._tire(m, side, dribbler, 0.5)
+
+        success = u[:, 2] < 0.6
+        s_m, s_side, s_player = m[success], side[success], dribbler[success]
+        self.counters[s_m, s_side, s_player, C_DRIBBLES] += 1
+        self.counters[s_m, s_side, s_player, C_DRIBBLES_COMPLETED] += 1
+        self.zone[s_m] = self._advance(zone[success], s_side)
+        self._record(s_m, EV_DRIBBLE_SUCCESS, s_side, s_player, np.full(len(s_m), -1))
+
+        failed = ~success
+        f_m, f_other = m[failed], other[failed]
+        self.counters[f_m, side[failed], dribbler[failed], C_DRIBBLES_FAILED] += 1
+        tackler = self._pick(f_m, f_other, SEL_DEF, u[failed, 3])
+        for col in (C_TACKLES, C_TACKLES_COMPLETED, C_TACKLES_ATTEMPTED):
+            self.counters[f_m, f_other, tackler, col] += 1
+        self._tire(f_m, f_other, tackler, 0.4)
+        self.possession[f_m] = f_other
+        self._record(f_m, EV_DRIBBLE_FAIL, side[failed], dribbler[failed], np.full(len(f_m), -1))
+
+        return np.zeros(len(m), dtype=bool)
+
+    def _handle_shot(self, m, side, u, minute) -> np.ndarray:
+        other = 1 - side
+        zone = self.zone[m]
+        score_diff = self.minute_score_diff[m]
+
+        shooter = self._pick(m, side, SEL_ATT, u[:, 1])
+        self.counters[m, side, shooter, C_SHOTS] += 1
+        self._tire(m, side, shooter, 0.7)
+
+        header_chance = np.where(zone == AWAY_BOX, self.header_chance[m, side, shooter], 0.0)
+        is_header = u[:, 2] < header_chance
+
+        keeper = self._pick(m, other, SEL_GK, u[:, 3])
+
+        if minute > 75:
+            pressure = 0.4
+        elif minute > 60:
+            pressure = 0.2
+        else:
+            pressure = 0.0
+        total_pressure = pressure + np.where((minute > 80) & (np.abs(score_diff) <= 1), 0.3, 0.0)
+
+        pressed = u[:, 4] < 0.65
+        defender = self._pick(m, other, SEL_DEF, u[:, 5])
+        defensive_pressure = np.where(
+            pressed, np.clip((self.def_score[m, other, defender] - 50) / 100.0, 0.0, 0.8), 0.0
+        )
+        overall_diff = self.overall[m, side] - self.overall[m, other]
+        defensive_pressure *= np.maximum(0.4, 1.0 - overall_diff / 80)
+
+        # compute_shot_xg with the engine's fixed shot location
+        shooting_factor = (
+            self.shooting[m, side, shooter] + self.positioning[m, side, shooter]
+        ) / 200
+        gk_factor = 1 - (
+            (self.reflexes[m, other, keeper] + self.positioning[m, other, keeper]) / 400
+        )
+        distance_factor = max(0.3, 1 - (SHOT_DISTANCE / 100))
+        xg = 0.11 * shooting_factor * gk_factor * distance_factor
+        xg = np.where(total_pressure > 0, xg * np.maximum(0.5, 1 - total_pressure / 100), xg)
+        xg = np.where(
+            defensive_pressure > 0, xg * np.maximum(0.5, 1 - defensive_pressure / 100), xg
+        )
+        xg = np.where(is_header, xg * 0.8, xg)
+        goal_prob = np.clip(xg, 0.01, 0.95)
+        on_target_prob = np.minimum(0.98, goal_prob * 2.5)
+
+        final_goal_prob = goal_prob * self._momentum(m, side)
+        final_goal_prob = np.where(side == 0, final_goal_prob * 1.04, final_goal_prob)
+
+        roll = u[:, 6]
+        goal = roll < final_goal_prob
+        saved = ~goal & (roll < on_target_prob)
+        off_target = ~goal & ~saved
+
+        # Goals
+        g_m, g_side, g_other, g_shooter = m[goal], side[goal], other[goal], shooter[goal]
+        self.score[g_m, g_side] += 1
+        self.counters[g_m, g_side, g_shooter, C_GOALS] += 1
+        self.counters[g_m, g_side, g_shooter, C_SHOTS_ON_TARGET] += 1
+        assister = self.last_passer[g_m, g_side]
+        assisted = (assister >= 0) & (minute - self.last_pass_minute[g_m, g_side] <= 2)
+        self.counters[g_m[assisted], g_side[assisted], assister[assisted], C_ASSISTS] += 1
+        self.last_passer[g_m[assisted], g_side[assisted]] = -1
+        conceding_keeper = self._pick(g_m, g_other, SEL_GK, u[goal, 7])
+        self.counters[g_m, g_other, conceding_keeper, C_GOALS_CONCEDED] += 1
+        self.team_counters[g_m, g_other, T_GOALS_CONCEDED] += 1
+        self.team_counters[g_m, g_side, T_SHOTS] += 1
+        self.team_counters[g_m, g_side, T_SHOTS_ON_TARGET] += 2
+        self.attacking_momentum[g_m, g_side] = np.clip(
+            self.attacking_momentum[g_m, g_side] + 3.0, -10, 10
+        )
+        self.attacking_momentum[g_m, g_other] = np.maximum(
+            -10, self.attacking_momentum[g_m, g_other] - 4.0
+        )
+        self._record(
+            g_m,
+            EV_GOAL,
+            g_side,
+            g_shooter,
+            zone[goal],
+            aux=np.where(assisted, assister, -1),
+        )
+
+        # Saves
+        s_m, s_side, s_other = m[saved], side[saved], other[saved]
+        self.counters[s_m, s_other, keeper[saved], C_SAVES] += 1
+        self.team_counters[s_m, s_other, T_SAVES] += 1
+        self.team_counters[s_m, s_side, T_SHOTS] += 1
+        self.team_counters[s_m, s_side, T_SHOTS_ON_TARGET] += 1
+        self.attacking_momentum[s_m, s_side] = np.minimum(
+            10, self.attacking_momentum[s_m, s_side] + 0.5
+        )
+        self.defensive_stability[s_m, s_other] = np.maximum(
+            -10, self.defensive_stability[s_m, s_other] - 0.5
+        )
+        self._record(
+            s_m, EV_SHOT_ON_TARGET, s_side, shooter[saved], zone[saved], xg=goal_prob[saved]
+        )
+
+        self._record(
+            m[off_target],
+            EV_SHOT_OFF_TARGET,
+            side[off_target],
+            shooter[off_target],
+            zone[off_target],
+            xg=goal_prob[off_target],
+        )
+
+        return goal | off_target
+
+    def _handle_foul(self, m, side, u, minute) -> np.ndarray:
+        other = 1 - side
+        fouler = self._pick(m, other, SEL_DEF, u[:, 1])
+        self.counters[m, other, fouler, C_FOULS] += 1
+        self.team_counters[m, other, T_FOULS] += 1
+
+        card_roll = u[:, 2] + np.where(self.defensive_stability[m, other] < -5, 0.01, 0.0)
+        red = card_roll < 0.005
+        yellow = ~red & (card_roll < 0.025)
+        self.counters[m[red], other[red], fouler[red], C_RED_CARDS] += 1
+        self.counters[m[yellow], other[yellow], fouler[yellow], C_YELLOW_CARDS] += 1
+
+        code = np.where(red, EV_RED, np.where(yellow, EV_YELLOW, EV_FOUL))
+        self._record(m, code, other, fouler, self.zone[m])
+        return red | yellow
+
+    def _handle_clearance(self, m, side, u, minute) -> np.ndarray:
+        # Matches the scalar engine: the ball goes to midfield and the
+        # attacking side keeps possession.
+        other = 1 - side
+        self.zone[m] = MIDFIELD
+        self.defensive_stability[m, other] = np.minimum(
+            10, self.defensive_stability[m, other] + 0.5
+        )
+        k = len(m)
+        self._record(m, EV_CLEARANCE, other, np.full(k, -1), np.full(k, -1))
+        return np.ones(k, dtype=bool)
+
+    def _handle_injury(self, m: int, minute: int) -> None:
+        engine = self.engine
+        if m not in self._chemistry:
+            fixture = self._fixtures[m]
+            self._chemistry[m] = (
+                engine.chemistry_engine.get_team_chemistry_modifier(fixture.home_lineup) * 100,
+                engine.chemistry_engine.get_team_chemistry_modifier(fixture.away_lineup) * 100,
+            )
+
+        for side, team in ((0, "home"), (1, "away")):
+            for i, player in enumerate(self.squads[m][side]):
+                risk = engine.injury_engine.simulate_injury_risk(
+                    player,
+                    match_importance="normal",
+                    fatigue=float(self.fatigue[m, side, i]),
+                    team_chemistry=self._chemistry[m][side],
+                )
+                if self.rng.random() < risk:
+                    self.injured[m, side, i] = True
+                    if not self._record_events:
+                        break
+
+                    injury = engine.injury_engine.generate_injury(
+                        player, getattr(player, "club_id", None) or 0, date.today()
+                    )
+                    weeks = injury.expected_return.day - injury.occurred_at.day
+                    event = MatchEvent(
+                        minute=minute,
+                        event_type=MatchEventType.INJURY,
+                        team=team,
+                        player=player.full_name,
+                        description=f"INJURY: {player.full_name} suffers {injury.injury_type.value} injury (out {weeks} weeks)",
+                        zone=ZONES[self.zone[m]],
+                    )
+                    self._injuries.setdefault(m, []).append((self._seq, event))
+                    break
+
+    # === Results ===
+
+    def _build_state(self, m: int) -> MatchState:
+        fixture = self._fixtures[m]
+        home_goals, away_goals = (int(g) for g in self.score[m])
+        match_state = MatchState(
+            home_lineup=fixture.home_lineup,
+            away_lineup=fixture.away_lineup,
+            minute=90,
+            home_goals=home_goals,
+            away_goals=away_goals,
+            home_score=home_goals,
+            away_score=away_goals,
+        )
+        if self._detail is ResultDetail.SCORE:
+            return match_state
+
+        for prefix, side in (("home", 0), ("away", 1)):
+            counters = self.team_counters[m, side].tolist()
+            setattr(match_state, f"{prefix}_passes", counters[T_PASSES])
+            setattr(match_state, f"{prefix}_shots", counters[T_SHOTS])
+            setattr(match_state, f"{prefix}_shots_on_target", counters[T_SHOTS_ON_TARGET])
+            setattr(match_state, f"{prefix}_fouls", counters[T_FOULS])
+            setattr(match_state, f"{prefix}_saves", counters[T_SAVES])
+            setattr(match_state, f"{prefix}_goals_conceded", counters[T_GOALS_CONCEDED])
+
+        total_passes = match_state.home_passes + match_state.away_passes
+        if total_passes > 0:
+            match_state.home_possession = (match_state.home_passes / total_passes) * 100
+
+        if self._detail is ResultDetail.TEAM_STATS:
+            return match_state
+
+        home, away = self.squads[m]
+        match_state.home_player_stats = self._player_stats(m, 0, home)
+        match_state.away_player_stats = self._player_stats(m, 1, away)
+        match_state.events = self._events_for(m)
+        match_state.events.append(
+            MatchEvent(
+                minute=90,
+                event_type=MatchEventType.FULL_TIME,
+                team="",
+                description=f"Full Time: {match_state.score_string()}",
+            )
+        )
+
+        self.engine._calculate_match_ratings_enhanced(match_state)
+        return match_state
+
+    def _player_stats(self, m: int, side: int, players: list) -> Dict[str, PlayerMatchState]:
+        counters = self.counters[m, side].tolist()
+        fatigue = self.fatigue[m, side].tolist()
+        injured = self.injured[m, side].tolist()
+        stats = {}
+        for i, player in enumerate(players):
+            state = PlayerMatchState(player)
+            for name, value in zip(COUNTER_FIELDS, counters[i], strict=True):
+                setattr(state, name, value)
+            state.fatigue = fatigue[i]
+            state.is_injured = injured[i]
+            state.minutes_played = 90
+            stats[player.full_name] = state
+        return stats
+
+    def _events_for(self, m: int) -> List[MatchEvent]:
+        start, end = self._event_bounds[m]
+        rows = self._event_rows
+        squads = self.squads[m]
+        events = [
+            (seq, self._make_event(squads, minute, code, team, player, zone, xg, aux))
+            for seq, minute, code, team, player, zone, xg, aux in zip(
+                *(col[start:end] for col in rows), strict=True
+            )
+        ]
+
+        injuries = self._injuries.get(m)
+        if injuries:
+            events = list(merge(events, injuries, key=lambda item: item[0]))
+        return [event for _, event in events]
+
+    def _index_events(self) -> None:
+        """Concatenate step records and group them per match in event order."""
+        columns = [np.concatenate(col) for col in zip(*self._records, strict=True)]
+        m = columns[0]
+        order = np.lexsort((columns[1], m))
+        self._event_rows = [col[order].tolist() for col in columns[1:]]
+        counts = np.bincount(m, minlength=self.n)
+        ends = np.cumsum(counts)
+        self._event_bounds = list(zip((ends - counts).tolist(), ends.tolist(), strict=True))
+
+    def _make_event(self, squads, minute, code, team, player, zone, xg, aux) -> MatchEvent:
+        team_name = "home" if team == 0 else "away"
+        squad = squads[team]
+        name = getattr(squad[player], "full_name", None) if player >= 0 else None
+        pitch_zone = ZONES[zone] if zone >= 0 else None
+
+        if code == EV_PASS_SUCCESS:
+            return MatchEvent(
+                minute,
+                MatchEventType.PASS_SUCCESS,
+                team_name,
+                f"Pass completed to {pitch_zone.name}",
+                name,
+                zone=pitch_zone,
+            )
+        if code == EV_PASS_FAIL:
+            description = (
+                "Pass intercepted - loose ball" if aux else "Pass intercepted - defense control"
+            )
+            return MatchEvent(
+                minute, MatchEventType.PASS_FAIL, team_name, description, name, zone=pitch_zone
+            )
+        if code == EV_DRIBBLE_SUCCESS:
+            return MatchEvent(minute, MatchEventType.DRIBBLE, team_name, "Dribble succeeded", name)
+        if code == EV_DRIBBLE_FAIL:
+            return MatchEvent(minute, MatchEventType.DRIBBLE, team_name, "Dribble failed", name)
+        if code == EV_SHOT_ON_TARGET:
+            return MatchEvent(
+                minute,
+                MatchEventType.SHOT_ON_TARGET,
+                team_name,
+                f"Shot saved by GK (xG: {xg:.2f})",
+                name,
+                zone=pitch_zone,
+            )
+        if code == EV_SHOT_OFF_TARGET:
+            return MatchEvent(
+                minute,
+                MatchEventType.SHOT_OFF_TARGET,
+                team_name,
+                f"Shot off target (xG: {xg:.2f})",
+                name,
+                zone=pitch_zone,
+            )
+        if code == EV_GOAL:
+            scorer = getattr(squad[player], "full_name", "Unknown")
+            description = f"GOAL! {scorer}"
+            if aux >= 0:
+                assist = getattr(squad[aux], "full_name", None)
+                if assist:
+                    description += f" (Assist: {assist})"
+            description += f" from {SHOT_DISTANCE:.1f}m, {SHOT_ANGLE:.1f}°"
+            event_type = MatchEventType.GOAL_HOME if team == 0 else MatchEventType.GOAL_AWAY
+            return MatchEvent(minute, event_type, team_name, description, scorer, zone=pitch_zone)
+        if code == EV_FOUL:
+            return MatchEvent(minute, MatchEventType.FOUL, team_name, "Foul", name, zone=pitch_zone)
+        if code == EV_YELLOW:
+            return MatchEvent(
+                minute, MatchEventType.YELLOW_CARD, team_name, "Yellow card", name, zone=pitch_zone
+            )
+        if code == EV_RED:
+            return MatchEvent(
+                minute,
+                MatchEventType.RED_CARD,
+                team_name,
+                "Red card! Straight red",
+                name,
+                zone=pitch_zone,
+            )
+        return MatchEvent(minute, MatchEventType.CLEARANCE, team_name, "Clearance")
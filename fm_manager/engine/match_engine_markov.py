@@ -12,12 +12,13 @@ Key improvements over v1:
 
 import random
 import math
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, Callable, Dict, List, Tuple
 
 from fm_manager.engine.injury_chemistry_engine import InjuryEngine, ChemistryEngine
-
+from fm_manager.engine.rng import derive_seed
 
 # === Base classes (previously imported from match_engine_markov) ===
 
@@ -68,6 +69,18 @@ class MatchEventType(Enum):
     SUBSTITUTION = "substitution"
 
 
+class ResultDetail(Enum):
+    """How much of a simulated match is recorded in the returned MatchState.
+
+    Every level plays exactly the same match: a seeded engine produces the same
+    score at each level, lower levels just skip the bookkeeping nobody reads.
+    """
+
+    SCORE = "score"  # Final score only
+    TEAM_STATS = "team_stats"  # Score plus team totals and possession
+    FULL = "full"  # Events, player stats and ratings as well
+
+
 @dataclass
 class GameState:
     """Current game state."""
@@ -177,6 +190,20 @@ class MatchState:
         return f"{self.home_goals}-{self.away_goals}"
 
 
+# Placeholder events returned by handlers when descriptions are not recorded;
+# the engine only reads their type and team.
+_LIGHT_EVENTS: Dict[Tuple[MatchEventType, str], "MatchEvent"] = {}
+
+
+def _light_event(event_type: MatchEventType, team: str) -> MatchEvent:
+    """Shared, description-less event for SCORE/TEAM_STATS simulations."""
+    event = _LIGHT_EVENTS.get((event_type, team))
+    if event is None:
+        event = MatchEvent(minute=0, event_type=event_type, team=team, description="")
+        _LIGHT_EVENTS[(event_type, team)] = event
+    return event
+
+
 def compute_shot_xg(
     shooter=None,
     goalkeeper=None,
@@ -258,6 +285,12 @@ class MarkovMatchEngine:
 
     def __init__(self, random_seed: Optional[int] = None):
         self.rng = random.Random(random_seed)
+        self._pool_cache: Dict[str, Tuple[dict, Dict[str, List[PlayerMatchState]]]] = {}
+        self._record_events = True
+
+    def reseed(self, random_seed: Optional[int]) -> None:
+        """Restart the engine's random stream."""
+        self.rng = random.Random(random_seed)
 
     def simulate(self, home_lineup: list, away_lineup: list, **kwargs) -> MatchState:
         """Basic simulation - overridden by EnhancedMarkovEngine."""
@@ -291,56 +324,59 @@ class MarkovMatchEngine:
             match_state.away_shots += 1
             match_state.away_shots_on_target += 1
 
+    def _squad_pools(self, match_state: MatchState, team: str) -> Dict[str, List[PlayerMatchState]]:
+        """Group a side's players into the selection pools used below.
+
+        The lineup is fixed for the whole match, so pools are built once per
+        match and side instead of re-filtering position strings on every event.
+        """
+        stats = match_state.home_player_stats if team == "home" else match_state.away_player_stats
+        cached = self._pool_cache.get(team)
+        if cached is not None and cached[0] is stats:
+            return cached[1]
+
+        players = list(stats.values())
+        positions = [str(getattr(p.player, "position", "")) for p in players]
+
+        def having(*tokens: str) -> List[PlayerMatchState]:
+            return [
+                p
+                for p, pos in zip(players, positions, strict=True)
+                if any(t in pos for t in tokens)
+            ]
+
+        pools = {
+            "all": players,
+            "gk": having("GK"),
+            "def": having("CB", "LB", "RB", "WB", "LCB", "RCB", "LWB", "RWB"),
+            "mid": having("CM", "DM", "AM", "WM", "CDM", "CAM", "LM", "RM"),
+            "att": having("ST", "CF", "WF", "AM", "LW", "RW", "SS"),
+            "cb": having("CB"),
+            "fb": having("LB", "RB", "WB"),
+            "cdm": having("CDM"),
+            "cm": having("CM"),
+            "cam": having("CAM"),
+            "wide_am": having("CAM", "LM", "RM", "LW", "RW"),
+            "st": having("ST", "CF"),
+            "winger": having("LW", "RW", "WF"),
+        }
+        pools["cm_cdm"] = pools["cm"] + pools["cdm"]
+        self._pool_cache[team] = (stats, pools)
+        return pools
+
     def _select_player(
         self, match_state: MatchState, team: str, role: str
     ) -> Optional[PlayerMatchState]:
         """Select a player from the team based on role."""
-        if team == "home":
-            players = list(match_state.home_player_stats.values())
-        else:
-            players = list(match_state.away_player_stats.values())
+        pools = self._squad_pools(match_state, team)
+        players = pools["all"]
 
         if not players:
             return None
 
         # Filter by role if possible
-        if role == "gk":
-            gks = [p for p in players if "GK" in str(getattr(p.player, "position", ""))]
-            if gks:
-                return self.rng.choice(gks)
-        elif role == "def":
-            defs = [
-                p
-                for p in players
-                if any(
-                    pos in str(getattr(p.player, "position", ""))
-                    for pos in ["CB", "LB", "RB", "WB", "LCB", "RCB", "LWB", "RWB"]
-                )
-            ]
-            if defs:
-                return self.rng.choice(defs)
-        elif role == "mid":
-            mids = [
-                p
-                for p in players
-                if any(
-                    pos in str(getattr(p.player, "position", ""))
-                    for pos in ["CM", "DM", "AM", "WM", "CDM", "CAM", "LM", "RM"]
-                )
-            ]
-            if mids:
-                return self.rng.choice(mids)
-        elif role == "att":
-            atts = [
-                p
-                for p in players
-                if any(
-                    pos in str(getattr(p.player, "position", ""))
-                    for pos in ["ST", "CF", "WF", "AM", "LW", "RW", "SS"]
-                )
-            ]
-            if atts:
-                return self.rng.choice(atts)
+        if role in ("gk", "def", "mid", "att") and pools[role]:
+            return self.rng.choice(pools[role])
 
         # Fallback: return random player
         return self.rng.choice(players)
@@ -355,10 +391,8 @@ class MarkovMatchEngine:
         self, match_state: MatchState, team: str, zone: PitchZone
     ) -> Optional[PlayerMatchState]:
         """Select a passer based on zone for realistic position distribution."""
-        if team == "home":
-            players = list(match_state.home_player_stats.values())
-        else:
-            players = list(match_state.away_player_stats.values())
+        pools = self._squad_pools(match_state, team)
+        players = pools["all"]
 
         if not players:
             return None
@@ -366,8 +400,7 @@ class MarkovMatchEngine:
         # Zone-based position selection probabilities
         if zone == PitchZone.HOME_BOX:
             # Goalkeeper and central defenders build from back
-            gks = [p for p in players if "GK" in str(getattr(p.player, "position", ""))]
-            cbs = [p for p in players if "CB" in str(getattr(p.player, "position", ""))]
+            gks, cbs = pools["gk"], pools["cb"]
             if self.rng.random() < 0.70 and gks:
                 return self.rng.choice(gks)
             elif cbs:
@@ -376,14 +409,7 @@ class MarkovMatchEngine:
 
         elif zone == PitchZone.HOME_THIRD:
             # Defenders and defensive midfielders
-            cbs = [p for p in players if "CB" in str(getattr(p.player, "position", ""))]
-            fbs = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["LB", "RB", "WB"])
-            ]
-            dms = [p for p in players if "CDM" in str(getattr(p.player, "position", ""))]
-            cms = [p for p in players if "CM" in str(getattr(p.player, "position", ""))]
+            cbs, fbs, dms, cms = pools["cb"], pools["fb"], pools["cdm"], pools["cm"]
 
             r = self.rng.random()
             if r < 0.50 and cbs:
@@ -398,18 +424,10 @@ class MarkovMatchEngine:
 
         elif zone == PitchZone.MIDFIELD:
             # Central midfielders and full-backs
-            cms = [p for p in players if "CM" in str(getattr(p.player, "position", ""))]
-            dms = [p for p in players if "CDM" in str(getattr(p.player, "position", ""))]
-            fbs = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["LB", "RB", "WB"])
-            ]
-            ams = [p for p in players if "CAM" in str(getattr(p.player, "position", ""))]
+            mid_pool, fbs, ams = pools["cm_cdm"], pools["fb"], pools["cam"]
 
             r = self.rng.random()
-            if r < 0.60 and (cms or dms):
-                mid_pool = cms + dms
+            if r < 0.60 and mid_pool:
                 return self.rng.choice(mid_pool)
             elif r < 0.85 and fbs:
                 return self.rng.choice(fbs)
@@ -419,24 +437,7 @@ class MarkovMatchEngine:
 
         elif zone == PitchZone.AWAY_THIRD:
             # Attacking midfielders, wingers, strikers
-            ams = [
-                p
-                for p in players
-                if any(
-                    pos in str(getattr(p.player, "position", ""))
-                    for pos in ["CAM", "LM", "RM", "LW", "RW"]
-                )
-            ]
-            sts = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["ST", "CF"])
-            ]
-            fbs = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["LB", "RB", "WB"])
-            ]
+            ams, sts, fbs = pools["wide_am"], pools["st"], pools["fb"]
 
             r = self.rng.random()
             if r < 0.40 and ams:
@@ -449,22 +450,7 @@ class MarkovMatchEngine:
 
         elif zone == PitchZone.AWAY_BOX:
             # Strikers and wingers
-            sts = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["ST", "CF"])
-            ]
-            wingers = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["LW", "RW", "WF"])
-            ]
-            ams = [p for p in players if "CAM" in str(getattr(p.player, "position", ""))]
-            fbs = [
-                p
-                for p in players
-                if any(pos in str(getattr(p.player, "position", "")) for pos in ["LB", "RB", "WB"])
-            ]
+            sts, wingers, ams, fbs = pools["st"], pools["winger"], pools["cam"], pools["fb"]
 
             r = self.rng.random()
             if r < 0.40 and sts:
@@ -537,6 +523,8 @@ class MarkovMatchEngine:
                 dribbler.dribbles_completed += 1
 
             game_state.zone = self._advance_zone(game_state.zone, attacking_team)
+            if not self._record_events:
+                return _light_event(MatchEventType.DRIBBLE, attacking_team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.DRIBBLE,
@@ -559,6 +547,8 @@ class MarkovMatchEngine:
                     tackler.update_fatigue(0.4)
 
             game_state.possession = Possession.AWAY if attacking_team == "home" else Possession.HOME
+            if not self._record_events:
+                return _light_event(MatchEventType.DRIBBLE, attacking_team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.DRIBBLE,
@@ -583,6 +573,8 @@ class MarkovMatchEngine:
         # Clear ball to midfield
         game_state.zone = PitchZone.MIDFIELD
         game_state.possession = Possession.AWAY if defending_team == "home" else Possession.HOME
+        if not self._record_events:
+            return _light_event(MatchEventType.CLEARANCE, defending_team)
         return MatchEvent(
             minute=game_state.minute,
             event_type=MatchEventType.CLEARANCE,
@@ -692,20 +684,140 @@ class TacticalFormation:
         return base
 
 
+# Base event probabilities per zone, in sampling order
+ZONE_BASE_PROBS: Dict[PitchZone, Dict[str, float]] = {
+    PitchZone.HOME_BOX: {
+        "clearance": 0.25,
+        "pass": 0.40,
+        "dribble": 0.10,
+        "foul": 0.12,
+        "shot": 0.08,
+    },
+    PitchZone.HOME_THIRD: {
+        "pass": 0.52,
+        "dribble": 0.24,
+        "foul": 0.13,
+        "clearance": 0.05,
+        "shot": 0.06,
+    },
+    PitchZone.MIDFIELD: {
+        "pass": 0.55,
+        "dribble": 0.28,
+        "foul": 0.09,
+        "shot": 0.08,
+        "clearance": 0.0,
+    },
+    PitchZone.AWAY_THIRD: {
+        "pass": 0.45,
+        "dribble": 0.25,
+        "foul": 0.10,
+        "shot": 0.20,
+        "clearance": 0.0,
+    },
+    PitchZone.AWAY_BOX: {
+        "shot": 0.35,
+        "pass": 0.30,
+        "dribble": 0.18,
+        "foul": 0.12,
+        "clearance": 0.0,
+    },
+}
+
+# (zone, strength factor, tempo class, wide, momentum class, desperate)
+ZoneKey = Tuple[PitchZone, float, int, bool, int, bool]
+# (events, cumulative probabilities)
+ZoneTable = Tuple[Tuple[str, ...], Tuple[float, ...]]
+
+# Compiled tables are shared by all engines; the strength factor is exact
+# rather than bucketed, so a long-lived process is capped at this many.
+_ZONE_TABLE_CACHE_SIZE = 65536
+_ZONE_TABLES: Dict[ZoneKey, ZoneTable] = {}
+
+_STOP_EVENTS = frozenset(
+    {
+        MatchEventType.GOAL_HOME,
+        MatchEventType.GOAL_AWAY,
+        MatchEventType.CORNER_HOME,
+        MatchEventType.CORNER_AWAY,
+        MatchEventType.FREE_KICK,
+        MatchEventType.PENALTY,
+        MatchEventType.CLEARANCE,
+        MatchEventType.SHOT_OFF_TARGET,
+        MatchEventType.YELLOW_CARD,
+        MatchEventType.RED_CARD,
+    }
+)
+
+
+def _zone_probs(key: ZoneKey) -> Dict[str, float]:
+    """Normalised event probabilities for a zone context."""
+    zone, strength_factor, tempo_class, wide, momentum_class, desperate = key
+    probs = ZONE_BASE_PROBS[zone].copy()
+
+    probs["pass"] *= 1.0 + strength_factor * 0.30
+    probs["dribble"] *= 1.0 + strength_factor * 0.20
+    probs["clearance"] *= 1.0 - strength_factor * 0.40
+    probs["shot"] *= 1.0 + strength_factor * 0.35
+    probs["foul"] *= 1.0 - strength_factor * 0.15
+
+    # Tactical modifiers
+    if tempo_class > 0:  # Fast tempo
+        probs["pass"] *= 0.9
+        probs["dribble"] *= 1.2
+    elif tempo_class < 0:  # Slow tempo
+        probs["pass"] *= 1.2
+        probs["dribble"] *= 0.8
+
+    if wide:
+        probs["dribble"] *= 1.3
+
+    # Momentum modifiers
+    if momentum_class < 0:
+        probs["shot"] *= 1.3
+        probs["pass"] *= 0.9
+    elif momentum_class > 0:
+        probs["shot"] *= 0.7
+        probs["clearance"] *= 1.3
+
+    if desperate:
+        probs["shot"] *= 1.15
+        probs["pass"] *= 0.95
+
+    # Normalize
+    total = sum(probs.values())
+    return {k: v / total for k, v in probs.items()}
+
+
+def _zone_table(key: ZoneKey) -> ZoneTable:
+    """Cumulative event table for a zone context, compiled on first use."""
+    table = _ZONE_TABLES.get(key)
+    if table is None:
+        if len(_ZONE_TABLES) >= _ZONE_TABLE_CACHE_SIZE:
+            _ZONE_TABLES.clear()
+        events = []
+        cumulative = []
+        running = 0
+        for event, prob in _zone_probs(key).items():
+            running += prob
+            events.append(event)
+            cumulative.append(running)
+        table = (tuple(events), tuple(cumulative))
+        _ZONE_TABLES[key] = table
+    return table
+
+
 class EnhancedMarkovEngine:
     """Enhanced match engine with advanced tactical and psychological modeling."""
 
     def __init__(self, random_seed: Optional[int] = None):
-        self.rng = random.Random(random_seed)
-
         # Enhanced state tracking
         self.home_momentum = TeamMomentum(club_id=0)
         self.away_momentum = TeamMomentum(club_id=0)
         self.home_tactics = TacticalFormation()
         self.away_tactics = TacticalFormation()
 
-        self.injury_engine = InjuryEngine(random_seed)
-        self.chemistry_engine = ChemistryEngine(random_seed)
+        self.injury_engine = InjuryEngine()
+        self.chemistry_engine = ChemistryEngine()
 
         self.home_chemistry: float = 50.0
         self.away_chemistry: float = 50.0
@@ -716,8 +828,31 @@ class EnhancedMarkovEngine:
         # Match stage
         self._match_stage: MatchStage = MatchStage.OPENING
 
+        # Result level of the match being simulated
+        self._detail: ResultDetail = ResultDetail.FULL
+        self._record_events = True
+
         # Create base engine for helper methods
-        self._base_engine = MarkovMatchEngine(random_seed)
+        self._base_engine = MarkovMatchEngine()
+
+        self.reseed(random_seed)
+
+    def reseed(self, random_seed: Optional[int]) -> None:
+        """Restart all random streams from ``random_seed``.
+
+        The event, player-selection, injury and chemistry streams are derived
+        from the seed under separate keys, so they are independent of each
+        other. The same seed always replays the same match, and one engine
+        can be reused across fixtures by reseeding it per fixture (see
+        ``fm_manager.engine.rng.RandomStreams``).
+        """
+        if random_seed is None:
+            random_seed = random.SystemRandom().getrandbits(64)
+        self.random_seed = random_seed
+        self.rng = random.Random(random_seed)
+        self._base_engine.reseed(derive_seed(random_seed, "selection"))
+        self.injury_engine.rng = random.Random(derive_seed(random_seed, "injury"))
+        self.chemistry_engine.rng = random.Random(derive_seed(random_seed, "chemistry"))
 
     def simulate(
         self,
@@ -726,8 +861,22 @@ class EnhancedMarkovEngine:
         home_formation: str = "4-3-3",
         away_formation: str = "4-3-3",
         callback: Optional[Callable[[MatchState], None]] = None,
+        detail: ResultDetail | str = ResultDetail.FULL,
     ) -> MatchState:
-        """Simulate a full 90-minute match with enhanced realism."""
+        """Simulate a full 90-minute match with enhanced realism.
+
+        ``detail`` selects how much of the match is recorded (see
+        ``ResultDetail``). Callers that only need the result should pass
+        ``"score"``: event objects, descriptions and player ratings are skipped.
+        """
+        self._detail = ResultDetail(detail)
+        self._record_events = self._detail is ResultDetail.FULL
+        self._base_engine._record_events = self._record_events
+
+        # Each match starts from neutral momentum and a clean assist tracker
+        self.home_momentum = TeamMomentum(club_id=0)
+        self.away_momentum = TeamMomentum(club_id=0)
+        self._last_passer = {}
 
         # Initialize tactics
         self.home_tactics = self._get_formation_tactics(home_formation)
@@ -743,7 +892,7 @@ class EnhancedMarkovEngine:
         home_possession_prob = max(0.30, min(0.70, home_possession_prob))
 
         initial_possession = (
-            Possession.HOME if random.random() < home_possession_prob else Possession.AWAY
+            Possession.HOME if self.rng.random() < home_possession_prob else Possession.AWAY
         )
 
         # Initialize states
@@ -782,14 +931,16 @@ class EnhancedMarkovEngine:
                 )
 
                 if event:
-                    match_state.events.append(event)
+                    if self._record_events:
+                        match_state.events.append(event)
                     game_state.last_event = event.event_type
 
                     # Update momentum
                     self._update_momentum(event, game_state)
 
                     # Update stats using base engine
-                    self._base_engine._update_stats(match_state, event, game_state)
+                    if self._detail is not ResultDetail.SCORE:
+                        self._base_engine._update_stats(match_state, event, game_state)
                     events_this_minute += 1
 
                     # Stop conditions
@@ -812,6 +963,27 @@ class EnhancedMarkovEngine:
             if callback:
                 callback(match_state)
 
+        if self._detail is ResultDetail.SCORE:
+            return MatchState(
+                home_lineup=home_lineup,
+                away_lineup=away_lineup,
+                minute=90,
+                home_goals=game_state.home_score,
+                away_goals=game_state.away_score,
+                home_score=game_state.home_score,
+                away_score=game_state.away_score,
+            )
+
+        # Calculate final possession
+        total_passes = match_state.home_passes + match_state.away_passes
+        if total_passes > 0:
+            match_state.home_possession = (match_state.home_passes / total_passes) * 100
+
+        if self._detail is ResultDetail.TEAM_STATS:
+            match_state.home_player_stats = {}
+            match_state.away_player_stats = {}
+            return match_state
+
         # Final event
         match_state.events.append(
             MatchEvent(
@@ -822,11 +994,6 @@ class EnhancedMarkovEngine:
             )
         )
 
-        # Calculate final possession
-        total_passes = match_state.home_passes + match_state.away_passes
-        if total_passes > 0:
-            match_state.home_possession = (match_state.home_passes / total_passes) * 100
-
         for stats in match_state.home_player_stats.values():
             if not stats.is_subbed:
                 stats.minutes_played = 90
@@ -839,6 +1006,25 @@ class EnhancedMarkovEngine:
 
         return match_state
 
+    def simulate_batch(
+        self,
+        fixtures: list,
+        random_seed: Optional[int] = None,
+        detail: ResultDetail | str = ResultDetail.FULL,
+    ) -> List[MatchState]:
+        """Simulate many fixtures in lockstep over NumPy arrays.
+
+        Each fixture is a ``BatchFixture`` or a ``(home_lineup, away_lineup)``
+        tuple, optionally followed by the two formations. Results come back in
+        fixture order with the same shape as ``simulate``. Without an explicit
+        seed the batch stream is drawn from this engine's RNG.
+        """
+        from fm_manager.engine.match_engine_batch import BatchMarkovSimulator
+
+        if random_seed is None:
+            random_seed = self.rng.getrandbits(64)
+        return BatchMarkovSimulator(self, random_seed).simulate(fixtures, detail)
+
     def _get_match_stage(self, minute: int) -> MatchStage:
         """Determine current match stage."""
         if minute <= 15:
@@ -898,19 +1084,21 @@ class EnhancedMarkovEngine:
         def_momentum = self.away_momentum if defending_team == "home" else self.home_momentum
 
         # Get event probabilities
-        zone_probs = self._get_enhanced_zone_probs(
-            game_state.zone,
-            att_strength,
-            def_strength,
-            att_tactics,
-            def_momentum,
-            score_diff,
-            game_state.minute,
-            attacking_team,
+        zone_table = _zone_table(
+            self._zone_key(
+                game_state.zone,
+                att_strength,
+                def_strength,
+                att_tactics,
+                def_momentum,
+                score_diff,
+                game_state.minute,
+                attacking_team,
+            )
         )
 
         # Select event type
-        event_type = self._select_event(zone_probs)
+        event_type = self._select_event_from_table(zone_table)
 
         # Execute event
         return self._execute_event(
@@ -940,53 +1128,35 @@ class EnhancedMarkovEngine:
         增强球队实力差距对事件概率的影响。
         """
 
-        # Base probabilities
-        base_probs = {
-            PitchZone.HOME_BOX: {
-                "clearance": 0.25,
-                "pass": 0.40,
-                "dribble": 0.10,
-                "foul": 0.12,
-                "shot": 0.08,
-            },
-            PitchZone.HOME_THIRD: {
-                "pass": 0.52,
-                "dribble": 0.24,
-                "foul": 0.13,
-                "clearance": 0.05,
-                "shot": 0.06,
-            },
-            PitchZone.MIDFIELD: {
-                "pass": 0.55,
-                "dribble": 0.28,
-                "foul": 0.09,
-                "shot": 0.08,
-                "clearance": 0.0,
-            },
-            PitchZone.AWAY_THIRD: {
-                "pass": 0.45,
-                "dribble": 0.25,
-                "foul": 0.10,
-                "shot": 0.20,
-                "clearance": 0.0,
-            },
-            PitchZone.AWAY_BOX: {
-                "shot": 0.35,
-                "pass": 0.30,
-                "dribble": 0.18,
-                "foul": 0.12,
-                "clearance": 0.0,
-            },
-        }
+        return _zone_probs(
+            self._zone_key(
+                zone,
+                att_strength,
+                def_strength,
+                att_tactics,
+                def_momentum,
+                score_diff,
+                minute,
+                attacking_team,
+            )
+        )
 
-        probs = base_probs[zone].copy()
+    def _zone_key(
+        self,
+        zone: PitchZone,
+        att_strength: dict,
+        def_strength: dict,
+        att_tactics: TacticalFormation,
+        def_momentum: TeamMomentum,
+        score_diff: int,
+        minute: int,
+        attacking_team: str = "",
+    ) -> ZoneKey:
+        """Reduce the match context to the inputs the zone probabilities depend on."""
 
         # === 球队实力差距对进攻效率的影响 ===
-        # 计算整体实力差距 (进攻方 vs 防守方)
-        att_overall = att_strength["overall"]
-        def_overall = def_strength["overall"]
-        strength_diff = att_overall - def_overall  # 正值表示进攻方更强
-
+        # 计算整体实力差距 (进攻方 vs 防守方), 正值表示进攻方更强
+        strength_diff = att_strength["overall"] - def_strength["overall"]
         strength_factor = strength_diff / 50.0  # -1.2 到 +1.2 范围
 
         # Home advantage adjustment
@@ -995,53 +1165,30 @@ class EnhancedMarkovEngine:
         elif attacking_team == "away":
             strength_factor -= 0.05  # -5% penalty for away team
 
-        if "pass" in probs:
-            probs["pass"] *= 1.0 + strength_factor * 0.30
-        if "dribble" in probs:
-            probs["dribble"] *= 1.0 + strength_factor * 0.20
-        if "clearance" in probs:
-            probs["clearance"] *= 1.0 - strength_factor * 0.40
-        if "shot" in probs:
-            probs["shot"] *= 1.0 + strength_factor * 0.35
-        if "foul" in probs:
-            probs["foul"] *= 1.0 - strength_factor * 0.15
-
-        # Tactical modifiers
-        tempo = att_tactics.get_pressing_modifier(minute, score_diff)
-        width = att_tactics.get_width_modifier(zone)
-
         # Tempo affects pass/dribble balance
-        if tempo > 1.1:  # Fast tempo
-            probs["pass"] *= 0.9
-            probs["dribble"] *= 1.2
-        elif tempo < 0.9:  # Slow tempo
-            probs["pass"] *= 1.2
-            probs["dribble"] *= 0.8
+        tempo = att_tactics.get_pressing_modifier(minute, score_diff)
+        tempo_class = 1 if tempo > 1.1 else -1 if tempo < 0.9 else 0
 
         # Width affects zone progression
-        if width > 1.0 and zone in [PitchZone.AWAY_THIRD, PitchZone.HOME_THIRD]:
-            probs["dribble"] *= 1.3
+        wide = att_tactics.get_width_modifier(zone) > 1.0 and zone in (
+            PitchZone.AWAY_THIRD,
+            PitchZone.HOME_THIRD,
+        )
 
-        # Momentum modifiers
         momentum_factor = def_momentum.get_overall_momentum()
-        if momentum_factor < 0.9:
-            probs["shot"] *= 1.3
-            probs["pass"] *= 0.9
-        elif momentum_factor > 1.1:
-            probs["shot"] *= 0.7
-            probs["clearance"] *= 1.3
+        momentum_class = -1 if momentum_factor < 0.9 else 1 if momentum_factor > 1.1 else 0
 
         # Late-game desperation
-        if minute > 80 and abs(score_diff) >= 2:
-            if (attacking_team == "home" and score_diff < 0) or (
-                attacking_team == "away" and score_diff > 0
-            ):
-                probs["shot"] *= 1.15
-                probs["pass"] *= 0.95
+        desperate = (
+            minute > 80
+            and abs(score_diff) >= 2
+            and (
+                (attacking_team == "home" and score_diff < 0)
+                or (attacking_team == "away" and score_diff > 0)
+            )
+        )
 
-        # Normalize
-        total = sum(probs.values())
-        return {k: v / total for k, v in probs.items()}
+        return (zone, strength_factor, tempo_class, wide, momentum_class, desperate)
 
     def _execute_event(
         self,
@@ -1109,6 +1256,8 @@ class EnhancedMarkovEngine:
             if fouler:
                 fouler.red_cards += 1
 
+            if not self._record_events:
+                return _light_event(MatchEventType.RED_CARD, defending_team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.RED_CARD,
@@ -1121,6 +1270,8 @@ class EnhancedMarkovEngine:
             if fouler:
                 fouler.yellow_cards += 1
 
+            if not self._record_events:
+                return _light_event(MatchEventType.YELLOW_CARD, defending_team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.YELLOW_CARD,
@@ -1130,6 +1281,8 @@ class EnhancedMarkovEngine:
                 zone=game_state.zone,
             )
 
+        if not self._record_events:
+            return _light_event(MatchEventType.FOUL, defending_team)
         return MatchEvent(
             minute=game_state.minute,
             event_type=MatchEventType.FOUL,
@@ -1229,6 +1382,8 @@ class EnhancedMarkovEngine:
             else:
                 match_state.away_passes += 1
 
+            if not self._record_events:
+                return _light_event(MatchEventType.PASS_SUCCESS, team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.PASS_SUCCESS,
@@ -1249,7 +1404,10 @@ class EnhancedMarkovEngine:
             game_state.consecutive_passes = 0
 
             # Second ball chance
-            if self.rng.random() < 0.55:
+            loose_ball = self.rng.random() < 0.55
+            if not self._record_events:
+                return _light_event(MatchEventType.PASS_FAIL, team)
+            if loose_ball:
                 return MatchEvent(
                     minute=game_state.minute,
                     event_type=MatchEventType.PASS_FAIL,
@@ -1404,6 +1562,8 @@ class EnhancedMarkovEngine:
             else:
                 match_state.home_saves += 1
 
+            if not self._record_events:
+                return _light_event(MatchEventType.SHOT_ON_TARGET, attacking_team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.SHOT_ON_TARGET,
@@ -1414,6 +1574,8 @@ class EnhancedMarkovEngine:
             )
         else:
             # Missed
+            if not self._record_events:
+                return _light_event(MatchEventType.SHOT_OFF_TARGET, attacking_team)
             return MatchEvent(
                 minute=game_state.minute,
                 event_type=MatchEventType.SHOT_OFF_TARGET,
@@ -1458,14 +1620,6 @@ class EnhancedMarkovEngine:
                     assister.assists += 1
                 del self._last_passer[scoring_team]
 
-        scorer_name = (
-            getattr(scorer_state.player, "full_name", "Unknown") if scorer_state else "Unknown"
-        )
-        description = f"GOAL! {scorer_name}"
-        if assist_player:
-            description += f" (Assist: {assist_player})"
-        description += f" from {distance:.1f}m, {angle:.1f}°"
-
         # Update goals conceded
         conceding_team = "away" if scoring_team == "home" else "home"
         conceding_gk = self._base_engine._select_player(match_state, conceding_team, "gk")
@@ -1486,6 +1640,17 @@ class EnhancedMarkovEngine:
         else:
             match_state.away_shots_on_target += 1
 
+        if not self._record_events:
+            return _light_event(event_type, scoring_team)
+
+        scorer_name = (
+            getattr(scorer_state.player, "full_name", "Unknown") if scorer_state else "Unknown"
+        )
+        description = f"GOAL! {scorer_name}"
+        if assist_player:
+            description += f" (Assist: {assist_player})"
+        description += f" from {distance:.1f}m, {angle:.1f}°"
+
         return MatchEvent(
             minute=game_state.minute,
             event_type=event_type,
@@ -1596,6 +1761,8 @@ class EnhancedMarkovEngine:
         player_in.minutes_played = player_out.minutes_played
 
         # Record substitution
+        if not self._record_events:
+            return
         match_state.events.append(
             MatchEvent(
                 minute=minute,
@@ -1770,19 +1937,7 @@ class EnhancedMarkovEngine:
 
     def _should_stop_sequence(self, event: MatchEvent) -> bool:
         """Determine if event sequence should stop."""
-        stop_events = [
-            MatchEventType.GOAL_HOME,
-            MatchEventType.GOAL_AWAY,
-            MatchEventType.CORNER_HOME,
-            MatchEventType.CORNER_AWAY,
-            MatchEventType.FREE_KICK,
-            MatchEventType.PENALTY,
-            MatchEventType.CLEARANCE,
-            MatchEventType.SHOT_OFF_TARGET,
-            MatchEventType.YELLOW_CARD,
-            MatchEventType.RED_CARD,
-        ]
-        return event.event_type in stop_events
+        return event.event_type in _STOP_EVENTS
 
     def _select_event(self, probs: dict) -> str:
         """Randomly select an event based on probabilities."""
@@ -1794,6 +1949,15 @@ class EnhancedMarkovEngine:
                 return event
         return list(probs.keys())[-1]
 
+    def _select_event_from_table(self, table: ZoneTable) -> str:
+        """Select an event from a precompiled cumulative table.
+
+        Draws exactly as ``_select_event`` does on the equivalent dict.
+        """
+        events, cumulative = table
+        index = bisect_left(cumulative, self.rng.random())
+        return events[index] if index < len(events) else events[-1]
+
     def _handle_injury_enhanced(
         self,
         match_state: MatchState,
@@ -1822,6 +1986,11 @@ class EnhancedMarkovEngine:
                 )
 
                 if self.rng.random() < risk:
+                    if hasattr(stats, "is_injured"):
+                        stats.is_injured = True
+                    if not self._record_events:
+                        break
+
                     from datetime import date
 
                     injury = self.injury_engine.generate_injury(
@@ -1838,9 +2007,6 @@ class EnhancedMarkovEngine:
                             zone=game_state.zone,
                         )
                     )
-
-                    if hasattr(stats, "is_injured"):
-                        stats.is_injured = True
                     break
 
     def _select_shooter(
@@ -0,0 +1,213 @@
+"""Monte Carlo season outcome forecasting for FM Manager.
+
+The forecaster first samples a score distribution for every remaining
+fixture with the batched match engine. It then replays the rest of the
+season thousands of times by resampling those scores with numpy. Match
+simulation is the expensive part, so it runs once per fixture, optionally
+across worker processes. The season-level Monte Carlo is then cheap enough
+for board, fan and AI systems to query.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+
+from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine, ResultDetail
+from fm_manager.engine.rng import derive_seed
+from fm_manager.engine.season_runner import pack_lineup
+from fm_manager.engine.season_simulator import LeagueTableEntry
+
+
+@dataclass
+class ClubForecast:
+    """Projected season outcome for one club."""
+
+    club_id: int
+    club_name: str
+    current_points: int
+    expected_points: float
+    title_probability: float
+    european_probability: float
+    relegation_probability: float
+    # position_probabilities[i] is the chance of finishing in position i + 1
+    position_probabilities: list[float] = field(default_factory=list)
+
+    @property
+    def expected_position(self) -> float:
+        return sum((i + 1) * p for i, p in enumerate(self.position_probabilities))
+
+
+@dataclass
+class SeasonForecast:
+    """Projected outcome for every club in a league."""
+
+    simulations: int
+    remaining_fixtures: int
+    clubs: list[ClubForecast] = field(default_factory=list)
+
+    def for_club(self, club_id: int) -> ClubForecast | None:
+        """Get the forecast for a club."""
+        for club in self.clubs:
+            if club.club_id == club_id:
+                return club
+        return None
+
+
+# Fixtures per batched task; fixed so results do not depend on worker count
+FIXTURES_PER_TASK = 8
+
+
+def _sample_fixtures(pairs: list[tuple[list, list]], samples: int, seed: int) -> np.ndarray:
+    """Worker entry point: sample a (fixtures, samples, 2) array of scores."""
+    batch = [pair for pair in pairs for _ in range(samples)]
+    states = EnhancedMarkovEngine().simulate_batch(
+        batch, random_seed=seed, detail=ResultDetail.SCORE
+    )
+    scores = np.array([(s.home_score, s.away_score) for s in states], dtype=np.int16)
+    return scores.reshape(len(pairs), samples, 2)
+
+
+class SeasonForecaster:
+    """Forecast final standings by Monte Carlo simulation of remaining fixtures."""
+
+    def __init__(
+        self,
+        samples_per_fixture: int = 256,
+        max_workers: int = 1,
+        seed: int = 0,
+    ):
+        self.samples_per_fixture = samples_per_fixture
+        self.max_workers = max_workers
+        self.seed = seed
+
+    def forecast(
+        self,
+        standings: Iterable[LeagueTableEntry],
+        remaining_fixtures: Iterable[tuple[int, int]],
+        lineups: dict[int, list],
+        simulations: int = 10_000,
+        cl_spots: int = 4,
+        el_spots: int = 2,
+        relegation_spots: int = 3,
+    ) -> SeasonForecast:
+        """Forecast the rest of the season.
+
+        Args:
+            standings: Current table entries, one per club
+            remaining_fixtures: (home_club_id, away_club_id) pairs still to play
+            lineups: Starting eleven per club id
+            simulations: Number of season replays
+            cl_spots: Positions qualifying for the Champions League
+            el_spots: Further positions qualifying for the Europa League
+            relegation_spots: Positions relegated at the bottom
+
+        Returns:
+            SeasonForecast with clubs sorted by expected points
+        """
+        entries = list(standings)
+        fixtures = list(remaining_fixtures)
+        index = {entry.club_id: i for i, entry in enumerate(entries)}
+        num_clubs = len(entries)
+
+        scores = self._sample_scores(fixtures, lineups)
+        rng = np.random.default_rng(self.seed)
+
+        points = np.tile(np.array([e.points for e in entries], dtype=np.int32), (simulations, 1))
+        goal_diff = np.tile(
+            np.array([e.goal_difference for e in entries], dtype=np.int32), (simulations, 1)
+        )
+        goals_for = np.tile(
+            np.array([e.goals_for for e in entries], dtype=np.int32), (simulations, 1)
+        )
+
+        if fixtures:
+            # Independent scoreline draw per (simulation, fixture)
+            picks = rng.integers(0, self.samples_per_fixture, size=(simulations, len(fixtures)))
+            home_goals = np.take_along_axis(scores[:, :, 0].T, picks, axis=0)
+            away_goals = np.take_along_axis(scores[:, :, 1].T, picks, axis=0)
+            home_points = np.where(
+                home_goals > away_goals, 3, np.where(home_goals == away_goals, 1, 0)
+            )
+            away_points = np.where(
+                away_goals > home_goals, 3, np.where(home_goals == away_goals, 1, 0)
+            )
+
+            for f, (home_id, away_id) in enumerate(fixtures):
+                h, a = index[home_id], index[away_id]
+                points[:, h] += home_points[:, f]
+                points[:, a] += away_points[:, f]
+                goal_diff[:, h] += home_goals[:, f] - away_goals[:, f]
+                goal_diff[:, a] += away_goals[:, f] - home_goals[:, f]
+                goals_for[:, h] += home_goals[:, f]
+                goals_for[:, a] += away_goals[:, f]
+
+        # Points, then goal difference, then goals scored; remaining ties at random
+        sort_key = (
+            points.astype(np.float64) * 1e8
+            + (goal_diff + 10_000) * 1e3
+            + goals_for
+            + rng.random((simulations, num_clubs)) * 0.5
+        )
+        order = np.argsort(-sort_key, axis=1)
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(num_clubs), axis=1)
+
+        position_counts = np.zeros((num_clubs, num_clubs), dtype=np.int64)
+        for club in range(num_clubs):
+            position_counts[club] = np.bincount(positions[:, club], minlength=num_clubs)
+        position_probs = position_counts / simulations
+
+        clubs = []
+        for i, entry in enumerate(entries):
+            probs = position_probs[i]
+            clubs.append(
+                ClubForecast(
+                    club_id=entry.club_id,
+                    club_name=entry.club_name,
+                    current_points=entry.points,
+                    expected_points=float(points[:, i].mean()),
+                    title_probability=float(probs[0]),
+                    european_probability=float(probs[: cl_spots + el_spots].sum()),
+                    relegation_probability=(
+                        float(probs[num_clubs - relegation_spots :].sum())
+                        if relegation_spots
+                        else 0.0
+                    ),
+                    position_probabilities=[float(p) for p in probs],
+                )
+            )
+
+        clubs.sort(key=lambda c: c.expected_points, reverse=True)
+        return SeasonForecast(
+            simulations=simulations, remaining_fixtures=len(fixtures), clubs=clubs
+        )
+
+    def _sample_scores(
+        self, fixtures: list[tuple[int, int]], lineups: dict[int, list]
+    ) -> np.ndarray:
+        """Sample a (fixtures, samples, 2) array of scorelines."""
+        if not fixtures:
+            return np.zeros((0, self.samples_per_fixture, 2), dtype=np.int16)
+
+        # Packed once per club; each task shares them across its fixtures
+        snapshots = {club_id: pack_lineup(lineup) for club_id, lineup in lineups.items()}
+        tasks = []
+        for start in range(0, len(fixtures), FIXTURES_PER_TASK):
+            chunk = fixtures[start : start + FIXTURES_PER_TASK]
+            home_id, away_id = chunk[0]
+            tasks.append(
+                (
+                    [(snapshots[h], snapshots[a]) for h, a in chunk],
+                    self.samples_per_fixture,
+                    derive_seed(self.seed, "forecast", start, home_id, away_id),
+                )
+            )
+
+        if self.max_workers > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                samples = list(executor.map(_sample_fixtures, *map(list, zip(*tasks, strict=True))))
+        else:
+            samples = [_sample_fixtures(*task) for task in tasks]
+        return np.concatenate(samples)
@@ -0,0 +1,259 @@
+"""Parallel season simulation for FM Manager.
+
+Fixtures within a matchday are independent, so whole seasons (or several
+leagues at once) can be fanned out to worker processes. Every fixture gets
+its own seed derived from the season seed and the fixture identity, which
+makes results independent of worker count and scheduling order.
+"""
+
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Iterable
+
+from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine, MatchState, ResultDetail
+from fm_manager.engine.rng import derive_seed
+from fm_manager.engine.season_simulator import LeagueTableEntry
+
+# Player attributes read by the match, injury and chemistry engines
+LINEUP_FIELDS = (
+    "id",
+    "club_id",
+    "full_name",
+    "position",
+    "age",
+    "current_ability",
+    "fitness",
+    "stamina",
+    "pace",
+    "passing",
+    "positioning",
+    "shooting",
+    "composure",
+    "tackling",
+    "marking",
+    "strength",
+    "reflexes",
+    "goalkeeping",
+)
+
+_MISSING = object()
+
+
+def pack_lineup(players: Iterable[object]) -> list[SimpleNamespace]:
+    """Copy the attributes the engine reads into small picklable payloads.
+
+    Attributes missing on the source player stay missing, so the engine
+    falls back to the same defaults it would use for the original object.
+    """
+    packed = []
+    for player in players:
+        payload = SimpleNamespace()
+        for name in LINEUP_FIELDS:
+            value = getattr(player, name, _MISSING)
+            if value is not _MISSING:
+                setattr(payload, name, value)
+        packed.append(payload)
+    return packed
+
+
+def fixture_seed(season_seed: int, league: str, matchday: int, home_id: int, away_id: int) -> int:
+    """Derive a stable 64-bit seed for one fixture."""
+    return derive_seed(season_seed, league, matchday, home_id, away_id)
+
+
+@dataclass
+class SeasonFixture:
+    """A fixture to simulate, with its lineups."""
+
+    league: str
+    matchday: int
+    home_id: int
+    away_id: int
+    home_lineup: list
+    away_lineup: list
+    home_name: str = ""
+    away_name: str = ""
+    home_formation: str = "4-3-3"
+    away_formation: str = "4-3-3"
+
+
+@dataclass
+class FixtureResult:
+    """Result of one simulated fixture."""
+
+    fixture: SeasonFixture
+    seed: int
+    state: MatchState
+
+    @property
+    def home_score(self) -> int:
+        return self.state.home_score
+
+    @property
+    def away_score(self) -> int:
+        return self.state.away_score
+
+
+@dataclass
+class _Job:
+    """Picklable unit of work for a worker process."""
+
+    seed: int
+    home_lineup: list
+    away_lineup: list
+    home_formation: str
+    away_formation: str
+
+
+def _simulate_jobs(jobs: list[_Job], detail: ResultDetail) -> list[MatchState]:
+    """Worker entry point: simulate a chunk of fixtures."""
+    engine = EnhancedMarkovEngine()
+    states = []
+    for job in jobs:
+        engine.reseed(job.seed)
+        state = engine.simulate(
+            job.home_lineup,
+            job.away_lineup,
+            home_formation=job.home_formation,
+            away_formation=job.away_formation,
+            detail=detail,
+        )
+        # Lineups are reattached by the parent process
+        state.home_lineup = []
+        state.away_lineup = []
+        states.append(state)
+    return states
+
+
+class ParallelSeasonRunner:
+    """Simulate fixtures across worker processes, deterministically.
+
+    Each (league, matchday) is split into about ``max_workers`` chunks,
+    one task per chunk. Use as a context manager to reuse the worker pool
+    across several calls; with ``max_workers=1`` everything runs in the
+    calling process.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        season_seed: int = 0,
+        detail: ResultDetail | str = ResultDetail.SCORE,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.season_seed = season_seed
+        self.detail = ResultDetail(detail)
+        self._executor: Executor | None = None
+
+    def __enter__(self) -> "ParallelSeasonRunner":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def active(self) -> bool:
+        """Whether a worker pool is open for reuse."""
+        return self._executor is not None
+
+    def open(self) -> None:
+        """Start the worker pool, unless one is open or not needed."""
+        if self._executor is None and self.max_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def close(self) -> None:
+        """Shut down the worker pool, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(self, fixtures: Iterable[SeasonFixture]) -> list[FixtureResult]:
+        """Simulate fixtures, returning results in input order."""
+        fixtures = list(fixtures)
+        groups: dict[tuple[str, int], list[int]] = {}
+        for index, fixture in enumerate(fixtures):
+            groups.setdefault((fixture.league, fixture.matchday), []).append(index)
+        # Split each matchday so a single round still spreads over the workers
+        batches = []
+        for indices in groups.values():
+            size = math.ceil(len(indices) / self.max_workers)
+            batches.extend(indices[i : i + size] for i in range(0, len(indices), size))
+
+        seeds = [
+            fixture_seed(self.season_seed, f.league, f.matchday, f.home_id, f.away_id)
+            for f in fixtures
+        ]
+        chunks = [
+            [
+                _Job(
+                    seed=seeds[i],
+                    home_lineup=pack_lineup(fixtures[i].home_lineup),
+                    away_lineup=pack_lineup(fixtures[i].away_lineup),
+                    home_formation=fixtures[i].home_formation,
+                    away_formation=fixtures[i].away_formation,
+                )
+                for i in indices
+            ]
+            for indices in batches
+        ]
+
+        if self._executor is not None:
+            chunk_states = self._executor.map(_simulate_jobs, chunks, [self.detail] * len(chunks))
+        elif self.max_workers > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                chunk_states = list(
+                    executor.map(_simulate_jobs, chunks, [self.detail] * len(chunks))
+                )
+        else:
+            chunk_states = [_simulate_jobs(chunk, self.detail) for chunk in chunks]
+
+        results: list[FixtureResult | None] = [None] * len(fixtures)
+        for indices, states in zip(batches, chunk_states, strict=True):
+            for i, state in zip(indices, states, strict=True):
+                state.home_lineup = fixtures[i].home_lineup
+                state.away_lineup = fixtures[i].away_lineup
+                results[i] = FixtureResult(fixture=fixtures[i], seed=seeds[i], state=state)
+        return results  # type: ignore[return-value]
+
+
+@dataclass
+class LeagueSeasonSummary:
+    """Standings and results for one league."""
+
+    league: str
+    standings: list[LeagueTableEntry] = field(default_factory=list)
+    results: list[FixtureResult] = field(default_factory=list)
+
+
+def build_standings(results: Iterable[FixtureResult]) -> dict[str, LeagueSeasonSummary]:
+    """Aggregate fixture results into sorted league tables."""
+    tables: dict[str, dict[int, LeagueTableEntry]] = {}
+    summaries: dict[str, LeagueSeasonSummary] = {}
+
+    for result in results:
+        fixture = result.fixture
+        summary = summaries.setdefault(fixture.league, LeagueSeasonSummary(fixture.league))
+        summary.results.append(result)
+
+        table = tables.setdefault(fixture.league, {})
+        for club_id, name in (
+            (fixture.home_id, fixture.home_name),
+            (fixture.away_id, fixture.away_name),
+        ):
+            if club_id not in table:
+                table[club_id] = LeagueTableEntry(club_id=club_id, club_name=name)
+
+        table[fixture.home_id].add_result(result.home_score, result.away_score)
+        table[fixture.away_id].add_result(result.away_score, result.home_score)
+
+    for league, table in tables.items():
+        summaries[league].standings = sorted(
+            table.values(),
+            key=lambda x: (x.points, x.goal_difference, x.goals_for),
+            reverse=True,
+        )
+    return summaries
@@ -4,16 +4,18 @@ This module provides functionality to simulate an entire league season,
 including fixture generation, match simulation, and standings tracking.
 """
 
+import asyncio
 import random
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Callable
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fm_manager.core.models import Club, League, Match, MatchStatus, Player, Season
-from fm_manager.engine.match_engine_markov import MarkovMatchEngine, MatchState
+from fm_manager.core.models import Club, League, Match, MatchEvent, MatchStatus, Player, Season
+from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine, MatchState, ResultDetail
 from fm_manager.engine.team_state import (
     TeamDynamicState,
     PlayerMatchState,
@@ -21,6 +23,11 @@ from fm_manager.engine.team_state import (
     calculate_performance_rating,
 )
 
+if TYPE_CHECKING:
+    from fm_manager.engine.season_runner import ParallelSeasonRunner
+
+T = TypeVar("T")
+
 
 @dataclass
 class LeagueTableEntry:
@@ -154,6 +161,150 @@ class SeasonResult:
         return sorted(form_data, key=lambda x: x[1], reverse=True)
 
 
+@dataclass
+class SeasonSquads:
+    """Clubs of one or more leagues and their players, loaded up front."""
+
+    clubs: dict[int, Club] = field(default_factory=dict)
+
+    # Players per club, best current ability first
+    players: dict[int, list[Player]] = field(default_factory=dict)
+
+    def squad(self, club_id: int) -> list[Player]:
+        return self.players.get(club_id, [])
+
+
+async def load_season_squads(session: AsyncSession, league_ids: list[int]) -> SeasonSquads:
+    """Load all clubs of the leagues and all their players in two queries."""
+    result = await session.execute(
+        select(Club).where(Club.league_id.in_(league_ids)).order_by(Club.id)
+    )
+    squads = SeasonSquads(clubs={club.id: club for club in result.scalars()})
+    for club_id in squads.clubs:
+        squads.players[club_id] = []
+
+    league_club_ids = select(Club.id).where(Club.league_id.in_(league_ids))
+    result = await session.execute(
+        select(Player)
+        .where(Player.club_id.in_(league_club_ids))
+        .order_by(Player.current_ability.desc(), Player.id)
+    )
+    for player in result.scalars():
+        squads.players[player.club_id].append(player)
+    return squads
+
+
+# Match columns written back after a simulated season
+MATCH_RESULT_COLUMNS = (
+    "season_id",
+    "matchday",
+    "match_date",
+    "home_club_id",
+    "away_club_id",
+    "home_score",
+    "away_score",
+    "status",
+)
+
+# Columns identifying a fixture; a club plays once per matchday
+MATCH_FIXTURE_COLUMNS = ("season_id", "matchday", "home_club_id", "away_club_id")
+
+
+def match_event_rows(match_state: MatchState) -> list[dict]:
+    """``match_events`` rows for a simulated match, without the match id."""
+    return [
+        {
+            "minute": e.minute,
+            "event_type": e.event_type.name,
+            "team": e.team,
+            "player": e.player,
+            "player2": e.player2,
+        }
+        for e in match_state.events
+    ]
+
+
+async def insert_matches(
+    session: AsyncSession,
+    matches: list[Match],
+    events: list[list[dict]] | None = None,
+) -> None:
+    """Insert played matches, and optionally their events, in bulk.
+
+    ``events[i]`` holds the ``match_event_rows`` of ``matches[i]``.
+    """
+    if not matches:
+        return
+    rows = [{column: getattr(m, column) for column in MATCH_RESULT_COLUMNS} for m in matches]
+    if events is None:
+        await session.execute(insert(Match), rows)
+        return
+
+    # The database assigns the ids, so concurrent writers never collide.
+    # SQLite cannot return them in parameter order without one INSERT per
+    # row, so they are matched back to the rows by their fixture instead.
+    keys = [tuple(row[column] for column in MATCH_FIXTURE_COLUMNS) for row in rows]
+    if len(set(keys)) == len(keys):
+        result = await session.execute(
+            insert(Match).returning(
+                Match.id, *(getattr(Match, column) for column in MATCH_FIXTURE_COLUMNS)
+            ),
+            rows,
+        )
+        ids = {tuple(fixture): match_id for match_id, *fixture in result}
+        match_ids = [ids[key] for key in keys]
+    else:
+        result = await session.execute(
+            insert(Match).returning(Match.id, sort_by_parameter_order=True), rows
+        )
+        match_ids = result.scalars().all()
+
+    event_rows = [
+        {"match_id": match_id, **event}
+        for match_id, match_events in zip(match_ids, events, strict=True)
+        for event in match_events
+    ]
+    if event_rows:
+        # Keep NULL players in the rows so the batch is not split on them
+        await session.execute(insert(MatchEvent).execution_options(render_nulls=True), event_rows)
+
+
+async def stream_match_events(
+    session: AsyncSession,
+    match_id: int | None = None,
+    player: str | None = None,
+    event_type: str | None = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[MatchEvent]:
+    """Stored match events in match order, fetched ``batch_size`` rows at a time."""
+    query = select(MatchEvent).order_by(MatchEvent.match_id, MatchEvent.minute, MatchEvent.id)
+    if match_id is not None:
+        query = query.where(MatchEvent.match_id == match_id)
+    if player is not None:
+        query = query.where(MatchEvent.player == player)
+    if event_type is not None:
+        query = query.where(MatchEvent.event_type == event_type)
+
+    result = await session.stream_scalars(query.execution_options(yield_per=batch_size))
+    async for event in result:
+        yield event
+
+
+async def count_player_events(
+    session: AsyncSession, event_types: list[str], limit: int = 10
+) -> list[tuple[str, int]]:
+    """Players with the most events of the given types, e.g. top scorers."""
+    count = func.count().label("count")
+    result = await session.execute(
+        select(MatchEvent.player, count)
+        .where(MatchEvent.event_type.in_(event_types), MatchEvent.player.is_not(None))
+        .group_by(MatchEvent.player)
+        .order_by(count.desc(), MatchEvent.player)
+        .limit(limit)
+    )
+    return [(player, n) for player, n in result]
+
+
 class FixtureGenerator:
     """Generate league fixtures using round-robin algorithm.
 
@@ -168,42 +319,12 @@ class FixtureGenerator:
         matchday_interval: int = 7,
     ) -> list[list[Match]]:
         """Generate a double round-robin fixture list."""
-        if len(clubs) < 2:
-            return []
-
-        n = len(clubs)
-
-        # If odd number of teams, add a dummy "bye" team
-        has_bye = False
-        if n % 2 == 1:
-            clubs = clubs + [None]  # type: ignore
-            n += 1
-            has_bye = True
-
-        num_rounds = n - 1
-        matches_per_round = n // 2
-
         matchdays = []
         current_date = start_date
 
-        # First half of season
-        for round_num in range(num_rounds):
-            matches = []
-
-            for match_num in range(matches_per_round):
-                home_idx = (round_num + match_num) % (n - 1)
-                away_idx = (n - 1 - match_num + round_num) % (n - 1)
-
-                if match_num == 0:
-                    away_idx = n - 1
-
-                home_club = clubs[home_idx]
-                away_club = clubs[away_idx]
-
-                if home_club is None or away_club is None:
-                    continue
-
-                match = Match(
+        for round_num, pairings in enumerate(self.generate_pairings(clubs)):
+            matches = [
+                Match(
                     season_id=season_id,
                     matchday=round_num + 1,
                     match_date=current_date,
@@ -213,14 +334,34 @@ class FixtureGenerator:
                     away_score=0,
                     status=MatchStatus.SCHEDULED,
                 )
-                matches.append(match)
-
+                for home_club, away_club in pairings
+            ]
             matchdays.append(matches)
             current_date += timedelta(days=matchday_interval)
 
-        # Second half (reverse fixtures)
+        return matchdays
+
+    def generate_pairings(self, clubs: list[T]) -> list[list[tuple[T, T]]]:
+        """Generate double round-robin (home, away) pairings per matchday."""
+        if len(clubs) < 2:
+            return []
+
+        n = len(clubs)
+
+        # If odd number of teams, add a dummy "bye" team
+        slots: list[T | None] = list(clubs)
+        if n % 2 == 1:
+            slots.append(None)
+            n += 1
+
+        num_rounds = n - 1
+        matches_per_round = n // 2
+
+        first_half = []
+        second_half = []
         for round_num in range(num_rounds):
-            matches = []
+            pairings = []
+            reverse = []
 
             for match_num in range(matches_per_round):
                 home_idx = (round_num + match_num) % (n - 1)
@@ -229,41 +370,49 @@ class FixtureGenerator:
                 if match_num == 0:
                     away_idx = n - 1
 
-                # Swap home and away
-                home_club = clubs[away_idx]
-                away_club = clubs[home_idx]
+                home_club = slots[home_idx]
+                away_club = slots[away_idx]
 
                 if home_club is None or away_club is None:
                     continue
 
-                match = Match(
-                    season_id=season_id,
-                    matchday=num_rounds + round_num + 1,
-                    match_date=current_date,
-                    home_club_id=home_club.id,
-                    away_club_id=away_club.id,
-                    home_score=0,
-                    away_score=0,
-                    status=MatchStatus.SCHEDULED,
-                )
-                matches.append(match)
+                pairings.append((home_club, away_club))
+                # Second half swaps home and away
+                reverse.append((away_club, home_club))
 
-            matchdays.append(matches)
-            current_date += timedelta(days=matchday_interval)
+            first_half.append(pairings)
+            second_half.append(reverse)
 
-        return matchdays
+        return first_half + second_half
 
 
 class SeasonSimulator:
     """Simulate an entire league season with dynamic team states."""
 
-    def __init__(self, session: AsyncSession, engine_version: str = "v2"):
+    def __init__(
+        self,
+        session: AsyncSession,
+        engine_version: str = "v2",
+        runner: "ParallelSeasonRunner | None" = None,
+    ):
+        """Create a simulator.
+
+        When a ``ParallelSeasonRunner`` is given, each matchday is simulated
+        by the runner's worker processes with the enhanced engine. The runner
+        must record ``ResultDetail.FULL`` results, since team states and
+        stored match events are built from them.
+        """
+        if runner is not None and runner.detail is not ResultDetail.FULL:
+            raise ValueError(
+                f"SeasonSimulator needs a runner with ResultDetail.FULL, got {runner.detail.value}"
+            )
         self.session = session
+        self.runner = runner
         self.fixture_generator = FixtureGenerator()
         self.state_manager = TeamStateManager()
         self.engine_version = engine_version
 
-        self.match_simulator = MarkovMatchEngine()
+        self.match_simulator = EnhancedMarkovEngine()
 
     async def simulate_season(
         self,
@@ -275,6 +424,10 @@ class SeasonSimulator:
     ) -> SeasonResult:
         """Simulate a complete season with dynamic team states.
 
+        Clubs and players are loaded once up front and the season is played
+        in memory; the season, its matches and their events are written back
+        at the end in a single commit.
+
         Args:
             league_id: League ID
             season_year: Starting year
@@ -285,6 +438,8 @@ class SeasonSimulator:
         Returns:
             SeasonResult with final standings and all match data
         """
+        from fm_manager.engine.season_runner import SeasonFixture, pack_lineup
+
         if start_date is None:
             start_date = date(season_year, 8, 1)
 
@@ -293,9 +448,9 @@ class SeasonSimulator:
         if not league:
             raise ValueError(f"League {league_id} not found")
 
-        # Get all clubs
-        result = await self.session.execute(select(Club).where(Club.league_id == league_id))
-        clubs = list(result.scalars().all())
+        # Get all clubs and their players
+        squads = await load_season_squads(self.session, [league_id])
+        clubs = list(squads.clubs.values())
 
         if len(clubs) < 2:
             raise ValueError(f"Not enough clubs in league: {len(clubs)}")
@@ -309,7 +464,7 @@ class SeasonSimulator:
             start_date=start_date,
         )
         self.session.add(season)
-        await self.session.commit()
+        await self.session.flush()
 
         # Initialize dynamic states if enabled
         if use_dynamic_states:
@@ -318,8 +473,7 @@ class SeasonSimulator:
 
             # Initialize player states
             for club in clubs:
-                players = await self._get_all_players(club.id)
-                for player in players:
+                for player in squads.squad(club.id):
                     self.state_manager.initialize_player(player)
 
         # Generate fixtures
@@ -340,107 +494,135 @@ class SeasonSimulator:
 
         # Simulate all matchdays
         all_matches: list[MatchState] = []
+        played: list[Match] = []
+        played_events: list[list[dict]] = []
         total_matchdays = len(fixtures)
 
-        for matchday_idx, matchday in enumerate(fixtures):
-            matchday_num = matchday_idx + 1
-
-            if progress_callback:
-                progress_callback(matchday_num, total_matchdays)
-
-            # Simulate each match
-            for match in matchday:
-                home_club = await self.session.get(Club, match.home_club_id)
-                away_club = await self.session.get(Club, match.away_club_id)
-
-                if not home_club or not away_club:
-                    continue
-
-                # Get lineups (considering dynamic states)
-                if use_dynamic_states:
-                    home_players = await self._get_lineup_dynamic(home_club.id)
-                    away_players = await self._get_lineup_dynamic(away_club.id)
-                else:
-                    home_players = await self._get_lineup(home_club.id)
-                    away_players = await self._get_lineup(away_club.id)
-
-                if len(home_players) < 11 or len(away_players) < 11:
-                    continue
-
-                # Store original fitness values
-                original_home_fitness = [p.fitness for p in home_players]
-                original_away_fitness = [p.fitness for p in away_players]
-
-                # Apply form modifiers if using dynamic states
-                if use_dynamic_states:
-                    home_state = self.state_manager.get_team_state(home_club.id)
-                    away_state = self.state_manager.get_team_state(away_club.id)
-
-                    # Apply team form modifiers (through morale/fitness adjustments)
-                    if home_state:
-                        modifier = home_state.get_form_modifier()
-                        for p in home_players:
-                            p.fitness = int(min(100.0, (p.fitness or 50) * modifier))
-
-                    if away_state:
-                        modifier = away_state.get_form_modifier()
-                        for p in away_players:
-                            p.fitness = int(min(100.0, (p.fitness or 50) * modifier))
-
-                # Simulate match
-                match_state = self.match_simulator.simulate(
-                    home_lineup=home_players[:11],
-                    away_lineup=away_players[:11],
-                )
-
-                # Restore original values
-                if use_dynamic_states:
-                    for i, p in enumerate(home_players):
-                        p.fitness = original_home_fitness[i]
-                    for i, p in enumerate(away_players):
-                        p.fitness = original_away_fitness[i]
-
-                # Update match record
-                match.home_score = match_state.home_score
-                match.away_score = match_state.away_score
-                match.status = MatchStatus.FULL_TIME
-                match.events = str(
-                    [
-                        {
-                            "minute": e.minute,
-                            "type": e.event_type.name,
-                            "team": e.team,
-                            "player": e.player,
-                        }
-                        for e in match_state.events
-                    ]
-                )
-
-                self.session.add(match)
-
-                # Update standings
-                standings[home_club.id].add_result(match_state.home_score, match_state.away_score)
-                standings[away_club.id].add_result(match_state.away_score, match_state.home_score)
+        def record_result(
+            match: Match,
+            home_club: Club,
+            away_club: Club,
+            match_state: MatchState,
+            matchday_num: int,
+        ) -> None:
+            # Update match record
+            match.home_score = match_state.home_score
+            match.away_score = match_state.away_score
+            match.status = MatchStatus.FULL_TIME
+            played.append(match)
+            played_events.append(match_event_rows(match_state))
+
+            # Update standings
+            standings[home_club.id].add_result(match_state.home_score, match_state.away_score)
+            standings[away_club.id].add_result(match_state.away_score, match_state.home_score)
+
+            # Update home record
+            if match_state.home_score > match_state.away_score:
+                home_records[home_club.id][0] += 1  # Win
+            elif match_state.home_score == match_state.away_score:
+                home_records[home_club.id][1] += 1  # Draw
+            else:
+                home_records[home_club.id][2] += 1  # Loss
 
-                # Update home record
-                if match_state.home_score > match_state.away_score:
-                    home_records[home_club.id][0] += 1  # Win
-                elif match_state.home_score == match_state.away_score:
-                    home_records[home_club.id][1] += 1  # Draw
-                else:
-                    home_records[home_club.id][2] += 1  # Loss
+            # Update dynamic states
+            if use_dynamic_states:
+                self._update_match_states(home_club, away_club, match_state, matchday_num)
+
+            all_matches.append(match_state)
+
+        # One worker pool serves every matchday of the season
+        with self._runner_pool():
+            for matchday_idx, matchday in enumerate(fixtures):
+                matchday_num = matchday_idx + 1
+                pending: list[tuple[Match, Club, Club, SeasonFixture]] = []
+
+                if progress_callback:
+                    progress_callback(matchday_num, total_matchdays)
+
+                # Simulate each match
+                for match in matchday:
+                    home_club = squads.clubs.get(match.home_club_id)
+                    away_club = squads.clubs.get(match.away_club_id)
+
+                    if not home_club or not away_club:
+                        continue
+
+                    # Get lineups (considering dynamic states)
+                    if use_dynamic_states:
+                        home_players = self._get_lineup_dynamic(squads.squad(home_club.id))
+                        away_players = self._get_lineup_dynamic(squads.squad(away_club.id))
+                    else:
+                        home_players = squads.squad(home_club.id)[:11]
+                        away_players = squads.squad(away_club.id)[:11]
+
+                    if len(home_players) < 11 or len(away_players) < 11:
+                        continue
+
+                    # Store original fitness values
+                    original_home_fitness = [p.fitness for p in home_players]
+                    original_away_fitness = [p.fitness for p in away_players]
+
+                    # Apply form modifiers if using dynamic states
+                    if use_dynamic_states:
+                        home_state = self.state_manager.get_team_state(home_club.id)
+                        away_state = self.state_manager.get_team_state(away_club.id)
+
+                        # Apply team form modifiers (through morale/fitness adjustments)
+                        if home_state:
+                            modifier = home_state.get_form_modifier()
+                            for p in home_players:
+                                p.fitness = int(min(100.0, (p.fitness or 50) * modifier))
+
+                        if away_state:
+                            modifier = away_state.get_form_modifier()
+                            for p in away_players:
+                                p.fitness = int(min(100.0, (p.fitness or 50) * modifier))
+
+                    # Simulate match, or snapshot the modified lineups for the runner
+                    if self.runner is not None:
+                        fixture = SeasonFixture(
+                            league=str(league_id),
+                            matchday=matchday_num,
+                            home_id=home_club.id,
+                            away_id=away_club.id,
+                            home_lineup=pack_lineup(home_players[:11]),
+                            away_lineup=pack_lineup(away_players[:11]),
+                        )
+                        pending.append((match, home_club, away_club, fixture))
+                    else:
+                        match_state = self.match_simulator.simulate(
+                            home_lineup=home_players[:11],
+                            away_lineup=away_players[:11],
+                            detail=ResultDetail.FULL,
+                        )
+
+                    # Restore original values
+                    if use_dynamic_states:
+                        for i, p in enumerate(home_players):
+                            p.fitness = original_home_fitness[i]
+                        for i, p in enumerate(away_players):
+                            p.fitness = original_away_fitness[i]
+
+                    if self.runner is None:
+                        record_result(match, home_club, away_club, match_state, matchday_num)
+
+                # Fixtures within a matchday are independent
+                if pending:
+                    # Run off the event loop; the runner blocks until its workers finish
+                    results = await asyncio.to_thread(
+                        self.runner.run, [fixture for *_, fixture in pending]
+                    )
+                    for (match, home_club, away_club, _), result in zip(
+                        pending, results, strict=True
+                    ):
+                        record_result(match, home_club, away_club, result.state, matchday_num)
 
-                # Update dynamic states
+                # Recover players between matchdays
                 if use_dynamic_states:
-                    self._update_match_states(home_club, away_club, match_state, matchday_num)
-
-                all_matches.append(match_state)
+                    self.state_manager.recover_all_players(days=7)
 
-            # Recover players between matchdays
-            if use_dynamic_states:
-                self.state_manager.recover_all_players(days=7)
-
-            await self.session.commit()
+        await insert_matches(self.session, played, played_events)
+        await self.session.commit()
 
         # Sort standings
         sorted_standings = sorted(
@@ -464,6 +646,15 @@ class SeasonSimulator:
 
         return result
 
+    @contextmanager
+    def _runner_pool(self) -> Iterator[None]:
+        """Keep the runner's worker pool open, unless the caller already did."""
+        if self.runner is None or self.runner.active:
+            yield
+            return
+        with self.runner:
+            yield
+
     def _update_match_states(
         self,
         home_club: Club,
@@ -522,29 +713,8 @@ class SeasonSimulator:
             if p_state:
                 p_state.play_match(90, away_perf)
 
-    async def _get_lineup(self, club_id: int) -> list[Player]:
-        """Get starting lineup for a club."""
-        result = await self.session.execute(
-            select(Player)
-            .where(Player.club_id == club_id)
-            .order_by(Player.current_ability.desc())
-            .limit(11)
-        )
-        return list(result.scalars().all())
-
-    async def _get_all_players(self, club_id: int) -> list[Player]:
-        """Get all players for a club."""
-        result = await self.session.execute(select(Player).where(Player.club_id == club_id))
-        return list(result.scalars().all())
-
-    async def _get_lineup_dynamic(self, club_id: int) -> list[Player]:
-        """Get lineup considering player fitness and form."""
-        # Get all players with their states
-        result = await self.session.execute(
-            select(Player).where(Player.club_id == club_id).order_by(Player.current_ability.desc())
-        )
-        players = list(result.scalars().all())
-
+    def _get_lineup_dynamic(self, players: list[Player]) -> list[Player]:
+        """Pick a lineup from a squad considering player fitness and form."""
         # Get available players sorted by effective rating
         available = []
         for player in players:
@@ -29,10 +29,11 @@ from fm_manager.core.models import (
     Transfer,
     TransferStatus,
 )
-from fm_manager.core.database import get_db_session
+from fm_manager.core.database import get_session_maker
 from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine
+from fm_manager.engine.season_simulator import SeasonSquads, insert_matches, load_season_squads
 from fm_manager.engine.team_state import TeamStateManager
-from fm_manager.engine.finance_engine import FinanceEngine
+from fm_manager.engine.finance_engine import ClubFinances, FinanceEngine
 from fm_manager.engine.transfer_engine_enhanced import EnhancedTransferEngine
 
 
@@ -156,6 +157,8 @@ class ComprehensiveSeasonSimulator:
         self.standings: Dict[int, Dict[int, LeagueStandings]] = {}
         self.european_fixtures: List[EuropeanFixture] = []
         self.european_tables: Dict[str, List[Tuple[int, int, int]]] = {}
+        self.squads = SeasonSquads()
+        self.played_matches: List[Match] = []
 
     async def simulate_full_season(
         self,
@@ -185,49 +188,65 @@ class ComprehensiveSeasonSimulator:
             total_matchdays=38,
         )
 
-        # Load leagues
-        async with get_db_session() as session:
+        async with get_session_maker()() as session:
             # Get leagues
-            leagues = []
-            for league_id in league_ids:
-                league = await session.get(League, league_id)
-                if league:
-                    leagues.append(league)
+            result = await session.execute(select(League).where(League.id.in_(league_ids)))
+            by_id = {league.id: league for league in result.scalars().all()}
+            leagues = [by_id[league_id] for league_id in league_ids if league_id in by_id]
+
+            # Clubs and squads for every league, loaded once for the whole season
+            self.squads = await load_season_squads(session, list(by_id))
+            self.played_matches = []
 
             # Initialize standings for each league
             for league in leagues:
                 if league.id not in self.standings:
                     self.standings[league.id] = {}
 
-                    # Get clubs
-                    result = await session.execute(select(Club).where(Club.league_id == league.id))
-                    clubs = list(result.scalars().all())
-
                     # Initialize standings
-                    for club in clubs:
+                    for club in self._league_clubs(league.id):
                         if club.id not in self.standings[league.id]:
                             self.standings[league.id][club.id] = LeagueStandings(
                                 club_id=club.id or 0,
                                 club_name=club.name or "Unknown",
                             )
 
-        # Generate fixtures
-        fixtures = await self._generate_fixtures(leagues, year, start_date)
+            # One season per league; its fixtures reference the season id
+            seasons = {
+                league.id: Season(
+                    league_id=league.id,
+                    start_year=year,
+                    end_year=year + 1,
+                    status="active",
+                    start_date=start_date,
+                )
+                for league in leagues
+            }
+            session.add_all(seasons.values())
+            await session.flush()
+
+            # Generate fixtures
+            fixtures = await self._generate_fixtures(leagues, seasons, start_date)
+            progress.total_matchdays = max((len(f) for f in fixtures.values()), default=0)
 
-        # Process season week by week
-        while progress.current_matchday <= progress.total_matchdays:
-            # Process matches for current matchday
-            await self._process_matchday(progress.current_matchday, fixtures, progress, session)
+            # Process season week by week
+            while progress.current_matchday <= progress.total_matchdays:
+                # Process matches for current matchday
+                await self._process_matchday(progress.current_matchday, fixtures, progress, session)
 
-            # Update progress
-            progress.current_matchday += 1
-            progress.weeks_processed = (progress.current_matchday - 1) // 4
+                # Update progress
+                progress.current_matchday += 1
+                progress.weeks_processed = (progress.current_matchday - 1) // 4
 
-            if progress_callback:
-                progress_callback(progress.weeks_processed, 38)
+                if progress_callback:
+                    progress_callback(progress.weeks_processed, 38)
 
-        # Handle end of season
-        await self._handle_season_end(leagues, session)
+            # Write all results back in one statement
+            await insert_matches(session, self.played_matches)
+
+            # Handle end of season
+            await self._handle_season_end(leagues, session)
+            await session.commit()
 
         return {
             "season_year": year,
@@ -238,26 +257,24 @@ class ComprehensiveSeasonSimulator:
     async def _generate_fixtures(
         self,
         leagues: List[League],
-        year: int,
+        seasons: Dict[int, Season],
         start_date: date,
     ) -> Dict[int, List[List[Match]]]:
         """Generate fixtures for all leagues."""
         all_fixtures = {}
 
         for league in leagues:
+            season = seasons[league.id]
             # Generate league fixtures (round robin)
-            if league.format.value == "double_round_robin":
-                fixtures = self._generate_double_round_robin(league, year, start_date)
-            elif league.format.value == "split":
-                fixtures = self._generate_split_season(league, year, start_date)
-            elif league.format.value == "playoff":
-                fixtures = self._generate_playoff_season(league, year, start_date)
-            else:
-                fixtures = self._generate_single_round_robin(league, year, start_date)
+            fixtures = await self._generate_double_round_robin(league, season.id, start_date)
+            if league.format.value == "single_round_robin":
+                fixtures = fixtures[: len(fixtures) // 2]
+            # Split and playoff leagues play a double round robin regular season
 
             all_fixtures[league.id] = fixtures
 
         # Generate European fixtures
+        year = start_date.year
         await self._generate_european_fixtures(leagues, year, start_date)
 
         return all_fixtures
@@ -271,25 +288,20 @@ class ComprehensiveSeasonSimulator:
     ) -> None:
         """Process all matches for a given matchday."""
         for league_id, league_fixtures in fixtures.items():
+            if matchday > len(league_fixtures):
+                continue
             for match in league_fixtures[matchday - 1]:  # 0-indexed
                 if match.status == MatchStatus.SCHEDULED:
                     # Check if clubs have enough players
-                    result = await session.execute(
-                        select(Club).where(Club.id == match.home_club_id)
-                    )
-                    home_club = result.scalars().first()
-
-                    result = await session.execute(
-                        select(Club).where(Club.id == match.away_club_id)
-                    )
-                    away_club = result.scalars().first()
+                    home_club = self.squads.clubs.get(match.home_club_id)
+                    away_club = self.squads.clubs.get(match.away_club_id)
 
                     if not home_club or not away_club:
                         continue
 
                     # Get lineups
-                    home_players = await self._get_club_players(home_club.id, session)
-                    away_players = await self._get_club_players(away_club.id, session)
+                    home_players = self.squads.squad(home_club.id)
+                    away_players = self.squads.squad(away_club.id)
 
                     if len(home_players) < 11 or len(away_players) < 11:
                         continue
@@ -310,15 +322,12 @@ class ComprehensiveSeasonSimulator:
                     # Update standings
                     await self._update_standings(match, league_id, session)
 
-                    # Save match details
-                    session.add(match)
+                    # Saved in bulk at the end of the season
+                    self.played_matches.append(match)
 
             # Process finances for the week
             await self._process_weekly_finances(matchday, fixtures, session)
 
-            # Save progress
-            await session.commit()
-
     async def _update_standings(
         self,
         match: Match,
@@ -344,8 +353,10 @@ class ComprehensiveSeasonSimulator:
 
         if match.home_score > match.away_score:
             home_standings.won += 1
+            home_standings.points += 3
         elif match.home_score == match.away_score:
             home_standings.drawn += 1
+            home_standings.points += 1
         else:
             home_standings.lost += 1
 
@@ -356,18 +367,20 @@ class ComprehensiveSeasonSimulator:
 
         if match.away_score > match.home_score:
             away_standings.won += 1
+            away_standings.points += 3
         elif match.away_score == match.home_score:
             away_standings.drawn += 1
+            away_standings.points += 1
         else:
             away_standings.lost += 1
 
+        home_standings.goal_diff = home_standings.goals_for - home_standings.goals_against
+        away_standings.goal_diff = away_standings.goals_for - away_standings.goals_against
+
         # Update form
         home_standings.form = self._update_form(home_standings, True)
         away_standings.form = self._update_form(away_standings, False)
 
-        # Update head-to-head
-        await self._update_head_to_head(home_standings, away_standings)
-
     def _update_form(self, standings: LeagueStandings, is_win: bool) -> List[str]:
         """Update form string based on result."""
         form = standings.form[-4:] if len(standings.form) >= 4 else standings.form
@@ -379,55 +392,24 @@ class ComprehensiveSeasonSimulator:
 
         return form
 
-    async def _update_head_to_head(
-        self,
-        home_standings: LeagueStandings,
-        away_standings: LeagueStandings,
-    ) -> None:
-        """Update head-to-head record."""
-        # Find existing H2H record
-        for record in self.european_fixtures:
-            if (
-                record.home_club_id == home_standings.club_id
-                and record.away_club_id == away_standings.club_id
-            ):
-                if record.home_away is not None:
-                    record.home_away = 0
-                break
-
-        # Update H2H
-        if home_standings.home_away is not None:
-            home_standings.home_away += home_standings.goals_for - home_standings.goals_against
-        if away_standings.home_away is not None:
-            away_standings.home_away = away_standings.goals_for - away_standings.goals_against
-
-    async def _get_club_players(
-        self,
-        club_id: int,
-        session: AsyncSession,
-    ) -> List[Player]:
-        """Get players for a club with state management."""
-        result = await session.execute(select(Player).where(Player.club_id == club_id))
-        players = list(result.scalars().all())
-        return players
-
     def _get_club_formation(self, club_id: int, league_id: int) -> str:
         """Get club's preferred formation."""
         # For now, return default formation
         # Could be stored in club preferences
         return "4-3-3"
 
+    def _league_clubs(self, league_id: int) -> List[Club]:
+        """Preloaded clubs of a league."""
+        return [c for c in self.squads.clubs.values() if c.league_id == league_id]
+
     async def _generate_double_round_robin(
         self,
         league: League,
-        year: int,
+        season_id: int,
         start_date: date,
     ) -> List[List[Match]]:
         """Generate double round-robin fixtures."""
-        # Get clubs
-        async with get_db_session() as session:
-            result = await session.execute(select(Club).where(Club.league_id == league.id))
-            clubs = list(result.scalars().all())
+        clubs = self._league_clubs(league.id)
 
         if len(clubs) < 2:
             return []
@@ -450,7 +432,7 @@ class ComprehensiveSeasonSimulator:
                 match_date = start_date + timedelta(weeks=round_num)
 
                 match = Match(
-                    season_id=0,  # Will be set when season created
+                    season_id=season_id,
                     matchday=round_num + 1,
                     match_date=match_date,
                     home_club_id=home_club.id,
@@ -478,12 +460,7 @@ class ComprehensiveSeasonSimulator:
 
     async def _allocate_european_spots(self, league: League) -> None:
         """Allocate Champions League and Europa League spots."""
-        # Get clubs
-        async with get_db_session() as get_session:
-            result = await get_session.execute(
-                select(Club).where(Club.league_id == league.id).order_by(Club.reputation.desc())
-            )
-            clubs = list(result.scalars().all())
+        clubs = sorted(self._league_clubs(league.id), key=lambda c: c.reputation, reverse=True)
 
         # CL spots: top 4
         # EL spots: next 2 (5th and 6th place)
@@ -512,60 +489,34 @@ class ComprehensiveSeasonSimulator:
                 if match.status != MatchStatus.FULL_TIME:
                     continue
 
-                # Get clubs
-                result = await session.execute(
-                    select(Club).where(Club.id.in_([match.home_club_id, match.away_club_id]))
-                )
-                clubs = {c.id: c for c in result.scalars().all()}
+                clubs = self.squads.clubs
 
                 # Process home club finances
                 home_club = clubs.get(match.home_club_id)
                 if home_club and match.home_club_id == match.home_club_id:
-                    club_finances = await self._load_club_finances(home_club.id, session)
+                    club_finances = self._load_club_finances(home_club)
                     self.finance_engine.process_matchday(
                         club_finances, home_club, is_home=True, match_importance="normal"
                     )
-                    self._save_club_finances(club_finances, session)
+                    await self._save_club_finances(club_finances, session)
 
                 # Process away club finances
                 away_club = clubs.get(match.away_club_id)
                 if away_club and match.away_club_id == match.away_club_id:
-                    club_finances = await self._load_club_finances(away_club.id, session)
+                    club_finances = self._load_club_finances(away_club)
                     self.finance_engine.process_matchday(
                         club_finances, away_club, is_home=False, match_importance="normal"
                     )
-                    self._save_club_finances(club_finances, session)
-
-    async def _load_club_finances(
-        self,
-        club_id: int,
-        session: AsyncSession,
-    ) -> object:
-        """Load club finances from database."""
-        # This would need proper ClubFinances model
-        # For now, return a simple object
-        from dataclasses import dataclass
-
-        @dataclass
-        class ClubFinances:
-            club_id: int
-            balance: int = 0
-            transfer_budget: int = 0
-            wage_budget: int = 0
-
-        # Try to get existing or create default
-        result = await session.execute(select(Club).where(Club.id == club_id))
-        club = result.scalars().first()
-
-        if club:
-            return ClubFinances(
-                club_id=club.id,
-                balance=club.balance or 0,
-                transfer_budget=club.transfer_budget or 50_000_000,
-                wage_budget=club.wage_budget or 5_000_000,
-            )
-        else:
-            return ClubFinances(club_id=club_id)
+                    await self._save_club_finances(club_finances, session)
+
+    def _load_club_finances(self, club: Club) -> ClubFinances:
+        """Club finances from the preloaded club."""
+        return ClubFinances(
+            club_id=club.id,
+            balance=club.balance or 0,
+            transfer_budget=club.transfer_budget or 50_000_000,
+            wage_budget=club.wage_budget or 5_000_000,
+        )
 
     async def _save_club_finances(self, club_finances: object, session: AsyncSession) -> None:
         """Save club finances to database."""
@@ -585,9 +536,7 @@ class ComprehensiveSeasonSimulator:
             standings_list = list(self.standings[league.id].values())
 
             # Sort by: points, goal difference, goals for
-            standings_list.sort(
-                key=lambda x: (x.points, x.goal_difference, x.goals_for), reverse=True
-            )
+            standings_list.sort(key=lambda x: (x.points, x.goal_diff, x.goals_for), reverse=True)
 
             # Process promotion/relegation
             if len(standings_list) >= 3:
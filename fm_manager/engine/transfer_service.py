@@ -151,6 +151,10 @@ class TransferService:
         if hasattr(to_club, "players"):
             to_club.players.append(player)
 
+        for club in (from_club, to_club):
+            if hasattr(club, "mark_squad_changed"):
+                club.mark_squad_changed()
+
         return True
 
     def validate_finances(self, club_id: int, fee: int) -> Tuple[bool, str, int]:
@@ -0,0 +1,185 @@
+"""Websocket fan-out for game rooms.
+
+Each connection gets a bounded outbound queue drained by its own writer
+task, so publishing never waits on a client and one slow client cannot
+delay the others. A message is encoded to JSON once and the same text is
+queued for every recipient.
+
+State snapshots (such as the player list) can be published with a
+coalescing key. A newer snapshot then replaces one that is still queued, so
+slow consumers skip stale states instead of falling further behind. A
+client whose queue still overflows is disconnected.
+"""
+
+import asyncio
+import contextlib
+import json
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+# Same encoding as Starlette's WebSocket.send_json
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Close code for clients that cannot keep up ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def encode_message(message: dict) -> str:
+    return _encode(message)
+
+
+class ClientConnection:
+    """Outbound queue and writer task for one websocket."""
+
+    def __init__(self, websocket: Any, max_queue: int = 64, name: str = ""):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.name = name
+        self.closed = False
+        self.sent = 0
+        self.coalesced = 0
+
+        self._queue: deque[tuple[Optional[str], str]] = deque()
+        self._keyed: Dict[str, tuple[Optional[str], str]] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer = asyncio.create_task(self._run())
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def send(self, text: str, coalesce_key: Optional[str] = None) -> bool:
+        """Queue encoded text without waiting; returns False if the client was dropped."""
+        if self.closed:
+            return False
+
+        entry = (coalesce_key, text)
+        if coalesce_key is not None:
+            stale = self._keyed.pop(coalesce_key, None)
+            if stale is not None:
+                self._queue.remove(stale)
+                self.coalesced += 1
+            self._keyed[coalesce_key] = entry
+
+        if len(self._queue) >= self.max_queue and not self._drop_oldest_snapshot():
+            print(f"Dropping slow websocket client {self.name}")
+            self._close(SLOW_CONSUMER_CLOSE_CODE)
+            return False
+
+        self._queue.append(entry)
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def drain(self) -> None:
+        """Wait until everything queued so far has been written."""
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the writer; the websocket itself is left to its owner."""
+        self._close()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer
+
+    def _drop_oldest_snapshot(self) -> bool:
+        """Make room by dropping the oldest queued snapshot, if there is one."""
+        for entry in self._queue:
+            if entry[0] is not None:
+                self._queue.remove(entry)
+                del self._keyed[entry[0]]
+                self.coalesced += 1
+                return True
+        return False
+
+    def _close(self, code: Optional[int] = None) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.clear()
+        self._keyed.clear()
+        self._idle.set()
+        self._writer.cancel()
+        if code is not None:
+            self._closer = asyncio.create_task(self._close_websocket(code))
+
+    async def _close_websocket(self, code: int) -> None:
+        with contextlib.suppress(Exception):
+            await self.websocket.close(code=code)
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                if not self._queue:
+                    self._idle.set()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                entry = self._queue.popleft()
+                if entry[0] is not None:
+                    self._keyed.pop(entry[0], None)
+                await self.websocket.send_text(entry[1])
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error broadcasting to {self.name}: {e}")
+            self.closed = True
+            self._queue.clear()
+            self._keyed.clear()
+            self._idle.set()
+
+
+class RoomBroadcaster:
+    """Publish messages to every connection of a room.
+
+    ``relay`` additionally receives every published message, encoded, with
+    its coalescing key; it forwards the room's traffic to other workers.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 64,
+        relay: Optional[Callable[[str, Optional[str]], None]] = None,
+    ):
+        self.max_queue = max_queue
+        self.relay = relay
+        self.connections: Dict[str, ClientConnection] = {}
+
+    def attach(self, client_id: str, websocket: Any, name: str = "") -> ClientConnection:
+        """Register a websocket; replaces any previous connection of the client."""
+        previous = self.connections.pop(client_id, None)
+        if previous is not None:
+            previous._close()
+        connection = ClientConnection(websocket, self.max_queue, name or client_id)
+        self.connections[client_id] = connection
+        return connection
+
+    async def detach(self, client_id: str) -> None:
+        connection = self.connections.pop(client_id, None)
+        if connection is not None:
+            await connection.close()
+
+    def send(self, client_id: str, message: dict) -> bool:
+        """Queue a message for one client."""
+        connection = self.connections.get(client_id)
+        return connection is not None and connection.send(encode_message(message))
+
+    def publish(self, message: dict, coalesce_key: Optional[str] = None) -> int:
+        """Queue a message for every client; returns how many accepted it."""
+        if self.relay is None and not self.connections:
+            return 0
+        text = encode_message(message)
+        if self.relay is not None:
+            self.relay(text, coalesce_key)
+        return sum(connection.send(text, coalesce_key) for connection in self.connections.values())
+
+    async def flush(self) -> None:
+        """Wait until every connection has written what is queued."""
+        await asyncio.gather(*(c.drain() for c in self.connections.values()))
+
+    async def close(self) -> None:
+        connections = list(self.connections.values())
+        self.connections.clear()
+        await asyncio.gather(*(c.close() for c in connections))
@@ -9,16 +9,22 @@ Manages a single game room including:
 
 import asyncio
 import json
-import random
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Any
 
 from fastapi import WebSocket
 
 from fm_manager.data.cleaned_data_loader import load_for_match_engine, ClubDataFull
-from fm_manager.engine.match_engine_markov import MarkovMatchEngine
+from fm_manager.data.club_registry import ClubRegistry
+from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine
+from fm_manager.engine.rng import RandomStreams
+from fm_manager.engine.season_runner import pack_lineup
+from fm_manager.server.broadcast import RoomBroadcaster
+from fm_manager.server.simulation_executor import SimulationExecutor, SimulationQueueFullError
+from fm_manager.server.standings import StandingsTable
 
 # AI Manager personality types
 class AIPersonality(Enum):
@@ -78,6 +84,28 @@ class MatchResult:
     played_at: datetime = field(default_factory=datetime.now)
 
 
+def play_fixtures(fixtures: List[tuple]) -> List[tuple]:
+    """Worker entry point: play (seed, home lineup, away lineup) fixtures.
+    
+    Returns (home_score, away_score, goal_events) per fixture.
+    """
+    engine = EnhancedMarkovEngine()
+    results = []
+    for seed, home_lineup, away_lineup in fixtures:
+        engine.reseed(seed)
+        match_state = engine.simulate(home_lineup, away_lineup)
+        goals = [
+            {
+                "minute": e.minute,
+                "type": e.event_type.name,
+                "description": e.description
+            }
+            for e in match_state.events if "GOAL" in e.event_type.name
+        ]
+        results.append((match_state.home_score, match_state.away_score, goals))
+    return results
+
+
 class GameRoom:
     """A game room managing a multiplayer session."""
     
@@ -88,7 +116,11 @@ class GameRoom:
         max_players: int = 4,
         season_length: int = 38,
         enable_ai: bool = True,
-        llm_client=None
+        llm_client=None,
+        seed: Optional[int] = None,
+        executor: Optional[SimulationExecutor] = None,
+        result_delay: float = 0.5,
+        relay: Optional[Callable[[str, Optional[str]], None]] = None
     ):
         self.room_id = room_id
         self.name = name
@@ -103,16 +135,26 @@ class GameRoom:
         
         # Players and clubs
         self.players: Dict[str, Player] = {}
-        self.available_clubs: List[ClubDataFull] = []
+        self.clubs = ClubRegistry()
         self.selected_clubs: Dict[str, int] = {}  # player_id -> club_id
         
         # Game state
         self.current_matchday = 0
         self.match_results: List[MatchResult] = []
-        self.standings: Dict[int, Dict] = {}  # club_id -> stats
+        self.standings = StandingsTable()
         
-        # Match engine
-        self.match_engine = MarkovMatchEngine()
+        # Matches run on the shared executor (inline without one); every
+        # matchday and match draws from its own random substream
+        self.executor = executor
+        self.random_streams = RandomStreams(seed)
+        self.simulating = False
+        # Pause between match result broadcasts, for drama; 0 disables it
+        self.result_delay = result_delay
+        
+        # Outbound websocket traffic for players and spectators; the relay
+        # forwards it to spectators connected to other server workers
+        self.broadcaster = RoomBroadcaster(relay=relay)
+        self.spectators: Dict[str, WebSocket] = {}
         
         # Load data
         self._load_data()
@@ -127,11 +169,20 @@ class GameRoom:
                 c for c in clubs.values() 
                 if c.league in major_leagues
             ]
-            print(f"Loaded {len(self.available_clubs)} clubs for room {self.room_id}")
+            print(f"Loaded {len(self.clubs)} clubs for room {self.room_id}")
         except Exception as e:
             print(f"Error loading clubs: {e}")
             self.available_clubs = []
     
+    @property
+    def available_clubs(self) -> List[ClubDataFull]:
+        """Clubs that can be picked in this room."""
+        return list(self.clubs)
+    
+    @available_clubs.setter
+    def available_clubs(self, clubs: List[ClubDataFull]):
+        self.clubs = ClubRegistry(clubs)
+    
     # ========================================================================
     # Player Management
     # ========================================================================
@@ -266,7 +317,8 @@ class GameRoom:
         player.websocket = websocket
         player.is_connected = True
         
-        await websocket.send_json({
+        self.broadcaster.attach(player_id, websocket, player.name)
+        self.broadcaster.send(player_id, {
             "type": "connected",
             "player_id": player_id,
             "room_id": self.room_id,
@@ -294,9 +346,31 @@ class GameRoom:
         player = self.players[player_id]
         player.is_connected = False
         player.websocket = None
+        await self.broadcaster.detach(player_id)
         
         await self._broadcast_player_list()
     
+    async def connect_spectator(self, spectator_id: str, websocket: WebSocket):
+        """Connect a read-only spectator WebSocket."""
+        self.spectators[spectator_id] = websocket
+        self.broadcaster.attach(spectator_id, websocket, f"spectator {spectator_id}")
+        self.broadcaster.send(spectator_id, {
+            "type": "connected",
+            "spectator_id": spectator_id,
+            "room_id": self.room_id,
+            "status": self.status.value,
+            "standings": self._get_sorted_standings()
+        })
+    
+    async def disconnect_spectator(self, spectator_id: str):
+        """Disconnect a spectator WebSocket."""
+        self.spectators.pop(spectator_id, None)
+        await self.broadcaster.detach(spectator_id)
+    
+    def send_to_player(self, player_id: str, message: dict):
+        """Queue a message for one player, after anything already queued for them."""
+        self.broadcaster.send(player_id, message)
+    
     # ========================================================================
     # Game State Management
     # ========================================================================
@@ -310,7 +384,7 @@ class GameRoom:
         if club_id in self.selected_clubs.values():
             return False
         
-        club = next((c for c in self.available_clubs if c.id == club_id), None)
+        club = self.clubs.get(club_id)
         if not club:
             return False
         
@@ -354,17 +428,7 @@ class GameRoom:
         # Initialize standings
         for player in self.players.values():
             if player.club_id:
-                self.standings[player.club_id] = {
-                    "club_id": player.club_id,
-                    "played": 0,
-                    "won": 0,
-                    "drawn": 0,
-                    "lost": 0,
-                    "gf": 0,
-                    "ga": 0,
-                    "gd": 0,
-                    "points": 0
-                }
+                self.standings.add_club(player.club_id, self.clubs.name_of(player.club_id))
         
         await self._broadcast({
             "type": "game_started",
@@ -380,9 +444,18 @@ class GameRoom:
     
     async def simulate_matchday(self):
         """Simulate one matchday."""
-        if self.status != RoomStatus.PLAYING:
+        if self.status != RoomStatus.PLAYING or self.simulating:
             return
         
+        # Claimed before the first await so a concurrent call cannot replay the matchday
+        self.simulating = True
+        try:
+            await self._play_matchday()
+        finally:
+            self.simulating = False
+    
+    async def _play_matchday(self):
+        """Simulate, record and broadcast the current matchday."""
         await self._broadcast({
             "type": "matchday_start",
             "matchday": self.current_matchday
@@ -394,35 +467,35 @@ class GameRoom:
             return
         
         # Simple round-robin pairing
-        random.shuffle(clubs)
-        matches = []
-        
-        for i in range(0, len(clubs) - 1, 2):
-            if i + 1 < len(clubs):
-                home_club_id = clubs[i]
-                away_club_id = clubs[i + 1]
-                
-                result = await self._simulate_match(home_club_id, away_club_id)
-                matches.append(result)
-                
-                # Update standings
-                self._update_standings(result)
-                
-                # Broadcast result
-                await self._broadcast({
-                    "type": "match_result",
-                    "match": {
-                        "home_club_id": result.home_club_id,
-                        "away_club_id": result.away_club_id,
-                        "home_score": result.home_score,
-                        "away_score": result.away_score,
-                        "home_club_name": self._get_club_name(result.home_club_id),
-                        "away_club_name": self._get_club_name(result.away_club_id)
-                    }
-                })
-                
-                # Small delay for drama
-                await asyncio.sleep(0.5)
+        self.random_streams.stream("pairing", self.current_matchday).shuffle(clubs)
+        pairs = [(clubs[i], clubs[i + 1]) for i in range(0, len(clubs) - 1, 2)]
+        
+        try:
+            matches = await self._simulate_matches(pairs)
+        except SimulationQueueFullError:
+            await self._broadcast_system_message("Server busy, please retry the matchday shortly")
+            return
+        
+        for result in matches:
+            # Update standings
+            self._update_standings(result)
+            
+            # Broadcast result
+            await self._broadcast({
+                "type": "match_result",
+                "match": {
+                    "home_club_id": result.home_club_id,
+                    "away_club_id": result.away_club_id,
+                    "home_score": result.home_score,
+                    "away_score": result.away_score,
+                    "home_club_name": self._get_club_name(result.home_club_id),
+                    "away_club_name": self._get_club_name(result.away_club_id)
+                }
+            })
+            
+            # Small delay for drama
+            if self.result_delay:
+                await asyncio.sleep(self.result_delay)
         
         self.match_results.extend(matches)
         self.current_matchday += 1
@@ -441,102 +514,67 @@ class GameRoom:
                 "standings": self._get_sorted_standings()
             })
     
-    async def _simulate_match(self, home_club_id: int, away_club_id: int) -> MatchResult:
-        """Simulate a single match."""
-        # Get clubs
-        home_club = next((c for c in self.available_clubs if c.id == home_club_id), None)
-        away_club = next((c for c in self.available_clubs if c.id == away_club_id), None)
-        
-        if not home_club or not away_club:
-            return MatchResult(home_club_id, away_club_id, 0, 0)
-        
-        # Build lineups
+    async def _simulate_matches(self, pairs: List[tuple]) -> List[MatchResult]:
+        """Simulate a matchday's (home, away) pairs on the executor."""
         from fm_manager.engine.match_engine_adapter import ClubSquadBuilder
         
-        home_builder = ClubSquadBuilder(home_club)
-        away_builder = ClubSquadBuilder(away_club)
-        
-        home_lineup = home_builder.build_lineup("4-3-3")
-        away_lineup = away_builder.build_lineup("4-3-3")
+        fixtures = []
+        playable = []
+        for home_club_id, away_club_id in pairs:
+            home_club = self.clubs.get(home_club_id)
+            away_club = self.clubs.get(away_club_id)
+            if not home_club or not away_club:
+                continue
+            
+            # Lineups are packed into small payloads for the worker
+            home_lineup = ClubSquadBuilder(home_club).build_lineup("4-3-3")
+            away_lineup = ClubSquadBuilder(away_club).build_lineup("4-3-3")
+            seed = self.random_streams.seed_for(
+                "match", self.current_matchday, home_club_id, away_club_id
+            )
+            fixtures.append((seed, pack_lineup(home_lineup), pack_lineup(away_lineup)))
+            playable.append((home_club_id, away_club_id))
         
-        # Simulate
-        match_state = self.match_engine.simulate(home_lineup, away_lineup)
+        if not fixtures:
+            outcomes = []
+        elif self.executor is None:
+            outcomes = play_fixtures(fixtures)
+        else:
+            outcomes = await self.executor.run(self.room_id, play_fixtures, fixtures)
         
-        return MatchResult(
-            home_club_id=home_club_id,
-            away_club_id=away_club_id,
-            home_score=match_state.home_score,
-            away_score=match_state.away_score,
-            events=[
-                {
-                    "minute": e.minute,
-                    "type": e.event_type.name,
-                    "description": e.description
-                }
-                for e in match_state.events if "GOAL" in e.event_type.name
-            ]
-        )
+        played = {
+            pair: MatchResult(pair[0], pair[1], home_score, away_score, events=goals)
+            for pair, (home_score, away_score, goals) in zip(playable, outcomes, strict=True)
+        }
+        # Unknown clubs keep the old behaviour of a 0-0 result
+        return [played.get(pair) or MatchResult(pair[0], pair[1], 0, 0) for pair in pairs]
     
     def _update_standings(self, result: MatchResult):
         """Update league standings."""
-        home = self.standings.get(result.home_club_id)
-        away = self.standings.get(result.away_club_id)
-        
-        if not home or not away:
-            return
-        
-        home["played"] += 1
-        away["played"] += 1
-        home["gf"] += result.home_score
-        home["ga"] += result.away_score
-        away["gf"] += result.away_score
-        away["ga"] += result.home_score
-        
-        if result.home_score > result.away_score:
-            home["won"] += 1
-            home["points"] += 3
-            away["lost"] += 1
-        elif result.home_score < result.away_score:
-            away["won"] += 1
-            away["points"] += 3
-            home["lost"] += 1
-        else:
-            home["drawn"] += 1
-            away["drawn"] += 1
-            home["points"] += 1
-            away["points"] += 1
-        
-        home["gd"] = home["gf"] - home["ga"]
-        away["gd"] = away["gf"] - away["ga"]
+        self.standings.record_result(
+            result.home_club_id, result.away_club_id, result.home_score, result.away_score
+        )
     
     def _get_club_name(self, club_id: int) -> str:
         """Get club name by ID."""
-        club = next((c for c in self.available_clubs if c.id == club_id), None)
-        return club.name if club else f"Club {club_id}"
+        return self.clubs.name_of(club_id)
     
     def _get_sorted_standings(self) -> List[Dict]:
         """Get sorted standings."""
-        standings = list(self.standings.values())
-        standings.sort(key=lambda x: (-x["points"], -x["gd"], -x["gf"]))
-        
-        for i, s in enumerate(standings, 1):
-            s["position"] = i
-            s["club_name"] = self._get_club_name(s["club_id"])
-        
-        return standings
+        return self.standings.rows()
     
     # ========================================================================
     # Broadcasting
     # ========================================================================
     
-    async def _broadcast(self, message: dict):
-        """Broadcast message to all connected players."""
-        for player in self.players.values():
-            if player.is_connected and player.websocket:
-                try:
-                    await player.websocket.send_json(message)
-                except Exception as e:
-                    print(f"Error broadcasting to {player.name}: {e}")
+    async def _broadcast(self, message: dict, coalesce_key: Optional[str] = None):
+        """Broadcast message to all connected players and spectators.
+        
+        Messages are queued per connection and written concurrently, so this
+        never waits on a slow client. Pass ``coalesce_key`` for state
+        snapshots that a newer message of the same key supersedes.
+        """
+        self.broadcaster.publish(message, coalesce_key)
     
     async def _broadcast_system_message(self, content: str):
         """Broadcast a system message."""
@@ -561,7 +599,7 @@ class GameRoom:
                 }
                 for p in self.players.values()
             ]
-        })
+        }, coalesce_key="player_list")
     
     async def broadcast_chat(self, player_id: str, content: str):
         """Broadcast chat message."""
@@ -598,13 +636,16 @@ class GameRoom:
     async def close(self):
         """Close the room."""
         self.status = RoomStatus.CLOSED
+        if self.executor is not None:
+            self.executor.cancel_room(self.room_id)
+        await self.broadcaster.close()
         
-        for player in self.players.values():
-            if player.websocket:
-                try:
-                    await player.websocket.close()
-                except:
-                    pass
+        websockets = [p.websocket for p in self.players.values() if p.websocket]
+        for websocket in websockets + list(self.spectators.values()):
+            try:
+                await websocket.close()
+            except:
+                pass
     
     # ========================================================================
     # Serialization
@@ -632,7 +673,7 @@ class GameRoom:
             ],
             "available_clubs": [
                 {"id": c.id, "name": c.name, "league": c.league}
-                for c in self.available_clubs[:20]  # Limit for performance
+                for c in islice(self.clubs, 20)  # Limit for performance
             ],
             "standings": self._get_sorted_standings() if self.standings else []
         }
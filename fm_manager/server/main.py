@@ -8,36 +8,66 @@ FastAPI-based server supporting multiplayer online gameplay with:
 
 import asyncio
 import json
+import os
+import re
+import socket
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Dict, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import RedirectResponse
 
+from fm_manager.core.config import settings
+from fm_manager.server.broadcast import ClientConnection, encode_message
 from fm_manager.server.game_room import GameRoom, RoomStatus, PlayerRole
+from fm_manager.server.room_state import create_room_backend
+from fm_manager.server.routing import RoomRouter
+from fm_manager.server.simulation_executor import SimulationExecutor
 from fm_manager.engine.llm_client import LLMClient, LLMProvider
 
 
 # Global state
+# Rooms hosted by this worker; the router knows which worker hosts the others
 rooms: Dict[str, GameRoom] = {}
+router = RoomRouter(
+    create_room_backend(settings.room_backend, settings.room_backend_path),
+    worker_id=settings.worker_id or f"{socket.gethostname()}-{os.getpid()}",
+    url=settings.worker_url or f"http://127.0.0.1:{settings.server_port}",
+)
 llm_client: Optional[LLMClient] = None
+simulation_executor: Optional[SimulationExecutor] = None
+
+# Close code for websockets that reached a worker not hosting their room
+WRONG_WORKER_CLOSE_CODE = 4307
+_ROOM_PATH = re.compile(r"^/api/rooms/([^/]+)")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Server lifespan management."""
     # Startup
-    global llm_client
+    global llm_client, simulation_executor
     llm_client = LLMClient()
+    simulation_executor = SimulationExecutor(
+        max_workers=settings.simulation_workers or None,
+        max_pending=settings.simulation_queue_size,
+        max_pending_per_room=settings.simulation_queue_per_room,
+    )
     print("🚀 FM Manager Server starting...")
     print(f"   LLM Client initialized")
+    print(f"   Simulation executor: {simulation_executor.max_workers} workers")
+    await router.start()
+    print(f"   Worker {router.worker_id} at {router.worker.url} ({settings.room_backend} rooms)")
     yield
     # Shutdown
     print("🛑 Server shutting down...")
-    for room in rooms.values():
-        await room.close()
+    for room in list(rooms.values()):
+        await _close_room(room)
+    await router.stop()
+    simulation_executor.close()
 
 
 app = FastAPI(
@@ -57,6 +87,20 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def route_to_room_worker(request: Request, call_next):
+    """Redirect requests for rooms hosted by another worker to that worker."""
+    match = _ROOM_PATH.match(request.url.path)
+    if match and match.group(1) not in rooms:
+        owner = await router.locate(match.group(1))
+        if owner is not None and not router.is_local(owner):
+            url = owner.url + request.url.path
+            if request.url.query:
+                url += "?" + request.url.query
+            return RedirectResponse(url, status_code=307)
+    return await call_next(request)
+
+
 # ============================================================================
 # HTTP API Endpoints
 # ============================================================================
@@ -67,6 +111,7 @@ async def root():
     return {
         "status": "running",
         "version": "0.1.0",
+        "worker_id": router.worker_id,
         "active_rooms": len([r for r in rooms.values() if r.status != RoomStatus.CLOSED]),
         "total_rooms": len(rooms)
     }
@@ -74,32 +119,42 @@ async def root():
 
 @app.get("/api/rooms")
 async def list_rooms():
-    """List all available game rooms."""
+    """List all available game rooms, on every worker."""
     return {
         "rooms": [
             {
-                "id": room.room_id,
-                "name": room.name,
-                "status": room.status.value,
-                "player_count": len(room.players),
-                "max_players": room.max_players,
-                "has_ai": room.has_ai_manager(),
-                "created_at": room.created_at.isoformat()
+                "id": record.room_id,
+                "name": record.name,
+                "status": record.status,
+                "player_count": record.player_count,
+                "max_players": record.max_players,
+                "has_ai": record.has_ai,
+                "created_at": record.created_at,
+                "worker_id": record.worker_id
             }
-            for room in rooms.values()
-            if room.status != RoomStatus.CLOSED
+            for record in await router.list_rooms()
+            if record.status != RoomStatus.CLOSED.value
         ]
     }
 
 
 @app.post("/api/rooms")
 async def create_room(
+    request: Request,
     name: str,
     max_players: int = 4,
     season_length: int = 38,
-    enable_ai: bool = True
+    enable_ai: bool = True,
+    routed: bool = False
 ):
-    """Create a new game room."""
+    """Create a new game room on the least loaded worker."""
+    if not routed:
+        target = await router.place()
+        if not router.is_local(target):
+            # Only redirect once, even if the load changes meanwhile
+            query = f"{request.url.query}&routed=true" if request.url.query else "routed=true"
+            return RedirectResponse(f"{target.url}/api/rooms?{query}", status_code=307)
+    
     room_id = str(uuid.uuid4())[:8]
     room = GameRoom(
         room_id=room_id,
@@ -107,15 +162,20 @@ async def create_room(
         max_players=max_players,
         season_length=season_length,
         enable_ai=enable_ai,
-        llm_client=llm_client
+        llm_client=llm_client,
+        executor=simulation_executor,
+        result_delay=settings.room_result_delay,
+        relay=router.relay(room_id)
     )
     rooms[room_id] = room
+    await router.save(room)
     
     return {
         "room_id": room_id,
         "name": name,
         "status": room.status.value,
-        "join_url": f"/api/rooms/{room_id}/join"
+        "join_url": f"/api/rooms/{room_id}/join",
+        "worker_url": router.worker.url
     }
 
 
@@ -147,12 +207,15 @@ async def join_room(room_id: str, player_name: str, role: str = "human"):
     player_role = PlayerRole.HUMAN if role == "human" else PlayerRole.LLM
     
     await room.add_player(player_id, player_name, player_role)
+    await router.save(room)
     
+    # Websockets must reach the worker hosting the room
     return {
         "player_id": player_id,
         "room_id": room_id,
         "role": player_role.value,
-        "ws_url": f"/ws/rooms/{room_id}?player_id={player_id}"
+        "ws_url": f"/ws/rooms/{room_id}?player_id={player_id}",
+        "worker_url": router.worker.url
     }
 
 
@@ -167,10 +230,11 @@ async def start_game(room_id: str, player_id: str):
     if room.host_id != player_id:
         raise HTTPException(status_code=403, detail="Only host can start the game")
     
-    if room.status != RoomStatus.WAITING:
+    if room.status not in (RoomStatus.WAITING, RoomStatus.READY):
         raise HTTPException(status_code=400, detail="Game already started")
     
     success = await room.start_game()
+    await router.save(room)
     
     return {"success": success, "status": room.status.value}
 
@@ -187,6 +251,7 @@ async def select_club(room_id: str, player_id: str, club_id: int):
     if not success:
         raise HTTPException(status_code=400, detail="Club not available")
     
+    await router.save(room)
     return {"success": True, "club_id": club_id}
 
 
@@ -198,7 +263,11 @@ async def select_club(room_id: str, player_id: str, club_id: int):
 async def websocket_endpoint(websocket: WebSocket, room_id: str, player_id: Optional[str] = None):
     """WebSocket connection for real-time game updates."""
     if room_id not in rooms:
-        await websocket.close(code=4004, reason="Room not found")
+        owner = await router.locate(room_id)
+        if owner is not None:
+            await websocket.close(code=WRONG_WORKER_CLOSE_CODE, reason=f"Room is hosted at {owner.url}")
+        else:
+            await websocket.close(code=4004, reason="Room not found")
         return
     
     room = rooms[room_id]
@@ -233,10 +302,10 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, player_id: Opti
                 await room.set_player_ready(player_id, message.get("ready", True))
             
             elif msg_type == "ping":
-                await websocket.send_json({"type": "pong", "timestamp": datetime.now().isoformat()})
+                room.send_to_player(player_id, {"type": "pong", "timestamp": datetime.now().isoformat()})
             
             else:
-                await websocket.send_json({
+                room.send_to_player(player_id, {
                     "type": "error",
                     "message": f"Unknown message type: {msg_type}"
                 })
@@ -248,6 +317,69 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, player_id: Opti
         await room.disconnect_websocket(player_id)
 
 
+@app.websocket("/ws/rooms/{room_id}/spectate")
+async def spectator_endpoint(websocket: WebSocket, room_id: str):
+    """Read-only WebSocket receiving a room's broadcasts."""
+    if room_id not in rooms:
+        owner = await router.locate(room_id)
+        if owner is None:
+            await websocket.close(code=4004, reason="Room not found")
+        else:
+            await _spectate_remote_room(websocket, room_id)
+        return
+    
+    room = rooms[room_id]
+    spectator_id = str(uuid.uuid4())[:8]
+    
+    await websocket.accept()
+    await room.connect_spectator(spectator_id, websocket)
+    
+    try:
+        while True:
+            # Spectators only receive; drain pings and other client frames
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Spectator WebSocket error: {e}")
+    finally:
+        await room.disconnect_spectator(spectator_id)
+
+
+async def _spectate_remote_room(websocket: WebSocket, room_id: str):
+    """Relay the broadcasts of a room hosted by another worker."""
+    spectator_id = str(uuid.uuid4())[:8]
+    await websocket.accept()
+    
+    connection = ClientConnection(websocket, name=f"spectator {spectator_id}")
+    subscription = router.subscribe(room_id)
+    record = await router.backend.get_room(room_id)
+    connection.send(encode_message({
+        "type": "connected",
+        "spectator_id": spectator_id,
+        "room_id": room_id,
+        "status": record.status if record else None
+    }))
+    
+    async def forward():
+        async for coalesce_key, text in subscription:
+            if not connection.send(text, coalesce_key):
+                break
+    
+    forwarder = asyncio.create_task(forward())
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Spectator WebSocket error: {e}")
+    finally:
+        subscription.close()
+        forwarder.cancel()
+        await connection.close()
+
+
 # ============================================================================
 # LLM Agent Management
 # ============================================================================
@@ -283,6 +415,7 @@ async def add_ai_manager(
     if not success:
         raise HTTPException(status_code=400, detail="Failed to add AI manager")
     
+    await router.save(room)
     return {
         "ai_id": ai_id,
         "name": ai_name,
@@ -303,6 +436,7 @@ async def remove_ai_manager(room_id: str, player_id: str, ai_id: str):
         raise HTTPException(status_code=403, detail="Only host can remove AI managers")
     
     success = await room.remove_ai_manager(ai_id)
+    await router.save(room)
     
     return {"success": success}
 
@@ -322,12 +456,29 @@ async def simulate_matchday(room_id: str, player_id: str, background_tasks: Back
     if room.host_id != player_id:
         raise HTTPException(status_code=403, detail="Only host can trigger simulation")
     
-    # Run simulation in background
-    background_tasks.add_task(room.simulate_matchday)
+    if room.simulating:
+        raise HTTPException(status_code=409, detail="Matchday simulation already running")
+    
+    if simulation_executor is not None and not simulation_executor.has_capacity(room_id):
+        raise HTTPException(status_code=503, detail="Simulation queue full, retry shortly")
+    
+    # Runs in the background; the match engine itself runs on the executor's workers
+    background_tasks.add_task(_play_matchday, room)
     
     return {"success": True, "message": "Matchday simulation started"}
 
 
+async def _play_matchday(room: GameRoom):
+    await room.simulate_matchday()
+    await router.save(room)
+
+
+async def _close_room(room: GameRoom):
+    await room.close()
+    rooms.pop(room.room_id, None)
+    await router.remove(room.room_id)
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -0,0 +1,409 @@
+"""Shared room directory and pub/sub for multi-worker servers.
+
+A room lives in the memory of exactly one worker, its owner. The backend
+records which worker owns which room, so every worker can list rooms and
+route requests to the owner, and it carries room broadcasts between
+workers so spectators can follow a room from any worker.
+
+``MemoryRoomBackend`` serves a single process (and tests).
+``SQLiteRoomBackend`` shares one database file between the workers of a
+host and stands in for a networked store such as Redis.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import aiosqlite
+
+# (coalesce_key, encoded message) as published by RoomBroadcaster
+Message = Tuple[Optional[str], str]
+
+
+@dataclass
+class WorkerInfo:
+    """A server worker and the base URL it is reachable at."""
+
+    worker_id: str
+    url: str
+    heartbeat: float = 0.0
+
+
+@dataclass
+class RoomRecord:
+    """Directory entry for a room hosted by some worker."""
+
+    room_id: str
+    name: str
+    worker_id: str
+    status: str = "waiting"
+    player_count: int = 0
+    max_players: int = 4
+    has_ai: bool = False
+    created_at: str = ""
+
+
+class Subscription:
+    """Messages published to one channel, as an async iterator.
+
+    The buffer is bounded; when a subscriber falls behind, the oldest
+    buffered message is dropped.
+    """
+
+    def __init__(self, backend: "RoomStateBackend", channel: str, max_buffer: int = 256):
+        self.backend = backend
+        self.channel = channel
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self.closed = False
+        self._buffer: deque[Message] = deque()
+        self._wakeup = asyncio.Event()
+
+    def deliver(self, message: Message) -> None:
+        if self.closed:
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(message)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.backend._unsubscribe(self)
+            self._wakeup.set()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Message:
+        while not self._buffer:
+            if self.closed:
+                raise StopAsyncIteration
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        return self._buffer.popleft()
+
+
+class RoomStateBackend(ABC):
+    """Room directory, worker registry and broadcast channels."""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Connect to the shared store."""
+
+    async def close(self) -> None:
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+    @abstractmethod
+    async def register_worker(self, worker: WorkerInfo) -> None:
+        """Add a worker or refresh its heartbeat."""
+
+    @abstractmethod
+    async def remove_worker(self, worker_id: str) -> None:
+        """Remove a worker together with the rooms it hosts."""
+
+    @abstractmethod
+    async def workers(self, max_age: float) -> List[WorkerInfo]:
+        """Workers whose heartbeat is at most ``max_age`` seconds old."""
+
+    @abstractmethod
+    async def put_room(self, record: RoomRecord) -> None:
+        pass
+
+    @abstractmethod
+    async def get_room(self, room_id: str) -> Optional[RoomRecord]:
+        pass
+
+    @abstractmethod
+    async def delete_room(self, room_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def list_rooms(self) -> List[RoomRecord]:
+        pass
+
+    @abstractmethod
+    def publish(self, channel: str, text: str, coalesce_key: Optional[str] = None) -> None:
+        """Send an encoded message to the channel's subscribers without waiting."""
+
+    def has_subscribers(self, channel: str) -> bool:
+        """Whether anyone follows the channel; publishing to it is pointless otherwise."""
+        return channel in self._subscriptions
+
+    def subscribe(self, channel: str, max_buffer: int = 256) -> Subscription:
+        subscription = Subscription(self, channel, max_buffer)
+        self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.channel)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.channel]
+
+    def _deliver(self, channel: str, message: Message) -> None:
+        for subscription in self._subscriptions.get(channel, ()):
+            subscription.deliver(message)
+
+
+class MemoryRoomBackend(RoomStateBackend):
+    """Backend for a single worker process."""
+
+    def __init__(self):
+        super().__init__()
+        self._workers: Dict[str, WorkerInfo] = {}
+        self._rooms: Dict[str, RoomRecord] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def register_worker(self, worker: WorkerInfo) -> None:
+        worker.heartbeat = time.time()
+        self._workers[worker.worker_id] = WorkerInfo(**asdict(worker))
+
+    async def remove_worker(self, worker_id: str) -> None:
+        self._workers.pop(worker_id, None)
+        for room_id in [r.room_id for r in self._rooms.values() if r.worker_id == worker_id]:
+            del self._rooms[room_id]
+
+    async def workers(self, max_age: float) -> List[WorkerInfo]:
+        cutoff = time.time() - max_age
+        return [w for w in self._workers.values() if w.heartbeat >= cutoff]
+
+    async def put_room(self, record: RoomRecord) -> None:
+        self._rooms[record.room_id] = RoomRecord(**asdict(record))
+
+    async def get_room(self, room_id: str) -> Optional[RoomRecord]:
+        return self._rooms.get(room_id)
+
+    async def delete_room(self, room_id: str) -> None:
+        self._rooms.pop(room_id, None)
+
+    async def list_rooms(self) -> List[RoomRecord]:
+        return list(self._rooms.values())
+
+    def publish(self, channel: str, text: str, coalesce_key: Optional[str] = None) -> None:
+        self._deliver(channel, (coalesce_key, text))
+
+
+class SQLiteRoomBackend(RoomStateBackend):
+    """Backend shared through a SQLite database file.
+
+    Every statement runs in autocommit mode and is fully read before the
+    next one starts, so no worker holds a database lock across awaits.
+    Published messages are appended to a table in batches by a background
+    task, and every worker polls the table for new rows to hand to its
+    subscribers. Messages are kept for ``retention`` seconds.
+
+    Workers also record the channels they subscribe to, and messages for
+    channels nobody follows are never written. A new subscription is seen
+    by the other workers on their next poll.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS workers ("
+        " worker_id TEXT PRIMARY KEY, url TEXT NOT NULL, heartbeat REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS rooms ("
+        " room_id TEXT PRIMARY KEY, worker_id TEXT NOT NULL, data TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_rooms_worker_id ON rooms (worker_id)",
+        "CREATE TABLE IF NOT EXISTS room_messages ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL,"
+        " coalesce_key TEXT, payload TEXT NOT NULL, created REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS room_subscriptions ("
+        " backend_id TEXT NOT NULL, channel TEXT NOT NULL, updated REAL NOT NULL,"
+        " PRIMARY KEY (backend_id, channel))",
+    )
+    # Rows per INSERT statement when flushing messages
+    FLUSH_BATCH = 500
+
+    def __init__(self, path: str, poll_interval: float = 0.05, retention: float = 60.0):
+        super().__init__()
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.backend_id = uuid.uuid4().hex
+        self._db: Optional[aiosqlite.Connection] = None
+        self._outbox: List[tuple] = []
+        self._outbox_ready = asyncio.Event()
+        self._last_id = 0
+        self._last_prune = 0.0
+        # Channels followed on any worker, and those this backend has recorded
+        self._channels: Set[str] = set()
+        self._recorded: Set[str] = set()
+        self._last_refresh = 0.0
+        self._tasks: List[asyncio.Task] = []
+        # Statements share one connection; an open read would pin an old snapshot
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = await aiosqlite.connect(self.path, isolation_level=None)
+        await self._execute("PRAGMA busy_timeout=5000")
+        await self._execute("PRAGMA journal_mode=WAL")
+        await self._execute("PRAGMA synchronous=NORMAL")
+        for statement in self.SCHEMA:
+            await self._execute(statement)
+        ((self._last_id,),) = await self._query("SELECT COALESCE(MAX(id), 0) FROM room_messages")
+        self._tasks = [
+            asyncio.create_task(self._flush_loop()),
+            asyncio.create_task(self._poll_loop()),
+        ]
+
+    async def close(self) -> None:
+        await super().close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._db is not None:
+            await self._flush()
+            await self._execute(
+                "DELETE FROM room_subscriptions WHERE backend_id = ?", (self.backend_id,)
+            )
+            await self._db.close()
+            self._db = None
+
+    async def register_worker(self, worker: WorkerInfo) -> None:
+        worker.heartbeat = time.time()
+        await self._execute(
+            "INSERT OR REPLACE INTO workers (worker_id, url, heartbeat) VALUES (?, ?, ?)",
+            (worker.worker_id, worker.url, worker.heartbeat),
+        )
+
+    async def remove_worker(self, worker_id: str) -> None:
+        await self._execute("DELETE FROM rooms WHERE worker_id = ?", (worker_id,))
+        await self._execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+
+    async def workers(self, max_age: float) -> List[WorkerInfo]:
+        rows = await self._query(
+            "SELECT worker_id, url, heartbeat FROM workers WHERE heartbeat >= ?",
+            (time.time() - max_age,),
+        )
+        return [WorkerInfo(*row) for row in rows]
+
+    async def put_room(self, record: RoomRecord) -> None:
+        await self._execute(
+            "INSERT OR REPLACE INTO rooms (room_id, worker_id, data) VALUES (?, ?, ?)",
+            (record.room_id, record.worker_id, json.dumps(asdict(record))),
+        )
+
+    async def get_room(self, room_id: str) -> Optional[RoomRecord]:
+        rows = await self._query("SELECT data FROM rooms WHERE room_id = ?", (room_id,))
+        return RoomRecord(**json.loads(rows[0][0])) if rows else None
+
+    async def delete_room(self, room_id: str) -> None:
+        await self._execute("DELETE FROM rooms WHERE room_id = ?", (room_id,))
+
+    async def list_rooms(self) -> List[RoomRecord]:
+        rows = await self._query("SELECT data FROM rooms")
+        return [RoomRecord(**json.loads(row[0])) for row in rows]
+
+    async def _execute(self, sql: str, parameters: tuple = ()) -> None:
+        async with self._lock:
+            await self._db.execute(sql, parameters)
+
+    async def _query(self, sql: str, parameters: tuple = ()) -> list:
+        async with self._lock, self._db.execute(sql, parameters) as cursor:
+            return await cursor.fetchall()
+
+    def has_subscribers(self, channel: str) -> bool:
+        return channel in self._channels or super().has_subscribers(channel)
+
+    def publish(self, channel: str, text: str, coalesce_key: Optional[str] = None) -> None:
+        if not self.has_subscribers(channel):
+            return
+        self._outbox.append((channel, coalesce_key, text, time.time()))
+        self._outbox_ready.set()
+
+    async def _flush(self) -> None:
+        batch, self._outbox = self._outbox, []
+        # One multi-row INSERT per chunk keeps each chunk a single commit
+        for start in range(0, len(batch), self.FLUSH_BATCH):
+            rows = batch[start : start + self.FLUSH_BATCH]
+            await self._execute(
+                "INSERT INTO room_messages (channel, coalesce_key, payload, created) VALUES "
+                + ",".join(["(?, ?, ?, ?)"] * len(rows)),
+                [value for row in rows for value in row],
+            )
+
+        now = time.time()
+        if now - self._last_prune >= self.retention / 4:
+            self._last_prune = now
+            await self._execute(
+                "DELETE FROM room_messages WHERE created < ?", (now - self.retention,)
+            )
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._outbox_ready.wait()
+            self._outbox_ready.clear()
+            try:
+                await self._flush()
+            except Exception as e:
+                print(f"Error publishing room messages: {e}")
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                rows = await self._query(
+                    "SELECT id, channel, coalesce_key, payload FROM room_messages"
+                    " WHERE id > ? ORDER BY id",
+                    (self._last_id,),
+                )
+                await self._sync_subscriptions()
+            except Exception as e:
+                print(f"Error polling room messages: {e}")
+                continue
+            for message_id, channel, coalesce_key, payload in rows:
+                self._deliver(channel, (coalesce_key, payload))
+                self._last_id = message_id
+
+    async def _sync_subscriptions(self) -> None:
+        """Record this worker's channels and read back everyone's."""
+        local = set(self._subscriptions)
+        now = time.time()
+        # Rows are refreshed now and then so those of crashed workers expire
+        refresh = now - self._last_refresh >= self.retention / 4
+        for channel in local if refresh else local - self._recorded:
+            await self._execute(
+                "INSERT OR REPLACE INTO room_subscriptions (backend_id, channel, updated)"
+                " VALUES (?, ?, ?)",
+                (self.backend_id, channel, now),
+            )
+        for channel in self._recorded - local:
+            await self._execute(
+                "DELETE FROM room_subscriptions WHERE backend_id = ? AND channel = ?",
+                (self.backend_id, channel),
+            )
+        self._recorded = local
+        if refresh:
+            self._last_refresh = now
+            await self._execute(
+                "DELETE FROM room_subscriptions WHERE updated < ?", (now - self.retention,)
+            )
+        rows = await self._query("SELECT DISTINCT channel FROM room_subscriptions")
+        self._channels = {channel for (channel,) in rows}
+
+
+def create_room_backend(kind: str = "memory", path: str = "") -> RoomStateBackend:
+    """Backend named by the ``ROOM_BACKEND`` setting."""
+    if kind == "memory":
+        return MemoryRoomBackend()
+    if kind == "sqlite":
+        return SQLiteRoomBackend(path)
+    raise ValueError(f"Unknown room backend: {kind}")
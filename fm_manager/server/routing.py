@@ -0,0 +1,138 @@
+"""Room-to-worker routing.
+
+Rooms are placed on the least loaded live worker when they are created
+and stay there: the room directory is the routing table, so requests and
+websockets for a room are always sent to the worker that holds it in
+memory. Workers announce themselves with a heartbeat; a worker that stops
+beating is treated as gone together with its rooms.
+"""
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from fm_manager.server.room_state import RoomRecord, RoomStateBackend, Subscription, WorkerInfo
+
+if TYPE_CHECKING:
+    from fm_manager.server.game_room import GameRoom
+
+
+# Room statuses that no longer load their worker (RoomStatus values)
+INACTIVE_STATUSES = frozenset({"finished", "closed"})
+
+
+def room_channel(room_id: str) -> str:
+    return f"room:{room_id}"
+
+
+class RoomRouter:
+    """One worker's view of the room directory."""
+
+    def __init__(
+        self,
+        backend: RoomStateBackend,
+        worker_id: str,
+        url: str,
+        heartbeat_interval: float = 5.0,
+    ):
+        self.backend = backend
+        self.worker = WorkerInfo(worker_id, url.rstrip("/"))
+        self.heartbeat_interval = heartbeat_interval
+        # Workers missing three heartbeats are considered dead
+        self.worker_timeout = heartbeat_interval * 3
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @property
+    def worker_id(self) -> str:
+        return self.worker.worker_id
+
+    async def start(self) -> None:
+        await self.backend.start()
+        await self.backend.register_worker(self.worker)
+        self._heartbeat = asyncio.create_task(self._beat())
+
+    async def stop(self) -> None:
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat
+        try:
+            await self.backend.remove_worker(self.worker_id)
+        except Exception as e:
+            print(f"Error deregistering worker: {e}")
+        await self.backend.close()
+
+    def is_local(self, worker: WorkerInfo) -> bool:
+        return worker.worker_id == self.worker_id
+
+    async def live_workers(self) -> List[WorkerInfo]:
+        return await self.backend.workers(self.worker_timeout)
+
+    async def place(self) -> WorkerInfo:
+        """Worker that should host a new room: the one with the fewest active rooms.
+
+        Ties go to this worker, so a lone worker never redirects.
+        """
+        workers = await self.live_workers()
+        counts = {w.worker_id: 0 for w in workers}
+        for record in await self.backend.list_rooms():
+            if record.worker_id in counts and record.status not in INACTIVE_STATUSES:
+                counts[record.worker_id] += 1
+        return min(
+            workers,
+            key=lambda w: (counts[w.worker_id], not self.is_local(w), w.worker_id),
+            default=self.worker,
+        )
+
+    async def locate(self, room_id: str) -> Optional[WorkerInfo]:
+        """Live worker hosting a room, or None."""
+        record = await self.backend.get_room(room_id)
+        if record is None:
+            return None
+        if record.worker_id == self.worker_id:
+            return self.worker
+        for worker in await self.live_workers():
+            if worker.worker_id == record.worker_id:
+                return worker
+        return None
+
+    async def list_rooms(self) -> List[RoomRecord]:
+        """Rooms hosted by live workers."""
+        live = {w.worker_id for w in await self.live_workers()}
+        return [r for r in await self.backend.list_rooms() if r.worker_id in live]
+
+    async def save(self, room: "GameRoom") -> None:
+        """Publish a local room's current summary to the directory."""
+        await self.backend.put_room(
+            RoomRecord(
+                room_id=room.room_id,
+                name=room.name,
+                worker_id=self.worker_id,
+                status=room.status.value,
+                player_count=len(room.players),
+                max_players=room.max_players,
+                has_ai=room.has_ai_manager(),
+                created_at=room.created_at.isoformat(),
+            )
+        )
+
+    async def remove(self, room_id: str) -> None:
+        """Drop a room this worker no longer hosts from the directory."""
+        await self.backend.delete_room(room_id)
+
+    def relay(self, room_id: str) -> Callable[[str, Optional[str]], None]:
+        """Callback forwarding a room's broadcasts to its channel."""
+        channel = room_channel(room_id)
+        return lambda text, coalesce_key=None: self.backend.publish(channel, text, coalesce_key)
+
+    def subscribe(self, room_id: str) -> Subscription:
+        """Follow the broadcasts of a room hosted by another worker."""
+        return self.backend.subscribe(room_channel(room_id))
+
+    async def _beat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.backend.register_worker(self.worker)
+            except Exception as e:
+                print(f"Worker heartbeat failed: {e}")
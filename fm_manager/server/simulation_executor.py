@@ -0,0 +1,194 @@
+"""Simulation executor for the game server.
+
+Match simulation is CPU-bound. Running it on the asyncio event loop stalls
+every websocket, chat message and REST request of every room until the
+matchday finishes. ``SimulationExecutor`` moves that work to a worker pool
+and keeps the loop free:
+
+- a bounded queue, so a burst of requests is rejected with
+  ``SimulationQueueFullError`` instead of growing without limit
+- per-room fairness: queued jobs are dispatched round-robin across rooms, so
+  one room queueing many matchdays cannot starve the others
+- cancellation: cancelling the awaiting coroutine, or ``cancel_room``,
+  drops jobs that have not started yet
+
+Jobs are only handed to the pool when a worker is free. The pool's own
+queue therefore never holds a backlog, and the dispatch order stays under
+the executor's control.
+"""
+
+import asyncio
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+class SimulationQueueFullError(RuntimeError):
+    """Raised when the executor or a room has too many queued jobs."""
+
+
+@dataclass
+class _Task:
+    """A queued simulation job."""
+
+    room_id: str
+    fn: Callable[..., Any]
+    args: tuple
+    future: asyncio.Future
+
+
+class SimulationExecutor:
+    """Run simulation jobs off the event loop, fairly across rooms.
+
+    Example:
+        executor = SimulationExecutor(max_workers=4)
+        results = await executor.run(room.room_id, play_fixtures, jobs)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        max_pending_per_room: int = 4,
+        use_processes: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Worker count; defaults to the CPU count
+            max_pending: Queued (not yet running) jobs allowed across all rooms
+            max_pending_per_room: Queued jobs allowed per room
+            use_processes: Use worker processes; threads only suit light or
+                GIL-releasing jobs, and tests
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.max_pending_per_room = max_pending_per_room
+        self.use_processes = use_processes
+
+        self._pool: Optional[Executor] = None
+        self._queues: OrderedDict[str, deque[_Task]] = OrderedDict()
+        self._pending = 0
+        self._running = 0
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._pending
+
+    @property
+    def running(self) -> int:
+        """Jobs currently on a worker."""
+        return self._running
+
+    def has_capacity(self, room_id: str) -> bool:
+        """Whether a job for ``room_id`` would be accepted right now."""
+        room_queue = self._queues.get(room_id)
+        room_pending = len(room_queue) if room_queue else 0
+        return (
+            not self._closed
+            and self._pending < self.max_pending
+            and room_pending < self.max_pending_per_room
+        )
+
+    async def run(self, room_id: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Queue ``fn(*args)`` for ``room_id`` and wait for its result.
+
+        ``fn`` and ``args`` must be picklable when worker processes are used.
+
+        Raises:
+            SimulationQueueFullError: The queue or the room's share of it is full
+        """
+        if self._closed:
+            raise RuntimeError("SimulationExecutor is closed")
+        if not self.has_capacity(room_id):
+            raise SimulationQueueFullError(f"Simulation queue full for room {room_id}")
+
+        task = _Task(room_id, fn, args, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(room_id, deque()).append(task)
+        self._pending += 1
+        self._dispatch()
+
+        try:
+            return await task.future
+        except asyncio.CancelledError:
+            self._discard(task)
+            raise
+
+    def cancel_room(self, room_id: str) -> int:
+        """Cancel a room's queued jobs; running jobs finish but are discarded."""
+        room_queue = self._queues.pop(room_id, None)
+        if not room_queue:
+            return 0
+        for task in room_queue:
+            task.future.cancel()
+        self._pending -= len(room_queue)
+        return len(room_queue)
+
+    def close(self) -> None:
+        """Cancel everything queued and shut down the workers.
+
+        Waits for running jobs: worker processes that outlive the server
+        would keep its inherited listening socket open.
+        """
+        self._closed = True
+        for room_id in list(self._queues):
+            self.cancel_room(room_id)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _discard(self, task: _Task) -> None:
+        """Drop a cancelled task if it is still queued."""
+        room_queue = self._queues.get(task.room_id)
+        if room_queue and task in room_queue:
+            room_queue.remove(task)
+            self._pending -= 1
+            if not room_queue:
+                del self._queues[task.room_id]
+
+    def _next_task(self) -> Optional[_Task]:
+        """Pop the head job of the next room in round-robin order."""
+        while self._queues:
+            room_id, room_queue = next(iter(self._queues.items()))
+            task = room_queue.popleft()
+            self._pending -= 1
+            if room_queue:
+                self._queues.move_to_end(room_id)
+            else:
+                del self._queues[room_id]
+            if not task.future.done():
+                return task
+        return None
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while workers are free."""
+        while self._running < self.max_workers:
+            task = self._next_task()
+            if task is None:
+                return
+            if self._pool is None:
+                pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+                self._pool = pool_class(max_workers=self.max_workers)
+
+            self._running += 1
+            loop = task.future.get_loop()
+            work = loop.run_in_executor(self._pool, task.fn, *task.args)
+            work.add_done_callback(lambda work, task=task: self._finished(task, work))
+
+    def _finished(self, task: _Task, work: asyncio.Future) -> None:
+        self._running -= 1
+        if work.cancelled():
+            task.future.cancel()
+        else:
+            # Always retrieve the error, even when nobody awaits the result any more
+            error = work.exception()
+            if not task.future.done():
+                if error is not None:
+                    task.future.set_exception(error)
+                else:
+                    task.future.set_result(work.result())
+        if not self._closed:
+            self._dispatch()
@@ -0,0 +1,115 @@
+"""Live league standings for game rooms."""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+
+class StandingsTable:
+    """League table kept in sorted order as results arrive.
+
+    Rows are the dicts broadcast to clients. Recording a result only moves
+    the two clubs involved, so a broadcast never re-sorts the table or looks
+    club names up again. Clubs are ordered by points, goal difference and
+    goals scored, and full ties keep the order the clubs were added in.
+    """
+
+    def __init__(self):
+        self._rows: Dict[int, Dict] = {}
+        self._seq: Dict[int, int] = {}
+        self._order: List[int] = []
+        self._keys: List[tuple] = []
+        # Positions from this index on are stale until the next rows() call
+        self._stale_from = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, club_id: object) -> bool:
+        return club_id in self._rows
+
+    def add_club(self, club_id: int, club_name: str) -> None:
+        """Add a club with an empty record."""
+        if club_id in self._rows:
+            return
+        self._seq[club_id] = len(self._seq)
+        self._rows[club_id] = {
+            "club_id": club_id,
+            "played": 0,
+            "won": 0,
+            "drawn": 0,
+            "lost": 0,
+            "gf": 0,
+            "ga": 0,
+            "gd": 0,
+            "points": 0,
+            "position": 0,
+            "club_name": club_name,
+        }
+        self._insert(club_id)
+
+    def get(self, club_id: int) -> Optional[Dict]:
+        return self._rows.get(club_id)
+
+    def rows(self) -> List[Dict]:
+        """Rows in table order, with ``position`` filled in."""
+        for index in range(self._stale_from, len(self._order)):
+            self._rows[self._order[index]]["position"] = index + 1
+        self._stale_from = len(self._order)
+        return [self._rows[club_id] for club_id in self._order]
+
+    def record_result(
+        self, home_club_id: int, away_club_id: int, home_score: int, away_score: int
+    ) -> bool:
+        """Apply a result; returns False if either club is not in the table."""
+        home = self._rows.get(home_club_id)
+        away = self._rows.get(away_club_id)
+        if not home or not away:
+            return False
+
+        self._remove(home_club_id)
+        self._remove(away_club_id)
+
+        home["played"] += 1
+        away["played"] += 1
+        home["gf"] += home_score
+        home["ga"] += away_score
+        away["gf"] += away_score
+        away["ga"] += home_score
+
+        if home_score > away_score:
+            home["won"] += 1
+            home["points"] += 3
+            away["lost"] += 1
+        elif home_score < away_score:
+            away["won"] += 1
+            away["points"] += 3
+            home["lost"] += 1
+        else:
+            home["drawn"] += 1
+            away["drawn"] += 1
+            home["points"] += 1
+            away["points"] += 1
+
+        home["gd"] = home["gf"] - home["ga"]
+        away["gd"] = away["gf"] - away["ga"]
+
+        self._insert(home_club_id)
+        self._insert(away_club_id)
+        return True
+
+    def _key(self, club_id: int) -> tuple:
+        row = self._rows[club_id]
+        return (-row["points"], -row["gd"], -row["gf"], self._seq[club_id])
+
+    def _remove(self, club_id: int) -> None:
+        index = bisect_left(self._keys, self._key(club_id))
+        del self._keys[index]
+        del self._order[index]
+        self._stale_from = min(self._stale_from, index)
+
+    def _insert(self, club_id: int) -> None:
+        key = self._key(club_id)
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._order.insert(index, club_id)
+        self._stale_from = min(self._stale_from, index)
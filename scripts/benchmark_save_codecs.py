@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark: save and load time and file size per save codec.
+
+Builds a world of clubs and players in a temporary SQLite database, then
+saves and loads it with every installed record codec. Codecs whose package
+is missing are listed as skipped.
+
+    python scripts/benchmark_save_codecs.py --clubs 40 --players 500
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fm_manager.core.database import Base
+from fm_manager.core.models import Club, League, Player, Season
+from fm_manager.core.models.player import Position
+from fm_manager.core.save_codecs import SAVE_CODECS, codec_available
+from fm_manager.core.save_load_enhanced import EnhancedSaveLoadManager
+
+POSITIONS = list(Position)
+
+
+def build_world(path: Path, num_clubs: int, players_per_club: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(League(id=1, name="Bench League", short_name="BL", country="England"))
+        session.add(Season(id=1, league_id=1, start_year=2024, end_year=2025))
+        for club_id in range(1, num_clubs + 1):
+            session.add(Club(id=club_id, name=f"Club {club_id}", short_name=f"C{club_id}"))
+            session.add_all(
+                Player(
+                    first_name="Player",
+                    last_name=f"{club_id}-{n}",
+                    position=POSITIONS[n % len(POSITIONS)],
+                    club_id=club_id,
+                    birth_date=date(1990 + n % 15, 1 + n % 12, 1),
+                    current_ability=40 + n % 60,
+                )
+                for n in range(players_per_club)
+            )
+        session.commit()
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare save record codecs")
+    parser.add_argument("--clubs", type=int, default=40)
+    parser.add_argument("--players", type=int, default=500, help="players per club")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per codec; best is shown")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "world.db"
+        build_world(db_path, args.clubs, args.players)
+        engine = create_engine(f"sqlite:///{db_path}")
+
+        print(f"{'codec':>8} {'save s':>8} {'load s':>8} {'size KB':>9}")
+        for name in SAVE_CODECS:
+            if not codec_available(name):
+                print(f"{name:>8}  skipped (not installed)")
+                continue
+            manager = EnhancedSaveLoadManager(Path(tmp) / name, codec=name)
+            save_times, load_times = [], []
+            with Session(engine) as session:
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    path = manager.save_game(session, "bench")
+                    save_times.append(time.perf_counter() - start)
+                    start = time.perf_counter()
+                    manager.load_game("bench")
+                    load_times.append(time.perf_counter() - start)
+            manager.end_session()
+            size = Path(path).stat().st_size / 1024
+            print(f"{name:>8} {min(save_times):>8.2f} {min(load_times):>8.2f} {size:>9.0f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
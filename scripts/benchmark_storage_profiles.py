@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark: season write throughput per SQLite storage profile.
+
+Simulates one league season in memory with the enhanced match engine, then
+writes it to a fresh database for every storage profile: the matches and
+their events of each matchday in one transaction, as a season in progress
+is saved. Simulation time is excluded; only the writes are timed.
+
+    python scripts/benchmark_storage_profiles.py --clubs 20 --seasons 3
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from fm_manager.core.database import STORAGE_PROFILES, Base, create_database_engine
+from fm_manager.core.models import Club, League, Match, MatchStatus, Player, Season
+from fm_manager.core.models.player import Position
+from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine
+from fm_manager.engine.season_simulator import FixtureGenerator, insert_matches, match_event_rows
+
+SQUAD_POSITIONS = [Position.GK] * 2 + [Position.CB] * 6 + [Position.CM] * 8 + [Position.ST] * 6
+
+
+# Attributes the match engine reads; ORM column defaults only apply on insert
+ENGINE_ATTRIBUTES = (
+    "passing",
+    "positioning",
+    "pace",
+    "shooting",
+    "tackling",
+    "marking",
+    "reflexes",
+    "strength",
+)
+
+
+def make_squads(num_clubs: int) -> dict[int, list[Player]]:
+    squads = {}
+    for club_id in range(1, num_clubs + 1):
+        squads[club_id] = []
+        for n, position in enumerate(SQUAD_POSITIONS):
+            ability = 55 + (club_id * 7 + n) % 30
+            squads[club_id].append(
+                Player(
+                    id=club_id * 100 + n,
+                    first_name="Player",
+                    last_name=f"{club_id}-{n}",
+                    position=position,
+                    club_id=club_id,
+                    current_ability=ability,
+                    stamina=70,
+                    fitness=100,
+                    **dict.fromkeys(ENGINE_ATTRIBUTES, ability),
+                )
+            )
+    return squads
+
+
+def simulate(num_clubs: int, seed: int) -> list[list[tuple[Match, list[dict]]]]:
+    """A season's matchdays of (match, event rows), simulated in memory."""
+    squads = make_squads(num_clubs)
+    engine = EnhancedMarkovEngine(random_seed=seed)
+    season = []
+    for matchday, pairings in enumerate(FixtureGenerator().generate_pairings(list(squads)), 1):
+        played = []
+        for home, away in pairings:
+            state = engine.simulate(squads[home][:11], squads[away][:11])
+            match = Match(
+                season_id=1,
+                matchday=matchday,
+                match_date=date(2024, 8, 1),
+                home_club_id=home,
+                away_club_id=away,
+                home_score=state.home_score,
+                away_score=state.away_score,
+                status=MatchStatus.FULL_TIME,
+            )
+            played.append((match, match_event_rows(state)))
+        season.append(played)
+    return season
+
+
+async def write_season(profile: str, path: Path, num_clubs: int, season: list) -> tuple:
+    """Write every matchday in its own commit; returns (seconds, matches, events)."""
+    engine = create_database_engine(f"sqlite+aiosqlite:///{path}", profile=profile)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add(League(id=1, name="Bench League", short_name="BL", country="England"))
+        session.add(Season(id=1, league_id=1, start_year=2024, end_year=2025))
+        session.add_all(
+            Club(id=c, name=f"Club {c}", short_name=f"C{c}", league_id=1)
+            for c in range(1, num_clubs + 1)
+        )
+        await session.commit()
+
+        matches = events = 0
+        start = time.perf_counter()
+        for matchday in season:
+            await insert_matches(session, [m for m, _ in matchday], [rows for _, rows in matchday])
+            await session.commit()
+            matches += len(matchday)
+            events += sum(len(rows) for _, rows in matchday)
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return elapsed, matches, events
+
+
+async def main_async(args) -> None:
+    season = simulate(args.clubs, args.seed)
+    print(f"{'profile':>9} {'seconds':>8} {'matches/s':>10} {'events/s':>10} {'commits/s':>10}")
+    for profile in args.profiles:
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed = matches = events = 0
+            for n in range(args.seasons):
+                seconds, m, e = await write_season(
+                    profile, Path(tmp) / f"season{n}.db", args.clubs, season
+                )
+                elapsed += seconds
+                matches += m
+                events += e
+        commits = len(season) * args.seasons
+        print(
+            f"{profile:>9} {elapsed:>8.2f} {matches / elapsed:>10.0f} "
+            f"{events / elapsed:>10.0f} {commits / elapsed:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare SQLite storage profiles")
+    parser.add_argument("--clubs", type=int, default=20)
+    parser.add_argument("--seasons", type=int, default=3, help="seasons written per profile")
+    parser.add_argument(
+        "--profiles", nargs="+", default=list(STORAGE_PROFILES), choices=list(STORAGE_PROFILES)
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
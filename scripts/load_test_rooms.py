@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Load test: game room capacity versus server worker count.
+
+For each worker count, starts that many server workers (one uvicorn
+process each, sharing a SQLite room backend) and ramps up the number of
+concurrently active rooms. Every room has two managers and plays matchdays
+back to back. A level passes while the p95 matchday latency stays under
+--slo-ms; the largest passing level is the room capacity for that worker
+count.
+
+Rooms need clubs, so the cleaned dataset must be present in data/cleaned.
+
+    python scripts/load_test_rooms.py --workers 1 2 4 --levels 4 8 16 32 64
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def start_workers(count: int, base_port: int, backend_path: str) -> list:
+    processes = []
+    for i in range(count):
+        port = base_port + i
+        env = dict(
+            os.environ,
+            ROOM_BACKEND="sqlite",
+            ROOM_BACKEND_PATH=backend_path,
+            WORKER_ID=f"worker-{i}",
+            WORKER_URL=f"http://127.0.0.1:{port}",
+            SIMULATION_WORKERS="1",
+            ROOM_RESULT_DELAY="0",
+        )
+        processes.append(
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "uvicorn",
+                    "fm_manager.server.main:app",
+                    "--port",
+                    str(port),
+                    "--log-level",
+                    "warning",
+                ],
+                cwd=PROJECT_ROOT,
+                env=env,
+                stdout=subprocess.DEVNULL,
+            )
+        )
+    return processes
+
+
+def stop_workers(processes: list) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.wait(timeout=30)
+
+
+async def wait_until_ready(session: aiohttp.ClientSession, urls: list, timeout: float = 120.0):
+    deadline = time.monotonic() + timeout
+    for url in urls:
+        while True:
+            try:
+                async with session.get(f"{url}/") as resp:
+                    if resp.status == 200:
+                        break
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Worker at {url} did not start")
+            await asyncio.sleep(0.2)
+
+
+async def create_room(session: aiohttp.ClientSession, entry_url: str, number: int) -> dict:
+    """Create a two-manager room ready to play; returns its routing details."""
+    # The entry worker redirects to the least loaded one
+    async with session.post(
+        f"{entry_url}/api/rooms",
+        params={
+            "name": f"Load {number}",
+            "max_players": 2,
+            "season_length": 10_000,
+            "enable_ai": "false",
+        },
+    ) as resp:
+        resp.raise_for_status()
+        room = await resp.json()
+    url, room_id = room["worker_url"], room["room_id"]
+
+    players = []
+    for name in ("Home", "Away"):
+        async with session.post(
+            f"{url}/api/rooms/{room_id}/join", params={"player_name": name}
+        ) as resp:
+            resp.raise_for_status()
+            players.append((await resp.json())["player_id"])
+
+    async with session.get(f"{url}/api/rooms/{room_id}") as resp:
+        clubs = (await resp.json())["available_clubs"]
+    if len(clubs) < 2:
+        raise RuntimeError("Rooms have no clubs; is the cleaned dataset in data/cleaned?")
+    for player_id, club in zip(players, clubs, strict=False):
+        async with session.post(
+            f"{url}/api/rooms/{room_id}/select-club",
+            params={"player_id": player_id, "club_id": club["id"]},
+        ) as resp:
+            resp.raise_for_status()
+
+    async with session.post(
+        f"{url}/api/rooms/{room_id}/start", params={"player_id": players[0]}
+    ) as resp:
+        resp.raise_for_status()
+    return {"url": url, "room_id": room_id, "host_id": players[0]}
+
+
+async def room_matchday(session: aiohttp.ClientSession, room: dict) -> float:
+    """Play one matchday; returns its latency in seconds."""
+    base = f"{room['url']}/api/rooms/{room['room_id']}"
+    async with session.get(base) as resp:
+        matchday = (await resp.json())["current_matchday"]
+
+    start = time.perf_counter()
+    while True:
+        async with session.post(
+            f"{base}/simulate-matchday", params={"player_id": room["host_id"]}
+        ) as resp:
+            if resp.status == 200:
+                break
+            if resp.status != 503:  # queue full: retry, counted in the latency
+                resp.raise_for_status()
+        await asyncio.sleep(0.05)
+
+    while True:
+        async with session.get(base) as resp:
+            if (await resp.json())["current_matchday"] > matchday:
+                return time.perf_counter() - start
+        await asyncio.sleep(0.02)
+
+
+async def run_level(session, rooms: list, matchdays: int) -> dict:
+    latencies: list[float] = []
+
+    async def play(room):
+        for _ in range(matchdays):
+            latencies.append(await room_matchday(session, room))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play(room) for room in rooms))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+    }
+
+
+async def measure(workers: int, args) -> int:
+    """Ramp rooms on ``workers`` workers; returns the largest level within the SLO."""
+    with tempfile.TemporaryDirectory() as tmp:
+        processes = start_workers(workers, args.base_port, str(Path(tmp) / "rooms.db"))
+        urls = [f"http://127.0.0.1:{args.base_port + i}" for i in range(workers)]
+        capacity = 0
+        try:
+            timeout = aiohttp.ClientTimeout(total=120)
+            connector = aiohttp.TCPConnector(limit=0)
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+                await wait_until_ready(session, urls)
+                rooms: list[dict] = []
+                for level in args.levels:
+                    # Spread creation requests over the workers like a load balancer
+                    rooms += [
+                        await create_room(session, urls[n % workers], n)
+                        for n in range(len(rooms), level)
+                    ]
+                    stats = await run_level(session, rooms, args.matchdays)
+                    passed = stats["p95"] <= args.slo_ms
+                    print(
+                        f"{workers:>7} {level:>6} {stats['throughput']:>12.1f} "
+                        f"{stats['p50']:>9.0f} {stats['p95']:>9.0f}  {'ok' if passed else 'over SLO'}"
+                    )
+                    if not passed:
+                        break
+                    capacity = level
+        finally:
+            stop_workers(processes)
+        return capacity
+
+
+async def main_async(args) -> None:
+    print(f"{'workers':>7} {'rooms':>6} {'matchdays/s':>12} {'p50 ms':>9} {'p95 ms':>9}")
+    capacities = {}
+    for workers in args.workers:
+        capacities[workers] = await measure(workers, args)
+
+    print("\nRoom capacity (p95 matchday latency <= %d ms):" % args.slo_ms)
+    for workers, capacity in capacities.items():
+        print(f"  {workers} worker(s): {capacity} rooms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure room capacity per worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--levels", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    parser.add_argument("--matchdays", type=int, default=3, help="matchdays per room per level")
+    parser.add_argument("--slo-ms", type=int, default=500, help="p95 matchday latency target")
+    parser.add_argument("--base-port", type=int, default=8100)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,7 @@ from rich.table import Table
 
 from fm_manager.ai.llm_tool_interface import get_llm_tool_interface
 from fm_manager.data.cleaned_data_loader import load_for_match_engine, ClubDataFull
+from fm_manager.data.club_registry import ClubRegistry
 from fm_manager.engine.llm_client import LLMClient, LLMProvider
 from fm_manager.engine.calendar import Calendar, create_league_calendar, Match
 from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine
@@ -165,6 +166,7 @@ class EnhancedNLGameInterface:
         self.calendar: Optional[Calendar] = None
         self.match_engine = EnhancedMarkovEngine()
         self.all_clubs: dict = {}
+        self.clubs = ClubRegistry()
 
         self.transfer_market: Optional[TransferMarket] = None
 
@@ -345,6 +347,7 @@ class EnhancedNLGameInterface:
 
         with self.console.status("[bold green]Loading clubs...[/bold green]", spinner="dots"):
             self.all_clubs, _ = load_for_match_engine()
+            self.clubs = ClubRegistry(self.all_clubs.values())
 
         major_leagues = [
             "England Premier League",
@@ -418,7 +421,7 @@ class EnhancedNLGameInterface:
     async def _init_calendar(self):
         """Initialize calendar for current club's league."""
         # Get all clubs in the same league
-        league_clubs = [c for c in self.all_clubs.values() if c.league == self.current_club.league]
+        league_clubs = self.clubs.in_league(self.current_club.league)
 
         if len(league_clubs) < 2:
             # Fallback: create mini league
@@ -584,15 +587,13 @@ class EnhancedNLGameInterface:
         results = []
         for match in self.calendar.get_current_matches():
             # Find club data for both teams
-            home_club = next(
-                (c for c in self.all_clubs.values() if c.name == match.home_team), None
-            )
-            away_club = next(
-                (c for c in self.all_clubs.values() if c.name == match.away_team), None
-            )
+            home_club = self.clubs.by_name(match.home_team)
+            away_club = self.clubs.by_name(match.away_team)
 
             if home_club and away_club:
-                result = self.match_engine.simulate(home_club.players, away_club.players)
+                result = self.match_engine.simulate(
+                    home_club.players, away_club.players, detail="score"
+                )
                 match.play(result.home_goals, result.away_goals)
             else:
                 home_goals = random.randint(0, 4)
@@ -945,12 +946,10 @@ class EnhancedNLGameInterface:
         try:
             game_state = self.save_manager.load_game(save_name)
             self.all_clubs, _ = load_for_match_engine()
-            club_id = game_state.club_id
-            self.current_club = None
-            for club in self.all_clubs.values():
-                if getattr(club, "id", None) == club_id or club.name == game_state.club_name:
-                    self.current_club = club
-                    break
+            self.clubs = ClubRegistry(self.all_clubs.values())
+            self.current_club = self.clubs.get(game_state.club_id) or self.clubs.by_name(
+                game_state.club_name
+            )
 
             if not self.current_club:
                 self.console.print(f"[red]Could not find club: {game_state.club_name}[/red]")
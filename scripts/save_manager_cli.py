@@ -165,8 +165,9 @@ def cmd_load(args):
         if not args.dry_run:
             # Restore to database
             session = get_db_session()
-            manager.restore_game_state(session, game_state)
+            report = manager.restore_game_state(session, game_state)
             print(f"{Fore.GREEN}✓ Game state restored to database{Style.RESET_ALL}")
+            print(f"  {report.summary()}")
         else:
             print(f"{Fore.YELLOW}(Dry run - not restored){Style.RESET_ALL}")
 
@@ -58,7 +58,9 @@ class SimpleGameLoop:
             away_club = clubs.get(match.away_team)
 
             if home_club and away_club:
-                match_result = self.match_engine.simulate(home_club.players, away_club.players)
+                match_result = self.match_engine.simulate(
+                    home_club.players, away_club.players, detail="score"
+                )
                 home_goals = match_result.home_goals
                 away_goals = match_result.away_goals
             else:
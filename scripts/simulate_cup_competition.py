@@ -97,7 +97,7 @@ def simulate_fa_cup():
             away_lineup = ClubSquadBuilder(away).build_lineup("4-3-3")
 
             # 模拟比赛
-            state = engine.simulate(home_lineup, away_lineup)
+            state = engine.simulate(home_lineup, away_lineup, detail="score")
 
             # 确定胜者
             if state.home_score > state.away_score:
@@ -225,7 +225,7 @@ def simulate_champions_league():
                 home_lineup = ClubSquadBuilder(home).build_lineup("4-3-3")
                 away_lineup = ClubSquadBuilder(away).build_lineup("4-3-3")
 
-                state = engine.simulate(home_lineup, away_lineup)
+                state = engine.simulate(home_lineup, away_lineup, detail="score")
 
                 # 更新积分榜
                 standings[home.id].add_result(state.home_score, state.away_score)
@@ -315,7 +315,7 @@ def simulate_champions_league():
                 home_lineup = ClubSquadBuilder(home).build_lineup("4-3-3")
                 away_lineup = ClubSquadBuilder(away).build_lineup("4-3-3")
 
-                state = engine.simulate(home_lineup, away_lineup)
+                state = engine.simulate(home_lineup, away_lineup, detail="score")
 
                 if state.home_score > state.away_score:
                     winner = home
@@ -337,12 +337,12 @@ def simulate_champions_league():
                 # 首回合
                 home_lineup = ClubSquadBuilder(home).build_lineup("4-3-3")
                 away_lineup = ClubSquadBuilder(away).build_lineup("4-3-3")
-                state1 = engine.simulate(home_lineup, away_lineup)
+                state1 = engine.simulate(home_lineup, away_lineup, detail="score")
 
                 # 次回合
                 home_lineup2 = ClubSquadBuilder(away).build_lineup("4-3-3")
                 away_lineup2 = ClubSquadBuilder(home).build_lineup("4-3-3")
-                state2 = engine.simulate(home_lineup2, away_lineup2)
+                state2 = engine.simulate(home_lineup2, away_lineup2, detail="score")
 
                 # 计算总比分
                 home_agg = state1.home_score + state2.away_score
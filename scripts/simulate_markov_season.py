@@ -22,10 +22,39 @@ from fm_manager.engine.match_engine_adapter import ClubSquadBuilder
 from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine as MarkovMatchEngine
 from fm_manager.engine.match_stats_exporter import SeasonStatsTracker, MatchStatsExporter
 from fm_manager.engine.rotation_system import MatchImportance, MatchScheduler
+from fm_manager.engine.season_runner import ParallelSeasonRunner, SeasonFixture
+from fm_manager.engine.season_simulator import FixtureGenerator
 from colorama import Fore, Style, init as colorama_init  # type: ignore[import-not-found]
 
 
-def simulate_season(enable_rotation: bool = False):
+def simulate_matches_parallel(clubs, tracker, workers: int) -> None:
+    """Simulate the season across worker processes (no rotation)."""
+    lineups = {club.id: ClubSquadBuilder(club).build_lineup("4-3-3") for club in clubs}
+    fixtures = [
+        SeasonFixture(
+            league="league",
+            matchday=matchday,
+            home_id=home.id,
+            away_id=away.id,
+            home_lineup=lineups[home.id],
+            away_lineup=lineups[away.id],
+            home_name=home.name,
+            away_name=away.name,
+        )
+        for matchday, pairings in enumerate(FixtureGenerator().generate_pairings(clubs), 1)
+        for home, away in pairings
+    ]
+    print(f"Total matches: {len(fixtures)} ({workers} workers)")
+
+    with ParallelSeasonRunner(max_workers=workers, detail="full") as runner:
+        results = runner.run(fixtures)
+
+    for result in results:
+        f = result.fixture
+        tracker.add_match(result.state, f.home_id, f.home_name, f.away_id, f.away_name)
+
+
+def simulate_season(enable_rotation: bool = False, workers: int = 1):
     colorama_init()
     print("Loading data...")
     clubs, players = load_for_match_engine()
@@ -46,6 +75,11 @@ def simulate_season(enable_rotation: bool = False):
     # 使用新的 SeasonStatsTracker 来追踪统计
     tracker = SeasonStatsTracker()
 
+    if workers > 1 and not enable_rotation:
+        simulate_matches_parallel(premier_league, tracker, workers)
+        print_season_report(tracker)
+        return
+
     # Create squad builders for each team
     if enable_rotation:
         squad_builders = {
@@ -131,7 +165,11 @@ def simulate_season(enable_rotation: bool = False):
         sys.stdout.flush()
 
     print()
+    print_season_report(tracker)
 
+
+def print_season_report(tracker: SeasonStatsTracker) -> None:
+    """Print the league table and leaderboards, and export the stats."""
     # ============================================================================
     # 使用新的统计系统输出榜单
     # ============================================================================
@@ -260,6 +298,12 @@ if __name__ == "__main__":
         description="Simulate a football season with optional rotation system"
     )
     parser.add_argument("--rotation", action="store_true", help="Enable squad rotation system")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Simulate matchdays across this many processes (ignored with --rotation)",
+    )
     args = parser.parse_args()
 
-    simulate_season(enable_rotation=args.rotation)
+    simulate_season(enable_rotation=args.rotation, workers=args.workers)
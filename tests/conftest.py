@@ -0,0 +1,188 @@
+"""Shared fixtures for the test suite."""
+
+import random
+from datetime import date
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fm_manager.core.database import Base
+from fm_manager.core.models import Club, League, Match, MatchStatus, Player, Position, Season
+from fm_manager.core.save_load_enhanced import EnhancedSaveLoadManager
+from fm_manager.data.player_table import RATING_POSITIONS
+
+LINEUP_POSITIONS = [
+    Position.GK,
+    Position.CB,
+    Position.CB,
+    Position.LB,
+    Position.RB,
+    Position.CDM,
+    Position.CM,
+    Position.CAM,
+    Position.LW,
+    Position.RW,
+    Position.ST,
+]
+
+
+def make_lineup(prefix: str, ability: int, seed: int = 0) -> list:
+    """Build an eleven with flat attributes around the given ability."""
+    rng = random.Random(seed)
+    lineup = []
+    for i, position in enumerate(LINEUP_POSITIONS):
+        value = ability + rng.randint(-4, 4)
+        lineup.append(
+            SimpleNamespace(
+                id=i,
+                club_id=1,
+                full_name=f"{prefix} Player {i}",
+                position=position,
+                current_ability=value,
+                passing=value,
+                positioning=value,
+                pace=value,
+                shooting=value,
+                tackling=value,
+                marking=value,
+                reflexes=value,
+                strength=value,
+                stamina=70,
+                age=25,
+            )
+        )
+    return lineup
+
+
+POSITIONS = ["门将", "后卫 中", "后卫 左", "后腰", "中场 中", "攻击型中场 右左中", "前锋", "边锋"]
+
+
+def write_dataset(data_dir, num_players: int = 40) -> None:
+    """Write a small players/teams CSV pair in the cleaned format."""
+    players = []
+    for i in range(num_players):
+        row = {
+            "player_id": 1000 + i,
+            "name": f"Player {i}",
+            "nationality": ["Spain", "England", "Brazil"][i % 3],
+            "age": 18 + i % 17,
+            "birth_date": f"{1990 + i % 10}-01-01",
+            "position": POSITIONS[i % len(POSITIONS)],
+            "location": "",
+            "current_ability": 50 + i % 40 + 0.5,
+            "potential_ability": 60 + i % 40,
+            "player_role": "role",
+            "estimated_role": "",
+            "fatigue": i % 5,
+            "stamina": 80.5,
+            "match_shape": 55,
+            "happiness": 60,
+            "match_experience": 1.5,
+            "intl_caps": i,
+            "intl_goals": i // 4,
+            "value": 1_000_000 * (i + 1),
+            "wage": 10_000 * (i + 1),
+            "club_id": 1 + i % 2,
+            "club_name": ["Alpha FC", "Beta FC"][i % 2],
+            "club_reputation": 5000,
+            "squad_status": "First Team",
+        }
+        for j, pos in enumerate(RATING_POSITIONS):
+            row[f"rating_{pos}"] = (i * 7 + j * 3) % 90 + 0.1 * j
+            row[f"potential_{pos}"] = (i * 5 + j * 11) % 95
+        players.append(row)
+    # A row with missing numbers exercises the defaults
+    players.append({"player_id": 9999, "name": "Sparse", "position": "前锋"})
+
+    teams = [
+        {"club_id": 1, "name": "Alpha FC", "country": "Spain", "league": "La Liga"},
+        {"club_id": 2, "name": "Beta FC", "country": "Spain", "league": "La Liga"},
+    ]
+    data_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(players).to_csv(data_dir / "players_cleaned.csv", index=False)
+    pd.DataFrame(teams).to_csv(data_dir / "teams_cleaned.csv", index=False)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    data_dir = tmp_path / "cleaned"
+    write_dataset(data_dir)
+    return data_dir
+
+
+def build_world(
+    path,
+    clubs: int = 2,
+    players: int = 12,
+    matches: int = 6,
+    goalkeepers: int = 0,
+    first_name: str = "Player",
+) -> None:
+    """Write a league with ``players`` per club and ``matches`` played matches to SQLite.
+
+    The first ``goalkeepers`` players of each club are goalkeepers, the rest
+    central midfielders.
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(League(id=1, name="Test League", short_name="TL", country="England"))
+        session.add(Season(id=1, league_id=1, start_year=2024, end_year=2025))
+        for c in range(1, clubs + 1):
+            session.add(Club(id=c, name=f"Club {c}", short_name=f"C{c}", league_id=1))
+            session.add_all(
+                Player(
+                    first_name=first_name,
+                    last_name=f"{c}-{n}",
+                    position=Position.GK if n < goalkeepers else Position.CM,
+                    club_id=c,
+                    birth_date=date(2000, 1, n + 1),
+                )
+                for n in range(players)
+            )
+        session.add_all(
+            Match(
+                season_id=1,
+                matchday=md,
+                home_club_id=1 + md % 2,
+                away_club_id=2 - md % 2,
+                match_date=date(2024, 8, md),
+                home_score=md % 3,
+                away_score=1,
+                status=MatchStatus.FULL_TIME,
+            )
+            for md in range(1, matches + 1)
+        )
+        session.commit()
+    engine.dispose()
+
+
+@pytest.fixture
+def world_options() -> dict:
+    """Arguments of ``build_world`` for ``world_db``; override in a test module."""
+    return {}
+
+
+@pytest.fixture
+def world_db(tmp_path, world_options):
+    path = tmp_path / "world.db"
+    build_world(path, **world_options)
+    return path
+
+
+@pytest.fixture
+def session(world_db):
+    engine = create_engine(f"sqlite:///{world_db}")
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = EnhancedSaveLoadManager(tmp_path / "saves")
+    yield manager
+    manager.end_session()
@@ -0,0 +1,217 @@
+"""Tests for the async, batched LLM client."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from fm_manager.core.models import Club, Player, Position
+from fm_manager.engine import llm_client
+from fm_manager.engine.ai_manager import (
+    AIManagerController,
+    AIPersonality,
+    LLMManagerDecisionMaker,
+)
+from fm_manager.engine.llm_client import (
+    AsyncLLMClient,
+    LLMClient,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    generate_async,
+    generate_many_async,
+)
+
+
+def chat_completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-3.5-turbo",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+
+
+class TestAsyncLLMClient:
+    """Tests for AsyncLLMClient and the async helpers."""
+
+    async def test_batch_runs_concurrently(self):
+        """Test that a batch of mock prompts takes about one round trip, not one each."""
+        client = AsyncLLMClient(max_concurrency=20)
+        start = time.perf_counter()
+
+        responses = await client.generate_many(f"Prompt {n}" for n in range(20))
+
+        assert time.perf_counter() - start < 20 * llm_client.MOCK_LATENCY_SECONDS / 4
+        assert len(responses) == 20
+        assert client.get_usage_stats()["requests_count"] == 20
+
+    async def test_identical_requests_are_coalesced(self):
+        """Test that identical prompts in flight together send a single request."""
+        client = AsyncLLMClient()
+
+        responses = await client.generate_many(["Same prompt"] * 5 + ["Other prompt"])
+
+        stats = client.get_usage_stats()
+        assert stats["requests_count"] == 2
+        assert stats["cache_hits"] == 4
+        assert stats["in_flight"] == 0
+        assert len({r.content for r in responses[:5]}) == 1
+        assert [r.cached for r in responses[:5]].count(False) == 1
+
+    async def test_concurrency_limit(self, monkeypatch):
+        """Test that no more than max_concurrency requests are sent at once."""
+        client = AsyncLLMClient(max_concurrency=3)
+        active = peak = 0
+
+        async def generate(prompt, *args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return LLMResponse(content=prompt, provider=LLMProvider.MOCK, model=client.model)
+
+        monkeypatch.setattr(client, "_generate", generate)
+        responses = await client.generate_many(f"Prompt {n}" for n in range(10))
+
+        assert peak == 3
+        assert [r.content for r in responses] == [f"Prompt {n}" for n in range(10)]
+
+    async def test_retries_back_off_without_blocking(self, monkeypatch):
+        """Test that failed requests are retried after an asyncio sleep."""
+        client = AsyncLLMClient(max_retries=3)
+        sleeps = []
+        attempts = 0
+        sleep = asyncio.sleep
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            await sleep(0)
+
+        async def generate(prompt, *args, **kwargs):
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise RuntimeError("Rate limited")
+            return LLMResponse(content="ok", provider=LLMProvider.MOCK, model=client.model)
+
+        monkeypatch.setattr(client, "_generate", generate)
+        monkeypatch.setattr(llm_client.asyncio, "sleep", fake_sleep)
+
+        assert (await client.generate("Prompt")).content == "ok"
+        assert sleeps == [1, 2]
+
+        attempts = -10
+        [failed] = await client.generate_many(["Another"], return_exceptions=True)
+        assert isinstance(failed, RuntimeError)
+
+    async def test_openai_requests_share_the_http_client(self):
+        """Test that OpenAI requests go through the given HTTP client and are cached."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            return httpx.Response(200, json=chat_completion(body["messages"][-1]["content"]))
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncLLMClient(
+            LLMProvider.OPENAI, api_key="test", http_client=http_client
+        ) as client:
+            responses = await client.generate_many(
+                [LLMRequest("Hello", system_prompt="Be brief", max_tokens=50), "World"]
+            )
+            cached = await client.generate("World")
+
+        assert [r.content for r in responses] == ["Hello", "World"]
+        assert cached.cached
+        assert len(requests) == 2
+        hello = next(r for r in requests if r["messages"][-1]["content"] == "Hello")
+        assert hello["messages"][0] == {"role": "system", "content": "Be brief"}
+        assert hello["max_tokens"] == 50
+        assert client.get_usage_stats()["total_tokens"] == 10
+
+    async def test_sync_client_does_not_block_the_loop(self):
+        """Test that a sync LLMClient runs in a worker thread from async code."""
+        client = LLMClient(enable_cache=False)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        response = await generate_async(client, "Prompt")
+        responses = await generate_many_async(client, ["One", LLMRequest("Two")])
+        task.cancel()
+
+        assert response.provider is LLMProvider.MOCK
+        assert len(responses) == 2
+        assert ticks > 10
+
+    async def test_controller_prepares_tactics_in_one_batch(self, monkeypatch):
+        """Test that LLM managers' tactics are generated as one concurrent batch."""
+        client = AsyncLLMClient()
+        answer = {"formation": "3-5-2", "style": "high-press", "mentality": "attacking"}
+
+        async def generate(prompt, *args, **kwargs):
+            await asyncio.sleep(0.05)
+            if "Opponent: Club 1 " in prompt:
+                return LLMResponse(content="not json", provider=LLMProvider.MOCK, model="m")
+            return LLMResponse(content=json.dumps(answer), provider=LLMProvider.MOCK, model="m")
+
+        monkeypatch.setattr(client, "_generate", generate)
+        controller = AIManagerController(LLMClient(), async_llm_client=client)
+        clubs = [Club(id=n, name=f"Club {n}", reputation=5000) for n in range(1, 7)]
+        for club in clubs[:4]:
+            controller.create_manager(club, AIPersonality.LLM_POWERED)
+        controller.create_manager(clubs[4], AIPersonality.DEFENSIVE)
+        players = [Player(id=1, first_name="A", last_name="B", position=Position.ST)]
+        fixtures = [(club, clubs[-1], players) for club in clubs[:-1]]
+        fixtures[2] = (clubs[2], clubs[0], players)
+
+        start = time.perf_counter()
+        tactics = await controller.prepare_match_tactics_many(fixtures)
+
+        assert time.perf_counter() - start < 0.15
+        assert tactics[1] == tactics[2] == tactics[4] == answer
+        assert tactics[3]["reasoning"] == "Default fallback"
+        assert tactics[5]["reasoning"] == "Standard defensive approach"
+        # Clubs 1, 2 and 4 face the same opponent with the same prompt
+        assert client.get_usage_stats()["requests_count"] == 2
+
+    async def test_controller_without_async_client(self):
+        """Test that sync-only controllers decide tactics in a worker thread."""
+        controller = AIManagerController(LLMClient(enable_cache=False))
+        clubs = [Club(id=n, name=f"Club {n}", reputation=5000) for n in range(1, 4)]
+        for club in clubs[:2]:
+            controller.create_manager(club, AIPersonality.LLM_POWERED)
+
+        tactics = await controller.prepare_match_tactics_many(
+            [(club, clubs[-1], []) for club in clubs[:2]]
+        )
+
+        # Mock responses are not JSON
+        fallback = LLMManagerDecisionMaker.FALLBACK_TACTICS
+        assert tactics == {1: fallback, 2: fallback}
+        assert controller.llm_client.get_usage_stats()["requests_count"] == 2
+
+    def test_decisions_refuse_an_async_client(self):
+        """Test that sync decisions reject an AsyncLLMClient instead of returning coroutines."""
+        controller = AIManagerController(AsyncLLMClient())
+
+        with pytest.raises(TypeError, match="async_llm_client"):
+            controller.create_manager(Club(id=1, name="Club 1"), AIPersonality.LLM_POWERED)
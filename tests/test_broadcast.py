@@ -0,0 +1,118 @@
+"""Tests for websocket broadcast fan-out."""
+
+import asyncio
+import json
+
+from fm_manager.server.broadcast import SLOW_CONSUMER_CLOSE_CODE, RoomBroadcaster
+from fm_manager.server.game_room import GameRoom, PlayerRole
+
+
+class FakeWebSocket:
+    """Records sent text; blocks sends while ``gate`` is clear."""
+
+    def __init__(self, blocked: bool = False):
+        self.messages: list[str] = []
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+        self.close_code = None
+
+    async def send_text(self, text: str) -> None:
+        await self.gate.wait()
+        self.messages.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+    def types(self) -> list[str]:
+        return [json.loads(m)["type"] for m in self.messages]
+
+
+class TestRoomBroadcaster:
+    """Tests for RoomBroadcaster."""
+
+    async def test_slow_client_does_not_delay_others(self):
+        """Test that a blocked client leaves delivery to other clients unaffected."""
+        broadcaster = RoomBroadcaster()
+        fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+        fast_connection = broadcaster.attach("fast", fast)
+        broadcaster.attach("slow", slow)
+
+        for i in range(5):
+            assert broadcaster.publish({"type": "tick", "n": i}) == 2
+        await asyncio.wait_for(fast_connection.drain(), timeout=1)
+
+        assert len(fast.messages) == 5
+        assert slow.messages == []
+
+        slow.gate.set()
+        await asyncio.wait_for(broadcaster.flush(), timeout=1)
+        assert slow.messages == fast.messages
+        await broadcaster.close()
+
+    async def test_payload_is_encoded_once(self):
+        """Test that every recipient is sent the same encoded text."""
+        broadcaster = RoomBroadcaster()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for i, websocket in enumerate(sockets):
+            broadcaster.attach(f"c{i}", websocket)
+
+        broadcaster.publish({"type": "chat", "content": "héllo"})
+        await broadcaster.flush()
+
+        first = sockets[0].messages[0]
+        assert all(ws.messages[0] is first for ws in sockets)
+        assert json.loads(first)["content"] == "héllo"
+        await broadcaster.close()
+
+    async def test_snapshots_are_coalesced(self):
+        """Test that a queued snapshot is replaced by a newer one with the same key."""
+        broadcaster = RoomBroadcaster()
+        websocket = FakeWebSocket(blocked=True)
+        broadcaster.attach("c", websocket)
+
+        broadcaster.publish({"type": "hello"})
+        await asyncio.sleep(0)  # the writer now holds "hello"
+        broadcaster.publish({"type": "player_list", "v": 1}, coalesce_key="player_list")
+        broadcaster.publish({"type": "chat"})
+        broadcaster.publish({"type": "player_list", "v": 2}, coalesce_key="player_list")
+        websocket.gate.set()
+        await broadcaster.flush()
+
+        assert websocket.types() == ["hello", "chat", "player_list"]
+        assert json.loads(websocket.messages[-1])["v"] == 2
+        await broadcaster.close()
+
+    async def test_overflowing_client_is_dropped(self):
+        """Test that a client whose bounded queue overflows is disconnected."""
+        broadcaster = RoomBroadcaster(max_queue=3)
+        websocket = FakeWebSocket(blocked=True)
+        connection = broadcaster.attach("c", websocket)
+
+        accepted = [broadcaster.publish({"type": "tick", "n": i}) for i in range(6)]
+        await asyncio.sleep(0)
+
+        assert accepted == [1, 1, 1, 0, 0, 0]
+        assert connection.closed
+        assert websocket.close_code == SLOW_CONSUMER_CLOSE_CODE
+        await broadcaster.close()
+
+
+class TestGameRoomBroadcast:
+    """Tests for GameRoom messaging through the broadcaster."""
+
+    async def test_players_and_spectators_receive_broadcasts(self):
+        """Test that chat reaches players and spectators after their welcome message."""
+        room = GameRoom("room", "Test", result_delay=0)
+        await room.add_player("p1", "Alice", PlayerRole.HUMAN)
+        player, spectator = FakeWebSocket(), FakeWebSocket()
+
+        await room.connect_websocket("p1", player)
+        await room.connect_spectator("s1", spectator)
+        await room.broadcast_chat("p1", "hi")
+        room.send_to_player("p1", {"type": "pong"})
+        await room.broadcaster.flush()
+
+        assert player.types() == ["connected", "player_list", "chat", "pong"]
+        assert spectator.types() == ["connected", "chat"]
+        await room.close()
@@ -0,0 +1,204 @@
+"""Tests for the cleaned dataset loader and columnar player table."""
+
+import pickle
+
+import pandas as pd
+
+from fm_manager.data.cleaned_data_loader import CleanedDataLoaderV2, PlayerDataFull, map_position
+from fm_manager.data.player_table import RATING_POSITIONS, PlayerRow, PlayerTable
+from fm_manager.data.snapshot import SNAPSHOT_DIRNAME
+
+
+def parse_player_row(row: pd.Series) -> PlayerDataFull:
+    """Reference parser: one CSV row to a PlayerDataFull, cell by cell."""
+
+    def get_float(col, default=0.0):
+        val = row.get(col, default)
+        try:
+            return float(val) if pd.notna(val) else default
+        except (TypeError, ValueError):
+            return default
+
+    def get_int(col, default=0):
+        val = row.get(col, default)
+        try:
+            return int(val) if pd.notna(val) else default
+        except (TypeError, ValueError):
+            return default
+
+    def get_str(col, default=""):
+        return str(row.get(col, default))
+
+    ratings = {
+        f"{kind}_{pos}": get_float(f"{kind}_{pos}")
+        for kind in ("rating", "potential")
+        for pos in RATING_POSITIONS
+    }
+    return PlayerDataFull(
+        id=get_int("player_id"),
+        name=get_str("name", "Unknown"),
+        nationality=get_str("nationality", "Unknown"),
+        age=get_int("age"),
+        birth_date=get_str("birth_date"),
+        position=map_position(get_str("position")),
+        location=get_str("location"),
+        current_ability=get_float("current_ability"),
+        potential_ability=get_float("potential_ability"),
+        player_role=get_str("player_role"),
+        estimated_role=get_str("estimated_role"),
+        **ratings,
+        fatigue=get_int("fatigue"),
+        stamina=get_float("stamina", 100.0),
+        match_shape=get_float("match_shape", 50.0),
+        happiness=get_int("happiness", 50),
+        match_experience=get_float("match_experience"),
+        intl_caps=get_int("intl_caps"),
+        intl_goals=get_int("intl_goals"),
+        market_value=get_int("value"),
+        weekly_wage=get_int("wage"),
+        club_id=get_int("club_id", -1),
+        club_name=get_str("club_name"),
+        club_reputation=get_int("club_reputation"),
+        squad_status=get_str("squad_status"),
+    )
+
+
+def reference_players(data_dir) -> dict[int, PlayerDataFull]:
+    """Parse the CSV row by row into PlayerDataFull records."""
+    df = pd.read_csv(data_dir / "players_cleaned.csv")
+    return {p.id: p for p in (parse_player_row(row) for _, row in df.iterrows())}
+
+
+class TestPlayerTable:
+    """Tests for PlayerTable and PlayerRow."""
+
+    def test_rows_match_records(self, dataset):
+        """Test that row views expose the same attributes as the records."""
+        expected = reference_players(dataset)
+        clubs, players = CleanedDataLoaderV2(str(dataset)).load_all()
+
+        assert list(players) == list(expected)
+        for player_id, record in expected.items():
+            row = players[player_id]
+            assert isinstance(row, PlayerRow)
+            for name in PlayerDataFull.__dataclass_fields__:
+                assert getattr(row, name) == getattr(record, name), name
+            assert row.get_best_position() == record.get_best_position()
+            for pos in ("GK", "CB", "ST", "CAM", "XX"):
+                assert row.get_rating_for_position(pos) == record.get_rating_for_position(pos)
+        assert sum(c.squad_size for c in clubs.values()) == 40
+
+    def test_views_write_through(self, dataset):
+        """Test that assignments on a view update the table columns."""
+        loader = CleanedDataLoaderV2(str(dataset))
+        _, players = loader.load_all()
+        player = players[1000]
+
+        player.club_id = 2
+        player.club_name = "Gamma FC"
+        player.rating_ts = 99.0
+
+        assert loader.table.get(1000).club_name == "Gamma FC"
+        assert 0 in loader.table.rows_for_club(2)
+        assert loader.table.column("rating_ts")[0] == 99.0
+        assert player.get_best_position() == ("TS", 99.0)
+
+    def test_vectorised_best_positions(self, dataset):
+        """Test that best_positions agrees with the per-row method."""
+        loader = CleanedDataLoaderV2(str(dataset))
+        loader.load_all()
+        codes, ratings = loader.table.best_positions()
+
+        for row, code, rating in zip(loader.table.rows(), codes, ratings, strict=True):
+            assert row.get_best_position() == (code, rating)
+
+    def test_pickles_as_record(self, dataset):
+        """Test that a view pickles to a standalone PlayerDataFull."""
+        _, players = CleanedDataLoaderV2(str(dataset)).load_all()
+
+        restored = pickle.loads(pickle.dumps(players[1003]))
+
+        assert isinstance(restored, PlayerDataFull)
+        assert restored == PlayerTable.from_players([restored]).to_record(0)
+        assert restored.name == "Player 3"
+
+
+class TestCleanedDataLoader:
+    """Tests for CleanedDataLoaderV2 ingestion."""
+
+    def test_load_metrics(self, dataset):
+        """Test that a load records row counts and timings."""
+        loader = CleanedDataLoaderV2(str(dataset))
+        loader.load_all()
+
+        assert loader.metrics.players == 41
+        assert loader.metrics.teams == 2
+        assert loader.metrics.total >= loader.metrics.read_players > 0
+
+    def test_missing_columns_use_defaults(self, dataset):
+        """Test that absent CSV columns fall back to the PlayerDataFull defaults."""
+        df = pd.read_csv(dataset / "players_cleaned.csv")
+        df.drop(columns=["stamina", "happiness", "club_name", "nationality"]).to_csv(
+            dataset / "players_cleaned.csv", index=False
+        )
+
+        _, players = CleanedDataLoaderV2(str(dataset)).load_all()
+
+        assert players[1000].stamina == 100.0
+        assert players[1000].happiness == 50
+        assert players[1000].club_name == ""
+        assert players[1000].nationality == "Unknown"
+        assert players[9999].club_id == -1
+
+
+class TestDatasetSnapshot:
+    """Tests for the memory-mapped dataset snapshot."""
+
+    def test_second_load_uses_snapshot(self, dataset):
+        """Test that a reload maps the snapshot and yields the same players."""
+        first = CleanedDataLoaderV2(str(dataset))
+        _, expected = first.load_all()
+        second = CleanedDataLoaderV2(str(dataset))
+        _, players = second.load_all()
+
+        assert not first.metrics.from_snapshot
+        assert second.metrics.from_snapshot
+        assert list(players) == list(expected)
+        for player_id, record in expected.items():
+            for name in PlayerDataFull.__dataclass_fields__:
+                assert getattr(players[player_id], name) == getattr(record, name), name
+
+    def test_changed_csv_invalidates_snapshot(self, dataset):
+        """Test that editing the CSV forces a reparse."""
+        CleanedDataLoaderV2(str(dataset)).load_all()
+        df = pd.read_csv(dataset / "players_cleaned.csv")
+        df.loc[0, "name"] = "Renamed"
+        df.to_csv(dataset / "players_cleaned.csv", index=False)
+
+        loader = CleanedDataLoaderV2(str(dataset))
+        _, players = loader.load_all()
+
+        assert not loader.metrics.from_snapshot
+        assert players[1000].name == "Renamed"
+        assert len(list((dataset / SNAPSHOT_DIRNAME).glob("v*"))) == 1
+
+    def test_writes_do_not_touch_snapshot(self, dataset):
+        """Test that mapped columns are copy-on-write."""
+        CleanedDataLoaderV2(str(dataset)).load_all()
+        _, players = CleanedDataLoaderV2(str(dataset)).load_all()
+
+        players[1000].age = 99
+        players[1000].rating_gk = 1.5
+        _, reloaded = CleanedDataLoaderV2(str(dataset)).load_all()
+
+        assert players[1000].age == 99
+        assert reloaded[1000].age == 18
+        assert reloaded[1000].rating_gk != 1.5
+
+    def test_snapshot_can_be_disabled(self, dataset):
+        """Test that use_snapshot=False neither reads nor writes a snapshot."""
+        loader = CleanedDataLoaderV2(str(dataset), use_snapshot=False)
+        loader.load_all()
+
+        assert not loader.metrics.from_snapshot
+        assert not (dataset / SNAPSHOT_DIRNAME).exists()
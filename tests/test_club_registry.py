@@ -0,0 +1,67 @@
+"""Tests for the club registry and live standings."""
+
+import random
+
+from fm_manager.data.cleaned_data_loader import ClubDataFull
+from fm_manager.data.club_registry import ClubRegistry
+from fm_manager.server.standings import StandingsTable
+
+
+def make_club(club_id: int, name: str, league: str = "Test League") -> ClubDataFull:
+    return ClubDataFull(id=club_id, name=name, country="Nowhere", league=league)
+
+
+class TestClubRegistry:
+    """Tests for ClubRegistry."""
+
+    def test_lookups(self):
+        """Test id, name and league lookups."""
+        registry = ClubRegistry(
+            [make_club(1, "Alpha"), make_club(2, "Beta"), make_club(3, "Gamma", "Other")]
+        )
+
+        assert registry.get(2).name == "Beta"
+        assert registry.by_name("Gamma").id == 3
+        assert [c.id for c in registry.in_league("Test League")] == [1, 2]
+        assert registry.name_of(9) == "Club 9"
+        assert [c.id for c in registry] == [1, 2, 3]
+
+    def test_duplicate_names_resolve_to_first_club(self):
+        """Test that name lookups behave like a first-match scan, also after removal."""
+        registry = ClubRegistry([make_club(1, "United"), make_club(2, "United")])
+
+        assert registry.by_name("United").id == 1
+        registry.remove(1)
+        assert registry.by_name("United").id == 2
+        assert 1 not in registry
+
+
+class TestStandingsTable:
+    """Tests for StandingsTable."""
+
+    def test_order_matches_full_sort(self):
+        """Test that incremental ordering equals sorting the table after each result."""
+        rng = random.Random(3)
+        table = StandingsTable()
+        for club_id in range(12):
+            table.add_club(club_id, f"Club {club_id}")
+
+        for _ in range(150):
+            home, away = rng.sample(range(12), 2)
+            table.record_result(home, away, rng.randint(0, 4), rng.randint(0, 4))
+
+            rows = table.rows()
+            expected = sorted(
+                (table.get(club_id) for club_id in range(12)),
+                key=lambda x: (-x["points"], -x["gd"], -x["gf"]),
+            )
+            assert [r["club_id"] for r in rows] == [r["club_id"] for r in expected]
+            assert [r["position"] for r in rows] == list(range(1, 13))
+
+    def test_unknown_club_is_ignored(self):
+        """Test that results involving clubs outside the table change nothing."""
+        table = StandingsTable()
+        table.add_club(1, "Alpha")
+
+        assert not table.record_result(1, 2, 3, 0)
+        assert table.get(1)["played"] == 0
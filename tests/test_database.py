@@ -0,0 +1,63 @@
+"""Tests for database engines and SQLite storage profiles."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from fm_manager.core.database import STORAGE_PROFILES, create_database_engine
+
+
+async def pragma(engine, name: str):
+    async with engine.connect() as conn:
+        return (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+
+
+class TestStorageProfiles:
+    """Tests for create_database_engine's storage profiles."""
+
+    async def test_profile_pragmas_are_applied(self, tmp_path):
+        """Test that every connection gets the profile's PRAGMAs."""
+        engine = create_database_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'fm.db'}", profile="balanced", pool_size=2
+        )
+        try:
+            assert await pragma(engine, "journal_mode") == "wal"
+            assert await pragma(engine, "synchronous") == 1  # NORMAL
+            assert await pragma(engine, "cache_size") == STORAGE_PROFILES["balanced"].cache_size
+            assert await pragma(engine, "temp_store") == 2  # MEMORY
+        finally:
+            await engine.dispose()
+
+    async def test_default_profile_keeps_sqlite_defaults(self):
+        """Test that the default profile sets nothing, even on in-memory databases."""
+        engine = create_database_engine(
+            "sqlite+aiosqlite:///:memory:", profile="default", pool_size=2
+        )
+        try:
+            assert STORAGE_PROFILES["default"].pragmas() == []
+            assert await pragma(engine, "synchronous") == 2  # FULL
+        finally:
+            await engine.dispose()
+
+    async def test_read_only_engine_rejects_writes(self, tmp_path):
+        """Test that the analytics engine reads the writer's data but cannot write."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'fm.db'}"
+        writer = create_database_engine(url)
+        reader = create_database_engine(url, read_only=True)
+        try:
+            async with writer.begin() as conn:
+                await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+                await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+            async with reader.connect() as conn:
+                assert (await conn.execute(text("SELECT x FROM t"))).scalar() == 1
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("INSERT INTO t VALUES (2)"))
+        finally:
+            await reader.dispose()
+            await writer.dispose()
+
+    def test_unknown_profile_is_rejected(self):
+        """Test that a misspelt profile name fails loudly."""
+        with pytest.raises(ValueError):
+            create_database_engine("sqlite+aiosqlite:///:memory:", profile="fast")
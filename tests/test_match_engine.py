@@ -0,0 +1,212 @@
+"""Tests for the enhanced Markov match engine."""
+
+import random
+
+import pytest
+from conftest import make_lineup
+
+from fm_manager.engine.match_engine_batch import BatchFixture
+from fm_manager.engine.match_engine_markov import (
+    EnhancedMarkovEngine,
+    MatchEventType,
+    MatchState,
+    PitchZone,
+    ResultDetail,
+    TacticalFormation,
+    TeamMomentum,
+    _zone_table,
+)
+from fm_manager.engine.rng import RandomStreams
+
+
+def mean_scores(states: list) -> tuple[float, float]:
+    return (
+        sum(s.home_score for s in states) / len(states),
+        sum(s.away_score for s in states) / len(states),
+    )
+
+
+class TestBatchSimulation:
+    """Tests for EnhancedMarkovEngine.simulate_batch."""
+
+    def test_returns_one_state_per_fixture(self):
+        """Test that results come back in fixture order with full accounting."""
+        home = make_lineup("Home", 75, seed=1)
+        away = make_lineup("Away", 65, seed=2)
+        engine = EnhancedMarkovEngine(random_seed=7)
+
+        states = engine.simulate_batch(
+            [(home, away), BatchFixture(away, home, "4-4-2", "4-2-3-1"), (home, home)]
+        )
+
+        assert len(states) == 3
+        assert all(isinstance(s, MatchState) for s in states)
+        assert states[1].home_lineup is away
+
+        for state in states:
+            home_goals = sum(e.event_type == MatchEventType.GOAL_HOME for e in state.events)
+            away_goals = sum(e.event_type == MatchEventType.GOAL_AWAY for e in state.events)
+            assert (home_goals, away_goals) == (state.home_score, state.away_score)
+            assert state.home_goals == state.home_score
+            assert sum(p.goals for p in state.home_player_stats.values()) == state.home_score
+            assert sum(p.goals for p in state.away_player_stats.values()) == state.away_score
+            assert state.events[-1].event_type == MatchEventType.FULL_TIME
+            assert all(p.minutes_played == 90 for p in state.home_player_stats.values())
+            assert all(4.0 <= p.match_rating <= 10.0 for p in state.away_player_stats.values())
+
+    def test_seeded_batches_are_reproducible(self):
+        """Test that the same seed replays the same batch."""
+        home = make_lineup("Home", 70, seed=1)
+        away = make_lineup("Away", 70, seed=2)
+        fixtures = [(home, away)] * 20
+
+        first = EnhancedMarkovEngine().simulate_batch(fixtures, random_seed=123)
+        second = EnhancedMarkovEngine().simulate_batch(fixtures, random_seed=123)
+
+        assert [s.score_string() for s in first] == [s.score_string() for s in second]
+        assert [len(s.events) for s in first] == [len(s.events) for s in second]
+
+    def test_empty_batch(self):
+        """Test that an empty fixture list is a no-op."""
+        assert EnhancedMarkovEngine(random_seed=1).simulate_batch([]) == []
+
+    def test_empty_lineup_rejected(self):
+        """Test that fixtures without players are rejected."""
+        with pytest.raises(ValueError):
+            EnhancedMarkovEngine(random_seed=1).simulate_batch([([], make_lineup("Away", 70))])
+
+    def test_outcome_distribution_matches_scalar_engine(self):
+        """Test that batched and per-match simulation agree statistically."""
+        home = make_lineup("Home", 74, seed=1)
+        away = make_lineup("Away", 68, seed=2)
+
+        scalar = [EnhancedMarkovEngine(random_seed=s).simulate(home, away) for s in range(200)]
+        batch = EnhancedMarkovEngine(random_seed=99).simulate_batch([(home, away)] * 1000)
+
+        scalar_home, scalar_away = mean_scores(scalar)
+        batch_home, batch_away = mean_scores(batch)
+        assert batch_home == pytest.approx(scalar_home, abs=0.35)
+        assert batch_away == pytest.approx(scalar_away, abs=0.25)
+
+        scalar_passes = sum(s.home_passes for s in scalar) / len(scalar)
+        batch_passes = sum(s.home_passes for s in batch) / len(batch)
+        assert batch_passes == pytest.approx(scalar_passes, rel=0.05)
+
+
+class TestResultDetail:
+    """Tests for the reduced result levels of EnhancedMarkovEngine.simulate."""
+
+    def _simulate(self, seed: int, detail: str) -> MatchState:
+        engine = EnhancedMarkovEngine(random_seed=seed)
+        return engine.simulate(
+            make_lineup("Home", 72, 1), make_lineup("Away", 70, 2), detail=detail
+        )
+
+    def test_levels_agree_on_seeded_scores(self):
+        """Test that every level reports the same score for the same seed."""
+        for seed in range(10):
+            scores = {
+                self._simulate(seed, d).score_string() for d in ("score", "team_stats", "full")
+            }
+            assert len(scores) == 1
+
+    def test_score_level_is_bare(self):
+        """Test that the score level skips events and statistics."""
+        state = self._simulate(3, ResultDetail.SCORE)
+
+        assert state.events == []
+        assert state.home_player_stats == {} and state.away_player_stats == {}
+        assert state.home_passes == 0
+        assert state.home_goals == state.home_score
+
+    def test_team_stats_level_keeps_team_counters(self):
+        """Test that the team-stats level keeps team counters but no events."""
+        state = self._simulate(3, ResultDetail.TEAM_STATS)
+        full = self._simulate(3, ResultDetail.FULL)
+
+        assert state.events == []
+        assert state.home_player_stats == {}
+        assert state.home_passes == full.home_passes
+        assert state.home_possession == full.home_possession
+
+    def test_batch_levels_agree_on_seeded_scores(self):
+        """Test that the batch path reports the same scores at every level."""
+        fixtures = [(make_lineup("Home", 72, 1), make_lineup("Away", 70, 2))] * 20
+        results = [
+            EnhancedMarkovEngine().simulate_batch(fixtures, random_seed=5, detail=detail)
+            for detail in ("score", "team_stats", "full")
+        ]
+
+        assert len({tuple(s.score_string() for s in states) for states in results}) == 1
+        assert all(s.events == [] for s in results[0])
+
+
+class TestZoneTables:
+    """Tests for the precompiled zone event tables."""
+
+    def test_table_selection_matches_dict_selection(self):
+        """Test that bisecting the compiled table draws the same events as the dict walk."""
+        engine = EnhancedMarkovEngine(random_seed=0)
+        momentum = TeamMomentum(club_id=0, attacking_momentum=-5.0)
+        for zone in PitchZone:
+            for minute, score_diff in [(10, 0), (85, -2), (85, 3)]:
+                args = (
+                    zone,
+                    {"overall": 78.0},
+                    {"overall": 64.0},
+                    TacticalFormation(tempo=1.2, width=1.1),
+                    momentum,
+                    score_diff,
+                    minute,
+                    "away",
+                )
+                probs = engine._get_enhanced_zone_probs(*args)
+                table = _zone_table(engine._zone_key(*args))
+                assert table[0] == tuple(probs)
+
+                dict_rng = random.Random(minute)
+                table_rng = random.Random(minute)
+                for _ in range(200):
+                    engine.rng = dict_rng
+                    expected = engine._select_event(probs)
+                    engine.rng = table_rng
+                    assert engine._select_event_from_table(table) == expected
+
+
+class TestDeterminism:
+    """Tests for seeded, per-instance random streams."""
+
+    def test_seed_replays_regardless_of_global_random(self):
+        """Test that a seeded match does not depend on the module-level generator."""
+        home = make_lineup("Home", 72, 1)
+        away = make_lineup("Away", 70, 2)
+
+        random.seed(1)
+        first = EnhancedMarkovEngine(random_seed=42).simulate(home, away)
+        random.seed(2)
+        second = EnhancedMarkovEngine(random_seed=42).simulate(home, away)
+
+        assert [e.description for e in first.events] == [e.description for e in second.events]
+
+    def test_reseeded_engine_matches_fresh_engine(self):
+        """Test that reusing one engine per fixture replays fresh-engine results."""
+        streams = RandomStreams(2024)
+        home = make_lineup("Home", 72, 1)
+        away = make_lineup("Away", 70, 2)
+        reused = EnhancedMarkovEngine()
+
+        for matchday in range(5):
+            seed = streams.seed_for("match", matchday, 1, 2)
+            reused.reseed(seed)
+            replay = reused.simulate(home, away)
+            fresh = EnhancedMarkovEngine(random_seed=seed).simulate(home, away)
+            assert [e.description for e in replay.events] == [e.description for e in fresh.events]
+
+    def test_substreams_are_keyed(self):
+        """Test that substreams depend only on the root seed and key."""
+        assert RandomStreams(7).seed_for("a", 1) == RandomStreams(7).seed_for("a", 1)
+        assert RandomStreams(7).seed_for("a", 1) != RandomStreams(7).seed_for("a", 2)
+        assert RandomStreams(7).seed_for("a", 1) != RandomStreams(8).seed_for("a", 1)
+        assert RandomStreams(7).child("league").seed_for(1) == RandomStreams(7).child(
+            "league"
+        ).seed_for(1)
@@ -0,0 +1,78 @@
+"""Tests for the cleaned data to match engine adapter."""
+
+import pytest
+
+from fm_manager.data.cleaned_data_loader import CleanedDataLoaderV2
+from fm_manager.engine.match_engine_adapter import (
+    AdaptedPlayer,
+    ClubSquadBuilder,
+    SquadCache,
+    categorize_players,
+    select_lineup,
+)
+from fm_manager.engine.transfer_service import TransferService
+
+
+@pytest.fixture
+def league(dataset):
+    return CleanedDataLoaderV2(str(dataset), use_snapshot=False).load_all()
+
+
+class TestSquadCache:
+    """Tests for cached ClubSquadBuilder lineups."""
+
+    def test_lineup_matches_fresh_selection(self, league):
+        """Test that cached lineups pick the same players as a fresh selection."""
+        clubs, _ = league
+        for club in clubs.values():
+            for formation in ClubSquadBuilder.FORMATIONS:
+                expected = select_lineup(categorize_players(club.players), formation)
+
+                lineup = ClubSquadBuilder(club, cache=SquadCache()).build_lineup(formation)
+
+                assert [p.id for p in lineup] == [p.id for p in expected]
+                assert all(isinstance(p, AdaptedPlayer) for p in lineup)
+
+    def test_builders_share_cached_players(self, league):
+        """Test that new builders for an unchanged squad reuse the cached objects."""
+        clubs, _ = league
+        cache = SquadCache()
+        club = clubs[1]
+
+        first = ClubSquadBuilder(club, cache=cache).build_lineup()
+        second = ClubSquadBuilder(club, cache=cache).build_lineup()
+        rotation = ClubSquadBuilder(club, enable_rotation=True, cache=cache)
+
+        assert first is not second
+        assert len(first) == len(second) == 11
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert set(map(id, first)) <= set(map(id, rotation.rotation_system.squad))
+
+    def test_transfer_invalidates_both_clubs(self, league):
+        """Test that moving a player rebuilds the squads of both clubs."""
+        clubs, players = league
+        cache = SquadCache()
+        best = ClubSquadBuilder(clubs[1], cache=cache).build_lineup()[0]
+
+        TransferService(clubs, players).move_player_to_club(best.id, 1, 2)
+
+        squad = ClubSquadBuilder(clubs[2], cache=cache).players_by_position
+
+        assert best.id not in [p.id for p in ClubSquadBuilder(clubs[1], cache=cache).build_lineup()]
+        assert best.id in [p.id for members in squad.values() for p in members]
+
+    def test_condition_changes_rebuild_adapted_players(self, league):
+        """Test that fitness changes refresh cached players without recategorising."""
+        clubs, _ = league
+        cache = SquadCache()
+        club = clubs[1]
+        builder = ClubSquadBuilder(club, cache=cache)
+        first = builder.build_lineup()
+        player = next(p for p in club.players if p.id == first[0].id)
+
+        player.stamina = 12
+        second = ClubSquadBuilder(club, cache=cache)
+
+        assert second.players_by_position is builder.players_by_position
+        assert second.build_lineup()[0] is not first[0]
+        assert second.build_lineup()[0].fitness == 12
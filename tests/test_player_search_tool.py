@@ -0,0 +1,100 @@
+"""Tests for the indexed player search tool."""
+
+import pytest
+
+from fm_manager.ai.tools.player_search_tool import (
+    PlayerSearchCriteria,
+    PlayerSearchTool,
+    PositionCategory,
+)
+from fm_manager.data.cleaned_data_loader import CleanedDataLoaderV2
+
+
+@pytest.fixture
+def tool(dataset):
+    loader = CleanedDataLoaderV2(str(dataset), use_snapshot=False)
+    loader.load_all()
+    return PlayerSearchTool(loader.table)
+
+
+def linear_search(tool: PlayerSearchTool, criteria: PlayerSearchCriteria) -> list[int]:
+    """Reference: filter every player, then fully sort."""
+    nationality = criteria.nationality.lower() if criteria.nationality else None
+    if nationality == "english":
+        nationality = "england"
+    matches = [
+        p
+        for p in tool.players.values()
+        if (nationality is None or nationality in p.nationality.lower())
+        and (criteria.max_age is None or p.age <= criteria.max_age)
+        and (criteria.min_age is None or p.age >= criteria.min_age)
+        and (
+            criteria.min_current_ability is None
+            or p.current_ability >= criteria.min_current_ability
+        )
+        and (
+            criteria.position_category is None
+            or p.position in {"CB", "LB", "RB", "LWB", "RWB", "DC", "DL", "DR", "WBL", "WBR"}
+        )
+        and (criteria.exclude_club_id is None or p.club_id != criteria.exclude_club_id)
+    ]
+    matches.sort(key=lambda p: getattr(p, criteria.sort_by), reverse=criteria.sort_descending)
+    return [p.id for p in matches]
+
+
+class TestPlayerSearchTool:
+    """Tests for PlayerSearchTool."""
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            PlayerSearchCriteria(),
+            PlayerSearchCriteria(nationality="English", max_age=25, limit=3),
+            PlayerSearchCriteria(min_age=20, max_age=30, sort_by="age", sort_descending=False),
+            PlayerSearchCriteria(min_current_ability=70, exclude_club_id=1, offset=2, limit=4),
+            PlayerSearchCriteria(
+                position_category=PositionCategory.DEFENDER, sort_by="market_value", limit=5
+            ),
+            PlayerSearchCriteria(nationality="Atlantis"),
+        ],
+    )
+    def test_matches_linear_scan(self, tool, criteria):
+        """Test that indexed results equal a full filter-and-sort, ties in row order."""
+        expected = linear_search(tool, criteria)
+
+        result = tool.search(criteria)
+
+        assert result.total_count == len(expected)
+        assert [p.id for p in result.players] == expected[
+            criteria.offset : criteria.offset + criteria.limit
+        ]
+
+    def test_equivalent_criteria_share_cache_entry(self, tool):
+        """Test that criteria differing only in spelling hit the same cache entry."""
+        first = tool.search(PlayerSearchCriteria(nationality="England", sort_by="unknown"))
+        second = tool.search(PlayerSearchCriteria(nationality="english"))
+
+        assert len(tool._cache) == 1
+        assert [p.id for p in first.players] == [p.id for p in second.players]
+
+    def test_cache_is_bounded(self, dataset):
+        """Test that the least recently used query is evicted."""
+        loader = CleanedDataLoaderV2(str(dataset), use_snapshot=False)
+        loader.load_all()
+        tool = PlayerSearchTool(loader.table, cache_size=2)
+
+        for max_age in (20, 25, 20, 30):
+            tool.search(PlayerSearchCriteria(max_age=max_age))
+
+        assert [dict(key)["max_age"] for key in tool._cache] == [20, 30]
+
+    def test_player_changes_invalidate_results(self, tool):
+        """Test that a write through a player view is visible to the next search."""
+        criteria = PlayerSearchCriteria(club_id=2, limit=100)
+        before = tool.search(criteria).total_count
+
+        tool.players[1000].club_id = 2
+        after = tool.search(criteria)
+
+        assert after.total_count == before + 1
+        assert 1000 in [p.id for p in after.players]
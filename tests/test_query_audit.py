@@ -0,0 +1,72 @@
+"""Tests for hot-query indexes and the query-plan audit."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import OperationalError
+
+from fm_manager.core.database import Base, create_database_engine
+from fm_manager.core.models import Player
+from fm_manager.core.query_audit import audit, explain
+
+MIGRATIONS = Path(__file__).parent.parent / "alembic" / "versions"
+
+
+def load_migration(filename: str):
+    spec = importlib.util.spec_from_file_location(filename, MIGRATIONS / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestQueryAudit:
+    """Tests for the EXPLAIN QUERY PLAN audit."""
+
+    async def test_hot_queries_use_indexes(self):
+        """Test that no hot query scans a whole table."""
+        reports = await audit()
+
+        assert reports
+        assert {r.name: r.full_scans for r in reports if not r.ok} == {}
+
+    async def test_existing_databases_are_audited_read_only(self, tmp_path):
+        """Test that a database given by URL is audited without creating its schema."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'game.db'}"
+        engine = create_database_engine(url, profile="default")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[Player.__table__])
+
+        with pytest.raises(OperationalError, match="no such table"):
+            await audit(url)
+
+        async with engine.connect() as conn:
+            tables = await conn.run_sync(lambda sync: inspect(sync).get_table_names())
+        await engine.dispose()
+        assert tables == ["players"]
+
+    async def test_full_scans_are_flagged(self):
+        """Test that a query on an unindexed column is reported as a full scan."""
+        engine = create_database_engine("sqlite+aiosqlite:///:memory:", profile="default")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            report = await explain(
+                conn, "by_nationality", select(Player).where(Player.nationality == "Spain")
+            )
+        await engine.dispose()
+
+        assert report.full_scans == ["players"]
+        assert not report.ok
+
+    def test_migration_matches_model_indexes(self):
+        """Test that the index migration creates exactly the indexes the models declare."""
+        migration = load_migration("003_add_hot_query_indexes.py")
+        declared = {
+            index.name: (table.name, [c.name for c in index.columns])
+            for table in Base.metadata.tables.values()
+            for index in table.indexes
+        }
+
+        for name, table, columns in migration.INDEXES:
+            assert declared[name] == (table, columns)
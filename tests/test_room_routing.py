@@ -0,0 +1,206 @@
+"""Tests for multi-worker room routing and the shared room backend."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from fm_manager.server import main
+from fm_manager.server.broadcast import RoomBroadcaster
+from fm_manager.server.room_state import (
+    MemoryRoomBackend,
+    RoomRecord,
+    SQLiteRoomBackend,
+    WorkerInfo,
+)
+from fm_manager.server.routing import RoomRouter
+
+
+def record(room_id: str, worker_id: str, status: str = "waiting") -> RoomRecord:
+    return RoomRecord(room_id=room_id, name=f"Room {room_id}", worker_id=worker_id, status=status)
+
+
+class TestRoomRouter:
+    """Tests for RoomRouter over a shared in-memory backend."""
+
+    async def test_rooms_are_placed_on_least_loaded_worker(self):
+        """Test that placement balances rooms and prefers the local worker on ties."""
+        backend = MemoryRoomBackend()
+        a = RoomRouter(backend, "a", "http://a")
+        b = RoomRouter(backend, "b", "http://b")
+        await a.start()
+        await b.start()
+
+        assert (await a.place()).worker_id == "a"
+        await backend.put_room(record("r1", "a"))
+        assert (await a.place()).worker_id == "b"
+        assert (await a.locate("r1")).worker_id == "a"
+        assert await a.locate("missing") is None
+
+        await b.stop()
+        await a.stop()
+
+    async def test_inactive_rooms_do_not_count_toward_load(self):
+        """Test that finished and closed rooms are ignored by placement and can be removed."""
+        backend = MemoryRoomBackend()
+        a = RoomRouter(backend, "a", "http://a")
+        b = RoomRouter(backend, "b", "http://b")
+        await a.start()
+        await b.start()
+        await backend.put_room(record("r1", "a", status="finished"))
+        await backend.put_room(record("r2", "a", status="closed"))
+        await backend.put_room(record("r3", "b", status="playing"))
+
+        assert (await a.place()).worker_id == "a"
+
+        await a.remove("r1")
+        assert await a.locate("r1") is None
+        assert [r.room_id for r in await b.list_rooms()] == ["r2", "r3"]
+
+        await b.stop()
+        await a.stop()
+
+    async def test_dead_workers_are_not_routed_to(self):
+        """Test that rooms of a worker without a recent heartbeat are hidden."""
+        backend = MemoryRoomBackend()
+        a = RoomRouter(backend, "a", "http://a")
+        await a.start()
+        await backend.register_worker(WorkerInfo("b", "http://b"))
+        await backend.put_room(record("r2", "b"))
+        backend._workers["b"].heartbeat -= a.worker_timeout + 1
+
+        assert await a.locate("r2") is None
+        assert await a.list_rooms() == []
+        assert (await a.place()).worker_id == "a"
+        await a.stop()
+
+    async def test_relay_reaches_remote_subscribers(self):
+        """Test that a room's broadcasts reach subscribers through the backend."""
+        backend = MemoryRoomBackend()
+        router = RoomRouter(backend, "a", "http://a")
+        subscription = router.subscribe("r1")
+        broadcaster = RoomBroadcaster(relay=router.relay("r1"))
+
+        broadcaster.publish({"type": "chat"})
+        broadcaster.publish({"type": "player_list"}, coalesce_key="player_list")
+        subscription.close()
+
+        messages = [(key, json.loads(text)["type"]) async for key, text in subscription]
+        assert messages == [(None, "chat"), ("player_list", "player_list")]
+
+
+async def wait_for_subscribers(backend: SQLiteRoomBackend, channel: str) -> None:
+    async def poll():
+        while not backend.has_subscribers(channel):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), 2)
+
+
+class TestSQLiteRoomBackend:
+    """Tests for SQLiteRoomBackend shared by two workers."""
+
+    async def test_directory_and_messages_are_shared(self, tmp_path):
+        """Test that two backends on one file see each other's rooms and messages."""
+        path = tmp_path / "rooms.db"
+        first = SQLiteRoomBackend(str(path), poll_interval=0.01)
+        second = SQLiteRoomBackend(str(path), poll_interval=0.01)
+        await first.start()
+        await second.start()
+        try:
+            await first.register_worker(WorkerInfo("a", "http://a"))
+            await first.put_room(record("r1", "a"))
+            assert (await second.get_room("r1")).worker_id == "a"
+            assert [w.worker_id for w in await second.workers(max_age=10)] == ["a"]
+
+            subscription = second.subscribe("room:r1")
+            await wait_for_subscribers(first, "room:r1")
+            first.publish("room:r1", '{"type":"chat"}')
+            first.publish("room:other", '{"type":"ignored"}')
+            first.publish("room:r1", '{"type":"player_list"}', "player_list")
+            received = [await asyncio.wait_for(anext(subscription), 2) for _ in range(2)]
+            assert received == [
+                (None, '{"type":"chat"}'),
+                ("player_list", '{"type":"player_list"}'),
+            ]
+
+            await first.remove_worker("a")
+            assert await second.get_room("r1") is None
+        finally:
+            await first.close()
+            await second.close()
+
+    async def test_unfollowed_channels_are_not_written(self, tmp_path):
+        """Test that messages are only stored while some worker subscribes to the channel."""
+        path = tmp_path / "rooms.db"
+        first = SQLiteRoomBackend(str(path), poll_interval=0.01)
+        second = SQLiteRoomBackend(str(path), poll_interval=0.01)
+        await first.start()
+        await second.start()
+        try:
+            first.publish("room:r1", '{"type":"unseen"}')
+            subscription = second.subscribe("room:r1")
+            await wait_for_subscribers(first, "room:r1")
+            first.publish("room:r1", '{"type":"chat"}')
+            assert await asyncio.wait_for(anext(subscription), 2) == (None, '{"type":"chat"}')
+
+            subscription.close()
+            await second._sync_subscriptions()
+            await first._sync_subscriptions()
+            assert not first.has_subscribers("room:r1")
+            first.publish("room:r1", '{"type":"late"}')
+            await first._flush()
+
+            rows = await first._query("SELECT payload FROM room_messages")
+            assert rows == [('{"type":"chat"}',)]
+        finally:
+            await first.close()
+            await second.close()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main.router, "backend", MemoryRoomBackend())
+    with TestClient(main.app) as client:
+        yield client
+    main.rooms.clear()
+
+
+class TestServerRouting:
+    """Tests for request routing in the server app."""
+
+    def remote_worker(self, client, rooms=()):
+        backend = main.router.backend
+
+        async def register():
+            await backend.register_worker(WorkerInfo("remote", "http://remote:8001"))
+            for room_id in rooms:
+                await backend.put_room(record(room_id, "remote"))
+
+        client.portal.call(register)
+
+    def test_requests_for_remote_rooms_are_redirected(self, client):
+        """Test that room requests are redirected to the hosting worker."""
+        self.remote_worker(client, rooms=["far"])
+
+        response = client.post(
+            "/api/rooms/far/join", params={"player_name": "Ann"}, follow_redirects=False
+        )
+
+        assert response.status_code == 307
+        assert (
+            response.headers["location"] == "http://remote:8001/api/rooms/far/join?player_name=Ann"
+        )
+        assert [r["worker_id"] for r in client.get("/api/rooms").json()["rooms"]] == ["remote"]
+
+    def test_new_rooms_go_to_least_loaded_worker(self, client):
+        """Test that room creation is redirected once to a less loaded worker."""
+        created = client.post("/api/rooms", params={"name": "Local"}).json()
+        assert created["worker_url"] == main.router.worker.url
+        self.remote_worker(client)
+
+        response = client.post("/api/rooms", params={"name": "Next"}, follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"] == "http://remote:8001/api/rooms?name=Next&routed=true"
@@ -0,0 +1,110 @@
+"""Tests for the cached save catalog."""
+
+import json
+import os
+from datetime import date, datetime
+
+from fm_manager.core.game_save import SaveLoadManager
+from fm_manager.core.save_catalog import SaveCatalog
+from fm_manager.core.save_load_enhanced import EnhancedSaveLoadManager, SaveMetadata, SaveWriter
+from fm_manager.engine.calendar import create_league_calendar
+
+
+def write_save(path, club: str) -> None:
+    path.write_text(json.dumps({"club": club, "payload": "x" * 1000}))
+
+
+class CountingReader:
+    def __init__(self):
+        self.reads = []
+
+    def __call__(self, path):
+        self.reads.append(path.name)
+        data = json.loads(path.read_text())
+        return {"club": data["club"]} if "club" in data else None
+
+
+class TestSaveCatalog:
+    """Tests for SaveCatalog."""
+
+    def test_unchanged_files_are_not_reread(self, tmp_path):
+        """Test that a listing only reads new or modified files."""
+        write_save(tmp_path / "a.json", "Arsenal")
+        write_save(tmp_path / "b.json", "Brentford")
+        reader = CountingReader()
+        catalog = SaveCatalog(tmp_path, "*.json", reader, index_name=".json.index")
+
+        assert sorted(e.data["club"] for e in catalog.scan()) == ["Arsenal", "Brentford"]
+        assert sorted(e.data["club"] for e in catalog.scan()) == ["Arsenal", "Brentford"]
+        assert sorted(reader.reads) == ["a.json", "b.json"]
+
+        write_save(tmp_path / "a.json", "Aston Villa FC")
+        (tmp_path / "b.json").unlink()
+
+        assert [e.data["club"] for e in catalog.scan()] == ["Aston Villa FC"]
+        assert sorted(reader.reads) == ["a.json", "a.json", "b.json"]
+
+    def test_index_is_shared_between_instances(self, tmp_path):
+        """Test that a new catalog reuses the sidecar index instead of the files."""
+        write_save(tmp_path / "a.json", "Arsenal")
+        SaveCatalog(tmp_path, "*.json", CountingReader(), index_name=".json.index").scan()
+
+        reader = CountingReader()
+        entries = SaveCatalog(tmp_path, "*.json", reader, index_name=".json.index").scan()
+
+        assert [e.data for e in entries] == [{"club": "Arsenal"}]
+        assert reader.reads == []
+
+    def test_unreadable_files_are_skipped_until_changed(self, tmp_path):
+        """Test that a file the reader rejects is listed neither now nor on rescans."""
+        (tmp_path / "bad.json").write_text(json.dumps({"other": 1}))
+        reader = CountingReader()
+        catalog = SaveCatalog(tmp_path, "*.json", reader)
+
+        assert catalog.scan() == []
+        assert catalog.scan() == []
+        assert reader.reads == ["bad.json"]
+
+    def test_enhanced_manager_lists_from_catalog(self, tmp_path, monkeypatch):
+        """Test that get_save_files opens each save once across listings."""
+        manager = EnhancedSaveLoadManager(tmp_path)
+        for name, day in (("first", 1), ("second", 2)):
+            metadata = SaveMetadata(
+                save_name=name,
+                save_date=datetime(2024, 1, day),
+                version="2.0",
+                current_season=1,
+                current_week=day,
+                player_club_id=None,
+                player_club_name=None,
+                in_game_date=None,
+            )
+            with SaveWriter(tmp_path / f"{name}.fmsave", metadata) as writer:
+                writer.write("clubs", {"id": 1})
+
+        opened = []
+        read_metadata = manager._read_save_metadata
+        monkeypatch.setattr(
+            manager, "_read_save_metadata", lambda p: opened.append(p.name) or read_metadata(p)
+        )
+
+        assert [m.save_name for m, _ in manager.get_save_files()] == ["second", "first"]
+        assert [m.current_week for m, _ in manager.get_save_files()] == [2, 1]
+        assert sorted(opened) == ["first.fmsave", "second.fmsave"]
+
+    def test_game_save_listing_uses_catalog(self, tmp_path):
+        """Test that the lightweight manager lists summaries newest first."""
+        manager = SaveLoadManager(tmp_path)
+        calendar = create_league_calendar("Premier League", ["A", "B"], 2024)
+        manager.save_game("old", "A", 1, "Premier League", 2024, 3, calendar, date(2024, 9, 1))
+        manager.save_game("new", "B", 2, "Premier League", 2024, 5, calendar, date(2024, 9, 8))
+        old_path = tmp_path / "old.json"
+        os.utime(old_path, ns=(0, old_path.stat().st_mtime_ns - 10**9))
+
+        saves = manager.list_saves()
+
+        assert [(s["name"], s["club"], s["week"]) for s in saves] == [
+            ("new", "B", 5),
+            ("old", "A", 3),
+        ]
+        assert saves[0]["path"] == str(tmp_path / "new.json")
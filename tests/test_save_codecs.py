@@ -0,0 +1,140 @@
+"""Tests for the pluggable record codecs of save files."""
+
+import gzip
+import json
+from datetime import date
+
+import pytest
+
+from fm_manager.core import save_codecs
+from fm_manager.core.models import Player, Position
+from fm_manager.core.save_codecs import (
+    SAVE_CODECS,
+    SaveCodec,
+    codec_available,
+    column_encoders,
+    get_codec,
+)
+from fm_manager.core.save_load_enhanced import (
+    EnhancedSaveLoadManager,
+    SaveVersion,
+    read_save_header,
+)
+
+CODECS = [
+    pytest.param(name, marks=pytest.mark.skipif(not codec_available(name), reason="not installed"))
+    for name in SAVE_CODECS
+]
+
+
+@pytest.fixture
+def world_options():
+    return {"clubs": 1, "players": 15, "matches": 0, "goalkeepers": 1, "first_name": "Jörg"}
+
+
+def make_manager(tmp_path, codec: str) -> EnhancedSaveLoadManager:
+    return EnhancedSaveLoadManager(tmp_path / codec, codec=codec)
+
+
+class TestSaveCodecs:
+    """Tests for saving and loading through each codec."""
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_codecs_load_the_same_state(self, tmp_path, session, codec):
+        """Test that every codec round-trips to the same game state as stdlib JSON."""
+        reference = make_manager(tmp_path, "json")
+        manager = make_manager(tmp_path, codec)
+        path = manager.save_game(session, "career")
+        reference.save_game(session, "career")
+
+        metadata, state = manager.load_game("career")
+
+        assert read_save_header(path)["codec"] == codec
+        assert metadata.version == SaveVersion.V2_1.value
+        assert state.to_dict() == reference.load_game("career")[1].to_dict()
+        assert state.players[0]["position"] == "GK"
+        assert state.players[0]["birth_date"] == "2000-01-01"
+        reference.end_session()
+        manager.end_session()
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_truncated_save_is_detected(self, tmp_path, session, codec):
+        """Test that a save cut short fails to load whatever its codec."""
+        manager = make_manager(tmp_path, codec)
+        path = manager.save_game(session, "career")
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+        with gzip.open(path, "wb") as f:
+            f.write(data[: len(data) - 120])
+
+        with pytest.raises(ValueError, match="corrupted"):
+            manager.load_game("career")
+        manager.end_session()
+
+    def test_version_2_0_saves_still_load(self, tmp_path, session):
+        """Test that a streamed save whose header names no codec is read as JSON lines."""
+        manager = make_manager(tmp_path, "json")
+        path = manager.save_game(session, "career")
+        with gzip.open(path, "rb") as f:
+            header, *records = f.readlines()
+        header = json.loads(header)
+        del header["codec"]
+        header["metadata"]["version"] = SaveVersion.V2_0.value
+        with gzip.open(path, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.writelines(records)
+
+        metadata, state = manager.load_game("career")
+
+        assert metadata.version == "2.0"
+        assert len(state.players) == 15
+        manager.end_session()
+
+    def test_missing_and_unknown_codecs(self, monkeypatch):
+        """Test that unknown codecs and codecs without their package are rejected."""
+        with pytest.raises(ValueError, match="Unknown"):
+            get_codec("pickle")
+
+        monkeypatch.setitem(save_codecs._REQUIREMENTS, "orjson", False)
+        monkeypatch.setitem(save_codecs._REQUIREMENTS, "msgpack", False)
+        with pytest.raises(ImportError, match="pip install orjson"):
+            get_codec("orjson")
+        assert save_codecs.default_codec_name() == "json"
+
+    @pytest.mark.skipif(not codec_available("orjson"), reason="not installed")
+    def test_orjson_saves_load_without_orjson(self, tmp_path, session, monkeypatch):
+        """Test that orjson saves are read as JSON lines when orjson is missing."""
+        manager = make_manager(tmp_path, "orjson")
+        manager.save_game(session, "career")
+        expected = manager.load_game("career")[1].to_dict()
+        manager.end_session()
+
+        monkeypatch.setitem(save_codecs._REQUIREMENTS, "orjson", False)
+        monkeypatch.setitem(save_codecs._REQUIREMENTS, "msgpack", False)
+        reader = EnhancedSaveLoadManager(manager.save_dir, codec="json")
+
+        assert reader.load_game("career")[1].to_dict() == expected
+        with pytest.raises(ImportError, match="pip install msgpack"):
+            save_codecs.get_reading_codec("msgpack")
+        reader.end_session()
+
+    def test_codecs_must_implement_framing(self):
+        """Test that the base codec and incomplete subclasses cannot be created."""
+
+        class EncodeOnly(SaveCodec):
+            def encode(self, obj):
+                return b""
+
+        with pytest.raises(TypeError):
+            SaveCodec()
+        with pytest.raises(TypeError):
+            EncodeOnly()
+
+    def test_column_encoders_follow_column_types(self):
+        """Test that enum and date columns get typed encoders and others none."""
+        encoders = dict(column_encoders(Player.__table__))
+
+        assert encoders["position"](Position.ST) == "ST"
+        assert encoders["birth_date"](date(2001, 2, 3)) == "2001-02-03"
+        assert encoders["first_name"] is None
+        assert column_encoders(Player.__table__) is column_encoders(Player.__table__)
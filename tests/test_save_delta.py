@@ -0,0 +1,228 @@
+"""Tests for incremental (delta) saves and auto-save chains."""
+
+import gzip
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from fm_manager.core.models import Club, Match, Player, Position
+
+
+@pytest.fixture
+def world_options():
+    return {"players": 10, "matches": 4}
+
+
+def records(path) -> list:
+    with gzip.open(path, "rb") as f:
+        lines = [json.loads(line) for line in f]
+    return lines[1:-1]
+
+
+def by_id(state) -> dict:
+    return {
+        table: sorted(getattr(state, table), key=lambda row: row["id"])
+        for table in ("clubs", "players", "matches", "seasons")
+    }
+
+
+class TestDeltaSaves:
+    """Tests for save_delta and chain loading."""
+
+    def test_delta_holds_only_changed_rows(self, manager, session):
+        """Test that a delta after one change stores one row and loads like a full save."""
+        manager.save_game(session, "base")
+        player = session.scalars(select(Player).limit(1)).one()
+        player.morale = 99
+        session.commit()
+
+        path = manager.save_delta(session, "delta")
+
+        assert records(path) == [["players", manager._object_to_dict(player)]]
+        full_path = manager.save_game(session, "full")
+        assert by_id(manager.load_game("delta")[1]) == by_id(manager.load_game("full")[1])
+        assert records(full_path)[0][0] == "clubs"
+
+    def test_chain_applies_inserts_deletes_and_bulk_updates(self, manager, session):
+        """Test that inserts, deletes and bulk statements replay across a chain."""
+        manager.save_game(session, "base")
+        session.add(Player(first_name="New", last_name="Signing", position=Position.ST, club_id=1))
+        session.delete(session.scalars(select(Match).limit(1)).one())
+        session.commit()
+        first = manager.save_delta(session, "first")
+        session.execute(update(Player).where(Player.club_id == 2).values(morale=10))
+        session.commit()
+        second = manager.save_delta(session, "second")
+
+        assert [table for table, _ in records(first)] == ["players"] + ["matches"] * 3
+        assert {table for table, _ in records(second)} == {"players"}
+        _, state = manager.load_game("second")
+        assert len(state.players) == 21
+        assert len(state.matches) == 3
+        assert {p["morale"] for p in state.players if p["club_id"] == 2} == {10}
+        manager.save_game(session, "full")
+        assert by_id(state) == by_id(manager.load_game("full")[1])
+
+    def test_chain_keeps_the_recent_history_window(self, manager, session):
+        """Test that a chain past the match limit loads like a full save, newest first."""
+        manager.save_game(session, "base")
+        session.add_all(
+            Match(
+                season_id=1,
+                matchday=day,
+                home_club_id=1,
+                away_club_id=2,
+                match_date=date(2025, 1, 1) + timedelta(days=day),
+            )
+            for day in range(120)
+        )
+        session.commit()
+        manager.save_delta(session, "first")
+        session.add_all(
+            Match(
+                season_id=1,
+                matchday=day,
+                home_club_id=2,
+                away_club_id=1,
+                match_date=date(2026, 1, 1) + timedelta(days=day),
+            )
+            for day in range(120)
+        )
+        session.commit()
+        manager.save_delta(session, "second")
+
+        _, state = manager.load_game("second")
+        manager.save_game(session, "full")
+        _, full = manager.load_game("full")
+        assert len(state.matches) == 200
+        assert state.matches == full.matches
+
+    def test_missing_parent_is_reported(self, manager, session):
+        """Test that a delta whose base was removed behind the manager's back cannot be loaded."""
+        base = Path(manager.save_game(session, "base"))
+        session.get(Club, 1).reputation = 9000
+        session.commit()
+        manager.save_delta(session, "delta")
+        base.unlink()
+
+        with pytest.raises(FileNotFoundError, match="base"):
+            manager.load_game("delta")
+
+    def test_deleting_a_parent_compacts_its_deltas(self, manager, session):
+        """Test that deltas built on a deleted save are compacted and still load."""
+        manager.save_game(session, "base")
+        session.get(Club, 1).reputation = 9000
+        session.commit()
+        manager.save_delta(session, "first")
+        session.get(Club, 2).reputation = 8000
+        session.commit()
+        manager.save_delta(session, "second")
+        expected = by_id(manager.load_game("second")[1])
+
+        assert manager.delete_save("base")
+
+        assert len(manager._save_chain(manager.save_dir / "first.fmsave")) == 1
+        assert len(manager._save_chain(manager.save_dir / "second.fmsave")) == 2
+        assert by_id(manager.load_game("second")[1]) == expected
+
+    def test_renaming_a_parent_updates_its_deltas(self, manager, session):
+        """Test that deltas follow a renamed parent, as does the next delta of the session."""
+        manager.save_game(session, "base")
+        session.get(Club, 1).reputation = 9000
+        session.commit()
+        manager.save_delta(session, "first")
+        expected = by_id(manager.load_game("first")[1])
+
+        manager.rename_save("base", "renamed")
+        manager.rename_save("first", "head")
+
+        assert by_id(manager.load_game("head")[1]) == expected
+        session.get(Club, 2).reputation = 8000
+        session.commit()
+        path = manager.save_delta(session, "second")
+        assert [p.stem for p, _ in manager._save_chain(Path(path))] == ["second", "head", "renamed"]
+
+    def test_compacted_delta_stands_alone(self, manager, session):
+        """Test that compaction makes a delta independent of its parents."""
+        manager.save_game(session, "base")
+        session.get(Club, 2).reputation = 9000
+        session.commit()
+        manager.save_delta(session, "delta")
+
+        manager.compact_save("delta")
+        manager.delete_save("base")
+
+        _, state = manager.load_game("delta")
+        assert len(state.players) == 20
+        assert {c["id"]: c["reputation"] for c in state.clubs}[2] == 9000
+
+    def test_failed_delta_keeps_changes_for_the_next(self, manager, session, monkeypatch):
+        """Test that changes taken by a failed delta are written by the next one."""
+        manager.save_game(session, "base")
+        session.get(Club, 1).reputation = 9000
+        session.commit()
+
+        monkeypatch.setattr(manager, "_object_to_dict", lambda obj: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            manager.save_delta(session, "broken")
+        monkeypatch.undo()
+
+        assert [table for table, _ in records(manager.save_delta(session, "delta"))] == ["clubs"]
+
+    def test_rolled_back_changes_are_not_saved(self, manager, session):
+        """Test that flushed changes of a rolled back transaction or savepoint are dropped."""
+        manager.save_game(session, "base")
+        match = session.scalars(select(Match).limit(1)).one()
+        session.delete(match)
+        session.flush()
+        session.rollback()
+        with session.begin_nested():
+            session.get(Club, 2).reputation = 7000
+        savepoint = session.begin_nested()
+        session.delete(session.get(Match, match.id))
+        session.flush()
+        savepoint.rollback()
+        session.commit()
+
+        path = manager.save_delta(session, "delta")
+
+        assert [table for table, _ in records(path)] == ["clubs"] + ["matches"] * 4
+        _, state = manager.load_game("delta")
+        assert len(state.matches) == 4
+        assert {c["id"]: c["reputation"] for c in state.clubs}[2] == 7000
+
+    def test_uncommitted_changes_of_the_saving_session(self, manager, session):
+        """Test that a delta sees its own session's uncommitted changes but no other's."""
+        manager.save_game(session, "base")
+        with Session(session.get_bind()) as other:
+            other.get(Club, 2).reputation = 7000
+            other.flush()
+        session.get(Club, 1).reputation = 9000
+
+        path = manager.save_delta(session, "delta")
+
+        assert [row["id"] for _, row in records(path)] == [1]
+
+
+class TestAutoSaveChains:
+    """Tests for delta auto-saves, snapshots and cleanup."""
+
+    def test_auto_saves_snapshot_and_keep_ancestors(self, manager, session):
+        """Test that auto-saves take periodic full snapshots and cleanup keeps their bases."""
+        manager.AUTO_SAVE_COMPACT_EVERY = 2
+        manager.MAX_AUTO_SAVES = 1
+        player = session.scalars(select(Player).limit(1)).one()
+        paths = []
+        for morale in range(5):
+            player.morale = morale
+            session.commit()
+            paths.append(Path(manager.create_auto_save(session)))
+
+        assert [len(manager._save_chain(p)) for p in paths[3:]] == [1, 2]
+        assert sorted(manager.save_dir.glob("autosave_*.fmsave")) == paths[3:]
+        _, state = manager.load_game(paths[-1].stem)
+        assert {p["id"]: p["morale"] for p in state.players}[player.id] == 4
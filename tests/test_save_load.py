@@ -0,0 +1,113 @@
+"""Tests for streamed save files in EnhancedSaveLoadManager."""
+
+import gzip
+import hashlib
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from fm_manager.core.save_load_enhanced import (
+    SAVE_FORMAT,
+    SaveVersion,
+    read_save_header,
+)
+
+
+def save_lines(path) -> list:
+    with gzip.open(path, "rb") as f:
+        return f.readlines()
+
+
+class TestStreamedSaves:
+    """Tests for the newline-delimited save format."""
+
+    def test_round_trip(self, manager, session):
+        """Test that a saved game loads back with its metadata and every table."""
+        path = manager.save_game(session, "career", current_season=2, player_club_id=1)
+
+        metadata, state = manager.load_game("career")
+
+        assert metadata.version == SaveVersion.CURRENT.value
+        assert metadata.player_club_name == "Club 1"
+        assert metadata.total_matches_played == 6
+        assert len(state.clubs) == 2
+        assert len(state.players) == 24
+        assert {p["position"] for p in state.players} == {"CM"}
+        assert [m["match_date"] for m in state.matches][:2] == ["2024-08-06", "2024-08-05"]
+        assert read_save_header(path)["format"] == SAVE_FORMAT
+        assert [m.save_name for m, _ in manager.get_save_files()] == ["career"]
+
+    async def test_async_save_matches_sync_save(self, manager, session, world_db):
+        """Test that the async writer produces the same records as the sync one."""
+        sync_path = manager.save_game(session, "sync")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{world_db}")
+        async with AsyncSession(engine) as async_session:
+            async_path = await manager.save_game_async(async_session, "async")
+        await engine.dispose()
+
+        assert save_lines(sync_path)[1:] == save_lines(async_path)[1:]
+
+    def test_corrupted_record_is_detected(self, manager, session):
+        """Test that a modified record fails the checksum."""
+        path = manager.save_game(session, "career")
+        lines = save_lines(path)
+        lines[3] = lines[3].replace(b'"Player"', b'"Hacker"')
+        with gzip.open(path, "wb") as f:
+            f.writelines(lines)
+
+        with pytest.raises(ValueError, match="checksum"):
+            manager.load_game("career")
+
+    def test_failed_save_keeps_previous_file(self, manager, session, monkeypatch):
+        """Test that an error mid-save leaves the existing save untouched."""
+        manager.save_game(session, "career")
+        calls = []
+
+        def failing(obj):
+            calls.append(obj)
+            if len(calls) > 5:
+                raise RuntimeError("disk full")
+            return {}
+
+        monkeypatch.setattr(manager, "_object_to_dict", failing)
+        with pytest.raises(RuntimeError):
+            manager.save_game(session, "career")
+
+        assert len(manager.load_game("career")[1].players) == 24
+        assert list(manager.save_dir.glob("*.tmp")) == []
+
+    def test_rename_rewrites_only_the_header(self, manager, session):
+        """Test that renaming keeps the records and their checksum."""
+        path = manager.save_game(session, "career")
+        records = save_lines(path)[1:]
+
+        new_path = manager.rename_save("career", "renamed")
+
+        assert save_lines(new_path)[1:] == records
+        metadata, state = manager.load_game("renamed")
+        assert metadata.save_name == "renamed"
+        assert len(state.players) == 24
+
+    def test_legacy_saves_still_load(self, manager):
+        """Test that single-document saves from before 2.0 load and list."""
+        game_state = {"clubs": [{"id": 1, "name": "Old Club"}], "players": []}
+        metadata = {
+            "save_name": "old",
+            "save_date": datetime(2024, 1, 1).isoformat(),
+            "version": SaveVersion.V1_2.value,
+        }
+        save_data = {
+            "metadata": metadata,
+            "game_state": game_state,
+            "checksum": hashlib.sha256(json.dumps(game_state, sort_keys=True).encode()).hexdigest(),
+        }
+        with gzip.open(manager.save_dir / "old.fmsave", "wt", encoding="utf-8") as f:
+            json.dump(save_data, f, indent=2)
+
+        loaded_metadata, state = manager.load_game("old")
+
+        assert loaded_metadata.version == "1.2"
+        assert state.clubs == [{"id": 1, "name": "Old Club"}]
+        assert [m.save_name for m, _ in manager.get_save_files()] == ["old"]
@@ -0,0 +1,134 @@
+"""Tests for the bulk restore of saved game state."""
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from fm_manager.core.database import Base
+from fm_manager.core.models import Club, Match, MatchStatus, Player, Position
+from fm_manager.core.models.club import ClubReputation
+from fm_manager.core.save_restore import BulkRestorer
+
+
+def make_engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def world_options():
+    return {"players": 30, "matches": 3, "goalkeepers": 1}
+
+
+@pytest.fixture
+def game_state(manager, session):
+    manager.save_game(session, "career")
+    return manager.load_game("career")[1]
+
+
+def table_rows(manager, session, model) -> list:
+    return [manager._object_to_dict(obj) for obj in session.scalars(select(model).order_by("id"))]
+
+
+class TestBulkRestore:
+    """Tests for BulkRestorer and the manager's restore methods."""
+
+    def test_restore_into_empty_database(self, tmp_path, manager, game_state):
+        """Test that every saved table is restored with a handful of statements."""
+        engine = make_engine(tmp_path / "target.db")
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        with Session(engine) as session:
+            report = manager.restore_game_state(session, game_state)
+
+            assert table_rows(manager, session, Player) == game_state.players
+            assert table_rows(manager, session, Club) == sorted(
+                game_state.clubs, key=lambda row: row["id"]
+            )
+            assert session.get(Match, 1).status is MatchStatus.FULL_TIME
+        engine.dispose()
+
+        assert {s.table: s.inserted for s in report.tables} == {
+            "leagues": 1,
+            "clubs": 2,
+            "seasons": 1,
+            "players": 60,
+            "matches": 3,
+        }
+        assert len([s for s in statements if s.startswith(("INSERT", "UPDATE"))]) == 5
+        assert "players 60" in report.summary()
+
+    def test_restore_updates_existing_rows_in_place(self, tmp_path, manager, game_state):
+        """Test that saved rows overwrite their ids and unsaved rows are kept."""
+        engine = make_engine(tmp_path / "target.db")
+        with Session(engine) as session:
+            manager.restore_game_state(session, game_state)
+            session.get(Player, 1).morale = 5
+            session.add(Player(first_name="Kept", last_name="Row", position=Position.ST))
+            session.commit()
+
+            report = manager.restore_game_state(session, game_state)
+
+            assert session.get(Player, 1).morale == game_state.players[0]["morale"]
+            assert session.scalars(select(Player.last_name).where(Player.id == 61)).one() == "Row"
+        engine.dispose()
+
+        assert {s.table: (s.inserted, s.updated) for s in report.tables}["players"] == (0, 60)
+
+    def test_deferred_indexes_are_rebuilt(self, tmp_path, game_state):
+        """Test that indexes dropped for a large table exist again after the restore."""
+        engine = make_engine(tmp_path / "target.db")
+        before = {i["name"] for i in inspect(engine).get_indexes("players")}
+        with Session(engine) as session:
+            report = BulkRestorer(chunk_size=7, defer_indexes_min_rows=50).restore(
+                session, game_state.to_dict()
+            )
+            session.commit()
+
+        assert {i["name"] for i in inspect(engine).get_indexes("players")} == before
+        assert before
+        assert sum(s.rows for s in report.tables if s.table == "players") == 60
+        engine.dispose()
+
+    def test_missing_indexes_are_left_missing(self, tmp_path, game_state):
+        """Test that a deferred index absent from an unmigrated database is not touched."""
+        engine = make_engine(tmp_path / "target.db")
+        with engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_players_club_id_ability"))
+        with Session(engine) as session:
+            report = BulkRestorer(defer_indexes_min_rows=50).restore(session, game_state.to_dict())
+            session.commit()
+
+        names = {i["name"] for i in inspect(engine).get_indexes("players")}
+        assert "ix_players_club_id_ability" not in names
+        assert report.rows == 67
+        engine.dispose()
+
+    def test_legacy_enum_values_are_converted(self, tmp_path):
+        """Test that enum names are accepted and unknown values fall back to the default."""
+        engine = make_engine(tmp_path / "target.db")
+        clubs = [
+            {"id": 1, "name": "A", "short_name": "A", "reputation_level": "elite"},
+            {"id": 2, "name": "B", "short_name": "B", "reputation_level": "Galactic"},
+        ]
+        with Session(engine) as session:
+            BulkRestorer().restore(session, {"clubs": clubs, "unknown": [{"id": 1}]})
+
+            assert session.get(Club, 1).reputation_level is ClubReputation.ELITE
+            assert session.get(Club, 2).reputation_level is ClubReputation.RESPECTABLE
+        engine.dispose()
+
+    async def test_async_restore(self, tmp_path, manager, game_state):
+        """Test that the async restore writes the same rows as the sync one."""
+        make_engine(tmp_path / "target.db").dispose()
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'target.db'}")
+        async with AsyncSession(engine) as session:
+            report = await manager.restore_game_state_async(session, game_state)
+            players = (await session.scalars(select(Player).order_by(Player.id))).all()
+
+            assert [manager._object_to_dict(p) for p in players] == game_state.players
+        await engine.dispose()
+
+        assert report.rows == 67
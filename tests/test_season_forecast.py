@@ -0,0 +1,68 @@
+"""Tests for the Monte Carlo season forecaster."""
+
+import pytest
+from conftest import make_lineup
+
+from fm_manager.engine.season_forecast import SeasonForecaster
+from fm_manager.engine.season_simulator import FixtureGenerator, LeagueTableEntry
+
+
+def make_league(num_clubs: int = 4):
+    lineups = {i: make_lineup(f"Club {i}", 60 + 4 * i, seed=i) for i in range(num_clubs)}
+    standings = [
+        LeagueTableEntry(club_id=i, club_name=f"Club {i}", points=3 * i) for i in range(num_clubs)
+    ]
+    pairings = FixtureGenerator().generate_pairings(list(lineups))
+    return standings, pairings, lineups
+
+
+class TestSeasonForecaster:
+    """Tests for SeasonForecaster."""
+
+    def test_probabilities_are_consistent(self):
+        """Test that position probabilities form a distribution per club and per position."""
+        standings, pairings, lineups = make_league()
+        remaining = [pair for matchday in pairings[3:] for pair in matchday]
+
+        forecast = SeasonForecaster(samples_per_fixture=16, seed=1).forecast(
+            standings,
+            remaining,
+            lineups,
+            simulations=2000,
+            cl_spots=1,
+            el_spots=0,
+            relegation_spots=1,
+        )
+
+        assert forecast.remaining_fixtures == len(remaining) == 6
+        assert sum(c.title_probability for c in forecast.clubs) == pytest.approx(1.0)
+        assert sum(c.relegation_probability for c in forecast.clubs) == pytest.approx(1.0)
+        for club in forecast.clubs:
+            assert sum(club.position_probabilities) == pytest.approx(1.0)
+            assert club.european_probability == pytest.approx(club.title_probability)
+            assert club.current_points <= club.expected_points <= club.current_points + 9
+        assert forecast.clubs[0].club_id == 3
+
+    def test_finished_season_is_certain(self):
+        """Test that with no fixtures left the current table is the final one."""
+        standings, _, lineups = make_league()
+
+        forecast = SeasonForecaster(seed=1).forecast(standings, [], lineups, simulations=100)
+
+        assert forecast.for_club(3).title_probability == 1.0
+        assert forecast.for_club(0).relegation_probability == 1.0
+        assert forecast.for_club(1).expected_position == 3.0
+
+    def test_results_independent_of_worker_count(self):
+        """Test that forecasts are reproducible in and out of process."""
+        standings, pairings, lineups = make_league()
+        remaining = [pair for matchday in pairings for pair in matchday]
+
+        serial = SeasonForecaster(samples_per_fixture=8, seed=5).forecast(
+            standings, remaining, lineups, simulations=500
+        )
+        parallel = SeasonForecaster(samples_per_fixture=8, max_workers=2, seed=5).forecast(
+            standings, remaining, lineups, simulations=500
+        )
+
+        assert serial == parallel
@@ -0,0 +1,92 @@
+"""Tests for the parallel season runner."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import make_lineup
+
+from fm_manager.engine import season_runner
+from fm_manager.engine.season_runner import (
+    ParallelSeasonRunner,
+    SeasonFixture,
+    build_standings,
+)
+from fm_manager.engine.season_simulator import FixtureGenerator
+
+
+def make_season(league: str, num_clubs: int) -> list[SeasonFixture]:
+    lineups = {i: make_lineup(f"{league} {i}", 62 + 2 * i, seed=i) for i in range(num_clubs)}
+    pairings = FixtureGenerator().generate_pairings(list(lineups))
+    return [
+        SeasonFixture(
+            league=league,
+            matchday=matchday,
+            home_id=home,
+            away_id=away,
+            home_lineup=lineups[home],
+            away_lineup=lineups[away],
+            home_name=f"Club {home}",
+            away_name=f"Club {away}",
+        )
+        for matchday, round_pairings in enumerate(pairings, 1)
+        for home, away in round_pairings
+    ]
+
+
+class TestParallelSeasonRunner:
+    """Tests for ParallelSeasonRunner."""
+
+    def test_results_independent_of_worker_count(self):
+        """Test that per-fixture seeds make results identical in and out of process."""
+        fixtures = make_season("A", 4) + make_season("B", 4)
+
+        serial = ParallelSeasonRunner(max_workers=1, season_seed=11).run(fixtures)
+        with ParallelSeasonRunner(max_workers=2, season_seed=11) as runner:
+            parallel = runner.run(fixtures)
+
+        assert [r.fixture for r in parallel] == fixtures
+        assert [(r.home_score, r.away_score) for r in serial] == [
+            (r.home_score, r.away_score) for r in parallel
+        ]
+        assert parallel[0].state.home_lineup is fixtures[0].home_lineup
+
+    def test_matchday_is_split_across_workers(self, monkeypatch):
+        """Test that one matchday is dispatched as one chunk per worker, on one pool."""
+        pools: list[list[int]] = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                super().__init__(max_workers=max_workers)
+                pools.append([])
+
+            def map(self, fn, chunks, *args):
+                chunks = list(chunks)
+                pools[-1].extend(len(chunk) for chunk in chunks)
+                return super().map(fn, chunks, *args)
+
+        monkeypatch.setattr(season_runner, "ProcessPoolExecutor", RecordingExecutor)
+        fixtures = make_season("A", 8)
+        rounds = [fixtures[:4], fixtures[4:8]]
+
+        with ParallelSeasonRunner(max_workers=2, season_seed=5) as runner:
+            parallel = [runner.run(matchday) for matchday in rounds]
+        serial = [ParallelSeasonRunner(max_workers=1, season_seed=5).run(md) for md in rounds]
+
+        assert pools == [[2, 2, 2, 2]]
+        assert [[(r.home_score, r.away_score) for r in md] for md in parallel] == [
+            [(r.home_score, r.away_score) for r in md] for md in serial
+        ]
+
+    def test_build_standings(self):
+        """Test that standings are aggregated per league."""
+        fixtures = make_season("A", 5)
+        results = ParallelSeasonRunner(max_workers=1, season_seed=3).run(fixtures)
+
+        summary = build_standings(results)["A"]
+
+        assert len(summary.results) == len(fixtures) == 20
+        assert [entry.played for entry in summary.standings] == [8] * 5
+        points = [entry.points for entry in summary.standings]
+        assert points == sorted(points, reverse=True)
+        assert sum(e.goals_for for e in summary.standings) == sum(
+            r.home_score + r.away_score for r in results
+        )
@@ -0,0 +1,214 @@
+"""Tests for the database-backed season simulator."""
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fm_manager.core.database import Base
+from fm_manager.core.models import Club, League, Match, MatchEvent, Player, Season
+from fm_manager.core.models.player import Position
+from fm_manager.engine import season_simulator_comprehensive
+from fm_manager.engine.match_engine_markov import EnhancedMarkovEngine, ResultDetail
+from fm_manager.engine.season_runner import ParallelSeasonRunner
+from fm_manager.engine.season_simulator import (
+    SeasonSimulator,
+    count_player_events,
+    insert_matches,
+    load_season_squads,
+    stream_match_events,
+)
+from fm_manager.engine.season_simulator_comprehensive import ComprehensiveSeasonSimulator
+
+SQUAD_POSITIONS = [Position.GK] + [Position.CB] * 4 + [Position.CM] * 5 + [Position.ST] * 4
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'season.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        league = League(name="Test League", short_name="TL", country="England")
+        session.add(league)
+        await session.flush()
+        for c in range(4):
+            club = Club(name=f"Club {c}", short_name=f"C{c}", league_id=league.id)
+            session.add(club)
+            await session.flush()
+            session.add_all(
+                Player(
+                    first_name="Player",
+                    last_name=f"{c}-{p}",
+                    position=position,
+                    club_id=club.id,
+                    current_ability=50 + p,
+                )
+                for p, position in enumerate(SQUAD_POSITIONS)
+            )
+        await session.commit()
+        yield session
+
+
+def count_statements(engine) -> list:
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+class TestSeasonSimulator:
+    """Tests for SeasonSimulator's database access."""
+
+    async def test_squads_are_loaded_best_first(self, session):
+        """Test that squads are preloaded per club, ordered by ability."""
+        league_id = (await session.execute(select(League.id))).scalar_one()
+
+        squads = await load_season_squads(session, [league_id])
+
+        assert len(squads.clubs) == 4
+        for club_id in squads.clubs:
+            abilities = [p.current_ability for p in squads.squad(club_id)]
+            assert len(abilities) == len(SQUAD_POSITIONS)
+            assert abilities == sorted(abilities, reverse=True)
+        assert squads.squad(-1) == []
+
+    async def test_season_uses_constant_number_of_statements(self, engine, session):
+        """Test that a season is loaded and saved without per-match queries."""
+        league_id = (await session.execute(select(League.id))).scalar_one()
+        statements = count_statements(engine)
+
+        result = await SeasonSimulator(session).simulate_season(league_id, 2024)
+
+        assert len(result.matches) == 12
+        assert len(statements) <= 8
+        saved = await session.execute(select(func.count()).select_from(Match))
+        assert saved.scalar_one() == 12
+        stored = await session.execute(select(func.count()).select_from(MatchEvent))
+        assert stored.scalar_one() == sum(len(m.events) for m in result.matches) > 0
+
+    async def test_runner_must_record_full_results(self, session):
+        """Test that a runner skipping events and team stats is rejected."""
+        with pytest.raises(ValueError, match="FULL"):
+            SeasonSimulator(session, runner=ParallelSeasonRunner(max_workers=1))
+
+        runner = ParallelSeasonRunner(max_workers=1, detail=ResultDetail.FULL)
+        assert SeasonSimulator(session, runner=runner).runner is runner
+
+    async def test_events_are_stored_and_streamed(self, session):
+        """Test that match events land in match_events and can be read back and counted."""
+        league_id = (await session.execute(select(League.id))).scalar_one()
+        simulator = SeasonSimulator(session)
+        simulator.match_simulator = EnhancedMarkovEngine(random_seed=3)
+
+        result = await simulator.simulate_season(league_id, 2024, use_dynamic_states=False)
+
+        stored = await session.execute(select(func.count()).select_from(MatchEvent))
+        assert stored.scalar_one() == sum(len(m.events) for m in result.matches)
+
+        match_id = (await session.execute(select(func.min(Match.id)))).scalar_one()
+        events = [e async for e in stream_match_events(session, match_id=match_id, batch_size=7)]
+        assert events and all(e.match_id == match_id for e in events)
+        assert [e.minute for e in events] == sorted(e.minute for e in events)
+
+        goals = sum(m.home_score + m.away_score for m in result.matches)
+        scorers = await count_player_events(session, ["GOAL_HOME", "GOAL_AWAY"], limit=100)
+        assert sum(n for _, n in scorers) <= goals
+        if scorers:
+            player, n = scorers[0]
+            scored = [e async for e in stream_match_events(session, player=player)]
+            assert sum(e.event_type.startswith("GOAL") for e in scored) == n
+
+    async def test_runner_seasons_store_events(self, session):
+        """Test that a season played on the runner's workers stores its events."""
+        league_id = (await session.execute(select(League.id))).scalar_one()
+        runner = ParallelSeasonRunner(max_workers=2, season_seed=9, detail=ResultDetail.FULL)
+
+        result = await SeasonSimulator(session, runner=runner).simulate_season(league_id, 2024)
+
+        assert not runner.active
+        events = [e async for e in stream_match_events(session)]
+        assert events
+        assert len(events) == sum(len(m.events) for m in result.matches)
+        assert sum(e.event_type.startswith("GOAL") for e in events) == sum(
+            m.home_score + m.away_score for m in result.matches
+        )
+
+    async def test_events_reference_database_assigned_ids(self, engine, session):
+        """Test that events are keyed off the ids the database gave their matches."""
+        clubs = (await session.execute(select(Club.id).order_by(Club.id))).scalars().all()
+        async with async_sessionmaker(engine)() as other:
+            # Another writer's match, inserted between our reads and writes
+            other.add(
+                Match(id=40, season_id=1, matchday=1, home_club_id=clubs[3], away_club_id=clubs[2])
+            )
+            await other.commit()
+        matches = [
+            Match(season_id=1, matchday=2, home_club_id=home, away_club_id=away, home_score=n)
+            for n, (home, away) in enumerate([(clubs[0], clubs[1]), (clubs[2], clubs[3])])
+        ]
+        events = [
+            [{"minute": 10 * (n + 1), "event_type": "GOAL_HOME", "team": "home"}] for n in range(2)
+        ]
+
+        await insert_matches(session, matches, events)
+        await session.commit()
+
+        rows = await session.execute(
+            select(MatchEvent.minute, Match.id, Match.home_club_id)
+            .join(Match, Match.id == MatchEvent.match_id)
+            .order_by(MatchEvent.minute)
+        )
+        assert [(minute, home) for minute, _, home in rows] == [(10, clubs[0]), (20, clubs[2])]
+
+        # Rows sharing a fixture still get their own ids and events
+        replays = [
+            Match(season_id=1, matchday=3, home_club_id=clubs[0], away_club_id=clubs[1])
+            for _ in range(2)
+        ]
+        await insert_matches(
+            session,
+            replays,
+            [[{"minute": m, "event_type": "GOAL_HOME", "team": "home"}] for m in (1, 2)],
+        )
+        await session.commit()
+
+        replay_ids = await session.execute(
+            select(MatchEvent.match_id).where(MatchEvent.minute < 10).order_by(MatchEvent.minute)
+        )
+        assert sorted(replay_ids.scalars()) == [43, 44]
+
+
+class TestComprehensiveSeasonSimulator:
+    """Tests for ComprehensiveSeasonSimulator's database access."""
+
+    async def test_season_uses_constant_number_of_statements(self, engine, session, monkeypatch):
+        """Test that a full season is loaded and saved without per-match queries."""
+        league_id = (await session.execute(select(League.id))).scalar_one()
+        maker = async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(season_simulator_comprehensive, "get_session_maker", lambda: maker)
+        statements = count_statements(engine)
+
+        result = await ComprehensiveSeasonSimulator(random_seed=5).simulate_full_season(
+            [league_id], 2024
+        )
+
+        assert len(statements) <= 8
+        season_id = (await session.execute(select(Season.id))).scalar_one()
+        saved = await session.execute(
+            select(func.count()).select_from(Match).where(Match.season_id == season_id)
+        )
+        assert saved.scalar_one() == 12
+        standings = result["standings"][league_id].values()
+        assert [entry.played for entry in standings] == [6] * 4
+        assert sum(entry.goals_for for entry in standings) == sum(
+            entry.goals_against for entry in standings
+        )
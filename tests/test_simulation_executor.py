@@ -0,0 +1,143 @@
+"""Tests for the server simulation executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fm_manager.data.cleaned_data_loader import CleanedDataLoaderV2
+from fm_manager.server.game_room import GameRoom, PlayerRole, RoomStatus
+from fm_manager.server.simulation_executor import SimulationExecutor, SimulationQueueFullError
+
+
+def blocking_job(gate: threading.Event, label: str) -> str:
+    """Stand-in for a simulation: hold a worker until released."""
+    gate.wait(timeout=5)
+    return label
+
+
+def record_job(order: list, label: str) -> str:
+    order.append(label)
+    return label
+
+
+@pytest.fixture
+def executor():
+    executor = SimulationExecutor(max_workers=1, max_pending=4, use_processes=False)
+    yield executor
+    executor.close()
+
+
+class TestSimulationExecutor:
+    """Tests for SimulationExecutor."""
+
+    async def test_rooms_are_served_round_robin(self, executor):
+        """Test that a room with a backlog does not delay another room's job."""
+        gate = threading.Event()
+        order: list[str] = []
+        blocker = asyncio.create_task(executor.run("a", blocking_job, gate, "a0"))
+        await asyncio.sleep(0)
+        jobs = [
+            asyncio.create_task(executor.run(room, record_job, order, label))
+            for room, label in (("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1"))
+        ]
+        await asyncio.sleep(0)
+
+        gate.set()
+        await asyncio.gather(blocker, *jobs)
+
+        assert order == ["a1", "b1", "a2", "a3"]
+
+    async def test_queue_is_bounded(self, executor):
+        """Test that jobs beyond the room and global limits are rejected."""
+        gate = threading.Event()
+        executor.max_pending_per_room = 2
+        tasks = [asyncio.create_task(executor.run("a", blocking_job, gate, "x")) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert not executor.has_capacity("a")
+        with pytest.raises(SimulationQueueFullError):
+            await executor.run("a", blocking_job, gate, "x")
+        assert executor.has_capacity("b")
+
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    async def test_cancellation_drops_queued_jobs(self, executor):
+        """Test that cancelled jobs never run."""
+        gate = threading.Event()
+        order: list[str] = []
+        blocker = asyncio.create_task(executor.run("a", blocking_job, gate, "a0"))
+        waiting = asyncio.create_task(executor.run("a", record_job, order, "a1"))
+        closed_room = asyncio.create_task(executor.run("b", record_job, order, "b1"))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        assert executor.cancel_room("b") == 1
+        gate.set()
+        await blocker
+
+        assert executor.pending == 0
+        assert order == []
+        with pytest.raises(asyncio.CancelledError):
+            await closed_room
+
+    async def test_event_loop_stays_responsive(self, executor):
+        """Test that the loop keeps ticking while a job holds the worker."""
+        gate = threading.Event()
+        job = asyncio.create_task(executor.run("a", blocking_job, gate, "a0"))
+
+        start = time.perf_counter()
+        for _ in range(10):
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        gate.set()
+
+        assert await job == "a0"
+        assert elapsed < 1.0
+
+
+class TestGameRoomSimulation:
+    """Tests for GameRoom matchdays on the executor."""
+
+    async def start_room(self, clubs, executor, result_delay: float = 0) -> GameRoom:
+        room = GameRoom("room", "Test", seed=7, executor=executor, result_delay=result_delay)
+        room.available_clubs = list(clubs.values())
+        for i, club_id in enumerate(clubs):
+            await room.add_player(f"p{i}", f"Manager {i}", PlayerRole.HUMAN)
+            await room.select_club(f"p{i}", club_id)
+        await room.start_game()
+        assert room.status == RoomStatus.PLAYING
+        return room
+
+    async def play_matchday(self, clubs, executor) -> list[tuple[int, int]]:
+        room = await self.start_room(clubs, executor)
+
+        await room.simulate_matchday()
+
+        assert room.current_matchday == 2
+        return [(r.home_score, r.away_score) for r in room.match_results]
+
+    async def test_executor_matches_inline_results(self, dataset):
+        """Test that a matchday on the executor replays the inline simulation."""
+        clubs, _ = CleanedDataLoaderV2(str(dataset), use_snapshot=False).load_all()
+        executor = SimulationExecutor(max_workers=1, use_processes=False)
+        try:
+            offloaded = await self.play_matchday(clubs, executor)
+        finally:
+            executor.close()
+
+        assert offloaded == await self.play_matchday(clubs, None)
+        assert len(offloaded) == 1
+
+    async def test_concurrent_calls_play_one_matchday(self, dataset):
+        """Test that overlapping simulate calls play the matchday only once."""
+        clubs, _ = CleanedDataLoaderV2(str(dataset), use_snapshot=False).load_all()
+        room = await self.start_room(clubs, None, result_delay=0.01)
+
+        await asyncio.gather(room.simulate_matchday(), room.simulate_matchday())
+
+        assert room.current_matchday == 2
+        assert len(room.match_results) == 1
+        assert not room.simulating